@@ -0,0 +1,163 @@
+"""
+A minimal local stand-in for the TwelveLabs multipart upload API and the S3 presigned URLs it hands out.
+
+Only the endpoints used by ``client.multipart_upload.upload_file`` are implemented. The server keeps all
+state in memory and is intended for benchmarks only.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import typing
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+INITIAL_URL_COUNT = 10
+
+
+class _UploadSession:
+    def __init__(self, total_size: int, chunk_size: int):
+        self.total_size = total_size
+        self.chunk_size = chunk_size
+        self.total_chunks = max(1, -(-total_size // chunk_size))
+        self.asset_id = uuid.uuid4().hex[:24]
+        self.reported: typing.Set[int] = set()
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, chunk_size: int, put_delay: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.chunk_size = chunk_size
+        self.put_delay = put_delay
+        self.sessions: typing.Dict[str, _UploadSession] = {}
+        self.connections = 0
+        self.put_requests = 0
+        self.lock = threading.Lock()
+        self._thread: typing.Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def process_request(self, request: typing.Any, client_address: typing.Any) -> None:
+        with self.lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    def presigned_url(self, upload_id: str, chunk_index: int) -> str:
+        return f"{self.base_url}/s3/{upload_id}/{chunk_index}"
+
+    def __enter__(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StubServer
+
+    def log_message(self, format: str, *args: typing.Any) -> None:
+        pass
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length) if length else b""
+
+    def _send_json(self, body: typing.Any, status: int = 200) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _urls(self, upload_id: str, start: int, count: int) -> typing.List[typing.Dict[str, typing.Any]]:
+        session = self.server.sessions[upload_id]
+        end = min(start + count, session.total_chunks + 1)
+        return [{"chunk_index": i, "url": self.server.presigned_url(upload_id, i)} for i in range(start, end)]
+
+    def do_PUT(self) -> None:
+        body = self._read_body()
+        if self.server.put_delay:
+            threading.Event().wait(self.server.put_delay)
+        with self.server.lock:
+            self.server.put_requests += 1
+        self.send_response(200)
+        self.send_header("ETag", f'"{hashlib.md5(body).hexdigest()}"')
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self) -> None:
+        body = json.loads(self._read_body() or b"{}")
+        path = self.path.split("?", 1)[0].rstrip("/")
+
+        if path.endswith("/assets/multipart-uploads"):
+            upload_id = uuid.uuid4().hex[:24]
+            session = _UploadSession(body["total_size"], self.server.chunk_size)
+            self.server.sessions[upload_id] = session
+            self._send_json(
+                {
+                    "upload_id": upload_id,
+                    "asset_id": session.asset_id,
+                    "chunk_size": session.chunk_size,
+                    "total_chunks": session.total_chunks,
+                    "upload_urls": self._urls(upload_id, 1, INITIAL_URL_COUNT),
+                },
+                status=201,
+            )
+            return
+
+        match = re.search(r"/assets/multipart-uploads/([^/]+)/presigned-urls$", path)
+        if match:
+            upload_id = match.group(1)
+            self._send_json(
+                {"upload_id": upload_id, "upload_urls": self._urls(upload_id, body["start"], body["count"])}
+            )
+            return
+
+        match = re.search(r"/assets/multipart-uploads/([^/]+)$", path)
+        if match:
+            session = self.server.sessions[match.group(1)]
+            with self.server.lock:
+                indices = [chunk["chunk_index"] for chunk in body["completed_chunks"]]
+                duplicates = len([i for i in indices if i in session.reported])
+                session.reported.update(indices)
+                total_completed = len(session.reported)
+            response: typing.Dict[str, typing.Any] = {
+                "asset_id": session.asset_id,
+                "processed_chunks": len(indices) - duplicates,
+                "duplicate_chunks": duplicates,
+                "total_completed": total_completed,
+            }
+            if total_completed == session.total_chunks:
+                response["url"] = f"{self.server.base_url}/assets/{session.asset_id}"
+            self._send_json(response)
+            return
+
+        self._send_json({"message": "not found"}, status=404)
+
+    def do_GET(self) -> None:
+        path, _, query = self.path.partition("?")
+        match = re.search(r"/assets/multipart-uploads/([^/]+)$", path.rstrip("/"))
+        if not match or match.group(1) not in self.server.sessions:
+            self._send_json({"message": "not found"}, status=404)
+            return
+        session = self.server.sessions[match.group(1)]
+        params = dict(pair.split("=", 1) for pair in query.split("&") if "=" in pair)
+        page = int(params.get("page", 1))
+        page_limit = int(params.get("page_limit", 10))
+        indices = sorted(session.reported)[(page - 1) * page_limit : page * page_limit]
+        self._send_json(
+            {
+                "upload_id": match.group(1),
+                "uploaded_chunks": [{"index": i, "status": "completed"} for i in indices],
+            }
+        )
@@ -0,0 +1,98 @@
+"""
+Measure the cost of opening a new connection for every presigned chunk PUT versus reusing the multipart
+upload wrapper's pooled HTTP client, by uploading many small chunks to a local stand-in S3 server.
+
+The stand-in server speaks plain HTTP, so the savings shown here are the TCP handshakes and per-request
+client construction only; against S3 every avoided connection also saves a TLS handshake.
+
+Usage:
+    python benchmarks/chunk_upload_pool.py --chunks 1000 --workers 8
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _stub_server import StubServer  # noqa: E402
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs  # noqa: E402
+
+
+def _put_fresh_connection(url: str, data: bytes) -> None:
+    # What the wrapper did before: a throwaway client per chunk
+    httpx.put(url, content=data, timeout=300.0).raise_for_status()
+
+
+async def _put_fresh_connection_async(url: str, data: bytes) -> None:
+    async with httpx.AsyncClient(timeout=300.0) as client:
+        (await client.put(url, content=data)).raise_for_status()
+
+
+def _run_sync(server: StubServer, pooled: bool, chunks: int, workers: int, data: bytes) -> float:
+    client = TwelveLabs(api_key="benchmark", base_url=server.base_url)
+    urls = [server.presigned_url("benchmark", i) for i in range(1, chunks + 1)]
+
+    def put(url: str) -> None:
+        if pooled:
+            client.multipart_upload._upload_chunk_to_s3(data, url)
+        else:
+            _put_fresh_connection(url, data)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(put, urls))
+    elapsed = time.perf_counter() - start
+    client.close()
+    return elapsed
+
+
+async def _run_async(server: StubServer, pooled: bool, chunks: int, workers: int, data: bytes) -> float:
+    client = AsyncTwelveLabs(api_key="benchmark", base_url=server.base_url)
+    semaphore = asyncio.Semaphore(workers)
+
+    async def put(url: str) -> None:
+        async with semaphore:
+            if pooled:
+                await client.multipart_upload._upload_chunk_to_s3_async(data, url)
+            else:
+                await _put_fresh_connection_async(url, data)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(put(server.presigned_url("benchmark", i)) for i in range(1, chunks + 1)))
+    elapsed = time.perf_counter() - start
+    await client.aclose()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--chunk-kb", type=int, default=4)
+    args = parser.parse_args()
+    data = os.urandom(args.chunk_kb * 1024)
+
+    print(f"{args.chunks} chunks of {args.chunk_kb} KB, {args.workers} workers")
+    print(f"{'variant':<22}{'wall (s)':>10}{'connections':>14}")
+    variants: typing.List[typing.Tuple[str, typing.Callable[[StubServer], float]]] = [
+        ("sync, per-chunk", lambda s: _run_sync(s, False, args.chunks, args.workers, data)),
+        ("sync, pooled", lambda s: _run_sync(s, True, args.chunks, args.workers, data)),
+        ("async, per-chunk", lambda s: asyncio.run(_run_async(s, False, args.chunks, args.workers, data))),
+        ("async, pooled", lambda s: asyncio.run(_run_async(s, True, args.chunks, args.workers, data))),
+    ]
+    for name, run in variants:
+        with StubServer(chunk_size=len(data)) as server:
+            elapsed = run(server)
+            print(f"{name:<22}{elapsed:>10.2f}{server.connections:>14}")
+
+
+if __name__ == "__main__":
+    main()
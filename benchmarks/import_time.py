@@ -0,0 +1,81 @@
+"""
+Measure cold-start import cost of the SDK with ``python -X importtime``, and fail when it regresses.
+
+Each scenario runs in a fresh interpreter. The generated package is imported eagerly, so the budget applies to the
+hand-written ``twelvelabs.wrapper`` modules, which are only imported with the resource client that needs them. The
+number loaded is deterministic; wall times and the total number of ``twelvelabs`` modules are reported for
+information only.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --repeat 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import typing
+
+# (name, statement, maximum number of twelvelabs.wrapper modules it may import)
+SCENARIOS: typing.List[typing.Tuple[str, str, int]] = [
+    ("import twelvelabs", "import twelvelabs", 0),
+    ("client", "from twelvelabs import TwelveLabs; TwelveLabs(api_key='x')", 0),
+    ("client.search", "from twelvelabs import TwelveLabs; TwelveLabs(api_key='x').search", 8),
+    ("client.embed", "from twelvelabs import TwelveLabs; TwelveLabs(api_key='x').embed", 8),
+]
+
+
+def _measure(statement: str) -> typing.Tuple[float, int, int]:
+    """
+    Returns the cumulative import time in ms, the number of twelvelabs modules imported and how many of them are
+    twelvelabs.wrapper modules.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        check=True,
+        universal_newlines=True,
+    )
+    total_us = 0
+    modules = 0
+    wrapper_modules = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        if name.strip().startswith("twelvelabs"):
+            modules += 1
+        if name.strip().startswith("twelvelabs.wrapper"):
+            wrapper_modules += 1
+        # Top-level imports are not indented beyond the single separating space
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative)
+    return total_us / 1000, modules, wrapper_modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<36}{'import (ms)':>14}{'modules':>10}{'wrapper':>10}{'budget':>10}")
+    failed = []
+    for name, statement, budget in SCENARIOS:
+        runs = [_measure(statement) for _ in range(args.repeat)]
+        elapsed = statistics.median(run[0] for run in runs)
+        _, modules, wrapper_modules = runs[0]
+        print(f"{name:<36}{elapsed:>14.1f}{modules:>10}{wrapper_modules:>10}{budget:>10}")
+        if wrapper_modules > budget:
+            failed.append(name)
+
+    if failed:
+        print(f"Import budget exceeded for: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
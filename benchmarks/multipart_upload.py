@@ -0,0 +1,109 @@
+"""
+Compare wall time, peak RSS and extra disk usage of ``multipart_upload.upload_file`` against the previous
+split-then-upload approach, which copied the whole file into a ``<stem>_chunks/`` directory first.
+
+The split-then-upload variant is reproduced here by writing the chunk files exactly as the old
+``_split_file`` did before running the upload, so both variants move the same bytes over the network.
+Each variant runs in a fresh subprocess so peak RSS is measured independently.
+
+Usage:
+    python benchmarks/multipart_upload.py --size-mb 512 --chunk-mb 16
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from _stub_server import StubServer  # noqa: E402
+
+
+def _peak_rss_mb() -> float:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _split_file(file_path: Path, chunk_size: int) -> int:
+    """Reproduces the removed ``_split_file`` helper and returns the bytes written to disk."""
+    chunk_dir = file_path.parent / f"{file_path.stem}_chunks"
+    chunk_dir.mkdir(exist_ok=True)
+    written = 0
+    with open(file_path, "rb") as f:
+        chunk_num = 1
+        while True:
+            chunk_data = f.read(chunk_size)
+            if not chunk_data:
+                break
+            with open(chunk_dir / f"chunk_{chunk_num:04d}", "wb") as chunk_f:
+                chunk_f.write(chunk_data)
+            written += len(chunk_data)
+            chunk_num += 1
+    return written
+
+
+def _run_variant(variant: str, file_path: Path, chunk_size: int, max_workers: int) -> typing.Dict[str, float]:
+    from twelvelabs import TwelveLabs
+
+    with StubServer(chunk_size=chunk_size) as server:
+        client = TwelveLabs(api_key="benchmark", base_url=server.base_url)
+        extra_disk = 0
+        start = time.perf_counter()
+        if variant == "split":
+            extra_disk = _split_file(file_path, chunk_size)
+        client.multipart_upload.upload_file(file_path, max_workers=max_workers)
+        elapsed = time.perf_counter() - start
+        shutil.rmtree(file_path.parent / f"{file_path.stem}_chunks", ignore_errors=True)
+
+    return {"wall_s": elapsed, "peak_rss_mb": _peak_rss_mb(), "extra_disk_mb": extra_disk / (1024 * 1024)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--chunk-mb", type=int, default=16)
+    parser.add_argument("--max-workers", type=int, default=5)
+    parser.add_argument("--variant", choices=["split", "offset"], help=argparse.SUPPRESS)
+    parser.add_argument("--file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    chunk_size = args.chunk_mb * 1024 * 1024
+
+    if args.variant:
+        result = _run_variant(args.variant, Path(args.file), chunk_size, args.max_workers)
+        print(json.dumps(result))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = Path(tmp) / "video.bin"
+        with open(file_path, "wb") as f:
+            for _ in range(args.size_mb):
+                f.write(os.urandom(1024 * 1024))
+
+        print(f"file: {args.size_mb} MB, chunk: {args.chunk_mb} MB, workers: {args.max_workers}")
+        print(f"{'variant':<10}{'wall (s)':>12}{'peak RSS (MB)':>16}{'extra disk (MB)':>18}")
+        for variant in ["split", "offset"]:
+            output = subprocess.check_output(
+                [sys.executable, __file__, "--variant", variant, "--file", str(file_path)]
+                + ["--size-mb", str(args.size_mb), "--chunk-mb", str(args.chunk_mb)]
+                + ["--max-workers", str(args.max_workers)]
+            )
+            result = json.loads(output.decode().strip().splitlines()[-1])
+            print(
+                f"{variant:<10}{result['wall_s']:>12.2f}{result['peak_rss_mb']:>16.1f}{result['extra_disk_mb']:>18.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Time decoding and validating large embedding and search responses, the two payloads where the SDK's own
+parsing overhead (as opposed to network time) is most visible, with each available JSON backend.
+
+Usage:
+    python benchmarks/parse_large_responses.py --segments 200 --dim 1024 --search-items 500
+"""
+
+import argparse
+import json
+import random
+import time
+import typing
+
+from twelvelabs.core.json_backend import JsonBackend, get_json_backend, parse_json_as
+from twelvelabs.types.embedding_success_response import EmbeddingSuccessResponse
+from twelvelabs.types.search_results import SearchResults
+
+
+def _embedding_body(segments: int, dim: int) -> str:
+    return json.dumps(
+        {
+            "data": [
+                {
+                    "embedding": [random.uniform(-1, 1) for _ in range(dim)],
+                    "embedding_option": "visual",
+                    "embedding_scope": "clip",
+                    "start_sec": i * 6.0,
+                    "end_sec": (i + 1) * 6.0,
+                }
+                for i in range(segments)
+            ]
+        }
+    )
+
+
+def _search_body(items: int) -> str:
+    return json.dumps(
+        {
+            "data": [
+                {
+                    "start": i * 2.5,
+                    "end": i * 2.5 + 8.0,
+                    "video_id": f"{i:024x}",
+                    "rank": i + 1,
+                    "thumbnail_url": f"https://thumbnails.example.com/{i}.jpg",
+                    "transcription": "Someone is talking about the weather in the park. " * 4,
+                    "user_metadata": {"category": "outdoor", "index": i},
+                }
+                for i in range(items)
+            ],
+            "page_info": {"limit_per_page": items, "total_results": items, "page_expires_at": "2026-01-01T00:00:00Z"},
+        }
+    )
+
+
+def _backends() -> typing.List[JsonBackend]:
+    backends = []
+    for name in ("stdlib", "orjson", "pydantic_core"):
+        try:
+            backends.append(get_json_backend(name))  # type: ignore[arg-type]
+        except ImportError:
+            print(f"{name} backend is not available, skipping")
+    return backends
+
+
+def _time(type_: typing.Any, body: bytes, backend: JsonBackend, repeat: int) -> float:
+    # Warm up so adapter construction isn't counted
+    parse_json_as(type_=type_, json_=body, json_backend=backend)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_json_as(type_=type_, json_=body, json_backend=backend)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--segments", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--search-items", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    bodies = [
+        (
+            f"EmbeddingSuccessResponse ({args.segments}x{args.dim})",
+            EmbeddingSuccessResponse,
+            _embedding_body(args.segments, args.dim).encode(),
+        ),
+        (f"SearchResults ({args.search_items} items)", SearchResults, _search_body(args.search_items).encode()),
+    ]
+    backends = _backends()
+    print(f"{'response':<42}{'body (MB)':>12}{'backend':>16}{'parse (ms)':>12}")
+    for name, type_, body in bodies:
+        for backend in backends:
+            elapsed = _time(type_, body, backend, args.repeat)
+            print(f"{name:<42}{len(body) / 1e6:>12.1f}{backend.name:>16}{elapsed * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
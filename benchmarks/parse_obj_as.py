@@ -0,0 +1,77 @@
+"""
+Measure the per-line cost of parsing a large ``analyze.batches.results`` JSONL stream into ``BatchResultItem``
+objects, building a fresh ``pydantic.TypeAdapter`` for every line (the previous ``parse_obj_as`` behavior)
+versus reusing the adapter cached by ``parse_obj_as``.
+
+Building an adapter for a model class is cheap because pydantic reuses the model's own validator; the
+savings are largest for generic targets such as ``Optional[...]`` or ``List[...]``, which get a freshly
+compiled validator every time. Both are measured.
+
+Usage:
+    python benchmarks/parse_obj_as.py --lines 100000
+"""
+
+import argparse
+import json
+import time
+import typing
+
+import pydantic
+
+from twelvelabs.core.pydantic_utilities import parse_obj_as
+from twelvelabs.core.serialization import convert_and_respect_annotation_metadata
+from twelvelabs.types.batch_result_item import BatchResultItem
+
+
+def _make_lines(count: int) -> typing.List[str]:
+    lines = []
+    for i in range(count):
+        item: typing.Dict[str, typing.Any] = {"task_id": f"{i:024x}", "custom_id": f"summary-{i:06d}"}
+        if i % 10 == 0:
+            item.update(status="failed", error={"code": "asset_unavailable", "message": "The asset could not be read."})
+        else:
+            item.update(
+                status="ready",
+                data={
+                    "generation_id": f"gen-{i}",
+                    "data": "A short summary of the video. " * 8,
+                    "finish_reason": "stop",
+                    "usage": {"output_tokens": 64, "input_tokens": 1024},
+                },
+            )
+        lines.append(json.dumps(item))
+    return lines
+
+
+def _parse_uncached(type_: typing.Any, line: str) -> typing.Any:
+    dealiased = convert_and_respect_annotation_metadata(object_=json.loads(line), annotation=type_, direction="read")
+    return pydantic.TypeAdapter(type_).validate_python(dealiased)
+
+
+def _parse_cached(type_: typing.Any, line: str) -> typing.Any:
+    return parse_obj_as(type_=type_, object_=json.loads(line))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=100_000)
+    args = parser.parse_args()
+    lines = _make_lines(args.lines)
+
+    print(f"{args.lines} BatchResultItem lines")
+    print(f"{'target type':<34}{'variant':<20}{'total (s)':>12}{'per line (us)':>16}")
+    targets: typing.List[typing.Tuple[str, typing.Any]] = [
+        ("BatchResultItem", BatchResultItem),
+        ("Optional[BatchResultItem]", typing.Optional[BatchResultItem]),
+    ]
+    for type_name, type_ in targets:
+        for name, parse in [("adapter per line", _parse_uncached), ("cached adapter", _parse_cached)]:
+            start = time.perf_counter()
+            for line in lines:
+                parse(type_, line)
+            elapsed = time.perf_counter() - start
+            print(f"{type_name:<34}{name:<20}{elapsed:>12.2f}{elapsed / len(lines) * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
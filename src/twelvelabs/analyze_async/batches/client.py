@@ -1,7 +1,10 @@
 # This file was auto-generated by Fern from our API Definition.
 
+import asyncio
+import time
 import typing
 
+import httpx
 from ...core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
 from ...core.pagination import AsyncPager, SyncPager
 from ...core.request_options import RequestOptions
@@ -22,6 +25,7 @@ OMIT = typing.cast(typing.Any, ...)
 
 class BatchesClient:
     def __init__(self, *, client_wrapper: SyncClientWrapper):
+        self._client_wrapper = client_wrapper
         self._raw_client = RawBatchesClient(client_wrapper=client_wrapper)
 
     @property
@@ -303,7 +307,7 @@ class BatchesClient:
         return _response.data
 
     def results(
-        self, batch_id: str, *, request_options: typing.Optional[RequestOptions] = None
+        self, batch_id: str, *, resume: bool = False, request_options: typing.Optional[RequestOptions] = None
     ) -> typing.Iterator[BatchResultItem]:
         """
         Use this method to retrieve the results for each item in a batch. You can call it while the batch has the `pending` or `processing` status.
@@ -319,6 +323,9 @@ class BatchesClient:
         batch_id : str
             The unique identifier of the batch.
 
+        resume : bool
+            Whether to reconnect when the connection drops mid-stream, skipping the result entries that were already yielded. Reconnects follow the client's retry policy. Resuming relies on the platform returning the result entries in the same order on every request.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -349,8 +356,40 @@ class BatchesClient:
         for chunk in response:
             yield chunk
         """
-        with self._raw_client.results(batch_id, request_options=request_options) as r:
-            yield from r.data
+        if not resume:
+            with self._raw_client.results(batch_id, request_options=request_options) as r:
+                yield from r.data
+            return
+
+        retry_policy = self._client_wrapper.httpx_client.get_retry_policy(request_options)
+        delivered = 0
+        delivered_at_last_disconnect = 0
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            to_skip = delivered
+            try:
+                with self._raw_client.results(batch_id, request_options=request_options) as r:
+                    for _chunk in r.data:
+                        if to_skip > 0:
+                            to_skip -= 1
+                            continue
+                        delivered += 1
+                        yield _chunk
+                return
+            except httpx.TransportError as e:
+                # The retry budget applies to each disconnect, not to the whole stream
+                if delivered > delivered_at_last_disconnect:
+                    delivered_at_last_disconnect = delivered
+                    started_at = time.monotonic()
+                    attempt = 0
+                delay = retry_policy.get_retry_delay(
+                    method="GET", attempt=attempt, elapsed=time.monotonic() - started_at, error=e
+                )
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
 
     def cancel(
         self, batch_id: str, *, request_options: typing.Optional[RequestOptions] = None
@@ -394,6 +433,7 @@ class BatchesClient:
 
 class AsyncBatchesClient:
     def __init__(self, *, client_wrapper: AsyncClientWrapper):
+        self._client_wrapper = client_wrapper
         self._raw_client = AsyncRawBatchesClient(client_wrapper=client_wrapper)
 
     @property
@@ -708,7 +748,7 @@ class AsyncBatchesClient:
         return _response.data
 
     async def results(
-        self, batch_id: str, *, request_options: typing.Optional[RequestOptions] = None
+        self, batch_id: str, *, resume: bool = False, request_options: typing.Optional[RequestOptions] = None
     ) -> typing.AsyncIterator[BatchResultItem]:
         """
         Use this method to retrieve the results for each item in a batch. You can call it while the batch has the `pending` or `processing` status.
@@ -724,6 +764,9 @@ class AsyncBatchesClient:
         batch_id : str
             The unique identifier of the batch.
 
+        resume : bool
+            Whether to reconnect when the connection drops mid-stream, skipping the result entries that were already yielded. Reconnects follow the client's retry policy. Resuming relies on the platform returning the result entries in the same order on every request.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -762,9 +805,41 @@ class AsyncBatchesClient:
 
         asyncio.run(main())
         """
-        async with self._raw_client.results(batch_id, request_options=request_options) as r:
-            async for _chunk in r.data:
-                yield _chunk
+        if not resume:
+            async with self._raw_client.results(batch_id, request_options=request_options) as r:
+                async for _chunk in r.data:
+                    yield _chunk
+            return
+
+        retry_policy = self._client_wrapper.httpx_client.get_retry_policy(request_options)
+        delivered = 0
+        delivered_at_last_disconnect = 0
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            to_skip = delivered
+            try:
+                async with self._raw_client.results(batch_id, request_options=request_options) as r:
+                    async for _chunk in r.data:
+                        if to_skip > 0:
+                            to_skip -= 1
+                            continue
+                        delivered += 1
+                        yield _chunk
+                return
+            except httpx.TransportError as e:
+                # The retry budget applies to each disconnect, not to the whole stream
+                if delivered > delivered_at_last_disconnect:
+                    delivered_at_last_disconnect = delivered
+                    started_at = time.monotonic()
+                    attempt = 0
+                delay = retry_policy.get_retry_delay(
+                    method="GET", attempt=attempt, elapsed=time.monotonic() - started_at, error=e
+                )
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
 
     async def cancel(
         self, batch_id: str, *, request_options: typing.Optional[RequestOptions] = None
@@ -1,15 +1,25 @@
-import typing
 import os
+import typing
+
+import httpx
+from .base_client import AsyncBaseClient, BaseClient
+from .core.json_backend import JsonBackend, JsonBackendName, get_json_backend
+from .core.rate_limiter import RateLimiter
+from .core.response_cache import ResponseCache
+from .core.retry_policy import RetryPolicy
 
-from .base_client import BaseClient, AsyncBaseClient
-from .wrapper.search_client_wrapper import SearchClientWrapper, AsyncSearchClientWrapper
-from .wrapper.task_client_wrapper import TaskClientWrapper, AsyncTaskClientWrapper
-from .wrapper.embed_client_wrapper import EmbedClientWrapper, AsyncEmbedClientWrapper
-from .wrapper.index_client_wrapper import (
-    IndexesClientWrapper,
-    AsyncIndexesClientWrapper,
-)
-from .wrapper.multipart_upload_client_wrapper import MultipartUploadClientWrapper, AsyncMultipartUploadClientWrapper
+if typing.TYPE_CHECKING:
+    from .wrapper.embed_client_wrapper import AsyncEmbedClientWrapper, EmbedClientWrapper
+    from .wrapper.index_client_wrapper import (
+        AsyncIndexesClientWrapper,
+        IndexesClientWrapper,
+    )
+    from .wrapper.multipart_upload_client_wrapper import (
+        AsyncMultipartUploadClientWrapper,
+        MultipartUploadClientWrapper,
+    )
+    from .wrapper.search_client_wrapper import AsyncSearchClientWrapper, SearchClientWrapper
+    from .wrapper.task_client_wrapper import AsyncTaskClientWrapper, TaskClientWrapper
 
 OMIT = typing.cast(typing.Any, ...)
 
@@ -19,6 +29,12 @@ class TwelveLabs(BaseClient):
         self,
         *,
         api_key: typing.Optional[str] = None,
+        upload_httpx_client: typing.Optional[httpx.Client] = None,
+        json_backend: typing.Optional[typing.Union[JsonBackendName, JsonBackend]] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
         **kwargs,
     ):
         """
@@ -29,6 +45,24 @@ class TwelveLabs(BaseClient):
         api_key : str, optional
             The API key for authentication with TwelveLabs API.
             If not provided, the TWELVE_LABS_API_KEY environment variable will be used.
+        upload_httpx_client : httpx.Client, optional
+            The httpx client used to upload multipart chunks to their presigned URLs.
+            By default a pooled client is created on first use and shared by all uploads of this client.
+        json_backend : str or JsonBackend, optional
+            The JSON decoder used for response bodies: "stdlib" (default), "orjson", "pydantic_core", or "auto"
+            to pick the fastest one installed. A `JsonBackend` instance can be passed to plug in another decoder.
+        retry_policy : RetryPolicy, optional
+            When and how failed requests are retried, including connection errors and timeouts.
+            Defaults to `RetryPolicy()`, which retries up to twice. Can be overridden per call with `request_options`.
+        rate_limiter : RateLimiter, optional
+            Spaces out requests on the client side, per endpoint group, before they are sent.
+            The same limiter can be passed to several clients to share one budget. By default, requests are not limited.
+        response_cache : ResponseCache, optional
+            Caches GET responses in memory or on disk, and revalidates them with their ETag once they expire.
+            By default, nothing is cached.
+        coalesce_requests : bool, optional
+            Whether concurrent identical GET requests share one HTTP call and its response, instead of each
+            downloading the same body. Defaults to False.
         **kwargs : dict
             Additional parameters to pass to the BaseClient
         """
@@ -38,19 +72,103 @@ class TwelveLabs(BaseClient):
         if os.getenv("TWELVELABS_BASE_URL"):
             kwargs["base_url"] = os.getenv("TWELVELABS_BASE_URL")
 
+        # An httpx client passed in by the caller is left open for the caller to close
+        self._owns_httpx_client = kwargs.get("httpx_client") is None
         super().__init__(**kwargs)
+        self._client_wrapper.json_backend = get_json_backend(json_backend)
+        if retry_policy is not None:
+            self._client_wrapper.retry_policy = retry_policy
+        self._client_wrapper.rate_limiter = rate_limiter
+        self._client_wrapper.response_cache = response_cache
+        self._client_wrapper.coalesce_requests = coalesce_requests
+
+        self._upload_httpx_client = upload_httpx_client
+        # The base client assigns its generated resource clients through the setters below; drop them so the
+        # wrappers are created instead.
+        self._search: typing.Optional["SearchClientWrapper"] = None
+        self._tasks: typing.Optional["TaskClientWrapper"] = None
+        self._embed: typing.Optional["EmbedClientWrapper"] = None
+        self._indexes: typing.Optional["IndexesClientWrapper"] = None
+        self._multipart_upload: typing.Optional["MultipartUploadClientWrapper"] = None
+
+    # The wrapped resource clients are created on first access, so that only the wrapper modules a program
+    # actually uses get imported.
+    @property  # type: ignore[override]
+    def search(self) -> "SearchClientWrapper":
+        if self._search is None:
+            from .wrapper.search_client_wrapper import SearchClientWrapper
+
+            self._search = SearchClientWrapper(client_wrapper=self._client_wrapper)
+        return self._search
+
+    @search.setter
+    def search(self, value: "SearchClientWrapper") -> None:
+        self._search = value
+
+    @property  # type: ignore[override]
+    def tasks(self) -> "TaskClientWrapper":
+        if self._tasks is None:
+            from .wrapper.task_client_wrapper import TaskClientWrapper
+
+            self._tasks = TaskClientWrapper(client_wrapper=self._client_wrapper)
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, value: "TaskClientWrapper") -> None:
+        self._tasks = value
+
+    @property  # type: ignore[override]
+    def embed(self) -> "EmbedClientWrapper":
+        if self._embed is None:
+            from .wrapper.embed_client_wrapper import EmbedClientWrapper
+
+            self._embed = EmbedClientWrapper(client_wrapper=self._client_wrapper)
+        return self._embed
+
+    @embed.setter
+    def embed(self, value: "EmbedClientWrapper") -> None:
+        self._embed = value
+
+    @property  # type: ignore[override]
+    def indexes(self) -> "IndexesClientWrapper":
+        if self._indexes is None:
+            from .wrapper.index_client_wrapper import IndexesClientWrapper
+
+            self._indexes = IndexesClientWrapper(client_wrapper=self._client_wrapper)
+        return self._indexes
+
+    @indexes.setter
+    def indexes(self, value: "IndexesClientWrapper") -> None:
+        self._indexes = value
+
+    @property  # type: ignore[override]
+    def multipart_upload(self) -> "MultipartUploadClientWrapper":
+        if self._multipart_upload is None:
+            from .wrapper.multipart_upload_client_wrapper import MultipartUploadClientWrapper
+
+            self._multipart_upload = MultipartUploadClientWrapper(
+                client_wrapper=self._client_wrapper, upload_httpx_client=self._upload_httpx_client
+            )
+        return self._multipart_upload
 
-        self.search = SearchClientWrapper(client_wrapper=self._client_wrapper)
-        self.tasks = TaskClientWrapper(client_wrapper=self._client_wrapper)
-        self.embed = EmbedClientWrapper(client_wrapper=self._client_wrapper)
-        self.indexes = IndexesClientWrapper(client_wrapper=self._client_wrapper)
-        self.multipart_upload = MultipartUploadClientWrapper(client_wrapper=self._client_wrapper)
+    @multipart_upload.setter
+    def multipart_upload(self, value: "MultipartUploadClientWrapper") -> None:
+        self._multipart_upload = value
+
+    def close(self) -> None:
+        """Release the connections held by the client and its upload connection pool, if the client created them."""
+        # `multipart_upload` may have been replaced with a client that has no pool to close
+        close_uploads = getattr(self._multipart_upload, "close", None)
+        if close_uploads is not None:
+            close_uploads()
+        if self._owns_httpx_client:
+            self._client_wrapper.httpx_client.httpx_client.close()
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        pass
+        self.close()
 
 
 class AsyncTwelveLabs(AsyncBaseClient):
@@ -58,6 +176,12 @@ class AsyncTwelveLabs(AsyncBaseClient):
         self,
         *,
         api_key: typing.Optional[str] = None,
+        upload_httpx_client: typing.Optional[httpx.AsyncClient] = None,
+        json_backend: typing.Optional[typing.Union[JsonBackendName, JsonBackend]] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
         **kwargs,
     ):
         """
@@ -68,6 +192,24 @@ class AsyncTwelveLabs(AsyncBaseClient):
         api_key : str, optional
             The API key for authentication with TwelveLabs API.
             If not provided, the TWELVE_LABS_API_KEY environment variable will be used.
+        upload_httpx_client : httpx.AsyncClient, optional
+            The httpx client used to upload multipart chunks to their presigned URLs.
+            By default a pooled client is created on first use and shared by all uploads of this client.
+        json_backend : str or JsonBackend, optional
+            The JSON decoder used for response bodies: "stdlib" (default), "orjson", "pydantic_core", or "auto"
+            to pick the fastest one installed. A `JsonBackend` instance can be passed to plug in another decoder.
+        retry_policy : RetryPolicy, optional
+            When and how failed requests are retried, including connection errors and timeouts.
+            Defaults to `RetryPolicy()`, which retries up to twice. Can be overridden per call with `request_options`.
+        rate_limiter : RateLimiter, optional
+            Spaces out requests on the client side, per endpoint group, before they are sent.
+            The same limiter can be passed to several clients to share one budget. By default, requests are not limited.
+        response_cache : ResponseCache, optional
+            Caches GET responses in memory or on disk, and revalidates them with their ETag once they expire.
+            By default, nothing is cached.
+        coalesce_requests : bool, optional
+            Whether concurrent identical GET requests share one HTTP call and its response, instead of each
+            downloading the same body. Defaults to False.
         **kwargs : dict
             Additional parameters to pass to the AsyncBaseClient
         """
@@ -77,16 +219,98 @@ class AsyncTwelveLabs(AsyncBaseClient):
         if os.getenv("TWELVELABS_BASE_URL"):
             kwargs["base_url"] = os.getenv("TWELVELABS_BASE_URL")
 
+        # An httpx client passed in by the caller is left open for the caller to close
+        self._owns_httpx_client = kwargs.get("httpx_client") is None
         super().__init__(**kwargs)
+        self._client_wrapper.json_backend = get_json_backend(json_backend)
+        if retry_policy is not None:
+            self._client_wrapper.retry_policy = retry_policy
+        self._client_wrapper.rate_limiter = rate_limiter
+        self._client_wrapper.response_cache = response_cache
+        self._client_wrapper.coalesce_requests = coalesce_requests
+
+        self._upload_httpx_client = upload_httpx_client
+        # The base client assigns its generated resource clients through the setters below; drop them so the
+        # wrappers are created instead.
+        self._search: typing.Optional["AsyncSearchClientWrapper"] = None
+        self._tasks: typing.Optional["AsyncTaskClientWrapper"] = None
+        self._embed: typing.Optional["AsyncEmbedClientWrapper"] = None
+        self._indexes: typing.Optional["AsyncIndexesClientWrapper"] = None
+        self._multipart_upload: typing.Optional["AsyncMultipartUploadClientWrapper"] = None
+
+    @property  # type: ignore[override]
+    def search(self) -> "AsyncSearchClientWrapper":
+        if self._search is None:
+            from .wrapper.search_client_wrapper import AsyncSearchClientWrapper
+
+            self._search = AsyncSearchClientWrapper(client_wrapper=self._client_wrapper)
+        return self._search
+
+    @search.setter
+    def search(self, value: "AsyncSearchClientWrapper") -> None:
+        self._search = value
+
+    @property  # type: ignore[override]
+    def tasks(self) -> "AsyncTaskClientWrapper":
+        if self._tasks is None:
+            from .wrapper.task_client_wrapper import AsyncTaskClientWrapper
+
+            self._tasks = AsyncTaskClientWrapper(client_wrapper=self._client_wrapper)
+        return self._tasks
+
+    @tasks.setter
+    def tasks(self, value: "AsyncTaskClientWrapper") -> None:
+        self._tasks = value
+
+    @property  # type: ignore[override]
+    def embed(self) -> "AsyncEmbedClientWrapper":
+        if self._embed is None:
+            from .wrapper.embed_client_wrapper import AsyncEmbedClientWrapper
+
+            self._embed = AsyncEmbedClientWrapper(client_wrapper=self._client_wrapper)
+        return self._embed
+
+    @embed.setter
+    def embed(self, value: "AsyncEmbedClientWrapper") -> None:
+        self._embed = value
+
+    @property  # type: ignore[override]
+    def indexes(self) -> "AsyncIndexesClientWrapper":
+        if self._indexes is None:
+            from .wrapper.index_client_wrapper import AsyncIndexesClientWrapper
+
+            self._indexes = AsyncIndexesClientWrapper(client_wrapper=self._client_wrapper)
+        return self._indexes
+
+    @indexes.setter
+    def indexes(self, value: "AsyncIndexesClientWrapper") -> None:
+        self._indexes = value
+
+    @property  # type: ignore[override]
+    def multipart_upload(self) -> "AsyncMultipartUploadClientWrapper":
+        if self._multipart_upload is None:
+            from .wrapper.multipart_upload_client_wrapper import AsyncMultipartUploadClientWrapper
+
+            self._multipart_upload = AsyncMultipartUploadClientWrapper(
+                client_wrapper=self._client_wrapper, upload_httpx_client=self._upload_httpx_client
+            )
+        return self._multipart_upload
+
+    @multipart_upload.setter
+    def multipart_upload(self, value: "AsyncMultipartUploadClientWrapper") -> None:
+        self._multipart_upload = value
 
-        self.search = AsyncSearchClientWrapper(client_wrapper=self._client_wrapper)
-        self.tasks = AsyncTaskClientWrapper(client_wrapper=self._client_wrapper)
-        self.embed = AsyncEmbedClientWrapper(client_wrapper=self._client_wrapper)
-        self.indexes = AsyncIndexesClientWrapper(client_wrapper=self._client_wrapper)
-        self.multipart_upload = AsyncMultipartUploadClientWrapper(client_wrapper=self._client_wrapper)
+    async def aclose(self) -> None:
+        """Release the connections held by the client and its upload connection pool, if the client created them."""
+        # `multipart_upload` may have been replaced with a client that has no pool to close
+        close_uploads = getattr(self._multipart_upload, "aclose", None)
+        if close_uploads is not None:
+            await close_uploads()
+        if self._owns_httpx_client:
+            await self._client_wrapper.httpx_client.httpx_client.aclose()
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
-        pass
+        await self.aclose()
@@ -8,6 +8,7 @@ from .datetime_utils import serialize_datetime
 from .file import File, convert_file_dict_to_httpx_tuples, with_content_type
 from .http_client import AsyncHttpClient, HttpClient
 from .http_response import AsyncHttpResponse, HttpResponse
+from .json_backend import JsonBackend, get_json_backend, parse_json_as
 from .jsonable_encoder import jsonable_encoder
 from .pagination import AsyncPager, SyncPager
 from .pydantic_utilities import (
@@ -20,8 +21,11 @@ from .pydantic_utilities import (
     update_forward_refs,
 )
 from .query_encoder import encode_query
+from .rate_limiter import RateLimit, RateLimiter
 from .remove_none_from_dict import remove_none_from_dict
 from .request_options import RequestOptions
+from .response_cache import CacheBackend, MemoryCacheBackend, ResponseCache, SqliteCacheBackend
+from .retry_policy import RetryPolicy
 from .serialization import FieldMetadata, convert_and_respect_annotation_metadata
 
 __all__ = [
@@ -31,12 +35,20 @@ __all__ = [
     "AsyncHttpResponse",
     "AsyncPager",
     "BaseClientWrapper",
+    "CacheBackend",
     "FieldMetadata",
     "File",
     "HttpClient",
     "HttpResponse",
     "IS_PYDANTIC_V2",
+    "JsonBackend",
+    "MemoryCacheBackend",
+    "RateLimit",
+    "RateLimiter",
     "RequestOptions",
+    "ResponseCache",
+    "RetryPolicy",
+    "SqliteCacheBackend",
     "SyncClientWrapper",
     "SyncPager",
     "UniversalBaseModel",
@@ -44,7 +56,9 @@ __all__ = [
     "convert_and_respect_annotation_metadata",
     "convert_file_dict_to_httpx_tuples",
     "encode_query",
+    "get_json_backend",
     "jsonable_encoder",
+    "parse_json_as",
     "parse_obj_as",
     "remove_none_from_dict",
     "serialize_datetime",
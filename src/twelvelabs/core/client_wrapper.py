@@ -4,6 +4,10 @@ import typing
 
 import httpx
 from .http_client import AsyncHttpClient, HttpClient
+from .json_backend import JsonBackend, get_json_backend
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
 
 
 class BaseClientWrapper:
@@ -14,11 +18,21 @@ class BaseClientWrapper:
         headers: typing.Optional[typing.Dict[str, str]] = None,
         base_url: str,
         timeout: typing.Optional[float] = None,
+        json_backend: typing.Optional[JsonBackend] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
     ):
         self.api_key = api_key
         self._headers = headers
         self._base_url = base_url
         self._timeout = timeout
+        self.json_backend = json_backend if json_backend is not None else get_json_backend()
+        self.retry_policy = retry_policy if retry_policy is not None else DEFAULT_RETRY_POLICY
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        self.coalesce_requests = coalesce_requests
 
     def get_headers(self) -> typing.Dict[str, str]:
         headers: typing.Dict[str, str] = {
@@ -40,6 +54,21 @@ class BaseClientWrapper:
     def get_timeout(self) -> typing.Optional[float]:
         return self._timeout
 
+    def get_retry_policy(self) -> RetryPolicy:
+        return self.retry_policy
+
+    def get_rate_limiter(self) -> typing.Optional[RateLimiter]:
+        return self.rate_limiter
+
+    def get_response_cache(self) -> typing.Optional[ResponseCache]:
+        return self.response_cache
+
+    def get_coalesce_requests(self) -> bool:
+        return self.coalesce_requests
+
+    def get_json_backend(self) -> JsonBackend:
+        return self.json_backend
+
 
 class SyncClientWrapper(BaseClientWrapper):
     def __init__(
@@ -50,13 +79,33 @@ class SyncClientWrapper(BaseClientWrapper):
         base_url: str,
         timeout: typing.Optional[float] = None,
         httpx_client: httpx.Client,
+        json_backend: typing.Optional[JsonBackend] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
     ):
-        super().__init__(api_key=api_key, headers=headers, base_url=base_url, timeout=timeout)
+        super().__init__(
+            api_key=api_key,
+            headers=headers,
+            base_url=base_url,
+            timeout=timeout,
+            json_backend=json_backend,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            coalesce_requests=coalesce_requests,
+        )
         self.httpx_client = HttpClient(
             httpx_client=httpx_client,
             base_headers=self.get_headers,
             base_timeout=self.get_timeout,
             base_url=self.get_base_url,
+            base_retry_policy=self.get_retry_policy,
+            base_rate_limiter=self.get_rate_limiter,
+            base_response_cache=self.get_response_cache,
+            base_coalesce_requests=self.get_coalesce_requests,
+            base_json_backend=self.get_json_backend,
         )
 
 
@@ -69,11 +118,31 @@ class AsyncClientWrapper(BaseClientWrapper):
         base_url: str,
         timeout: typing.Optional[float] = None,
         httpx_client: httpx.AsyncClient,
+        json_backend: typing.Optional[JsonBackend] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        rate_limiter: typing.Optional[RateLimiter] = None,
+        response_cache: typing.Optional[ResponseCache] = None,
+        coalesce_requests: bool = False,
     ):
-        super().__init__(api_key=api_key, headers=headers, base_url=base_url, timeout=timeout)
+        super().__init__(
+            api_key=api_key,
+            headers=headers,
+            base_url=base_url,
+            timeout=timeout,
+            json_backend=json_backend,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            coalesce_requests=coalesce_requests,
+        )
         self.httpx_client = AsyncHttpClient(
             httpx_client=httpx_client,
             base_headers=self.get_headers,
             base_timeout=self.get_timeout,
             base_url=self.get_base_url,
+            base_retry_policy=self.get_retry_policy,
+            base_rate_limiter=self.get_rate_limiter,
+            base_response_cache=self.get_response_cache,
+            base_coalesce_requests=self.get_coalesce_requests,
+            base_json_backend=self.get_json_backend,
         )
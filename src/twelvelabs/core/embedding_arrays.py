@@ -0,0 +1,208 @@
+import array
+import dataclasses
+import importlib
+import math
+import typing
+
+from .json_backend import JsonBackend
+
+# One row of an embedding table: the vector, its start and end in seconds, its embedding option and its scope
+EmbeddingRow = typing.Tuple[
+    typing.Sequence[float], typing.Optional[float], typing.Optional[float], typing.Optional[str], typing.Optional[str]
+]
+
+
+def _import_numpy() -> typing.Any:
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+class Float32Matrix:
+    """
+    A row-major matrix of float32 values in one `array.array` buffer, used in place of a NumPy array when NumPy
+    is not installed. Rows are returned as `memoryview` slices of the buffer, without copying.
+    """
+
+    def __init__(self, buffer: "array.array[float]", dim: int) -> None:
+        if buffer.typecode != "f":
+            raise ValueError("buffer must hold float32 values")
+        if dim < 0 or (len(buffer) and (dim == 0 or len(buffer) % dim)):
+            raise ValueError("The buffer length must be a multiple of dim")
+        self.buffer = buffer
+        self.dim = dim
+
+    @property
+    def shape(self) -> typing.Tuple[int, int]:
+        return (len(self), self.dim)
+
+    def __len__(self) -> int:
+        return len(self.buffer) // self.dim if self.dim else 0
+
+    def __getitem__(self, index: int) -> memoryview:
+        rows = len(self)
+        if index < 0:
+            index += rows
+        if not 0 <= index < rows:
+            raise IndexError("row index out of range")
+        return memoryview(self.buffer)[index * self.dim : (index + 1) * self.dim]
+
+    def __iter__(self) -> typing.Iterator[memoryview]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def tolist(self) -> typing.List[typing.List[float]]:
+        return [typing.cast(typing.List[float], row.tolist()) for row in self]
+
+
+@dataclasses.dataclass(frozen=True)
+class EmbeddingArrays:
+    """
+    The embeddings of a response packed into contiguous arrays, at 4 bytes per dimension instead of a Python
+    float object per dimension.
+
+    `vectors` is an `(n_segments, dim)` float32 NumPy array, or a `Float32Matrix` when NumPy is not installed.
+    `start_sec` and `end_sec` are float64 NumPy arrays, or `array.array("d")`, with NaN where the response has
+    no offset, as for text and image embeddings.
+    """
+
+    vectors: typing.Any
+    start_sec: typing.Any
+    end_sec: typing.Any
+    embedding_option: typing.List[typing.Optional[str]]
+    embedding_scope: typing.List[typing.Optional[str]]
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+    def __len__(self) -> int:
+        return len(self.embedding_option)
+
+    def to_numpy(self) -> typing.Tuple[typing.Any, typing.Any, typing.Any]:
+        """Returns the vectors, start offsets and end offsets as NumPy arrays."""
+        numpy = _import_numpy()
+        if numpy is None:
+            raise ImportError("to_numpy requires NumPy. Install it with `pip install numpy`, or use to_arrays()")
+        if isinstance(self.vectors, Float32Matrix):
+            vectors = numpy.frombuffer(self.vectors.buffer, dtype=numpy.float32).reshape(self.vectors.shape)
+            start_sec = numpy.frombuffer(self.start_sec, dtype=numpy.float64)
+            end_sec = numpy.frombuffer(self.end_sec, dtype=numpy.float64)
+            return vectors, start_sec, end_sec
+        return self.vectors, self.start_sec, self.end_sec
+
+
+def pack_embeddings(rows: typing.Iterable[EmbeddingRow], *, use_numpy: typing.Optional[bool] = None) -> EmbeddingArrays:
+    """
+    Copies embedding rows into contiguous float32 arrays. NumPy arrays are returned when NumPy is installed,
+    unless `use_numpy` is False.
+    """
+    vectors: "array.array[float]" = array.array("f")
+    start_sec: "array.array[float]" = array.array("d")
+    end_sec: "array.array[float]" = array.array("d")
+    embedding_option: typing.List[typing.Optional[str]] = []
+    embedding_scope: typing.List[typing.Optional[str]] = []
+    dim: typing.Optional[int] = None
+    for vector, start, end, option, scope in rows:
+        if dim is None:
+            dim = len(vector)
+        elif len(vector) != dim:
+            raise ValueError(f"Embedding {len(embedding_option)} has {len(vector)} dimensions, expected {dim}")
+        vectors.extend(vector)
+        start_sec.append(math.nan if start is None else start)
+        end_sec.append(math.nan if end is None else end)
+        embedding_option.append(option)
+        embedding_scope.append(scope)
+
+    packed = EmbeddingArrays(
+        vectors=Float32Matrix(vectors, dim or 0),
+        start_sec=start_sec,
+        end_sec=end_sec,
+        embedding_option=embedding_option,
+        embedding_scope=embedding_scope,
+    )
+    if use_numpy is False or (use_numpy is None and _import_numpy() is None):
+        return packed
+    vectors_array, start_array, end_array = packed.to_numpy()
+    return dataclasses.replace(packed, vectors=vectors_array, start_sec=start_array, end_sec=end_array)
+
+
+def _get_row(item: typing.Any) -> EmbeddingRow:
+    # Embed v2 results name the vector `embedding` and the offsets `start_sec` and `end_sec`. Embed v1 segments
+    # name them `float` and `start_offset_sec` and `end_offset_sec`.
+    if isinstance(item, dict):
+        vector = item.get("embedding", item.get("float"))
+        start = item.get("start_sec", item.get("start_offset_sec"))
+        end = item.get("end_sec", item.get("end_offset_sec"))
+        return vector or [], start, end, item.get("embedding_option"), item.get("embedding_scope")
+    vector = getattr(item, "embedding", None)
+    if vector is None:
+        vector = getattr(item, "float_", None)
+    start = getattr(item, "start_sec", getattr(item, "start_offset_sec", None))
+    end = getattr(item, "end_sec", getattr(item, "end_offset_sec", None))
+    return vector or [], start, end, getattr(item, "embedding_option", None), getattr(item, "embedding_scope", None)
+
+
+def _get_items(result: typing.Any) -> typing.Iterable[typing.Any]:
+    # Embed v2 responses and task results hold their embeddings in `data`, embed v1 results in `segments`
+    if result is None:
+        return []
+    if isinstance(result, dict):
+        return result.get("data", result.get("segments")) or []
+    if isinstance(result, (list, tuple)):
+        return result
+    items = getattr(result, "data", None)
+    if items is None:
+        items = getattr(result, "segments", None)
+    return items if items is not None else result
+
+
+def to_embedding_arrays(result: typing.Any, *, use_numpy: typing.Optional[bool] = None) -> EmbeddingArrays:
+    """
+    Packs embeddings into `EmbeddingArrays`. `result` is an embed v2 response or task result, an embed v1
+    result with `segments`, or an iterable of embedding results or segments, as SDK models or decoded JSON.
+    Call `to_numpy()` on the result for NumPy arrays.
+
+    Examples
+    --------
+    from twelvelabs.core.embedding_arrays import to_embedding_arrays
+
+    response = client.embed.v_2.create(input_type="text", model_name="marengo3.0", text={"input_text": "goal"})
+    vectors, start_sec, end_sec = to_embedding_arrays(response).to_numpy()
+    """
+    return pack_embeddings((_get_row(item) for item in _get_items(result)), use_numpy=use_numpy)
+
+
+# The scanner is fed this many bytes at a time, so that the segments it returns are released as they are packed
+_SCAN_CHUNK_SIZE = 64 * 1024
+
+
+def parse_embedding_arrays(
+    json_: typing.Union[str, bytes],
+    *,
+    path: typing.Sequence[str] = ("data",),
+    json_backend: typing.Optional[JsonBackend] = None,
+    use_numpy: typing.Optional[bool] = None,
+) -> EmbeddingArrays:
+    """
+    Decodes an embedding response body straight into `EmbeddingArrays`, without building SDK models. The
+    array at `path` is scanned one segment at a time, so only one segment is held as Python floats while its
+    vector is copied into the float32 buffer. `path` is `("data",)` for embed v2 responses, `("segments",)` for
+    embed v1 results, and `()` for a body that is the array itself.
+    """
+    # embedding_stream builds on this module, so the scanner is imported when it is used
+    from .embedding_stream import JsonArrayScanner, _loads
+
+    body = json_.encode("utf-8") if isinstance(json_, str) else json_
+    scanner = JsonArrayScanner(path)
+
+    def rows() -> typing.Iterator[EmbeddingRow]:
+        view = memoryview(body)
+        for start in range(0, len(body), _SCAN_CHUNK_SIZE):
+            for item in scanner.feed(bytes(view[start : start + _SCAN_CHUNK_SIZE])):
+                yield _get_row(_loads(item, json_backend))
+            if scanner.done:
+                return
+
+    return pack_embeddings(rows(), use_numpy=use_numpy)
@@ -0,0 +1,322 @@
+import json
+import re
+import typing
+
+import httpx
+from .api_error import ApiError
+from .client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from .embedding_arrays import EmbeddingArrays, _get_row, pack_embeddings
+from .json_backend import JsonBackend, parse_json_as
+from .request_options import RequestOptions
+
+T = typing.TypeVar("T")
+
+# Where each endpoint puts its embeddings in the response body
+EMBED_V2_PATH: typing.Tuple[str, ...] = ("data",)
+VIDEO_EMBEDDING_PATH: typing.Tuple[str, ...] = ("embedding", "video_embedding", "segments")
+
+# Outside strings, only these characters change the structure. Numbers, commas and whitespace are skipped in
+# one regex search, so the long runs of floats in an embedding never go through the Python loop.
+_STRUCTURAL = re.compile(rb'["\[\]{}:]')
+_STRING_END = re.compile(rb'["\\]')
+# Longer strings can't be keys of the path, so they aren't kept
+_MAX_KEY_LENGTH = 64
+
+
+class JsonArrayScanner:
+    """
+    Finds the array at `path` in a JSON document fed to it in chunks, and returns each object of the array as
+    soon as its closing brace arrives. Only the unfinished object is buffered, so the memory used depends on
+    the size of one segment, not on the size of the body.
+
+    The scanner doesn't validate the document. Each returned object is decoded on its own, which catches a
+    malformed segment.
+    """
+
+    def __init__(self, path: typing.Sequence[str]) -> None:
+        self.path = tuple(path)
+        # Set once the array has been read to its closing bracket
+        self.done = False
+        self._buffer = bytearray()
+        self._pos = 0
+        self._in_string = False
+        self._string_start = 0
+        self._last_string: typing.Optional[bytes] = None
+        self._key: typing.Optional[str] = None
+        # The opening characters of the open containers, and the keys of all but the outermost one
+        self._stack: typing.List[int] = []
+        self._keys: typing.List[typing.Optional[str]] = []
+        self._item_start: typing.Optional[int] = None
+        self._item_depth = 0
+
+    def _in_array(self) -> bool:
+        return bool(self._stack) and self._stack[-1] == ord("[") and tuple(self._keys) == self.path
+
+    def feed(self, chunk: bytes) -> typing.List[bytes]:
+        """Adds the next chunk of the body, and returns the objects of the array it completes."""
+        items: typing.List[bytes] = []
+        if self.done:
+            return items
+        buffer = self._buffer
+        buffer += chunk
+        pos = self._pos
+        while True:
+            if self._in_string:
+                match = _STRING_END.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                index = match.start()
+                if buffer[index] == ord("\\"):
+                    if index + 1 >= len(buffer):
+                        # Wait for the escaped character
+                        pos = index
+                        break
+                    pos = index + 2
+                    continue
+                self._in_string = False
+                length = index - self._string_start - 1
+                self._last_string = bytes(buffer[self._string_start + 1 : index]) if length <= _MAX_KEY_LENGTH else None
+                pos = index + 1
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            index = match.start()
+            char = buffer[index]
+            pos = index + 1
+            if char == ord('"'):
+                self._in_string = True
+                self._string_start = index
+            elif char == ord(":"):
+                self._key = self._last_string.decode("utf-8", errors="replace") if self._last_string else None
+            elif char == ord("{") or char == ord("["):
+                if char == ord("{") and self._item_start is None and self._in_array():
+                    self._item_start = index
+                    self._item_depth = len(self._stack)
+                if self._stack:
+                    self._keys.append(self._key if self._stack[-1] == ord("{") else None)
+                self._stack.append(char)
+                self._key = None
+            elif char == ord("}") or char == ord("]"):
+                if not self._stack:
+                    continue
+                closes_array = char == ord("]") and self._item_start is None and self._in_array()
+                self._stack.pop()
+                if self._keys:
+                    self._keys.pop()
+                self._key = None
+                if closes_array:
+                    self.done = True
+                    break
+                if self._item_start is not None and len(self._stack) == self._item_depth:
+                    items.append(bytes(buffer[self._item_start : index + 1]))
+                    self._item_start = None
+
+        # Drop what has been scanned, keeping the unfinished object or string
+        keep = pos
+        if self._item_start is not None:
+            keep = min(keep, self._item_start)
+        if self._in_string:
+            keep = min(keep, self._string_start)
+        if self.done:
+            keep = len(buffer)
+        del buffer[:keep]
+        self._pos = pos - keep
+        if self._item_start is not None:
+            self._item_start -= keep
+        if self._in_string:
+            self._string_start -= keep
+        return items
+
+
+def _parse_item(item: bytes, type_: typing.Type[T], json_backend: typing.Optional[JsonBackend]) -> T:
+    return parse_json_as(type_=type_, json_=item, json_backend=json_backend)
+
+
+def _loads(item: bytes, json_backend: typing.Optional[JsonBackend]) -> typing.Any:
+    return json_backend.loads(item) if json_backend is not None else json.loads(item)
+
+
+def iter_embeddings(
+    chunks: typing.Iterable[bytes],
+    *,
+    type_: typing.Type[T],
+    path: typing.Sequence[str],
+    json_backend: typing.Optional[JsonBackend] = None,
+) -> typing.Iterator[T]:
+    """Decodes the embeddings at `path` one by one as the chunks of the body arrive."""
+    scanner = JsonArrayScanner(path)
+    for chunk in chunks:
+        for item in scanner.feed(chunk):
+            yield _parse_item(item, type_, json_backend)
+        if scanner.done:
+            return
+
+
+def iter_embedding_batches(
+    chunks: typing.Iterable[bytes],
+    *,
+    path: typing.Sequence[str],
+    batch_size: int,
+    json_backend: typing.Optional[JsonBackend] = None,
+    use_numpy: typing.Optional[bool] = None,
+) -> typing.Iterator[EmbeddingArrays]:
+    """
+    Decodes the embeddings at `path` into `EmbeddingArrays` of `batch_size` segments, and a smaller last
+    batch, as the chunks of the body arrive. The segments are packed without building SDK models.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    scanner = JsonArrayScanner(path)
+    batch: typing.List[typing.Any] = []
+    for chunk in chunks:
+        for item in scanner.feed(chunk):
+            batch.append(_get_row(_loads(item, json_backend)))
+            if len(batch) == batch_size:
+                yield pack_embeddings(batch, use_numpy=use_numpy)
+                batch = []
+        if scanner.done:
+            break
+    if batch:
+        yield pack_embeddings(batch, use_numpy=use_numpy)
+
+
+async def aiter_embeddings(
+    chunks: typing.AsyncIterable[bytes],
+    *,
+    type_: typing.Type[T],
+    path: typing.Sequence[str],
+    json_backend: typing.Optional[JsonBackend] = None,
+) -> typing.AsyncIterator[T]:
+    """The async counterpart of `iter_embeddings`."""
+    scanner = JsonArrayScanner(path)
+    async for chunk in chunks:
+        for item in scanner.feed(chunk):
+            yield _parse_item(item, type_, json_backend)
+        if scanner.done:
+            return
+
+
+async def aiter_embedding_batches(
+    chunks: typing.AsyncIterable[bytes],
+    *,
+    path: typing.Sequence[str],
+    batch_size: int,
+    json_backend: typing.Optional[JsonBackend] = None,
+    use_numpy: typing.Optional[bool] = None,
+) -> typing.AsyncIterator[EmbeddingArrays]:
+    """The async counterpart of `iter_embedding_batches`."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    scanner = JsonArrayScanner(path)
+    batch: typing.List[typing.Any] = []
+    async for chunk in chunks:
+        for item in scanner.feed(chunk):
+            batch.append(_get_row(_loads(item, json_backend)))
+            if len(batch) == batch_size:
+                yield pack_embeddings(batch, use_numpy=use_numpy)
+                batch = []
+        if scanner.done:
+            break
+    if batch:
+        yield pack_embeddings(batch, use_numpy=use_numpy)
+
+
+def _to_api_error(response: httpx.Response) -> ApiError:
+    try:
+        body: typing.Any = response.json()
+    except json.JSONDecodeError:
+        body = response.text
+    return ApiError(status_code=response.status_code, headers=dict(response.headers), body=body)
+
+
+def stream_embeddings(
+    client_wrapper: SyncClientWrapper,
+    url_path: str,
+    *,
+    method: str,
+    path: typing.Sequence[str],
+    type_: typing.Type[typing.Any],
+    batch_size: typing.Optional[int] = None,
+    use_numpy: typing.Optional[bool] = None,
+    params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    json: typing.Optional[typing.Any] = None,
+    request_options: typing.Optional[RequestOptions] = None,
+    omit: typing.Optional[typing.Any] = None,
+) -> typing.Iterator[typing.Any]:
+    """
+    Sends the request when iteration starts, and yields the embeddings of the response as its body downloads:
+    one `type_` model per segment, or `EmbeddingArrays` of `batch_size` segments. An unsuccessful response
+    raises an `ApiError`.
+    """
+    with client_wrapper.httpx_client.stream(
+        url_path,
+        method=method,
+        params=params,
+        json=json,
+        headers={"content-type": "application/json"} if json is not None else None,
+        request_options=request_options,
+        omit=omit,
+    ) as response:
+        if response.status_code >= 300:
+            response.read()
+            raise _to_api_error(response)
+        if batch_size is None:
+            yield from iter_embeddings(
+                response.iter_bytes(), type_=type_, path=path, json_backend=client_wrapper.json_backend
+            )
+        else:
+            yield from iter_embedding_batches(
+                response.iter_bytes(),
+                path=path,
+                batch_size=batch_size,
+                json_backend=client_wrapper.json_backend,
+                use_numpy=use_numpy,
+            )
+
+
+async def async_stream_embeddings(
+    client_wrapper: AsyncClientWrapper,
+    url_path: str,
+    *,
+    method: str,
+    path: typing.Sequence[str],
+    type_: typing.Type[typing.Any],
+    batch_size: typing.Optional[int] = None,
+    use_numpy: typing.Optional[bool] = None,
+    params: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    json: typing.Optional[typing.Any] = None,
+    request_options: typing.Optional[RequestOptions] = None,
+    omit: typing.Optional[typing.Any] = None,
+) -> typing.AsyncIterator[typing.Any]:
+    """The async counterpart of `stream_embeddings`."""
+    async with client_wrapper.httpx_client.stream(
+        url_path,
+        method=method,
+        params=params,
+        json=json,
+        headers={"content-type": "application/json"} if json is not None else None,
+        request_options=request_options,
+        omit=omit,
+    ) as response:
+        if response.status_code >= 300:
+            await response.aread()
+            raise _to_api_error(response)
+        items: typing.AsyncIterator[typing.Any]
+        if batch_size is None:
+            items = aiter_embeddings(
+                response.aiter_bytes(), type_=type_, path=path, json_backend=client_wrapper.json_backend
+            )
+        else:
+            items = aiter_embedding_batches(
+                response.aiter_bytes(),
+                path=path,
+                batch_size=batch_size,
+                json_backend=client_wrapper.json_backend,
+                use_numpy=use_numpy,
+            )
+        async for item in items:
+            yield item
@@ -1,92 +1,72 @@
 # This file was auto-generated by Fern from our API Definition.
 
 import asyncio
-import email.utils
-import re
+import dataclasses
 import time
 import typing
 import urllib.parse
 from contextlib import asynccontextmanager, contextmanager
-from random import random
 
 import httpx
 from .file import File, convert_file_dict_to_httpx_tuples
 from .force_multipart import FORCE_MULTIPART
+from .json_backend import JsonBackend, with_json_backend
 from .jsonable_encoder import jsonable_encoder
 from .query_encoder import encode_query
+from .rate_limiter import RateLimiter
 from .remove_none_from_dict import remove_none_from_dict
 from .request_options import RequestOptions
+from .response_cache import CacheEntry, ResponseCache
+from .retry_policy import DEFAULT_RETRY_POLICY, RetryPolicy
+from .single_flight import COALESCED_METHODS, AsyncSingleFlight, SingleFlight, get_request_key
 from httpx._types import RequestFiles
 
-INITIAL_RETRY_DELAY_SECONDS = 0.5
-MAX_RETRY_DELAY_SECONDS = 10
-MAX_RETRY_DELAY_SECONDS_FROM_HEADER = 30
 
-
-def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float]:
+def _get_retry_policy(
+    base_retry_policy: typing.Optional[typing.Callable[[], RetryPolicy]],
+    request_options: typing.Optional[RequestOptions],
+) -> RetryPolicy:
+    retry_policy = base_retry_policy() if base_retry_policy is not None else DEFAULT_RETRY_POLICY
+    if request_options is not None:
+        retry_policy = request_options.get("retry_policy") or retry_policy
+        max_retries = request_options.get("max_retries")
+        if max_retries is not None:
+            retry_policy = dataclasses.replace(retry_policy, max_retries=max_retries)
+    return retry_policy
+
+
+def _get_file_positions(
+    request_files: typing.Optional[RequestFiles],
+) -> typing.Optional[typing.List[typing.Tuple[typing.IO[bytes], int]]]:
     """
-    This function parses the `Retry-After` header in a HTTP response and returns the number of seconds to wait.
-
-    Inspired by the urllib3 retry implementation.
+    Records where each file object in the request starts, so that a retry can send it again from the same
+    point. Returns None if a file can't be rewound, in which case the request must not be retried.
     """
-    retry_after_ms = response_headers.get("retry-after-ms")
-    if retry_after_ms is not None:
+    positions: typing.List[typing.Tuple[typing.IO[bytes], int]] = []
+    if not isinstance(request_files, list):
+        return positions
+    for _, file in request_files:
+        content = file[1] if isinstance(file, tuple) else file
+        if isinstance(content, (bytes, str)):
+            continue
         try:
-            return int(retry_after_ms) / 1000 if retry_after_ms > 0 else 0
-        except Exception:
-            pass
-
-    retry_after = response_headers.get("retry-after")
-    if retry_after is None:
-        return None
-
-    # Attempt to parse the header as an int.
-    if re.match(r"^\s*[0-9]+\s*$", retry_after):
-        seconds = float(retry_after)
-    # Fallback to parsing it as a date.
-    else:
-        retry_date_tuple = email.utils.parsedate_tz(retry_after)
-        if retry_date_tuple is None:
+            positions.append((content, content.tell()))  # type: ignore[union-attr]
+        except (AttributeError, OSError):
             return None
-        if retry_date_tuple[9] is None:  # Python 2
-            # Assume UTC if no timezone was specified
-            # On Python2.7, parsedate_tz returns None for a timezone offset
-            # instead of 0 if no timezone is given, where mktime_tz treats
-            # a None timezone offset as local time.
-            retry_date_tuple = retry_date_tuple[:9] + (0,) + retry_date_tuple[10:]
+    return positions
 
-        retry_date = email.utils.mktime_tz(retry_date_tuple)
-        seconds = retry_date - time.time()
 
-    if seconds < 0:
-        seconds = 0
+def _is_replayable(
+    content: typing.Optional[typing.Union[bytes, typing.Iterator[bytes], typing.AsyncIterator[bytes]]],
+    file_positions: typing.Optional[typing.List[typing.Tuple[typing.IO[bytes], int]]],
+) -> bool:
+    # Streamed request bodies are consumed by the first attempt
+    return file_positions is not None and (content is None or isinstance(content, (bytes, str)))
 
-    return seconds
-
-
-def _retry_timeout(response: httpx.Response, retries: int) -> float:
-    """
-    Determine the amount of time to wait before retrying a request.
-    This function begins by trying to parse a retry-after header from the response, and then proceeds to use exponential backoff
-    with a jitter to determine the number of seconds to wait.
-    """
 
-    # If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
-    retry_after = _parse_retry_after(response.headers)
-    if retry_after is not None and retry_after <= MAX_RETRY_DELAY_SECONDS_FROM_HEADER:
-        return retry_after
-
-    # Apply exponential backoff, capped at MAX_RETRY_DELAY_SECONDS.
-    retry_delay = min(INITIAL_RETRY_DELAY_SECONDS * pow(2.0, retries), MAX_RETRY_DELAY_SECONDS)
-
-    # Add a randomness / jitter to the retry delay to avoid overwhelming the server with retries.
-    timeout = retry_delay * (1 - 0.25 * random())
-    return timeout if timeout >= 0 else 0
-
-
-def _should_retry(response: httpx.Response) -> bool:
-    retryable_400s = [429, 408, 409]
-    return response.status_code >= 500 or response.status_code in retryable_400s
+def _rewind_files(file_positions: typing.Optional[typing.List[typing.Tuple[typing.IO[bytes], int]]]) -> None:
+    for file, position in file_positions or []:
+        file.seek(position)
 
 
 def remove_omit_from_dict(
@@ -155,10 +135,21 @@ class HttpClient:
         base_timeout: typing.Callable[[], typing.Optional[float]],
         base_headers: typing.Callable[[], typing.Dict[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
+        base_retry_policy: typing.Optional[typing.Callable[[], RetryPolicy]] = None,
+        base_rate_limiter: typing.Optional[typing.Callable[[], typing.Optional[RateLimiter]]] = None,
+        base_response_cache: typing.Optional[typing.Callable[[], typing.Optional[ResponseCache]]] = None,
+        base_coalesce_requests: typing.Optional[typing.Callable[[], bool]] = None,
+        base_json_backend: typing.Optional[typing.Callable[[], JsonBackend]] = None,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
+        self.base_retry_policy = base_retry_policy
+        self.base_rate_limiter = base_rate_limiter
+        self.base_response_cache = base_response_cache
+        self.base_coalesce_requests = base_coalesce_requests
+        self.base_json_backend = base_json_backend
+        self._in_flight = SingleFlight()
         self.httpx_client = httpx_client
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
@@ -170,6 +161,46 @@ class HttpClient:
             raise ValueError("A base_url is required to make this request, please provide one and try again.")
         return base_url
 
+    def get_retry_policy(self, request_options: typing.Optional[RequestOptions] = None) -> RetryPolicy:
+        return _get_retry_policy(self.base_retry_policy, request_options)
+
+    def get_rate_limiter(self) -> typing.Optional[RateLimiter]:
+        return self.base_rate_limiter() if self.base_rate_limiter is not None else None
+
+    def get_response_cache(self) -> typing.Optional[ResponseCache]:
+        return self.base_response_cache() if self.base_response_cache is not None else None
+
+    def get_coalesce_requests(self) -> bool:
+        return self.base_coalesce_requests() if self.base_coalesce_requests is not None else False
+
+    def get_json_backend(self) -> typing.Optional[JsonBackend]:
+        return self.base_json_backend() if self.base_json_backend is not None else None
+
+    def _send(
+        self,
+        request: httpx.Request,
+        *,
+        path: typing.Optional[str],
+        rate_limiter: typing.Optional[RateLimiter],
+        response_cache: typing.Optional[ResponseCache],
+        cached: typing.Optional[CacheEntry],
+    ) -> httpx.Response:
+        # The limiter and the cache learn from each response once, however many callers share it
+        def send() -> httpx.Response:
+            if rate_limiter is not None:
+                time.sleep(rate_limiter.acquire(method=request.method, path=path))
+            response = self.httpx_client.send(request)
+            if rate_limiter is not None:
+                rate_limiter.update(method=request.method, path=path, response=response)
+            if response_cache is not None:
+                response = response_cache.update(request, path, response, cached)
+            return response
+
+        # Concurrent identical reads share one call
+        if request.method in COALESCED_METHODS and self.get_coalesce_requests():
+            return self._in_flight.do(get_request_key(request), send)
+        return send()
+
     def request(
         self,
         path: typing.Optional[str] = None,
@@ -188,7 +219,6 @@ class HttpClient:
         ] = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
     ) -> httpx.Response:
@@ -210,61 +240,78 @@ class HttpClient:
         if (request_files is None or len(request_files) == 0) and force_multipart:
             request_files = FORCE_MULTIPART
 
-        response = self.httpx_client.request(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
+        retry_policy = self.get_retry_policy(request_options)
+        rate_limiter = self.get_rate_limiter()
+        response_cache = self.get_response_cache()
+        file_positions = _get_file_positions(request_files)
+        replayable = _is_replayable(content, file_positions)
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            request = self.httpx_client.build_request(
+                method=method,
+                url=urllib.parse.urljoin(f"{base_url}/", path),
+                headers=jsonable_encoder(
                     remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {}) or {}
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
+                        {
+                            **self.base_headers(),
+                            **(headers if headers is not None else {}),
+                            **(
+                                request_options.get("additional_headers", {}) or {}
+                                if request_options is not None
+                                else {}
+                            ),
+                        }
+                    )
+                ),
+                params=encode_query(
+                    jsonable_encoder(
+                        remove_none_from_dict(
+                            remove_omit_from_dict(
+                                {
+                                    **(params if params is not None else {}),
+                                    **(
+                                        request_options.get("additional_query_parameters", {}) or {}
+                                        if request_options is not None
+                                        else {}
+                                    ),
+                                },
+                                omit,
+                            )
                         )
                     )
+                ),
+                json=json_body,
+                data=data_body,
+                content=content,
+                files=request_files,
+                timeout=timeout,
+            )
+            cached_response, cached = (
+                response_cache.lookup(request, path) if response_cache is not None else (None, None)
+            )
+            if cached_response is not None:
+                return with_json_backend(cached_response, self.get_json_backend())
+            try:
+                response = self._send(
+                    request, path=path, rate_limiter=rate_limiter, response_cache=response_cache, cached=cached
                 )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=request_files,
-            timeout=timeout,
-        )
-
-        max_retries: int = request_options.get("max_retries", 0) if request_options is not None else 0
-        if _should_retry(response=response):
-            if max_retries > retries:
-                time.sleep(_retry_timeout(response=response, retries=retries))
-                return self.request(
-                    path=path,
-                    method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
-                    content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
+            except Exception as e:
+                delay = retry_policy.get_retry_delay(
+                    method=method, attempt=attempt, elapsed=time.monotonic() - started_at, error=e
                 )
-
-        return response
+                if delay is None or not replayable:
+                    raise
+            else:
+                delay = retry_policy.get_retry_delay(
+                    method=method, attempt=attempt, elapsed=time.monotonic() - started_at, response=response
+                )
+                if delay is None or not replayable:
+                    return with_json_backend(response, self.get_json_backend())
+                response.close()
+            time.sleep(delay)
+            _rewind_files(file_positions)
+            attempt += 1
 
     @contextmanager
     def stream(
@@ -285,7 +332,6 @@ class HttpClient:
         ] = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
     ) -> typing.Iterator[httpx.Response]:
@@ -307,42 +353,76 @@ class HttpClient:
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
 
-        with self.httpx_client.stream(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
+        retry_policy = self.get_retry_policy(request_options)
+        rate_limiter = self.get_rate_limiter()
+        file_positions = _get_file_positions(request_files)
+        replayable = _is_replayable(content, file_positions)
+        started_at = time.monotonic()
+        attempt = 0
+        # Retries happen before the response is handed to the caller, so no body bytes have been consumed yet
+        while True:
+            if rate_limiter is not None:
+                time.sleep(rate_limiter.acquire(method=method, path=path))
+            request = self.httpx_client.build_request(
+                method=method,
+                url=urllib.parse.urljoin(f"{base_url}/", path),
+                headers=jsonable_encoder(
                     remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
+                        {
+                            **self.base_headers(),
+                            **(headers if headers is not None else {}),
+                            **(request_options.get("additional_headers", {}) if request_options is not None else {}),
+                        }
+                    )
+                ),
+                params=encode_query(
+                    jsonable_encoder(
+                        remove_none_from_dict(
+                            remove_omit_from_dict(
+                                {
+                                    **(params if params is not None else {}),
+                                    **(
+                                        request_options.get("additional_query_parameters", {})
+                                        if request_options is not None
+                                        else {}
+                                    ),
+                                },
+                                omit,
+                            )
                         )
                     )
+                ),
+                json=json_body,
+                data=data_body,
+                content=content,
+                files=request_files,
+                timeout=timeout,
+            )
+            try:
+                response = self.httpx_client.send(request, stream=True)
+            except Exception as e:
+                delay = retry_policy.get_retry_delay(
+                    method=method, attempt=attempt, elapsed=time.monotonic() - started_at, error=e
                 )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=request_files,
-            timeout=timeout,
-        ) as stream:
-            yield stream
+                if delay is None or not replayable:
+                    raise
+            else:
+                if rate_limiter is not None:
+                    rate_limiter.update(method=method, path=path, response=response)
+                delay = retry_policy.get_retry_delay(
+                    method=method, attempt=attempt, elapsed=time.monotonic() - started_at, response=response
+                )
+                if delay is None or not replayable:
+                    break
+                response.close()
+            time.sleep(delay)
+            _rewind_files(file_positions)
+            attempt += 1
+
+        try:
+            yield with_json_backend(response, self.get_json_backend())
+        finally:
+            response.close()
 
 
 class AsyncHttpClient:
@@ -353,10 +433,21 @@ class AsyncHttpClient:
         base_timeout: typing.Callable[[], typing.Optional[float]],
         base_headers: typing.Callable[[], typing.Dict[str, str]],
         base_url: typing.Optional[typing.Callable[[], str]] = None,
+        base_retry_policy: typing.Optional[typing.Callable[[], RetryPolicy]] = None,
+        base_rate_limiter: typing.Optional[typing.Callable[[], typing.Optional[RateLimiter]]] = None,
+        base_response_cache: typing.Optional[typing.Callable[[], typing.Optional[ResponseCache]]] = None,
+        base_coalesce_requests: typing.Optional[typing.Callable[[], bool]] = None,
+        base_json_backend: typing.Optional[typing.Callable[[], JsonBackend]] = None,
     ):
         self.base_url = base_url
         self.base_timeout = base_timeout
         self.base_headers = base_headers
+        self.base_retry_policy = base_retry_policy
+        self.base_rate_limiter = base_rate_limiter
+        self.base_response_cache = base_response_cache
+        self.base_coalesce_requests = base_coalesce_requests
+        self.base_json_backend = base_json_backend
+        self._in_flight = AsyncSingleFlight()
         self.httpx_client = httpx_client
 
     def get_base_url(self, maybe_base_url: typing.Optional[str]) -> str:
@@ -368,6 +459,46 @@ class AsyncHttpClient:
             raise ValueError("A base_url is required to make this request, please provide one and try again.")
         return base_url
 
+    def get_retry_policy(self, request_options: typing.Optional[RequestOptions] = None) -> RetryPolicy:
+        return _get_retry_policy(self.base_retry_policy, request_options)
+
+    def get_rate_limiter(self) -> typing.Optional[RateLimiter]:
+        return self.base_rate_limiter() if self.base_rate_limiter is not None else None
+
+    def get_response_cache(self) -> typing.Optional[ResponseCache]:
+        return self.base_response_cache() if self.base_response_cache is not None else None
+
+    def get_coalesce_requests(self) -> bool:
+        return self.base_coalesce_requests() if self.base_coalesce_requests is not None else False
+
+    def get_json_backend(self) -> typing.Optional[JsonBackend]:
+        return self.base_json_backend() if self.base_json_backend is not None else None
+
+    async def _send(
+        self,
+        request: httpx.Request,
+        *,
+        path: typing.Optional[str],
+        rate_limiter: typing.Optional[RateLimiter],
+        response_cache: typing.Optional[ResponseCache],
+        cached: typing.Optional[CacheEntry],
+    ) -> httpx.Response:
+        # The limiter and the cache learn from each response once, however many callers share it
+        async def send() -> httpx.Response:
+            if rate_limiter is not None:
+                await asyncio.sleep(rate_limiter.acquire(method=request.method, path=path))
+            response = await self.httpx_client.send(request)
+            if rate_limiter is not None:
+                rate_limiter.update(method=request.method, path=path, response=response)
+            if response_cache is not None:
+                response = response_cache.update(request, path, response, cached)
+            return response
+
+        # Concurrent identical reads share one call
+        if request.method in COALESCED_METHODS and self.get_coalesce_requests():
+            return await self._in_flight.do(get_request_key(request), send)
+        return await send()
+
     async def request(
         self,
         path: typing.Optional[str] = None,
@@ -386,7 +517,6 @@ class AsyncHttpClient:
         ] = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
     ) -> httpx.Response:
@@ -408,61 +538,78 @@ class AsyncHttpClient:
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
 
-        # Add the input to each of these and do None-safety checks
-        response = await self.httpx_client.request(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) or {} if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
+        retry_policy = self.get_retry_policy(request_options)
+        rate_limiter = self.get_rate_limiter()
+        response_cache = self.get_response_cache()
+        file_positions = _get_file_positions(request_files)
+        replayable = _is_replayable(content, file_positions)
+        started_at = time.monotonic()
+        attempt = 0
+        while True:
+            request = self.httpx_client.build_request(
+                method=method,
+                url=urllib.parse.urljoin(f"{base_url}/", path),
+                headers=jsonable_encoder(
                     remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {}) or {}
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit,
+                        {
+                            **self.base_headers(),
+                            **(headers if headers is not None else {}),
+                            **(
+                                request_options.get("additional_headers", {}) or {}
+                                if request_options is not None
+                                else {}
+                            ),
+                        }
+                    )
+                ),
+                params=encode_query(
+                    jsonable_encoder(
+                        remove_none_from_dict(
+                            remove_omit_from_dict(
+                                {
+                                    **(params if params is not None else {}),
+                                    **(
+                                        request_options.get("additional_query_parameters", {}) or {}
+                                        if request_options is not None
+                                        else {}
+                                    ),
+                                },
+                                omit,
+                            )
                         )
                     )
+                ),
+                json=json_body,
+                data=data_body,
+                content=content,
+                files=request_files,
+                timeout=timeout,
+            )
+            cached_response, cached = (
+                response_cache.lookup(request, path) if response_cache is not None else (None, None)
+            )
+            if cached_response is not None:
+                return with_json_backend(cached_response, self.get_json_backend())
+            try:
+                response = await self._send(
+                    request, path=path, rate_limiter=rate_limiter, response_cache=response_cache, cached=cached
                 )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=request_files,
-            timeout=timeout,
-        )
-
-        max_retries: int = request_options.get("max_retries", 0) if request_options is not None else 0
-        if _should_retry(response=response):
-            if max_retries > retries:
-                await asyncio.sleep(_retry_timeout(response=response, retries=retries))
-                return await self.request(
-                    path=path,
-                    method=method,
-                    base_url=base_url,
-                    params=params,
-                    json=json,
-                    content=content,
-                    files=files,
-                    headers=headers,
-                    request_options=request_options,
-                    retries=retries + 1,
-                    omit=omit,
+            except Exception as e:
+                delay = retry_policy.get_retry_delay(
+                    method=method, attempt=attempt, elapsed=time.monotonic() - started_at, error=e
+                )
+                if delay is None or not replayable:
+                    raise
+            else:
+                delay = retry_policy.get_retry_delay(
+                    method=method, attempt=attempt, elapsed=time.monotonic() - started_at, response=response
                 )
-        return response
+                if delay is None or not replayable:
+                    return with_json_backend(response, self.get_json_backend())
+                await response.aclose()
+            await asyncio.sleep(delay)
+            _rewind_files(file_positions)
+            attempt += 1
 
     @asynccontextmanager
     async def stream(
@@ -483,7 +630,6 @@ class AsyncHttpClient:
         ] = None,
         headers: typing.Optional[typing.Dict[str, typing.Any]] = None,
         request_options: typing.Optional[RequestOptions] = None,
-        retries: int = 2,
         omit: typing.Optional[typing.Any] = None,
         force_multipart: typing.Optional[bool] = None,
     ) -> typing.AsyncIterator[httpx.Response]:
@@ -505,39 +651,73 @@ class AsyncHttpClient:
 
         json_body, data_body = get_request_body(json=json, data=data, request_options=request_options, omit=omit)
 
-        async with self.httpx_client.stream(
-            method=method,
-            url=urllib.parse.urljoin(f"{base_url}/", path),
-            headers=jsonable_encoder(
-                remove_none_from_dict(
-                    {
-                        **self.base_headers(),
-                        **(headers if headers is not None else {}),
-                        **(request_options.get("additional_headers", {}) if request_options is not None else {}),
-                    }
-                )
-            ),
-            params=encode_query(
-                jsonable_encoder(
+        retry_policy = self.get_retry_policy(request_options)
+        rate_limiter = self.get_rate_limiter()
+        file_positions = _get_file_positions(request_files)
+        replayable = _is_replayable(content, file_positions)
+        started_at = time.monotonic()
+        attempt = 0
+        # Retries happen before the response is handed to the caller, so no body bytes have been consumed yet
+        while True:
+            if rate_limiter is not None:
+                await asyncio.sleep(rate_limiter.acquire(method=method, path=path))
+            request = self.httpx_client.build_request(
+                method=method,
+                url=urllib.parse.urljoin(f"{base_url}/", path),
+                headers=jsonable_encoder(
                     remove_none_from_dict(
-                        remove_omit_from_dict(
-                            {
-                                **(params if params is not None else {}),
-                                **(
-                                    request_options.get("additional_query_parameters", {})
-                                    if request_options is not None
-                                    else {}
-                                ),
-                            },
-                            omit=omit,
+                        {
+                            **self.base_headers(),
+                            **(headers if headers is not None else {}),
+                            **(request_options.get("additional_headers", {}) if request_options is not None else {}),
+                        }
+                    )
+                ),
+                params=encode_query(
+                    jsonable_encoder(
+                        remove_none_from_dict(
+                            remove_omit_from_dict(
+                                {
+                                    **(params if params is not None else {}),
+                                    **(
+                                        request_options.get("additional_query_parameters", {})
+                                        if request_options is not None
+                                        else {}
+                                    ),
+                                },
+                                omit=omit,
+                            )
                         )
                     )
+                ),
+                json=json_body,
+                data=data_body,
+                content=content,
+                files=request_files,
+                timeout=timeout,
+            )
+            try:
+                response = await self.httpx_client.send(request, stream=True)
+            except Exception as e:
+                delay = retry_policy.get_retry_delay(
+                    method=method, attempt=attempt, elapsed=time.monotonic() - started_at, error=e
                 )
-            ),
-            json=json_body,
-            data=data_body,
-            content=content,
-            files=request_files,
-            timeout=timeout,
-        ) as stream:
-            yield stream
+                if delay is None or not replayable:
+                    raise
+            else:
+                if rate_limiter is not None:
+                    rate_limiter.update(method=method, path=path, response=response)
+                delay = retry_policy.get_retry_delay(
+                    method=method, attempt=attempt, elapsed=time.monotonic() - started_at, response=response
+                )
+                if delay is None or not replayable:
+                    break
+                await response.aclose()
+            await asyncio.sleep(delay)
+            _rewind_files(file_positions)
+            attempt += 1
+
+        try:
+            yield with_json_backend(response, self.get_json_backend())
+        finally:
+            await response.aclose()
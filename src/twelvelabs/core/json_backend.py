@@ -0,0 +1,141 @@
+import json
+import typing
+
+import httpx
+from .pydantic_utilities import IS_PYDANTIC_V2, _get_type_adapter, parse_obj_as
+from .serialization import _has_aliases
+
+T = typing.TypeVar("T")
+
+JsonBackendName = typing.Literal["stdlib", "orjson", "pydantic_core", "auto"]
+
+
+class JsonBackend:
+    """
+    Decodes JSON response bodies and stream lines before they are validated into SDK types.
+
+    The base class uses the standard library `json` module. Subclasses override `loads` to plug in a faster
+    parser, and may override `parse` to validate straight from the raw body. Malformed input must raise
+    `json.JSONDecodeError` so that raw clients keep reporting it as an `ApiError`.
+    """
+
+    name = "stdlib"
+
+    def loads(self, json_: typing.Union[str, bytes]) -> typing.Any:
+        return json.loads(json_)
+
+    def parse(self, type_: typing.Type[T], json_: typing.Union[str, bytes]) -> T:
+        return parse_obj_as(type_=type_, object_=self.loads(json_))
+
+
+class OrjsonBackend(JsonBackend):
+    """
+    Decodes with `orjson`. Note that unlike the standard library, orjson rejects `NaN` and `Infinity`.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads = orjson.loads
+
+    def loads(self, json_: typing.Union[str, bytes]) -> typing.Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return self._loads(json_)
+
+
+class PydanticCoreBackend(JsonBackend):
+    """
+    Decodes with pydantic-core. In `parse_json_as`, types without `FieldMetadata` aliases are validated
+    directly from the body with `TypeAdapter.validate_json`, which skips building the intermediate Python dict.
+    The generated clients only decode through `loads`.
+    """
+
+    name = "pydantic_core"
+
+    def __init__(self) -> None:
+        if not IS_PYDANTIC_V2:
+            raise ImportError("The pydantic_core JSON backend requires pydantic v2")
+        import pydantic_core
+
+        self._from_json = pydantic_core.from_json
+        self._validation_error = pydantic_core.ValidationError
+
+    def loads(self, json_: typing.Union[str, bytes]) -> typing.Any:
+        try:
+            return self._from_json(json_)
+        except ValueError as e:
+            raise _to_json_decode_error(e, json_) from e
+
+    def parse(self, type_: typing.Type[T], json_: typing.Union[str, bytes]) -> T:
+        if _has_aliases(type_):
+            return super().parse(type_, json_)
+        try:
+            return typing.cast(T, _get_type_adapter(type_).validate_json(json_))
+        except self._validation_error as e:
+            errors = e.errors()
+            if errors and errors[0]["type"] == "json_invalid":
+                raise _to_json_decode_error(e, json_) from e
+            raise
+
+
+class JsonBackendResponse(httpx.Response):
+    """
+    An `httpx.Response` whose `json()` decodes the body with a `JsonBackend`, so that the generated clients,
+    which call `_response.json()`, use the configured backend.
+    """
+
+    json_backend: JsonBackend
+
+    def json(self, **kwargs: typing.Any) -> typing.Any:
+        if kwargs:
+            return super().json(**kwargs)
+        return self.json_backend.loads(self.content)
+
+
+def with_json_backend(response: httpx.Response, json_backend: typing.Optional[JsonBackend]) -> httpx.Response:
+    """Makes `response.json()` decode with `json_backend`. The standard library backend leaves it as is."""
+    if json_backend is None or type(json_backend) is JsonBackend:
+        return response
+    # The response keeps its state and only gains the `json` override
+    response.__class__ = JsonBackendResponse
+    typing.cast(JsonBackendResponse, response).json_backend = json_backend
+    return response
+
+
+def _to_json_decode_error(error: Exception, json_: typing.Union[str, bytes]) -> json.JSONDecodeError:
+    document = json_ if isinstance(json_, str) else json_.decode("utf-8", errors="replace")
+    return json.JSONDecodeError(str(error), document, 0)
+
+
+def parse_json_as(
+    type_: typing.Type[T], json_: typing.Union[str, bytes], json_backend: typing.Optional[JsonBackend] = None
+) -> T:
+    if json_backend is None:
+        return parse_obj_as(type_=type_, object_=json.loads(json_))
+    return json_backend.parse(type_, json_)
+
+
+def get_json_backend(backend: typing.Optional[typing.Union[JsonBackendName, JsonBackend]] = None) -> JsonBackend:
+    """
+    Resolves a JSON backend by name. `None` and `"stdlib"` select the standard library, and `"auto"`
+    selects the fastest backend installed: pydantic-core when running pydantic v2, then orjson, then the
+    standard library.
+    """
+    if isinstance(backend, JsonBackend):
+        return backend
+    if backend is None or backend == "stdlib":
+        return JsonBackend()
+    if backend == "orjson":
+        return OrjsonBackend()
+    if backend == "pydantic_core":
+        return PydanticCoreBackend()
+    if backend == "auto":
+        for candidate in (PydanticCoreBackend, OrjsonBackend):
+            try:
+                return candidate()
+            except ImportError:
+                continue
+        return JsonBackend()
+    raise ValueError(f"Unknown JSON backend {backend!r}, expected one of 'stdlib', 'orjson', 'pydantic_core', 'auto'")
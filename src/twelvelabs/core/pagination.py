@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import AsyncIterator, Awaitable, Callable, Generic, Iterator, List, Optional, TypeVar
+from typing import AsyncIterator, Awaitable, Callable, Deque, Generic, Iterator, List, Optional, Tuple, TypeVar
 
 from .http_response import BaseHttpResponse
 
@@ -20,6 +25,13 @@ T = TypeVar("T")
 #     # This should be the outer function that returns the SyncPager again
 #     get_next=lambda: list(..., cursor: response.cursor) (or list(..., offset: offset + 1))
 # )
+#
+# A pager may also carry get_page, page_number and total_pages, which lets iter_pages fetch the remaining pages
+# in parallel when prefetching. Generated endpoints don't set them: callers that know the list function and the
+# page count add them with dataclasses.replace, as scan_all does.
+
+# How often a blocked read-ahead thread checks whether the consumer has gone away
+_PREFETCH_POLL_INTERVAL = 0.1
 
 
 @dataclass(frozen=True)
@@ -28,6 +40,9 @@ class SyncPager(Generic[T]):
     has_next: bool
     items: Optional[List[T]]
     response: Optional[BaseHttpResponse]
+    get_page: Optional[Callable[[int], Optional[SyncPager[T]]]] = None
+    page_number: Optional[int] = None
+    total_pages: Optional[int] = None
 
     # Here we type ignore the iterator to avoid a mypy error
     # caused by the type conflict with Pydanitc's __iter__ method
@@ -37,7 +52,22 @@ class SyncPager(Generic[T]):
             if page.items is not None:
                 yield from page.items
 
-    def iter_pages(self) -> Iterator[SyncPager[T]]:
+    def iter_pages(self, *, prefetch: int = 0) -> Iterator[SyncPager[T]]:
+        """
+        Iterates over this page and the ones after it.
+
+        With `prefetch` set, up to that many pages are fetched ahead of the caller. Pagers that carry
+        `get_page`, `page_number` and `total_pages` fetch them in parallel on a thread pool; other pagers
+        follow the next-page links on a background thread. Either way, at most `prefetch` pages are held in
+        memory beyond the one being consumed.
+        """
+        if prefetch <= 0:
+            return self._iter_pages()
+        if self.get_page is not None and self.page_number is not None and self.total_pages is not None:
+            return self._iter_pages_in_parallel(prefetch)
+        return self._iter_pages_ahead(prefetch)
+
+    def _iter_pages(self) -> Iterator[SyncPager[T]]:
         page: Optional[SyncPager[T]] = self
         while page is not None:
             yield page
@@ -49,6 +79,66 @@ class SyncPager(Generic[T]):
             if page is None or page.items is None or len(page.items) == 0:
                 return
 
+    def _iter_pages_in_parallel(self, prefetch: int) -> Iterator[SyncPager[T]]:
+        assert self.get_page is not None and self.page_number is not None and self.total_pages is not None
+        yield self
+        if not self.has_next:
+            return
+        next_number = self.page_number + 1
+        window: Deque[Future[Optional[SyncPager[T]]]] = collections.deque()
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            try:
+                while window or next_number <= self.total_pages:
+                    while len(window) < prefetch and next_number <= self.total_pages:
+                        window.append(executor.submit(self.get_page, next_number))
+                        next_number += 1
+                    page = window.popleft().result()
+                    if page is None or page.items is None or len(page.items) == 0:
+                        return
+                    yield page
+            finally:
+                for future in window:
+                    future.cancel()
+
+    def _iter_pages_ahead(self, prefetch: int) -> Iterator[SyncPager[T]]:
+        pages: queue.Queue[Tuple[Optional[SyncPager[T]], Optional[BaseException]]] = queue.Queue(maxsize=prefetch)
+        stopped = threading.Event()
+
+        def put(item: Tuple[Optional[SyncPager[T]], Optional[BaseException]]) -> bool:
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=_PREFETCH_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch() -> None:
+            try:
+                iterator = self._iter_pages()
+                next(iterator)
+                for page in iterator:
+                    if not put((page, None)):
+                        return
+            except BaseException as e:
+                put((None, e))
+                return
+            put((None, None))
+
+        thread = threading.Thread(target=fetch, name="twelvelabs-page-prefetch", daemon=True)
+        thread.start()
+        try:
+            yield self
+            while True:
+                page, error = pages.get()
+                if error is not None:
+                    raise error
+                if page is None:
+                    return
+                yield page
+        finally:
+            stopped.set()
+
     def next_page(self) -> Optional[SyncPager[T]]:
         return self.get_next() if self.get_next is not None else None
 
@@ -59,6 +149,9 @@ class AsyncPager(Generic[T]):
     has_next: bool
     items: Optional[List[T]]
     response: Optional[BaseHttpResponse]
+    get_page: Optional[Callable[[int], Awaitable[Optional[AsyncPager[T]]]]] = None
+    page_number: Optional[int] = None
+    total_pages: Optional[int] = None
 
     async def __aiter__(self) -> AsyncIterator[T]:
         async for page in self.iter_pages():
@@ -66,7 +159,22 @@ class AsyncPager(Generic[T]):
                 for item in page.items:
                     yield item
 
-    async def iter_pages(self) -> AsyncIterator[AsyncPager[T]]:
+    def iter_pages(self, *, prefetch: int = 0) -> AsyncIterator[AsyncPager[T]]:
+        """
+        Iterates over this page and the ones after it.
+
+        With `prefetch` set, up to that many pages are fetched ahead of the caller. Pagers that carry
+        `get_page`, `page_number` and `total_pages` fetch them concurrently; other pagers follow the
+        next-page links in a background task. Either way, at most `prefetch` pages are held in memory beyond
+        the one being consumed.
+        """
+        if prefetch <= 0:
+            return self._iter_pages()
+        if self.get_page is not None and self.page_number is not None and self.total_pages is not None:
+            return self._iter_pages_in_parallel(prefetch)
+        return self._iter_pages_ahead(prefetch)
+
+    async def _iter_pages(self) -> AsyncIterator[AsyncPager[T]]:
         page: Optional[AsyncPager[T]] = self
         while page is not None:
             yield page
@@ -78,5 +186,55 @@ class AsyncPager(Generic[T]):
             if page is None or page.items is None or len(page.items) == 0:
                 return
 
+    async def _iter_pages_in_parallel(self, prefetch: int) -> AsyncIterator[AsyncPager[T]]:
+        assert self.get_page is not None and self.page_number is not None and self.total_pages is not None
+        yield self
+        if not self.has_next:
+            return
+        next_number = self.page_number + 1
+        window: Deque[asyncio.Future[Optional[AsyncPager[T]]]] = collections.deque()
+        try:
+            while window or next_number <= self.total_pages:
+                while len(window) < prefetch and next_number <= self.total_pages:
+                    window.append(asyncio.ensure_future(self.get_page(next_number)))
+                    next_number += 1
+                page = await window.popleft()
+                if page is None or page.items is None or len(page.items) == 0:
+                    return
+                yield page
+        finally:
+            for future in window:
+                future.cancel()
+            # Wait for the cancelled fetches to unwind, so that none outlives the iterator
+            await asyncio.gather(*window, return_exceptions=True)
+
+    async def _iter_pages_ahead(self, prefetch: int) -> AsyncIterator[AsyncPager[T]]:
+        pages: asyncio.Queue[Tuple[Optional[AsyncPager[T]], Optional[BaseException]]] = asyncio.Queue(maxsize=prefetch)
+
+        async def fetch() -> None:
+            try:
+                iterator = self._iter_pages().__aiter__()
+                await iterator.__anext__()
+                async for page in iterator:
+                    await pages.put((page, None))
+            except Exception as e:
+                await pages.put((None, e))
+                return
+            await pages.put((None, None))
+
+        task = asyncio.ensure_future(fetch())
+        try:
+            yield self
+            while True:
+                page, error = await pages.get()
+                if error is not None:
+                    raise error
+                if page is None:
+                    return
+                yield page
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
     async def next_page(self) -> Optional[AsyncPager[T]]:
         return await self.get_next() if self.get_next is not None else None
@@ -2,6 +2,7 @@
 
 # nopycln: file
 import datetime as dt
+import functools
 from collections import defaultdict
 from typing import Any, Callable, ClassVar, Dict, List, Mapping, Optional, Set, Tuple, Type, TypeVar, Union, cast
 
@@ -36,11 +37,31 @@ T = TypeVar("T")
 Model = TypeVar("Model", bound=pydantic.BaseModel)
 
 
+# Building a TypeAdapter compiles a validator for the whole type, which costs far more than validating a
+# single object with it. Adapters are cached per type so that parsing, e.g., every line of a JSONL stream
+# only pays that cost once. lru_cache is thread-safe and bounds the cache for callers that parse many
+# distinct (e.g. dynamically built generic) types.
+TYPE_ADAPTER_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=TYPE_ADAPTER_CACHE_SIZE)
+def _get_cached_type_adapter(type_: Any) -> Any:
+    return pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+
+
+def _get_type_adapter(type_: Any) -> Any:
+    try:
+        return _get_cached_type_adapter(type_)
+    except TypeError:
+        # Unhashable annotations (e.g. Annotated metadata holding a dict) can't be cache keys
+        return pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
+
+
 def parse_obj_as(type_: Type[T], object_: Any) -> T:
     dealiased_object = convert_and_respect_annotation_metadata(object_=object_, annotation=type_, direction="read")
     if IS_PYDANTIC_V2:
-        adapter = pydantic.TypeAdapter(type_)  # type: ignore[attr-defined]
-        return adapter.validate_python(dealiased_object)
+        adapter = _get_type_adapter(type_)
+        return cast(T, adapter.validate_python(dealiased_object))
     return pydantic.parse_obj_as(type_, dealiased_object)
 
 
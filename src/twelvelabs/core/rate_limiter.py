@@ -0,0 +1,172 @@
+import dataclasses
+import math
+import threading
+import time
+import typing
+
+import httpx
+from .retry_policy import _parse_retry_after
+
+EndpointGroup = typing.Literal["search", "embed", "analyze", "uploads", "default"]
+
+# Reset headers above this value are UTC epoch seconds rather than seconds from now
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def get_endpoint_group(method: str, path: typing.Optional[str]) -> EndpointGroup:
+    """
+    Returns the rate limit group of a request. Creating assets and video indexing tasks counts as an upload;
+    reading them back falls in the default group, so that polling doesn't use up the upload budget.
+    """
+    segments = (path or "").strip("/").split("/")
+    if segments[0] == "search" or segments[-1] == "search":
+        return "search"
+    if segments[0] in ("embed", "embed-v2"):
+        return "embed"
+    if segments[0] in ("analyze", "responses"):
+        return "analyze"
+    if segments[0] in ("assets", "tasks") and method.upper() != "GET":
+        return "uploads"
+    return "default"
+
+
+@dataclasses.dataclass(frozen=True)
+class RateLimit:
+    """
+    The request rate allowed for one endpoint group. `burst` is how many requests can start back to back after
+    an idle period, and defaults to one second's worth.
+    """
+
+    requests_per_second: float
+    burst: typing.Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.requests_per_second <= 0:
+            raise ValueError("requests_per_second must be greater than 0")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+
+class _TokenBucket:
+    def __init__(self, limit: typing.Optional[RateLimit]) -> None:
+        self._rate = limit.requests_per_second if limit is not None else None
+        self._capacity = float(
+            limit.burst if limit is not None and limit.burst is not None else max(math.ceil(self._rate or 1), 1)
+        )
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self._rate is not None:
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        # Takes a token even when none is left, so that concurrent callers queue up behind each other instead of
+        # all waking at the same moment
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            delay = self._blocked_until - now
+            if self._rate is not None:
+                self._tokens -= 1
+                if self._tokens < 0:
+                    delay = max(delay, -self._tokens / self._rate)
+            return max(delay, 0.0)
+
+    def update(self, remaining: typing.Optional[int], reset_after: typing.Optional[float]) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if remaining is not None:
+                self._tokens = min(self._tokens, float(remaining))
+                if remaining <= 0 and reset_after is not None:
+                    self._blocked_until = max(self._blocked_until, now + reset_after)
+
+    def block(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    """
+    Spaces out requests on the client side with one token bucket per endpoint group, so that bursts wait
+    locally instead of being rejected with a 429.
+
+    The groups are `"search"`, `"embed"`, `"analyze"`, `"uploads"` (creating assets and indexing tasks) and
+    `"default"` for every other request. Groups missing from `limits` are not limited up front, but every
+    group follows the `X-Ratelimit-Remaining` and `X-Ratelimit-Reset` response headers, and pauses for the
+    `Retry-After` of a 429. One limiter can be shared by several clients, threads and event loops.
+
+    Parameters
+    ----------
+    limits : typing.Mapping[str, RateLimit]
+        The request rate of each endpoint group.
+
+    use_response_headers : bool
+        Whether to adjust the buckets from the rate limit headers of each response.
+
+    Examples
+    --------
+    from twelvelabs import TwelveLabs
+    from twelvelabs.core import RateLimit, RateLimiter
+
+    client = TwelveLabs(
+        api_key="YOUR_API_KEY",
+        rate_limiter=RateLimiter({"search": RateLimit(requests_per_second=5), "embed": RateLimit(2, burst=4)}),
+    )
+    """
+
+    def __init__(self, limits: typing.Mapping[str, RateLimit], *, use_response_headers: bool = True) -> None:
+        unknown = set(limits) - set(typing.get_args(EndpointGroup))
+        if unknown:
+            raise ValueError(f"Unknown endpoint groups {sorted(unknown)}")
+        self._limits = dict(limits)
+        self._use_response_headers = use_response_headers
+        self._buckets: typing.Dict[str, _TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _get_bucket(self, method: str, path: typing.Optional[str]) -> _TokenBucket:
+        group = get_endpoint_group(method, path)
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(group, _TokenBucket(self._limits.get(group)))
+        return bucket
+
+    def acquire(self, *, method: str, path: typing.Optional[str]) -> float:
+        """Claims a request slot and returns the number of seconds to wait before sending the request."""
+        return self._get_bucket(method, path).reserve()
+
+    def update(self, *, method: str, path: typing.Optional[str], response: httpx.Response) -> None:
+        """Adjusts the bucket of the request from the rate limit headers of its response."""
+        bucket = self._get_bucket(method, path)
+        if response.status_code == 429:
+            retry_after = _parse_retry_after(response.headers)
+            if retry_after is not None:
+                bucket.block(retry_after)
+        if self._use_response_headers:
+            remaining = _parse_int(response.headers.get("x-ratelimit-remaining"))
+            if remaining is not None:
+                bucket.update(remaining, _parse_reset(response.headers.get("x-ratelimit-reset")))
+
+
+def _parse_int(value: typing.Optional[str]) -> typing.Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _parse_reset(value: typing.Optional[str]) -> typing.Optional[float]:
+    try:
+        reset = float(value) if value is not None else None
+    except ValueError:
+        return None
+    if reset is None:
+        return None
+    if reset > _EPOCH_THRESHOLD:
+        reset -= time.time()
+    return max(reset, 0.0)
@@ -2,6 +2,8 @@
 
 import typing
 
+from .retry_policy import RetryPolicy
+
 try:
     from typing import NotRequired  # type: ignore
 except ImportError:
@@ -18,6 +20,8 @@ class RequestOptions(typing.TypedDict, total=False):
 
         - max_retries: int. The max number of retries to attempt if the API call fails.
 
+        - retry_policy: RetryPolicy. Overrides the client's retry policy for this call. `max_retries`, if also given, takes precedence over the policy's own limit.
+
         - additional_headers: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's header dict
 
         - additional_query_parameters: typing.Dict[str, typing.Any]. A dictionary containing additional parameters to spread into the request's query parameters dict
@@ -29,6 +33,7 @@ class RequestOptions(typing.TypedDict, total=False):
 
     timeout_in_seconds: NotRequired[int]
     max_retries: NotRequired[int]
+    retry_policy: NotRequired[RetryPolicy]
     additional_headers: NotRequired[typing.Dict[str, typing.Any]]
     additional_query_parameters: NotRequired[typing.Dict[str, typing.Any]]
     additional_body_parameters: NotRequired[typing.Dict[str, typing.Any]]
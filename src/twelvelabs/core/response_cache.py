@@ -0,0 +1,322 @@
+import collections
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import typing
+
+import httpx
+
+# Bodies are cached decoded, so the headers describing the encoding on the wire no longer apply
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+# Task and upload statuses change while they are polled, so they are never cached unless a route TTL says otherwise
+DEFAULT_ROUTE_TTLS: typing.Dict[str, float] = {
+    pattern: 0
+    for prefix in ("tasks", "embed/tasks", "embed-v2/tasks", "analyze/tasks", "analyze/batches")
+    for pattern in (prefix, f"{prefix}/*", f"{prefix}/*/*")
+}
+DEFAULT_ROUTE_TTLS.update({"assets/multipart-uploads/*": 0})
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    """
+    A cached response body. `path` is the URL path it was requested from, and `expires_at` the UTC epoch time
+    after which it must be revalidated.
+    """
+
+    path: str
+    headers: typing.List[typing.Tuple[str, str]]
+    content: bytes
+    etag: typing.Optional[str]
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.content) + sum(len(name) + len(value) for name, value in self.headers)
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    invalidations: int = 0
+
+
+def _is_related(cached_path: str, mutated_path: str) -> bool:
+    # A change to a resource also changes the collections above it, and the resources nested under it
+    cached_path, mutated_path = cached_path.rstrip("/"), mutated_path.rstrip("/")
+    return (
+        cached_path == mutated_path
+        or cached_path.startswith(mutated_path + "/")
+        or mutated_path.startswith(cached_path + "/")
+    )
+
+
+class CacheBackend:
+    """
+    Stores cache entries by key. Backends evict entries on their own, and must be safe to share between
+    threads.
+    """
+
+    def get(self, key: str) -> typing.Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        raise NotImplementedError
+
+    def invalidate(self, path: str) -> int:
+        """Removes the entries whose path is `path`, above it or below it, and returns how many there were."""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Keeps entries in memory, evicting the least recently used ones once their bodies and headers take more than
+    `max_bytes`.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "collections.OrderedDict[str, CacheEntry]" = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> typing.Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+    def invalidate(self, path: str) -> int:
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if _is_related(entry.path, path)]
+            for key in keys:
+                self._size -= self._entries.pop(key).size
+            return len(keys)
+
+
+class SqliteCacheBackend(CacheBackend):
+    """
+    Keeps entries in a SQLite database file, so that they survive restarts and can be shared between processes.
+    The least recently used entries are evicted once the bodies take more than `max_bytes`.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.create_function("is_related", 2, _is_related)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, path TEXT, headers TEXT, content BLOB, etag TEXT, expires_at REAL, size INTEGER, "
+            "accessed_at REAL)"
+        )
+
+    def get(self, key: str) -> typing.Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT path, headers, content, etag, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        path, headers, content, etag, expires_at = row
+        return CacheEntry(
+            path=path,
+            headers=[(name, value) for name, value in json.loads(headers)],
+            content=bytes(content),
+            etag=etag,
+            expires_at=expires_at,
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.path,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.etag,
+                    entry.expires_at,
+                    entry.size,
+                    time.time(),
+                ),
+            )
+            (total,) = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+            if total <= self.max_bytes:
+                return
+            evicted = []
+            rows = self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+            for evicted_key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                evicted.append((evicted_key,))
+                total -= size
+            self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def invalidate(self, path: str) -> int:
+        with self._lock:
+            return self._connection.execute("DELETE FROM responses WHERE is_related(path, ?)", (path,)).rowcount
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def _match_route(pattern: str, route: str) -> bool:
+    pattern_segments, route_segments = pattern.strip("/").split("/"), route.strip("/").split("/")
+    return len(pattern_segments) == len(route_segments) and all(
+        expected in ("*", actual) for expected, actual in zip(pattern_segments, route_segments)
+    )
+
+
+class ResponseCache:
+    """
+    Caches the responses of GET requests, so that repeated reads of the same resource skip the network.
+
+    Entries are fresh for `ttl` seconds, or for the TTL of the first pattern in `route_ttls` that matches the
+    request path. In patterns, `*` stands for one path segment, and a TTL of 0 turns caching off for the route.
+    Task and upload status routes are in `DEFAULT_ROUTE_TTLS` with a TTL of 0, so that waiters see status changes.
+    Once an entry with an `ETag` goes stale, the next read revalidates it with `If-None-Match`, and a 304
+    response serves the cached body again. Any other request method invalidates the cached responses of the
+    same resource, of the collections above it and of the resources nested under it. Responses marked
+    `Cache-Control: no-store` and streamed responses are never cached.
+
+    `backends` are checked in order, and an entry found in a later backend is copied into the earlier ones.
+    The default is a single `MemoryCacheBackend`.
+
+    Examples
+    --------
+    from twelvelabs import TwelveLabs
+    from twelvelabs.core import MemoryCacheBackend, ResponseCache, SqliteCacheBackend
+
+    client = TwelveLabs(
+        api_key="YOUR_API_KEY",
+        response_cache=ResponseCache(
+            ttl=60,
+            route_ttls={"indexes/*/videos/*": 600, "tasks/*": 0},
+            backends=[MemoryCacheBackend(), SqliteCacheBackend("twelvelabs-cache.db")],
+        ),
+    )
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60.0,
+        route_ttls: typing.Optional[typing.Mapping[str, float]] = None,
+        backends: typing.Optional[typing.Sequence[CacheBackend]] = None,
+    ) -> None:
+        self.ttl = ttl
+        # The caller's routes come first, and keep their TTLs, so that they take precedence over the defaults
+        self.route_ttls = {**dict(route_ttls or {}), **DEFAULT_ROUTE_TTLS, **dict(route_ttls or {})}
+        self.backends = list(backends) if backends is not None else [MemoryCacheBackend()]
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self.stats, name, getattr(self.stats, name) + amount)
+
+    def get_ttl(self, route: typing.Optional[str]) -> float:
+        for pattern, ttl in self.route_ttls.items():
+            if _match_route(pattern, route or ""):
+                return ttl
+        return self.ttl
+
+    def get_key(self, request: httpx.Request) -> str:
+        # Different API keys may see different resources, so they never share entries
+        api_key = request.headers.get("x-api-key", "")
+        return f"{hashlib.sha256(api_key.encode()).hexdigest()[:16]} {request.url}"
+
+    def lookup(
+        self, request: httpx.Request, route: typing.Optional[str]
+    ) -> typing.Tuple[typing.Optional[httpx.Response], typing.Optional[CacheEntry]]:
+        """
+        Returns the cached response to a GET request if it is fresh. Otherwise returns the stale entry to
+        revalidate, after adding its ETag to the request, or None.
+        """
+        if request.method != "GET" or self.get_ttl(route) <= 0:
+            return None, None
+        key = self.get_key(request)
+        for index, backend in enumerate(self.backends):
+            entry = backend.get(key)
+            if entry is None:
+                continue
+            for earlier in self.backends[:index]:
+                earlier.set(key, entry)
+            if entry.is_fresh(time.time()):
+                self._count("hits")
+                return self.to_response(request, entry), entry
+            if entry.etag is None:
+                break
+            request.headers["If-None-Match"] = entry.etag
+            self._count("misses")
+            return None, entry
+        self._count("misses")
+        return None, None
+
+    def update(
+        self,
+        request: httpx.Request,
+        route: typing.Optional[str],
+        response: httpx.Response,
+        entry: typing.Optional[CacheEntry],
+    ) -> httpx.Response:
+        """
+        Stores, revalidates or invalidates entries with a response received from the server, and returns the
+        response to hand to the caller.
+        """
+        if request.method != "GET":
+            self._count("invalidations", sum(backend.invalidate(request.url.path) for backend in self.backends))
+            return response
+        if entry is not None and response.status_code == 304:
+            self._count("revalidations")
+            entry = dataclasses.replace(entry, expires_at=time.time() + self.get_ttl(route))
+            self._set(request, entry)
+            return self.to_response(request, entry)
+        ttl = self.get_ttl(route)
+        if response.status_code != 200 or ttl <= 0 or "no-store" in response.headers.get("cache-control", ""):
+            return response
+        entry = CacheEntry(
+            path=request.url.path,
+            headers=[(name, value) for name, value in response.headers.items() if name not in _DROPPED_HEADERS],
+            content=response.content,
+            etag=response.headers.get("etag"),
+            expires_at=time.time() + ttl,
+        )
+        self._set(request, entry)
+        return response
+
+    def _set(self, request: httpx.Request, entry: CacheEntry) -> None:
+        key = self.get_key(request)
+        for backend in self.backends:
+            backend.set(key, entry)
+
+    def to_response(self, request: httpx.Request, entry: CacheEntry) -> httpx.Response:
+        return httpx.Response(200, headers=entry.headers, content=entry.content, request=request)
@@ -0,0 +1,187 @@
+import dataclasses
+import email.utils
+import random
+import re
+import time
+import typing
+
+import httpx
+
+# Methods that can be repeated without changing the outcome, see RFC 9110 section 9.2.2
+IDEMPOTENT_METHODS: typing.FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+# The server did not act on the request, so it is safe to send it again whatever the method
+RETRYABLE_STATUS_CODES: typing.FrozenSet[int] = frozenset({408, 429, 503})
+
+# A conflict with the current state of the resource. In this API it is usually permanent, such as deleting an
+# asset that is still referenced, so it is only retried with `retry_conflicts`
+CONFLICT_STATUS_CODE = 409
+
+# The request never reached the server
+RETRYABLE_CONNECT_ERRORS: typing.Tuple[typing.Type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+
+# The server may or may not have processed the request before the connection failed
+RETRYABLE_TRANSPORT_ERRORS: typing.Tuple[typing.Type[Exception], ...] = (
+    httpx.ReadTimeout,
+    httpx.WriteTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+
+def _parse_retry_after(response_headers: httpx.Headers) -> typing.Optional[float]:
+    """
+    This function parses the `Retry-After` header in a HTTP response and returns the number of seconds to wait.
+
+    Inspired by the urllib3 retry implementation.
+    """
+    retry_after_ms = response_headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            return max(float(retry_after_ms) / 1000, 0)
+        except ValueError:
+            pass
+
+    retry_after = response_headers.get("retry-after")
+    if retry_after is None:
+        return None
+
+    # Attempt to parse the header as an int.
+    if re.match(r"^\s*[0-9]+\s*$", retry_after):
+        seconds = float(retry_after)
+    # Fallback to parsing it as a date.
+    else:
+        retry_date_tuple = email.utils.parsedate_tz(retry_after)
+        if retry_date_tuple is None:
+            return None
+        if retry_date_tuple[9] is None:  # Python 2
+            # Assume UTC if no timezone was specified
+            # On Python2.7, parsedate_tz returns None for a timezone offset
+            # instead of 0 if no timezone is given, where mktime_tz treats
+            # a None timezone offset as local time.
+            retry_date_tuple = retry_date_tuple[:9] + (0,) + retry_date_tuple[10:]
+
+        retry_date = email.utils.mktime_tz(retry_date_tuple)
+        seconds = retry_date - time.time()
+
+    if seconds < 0:
+        seconds = 0
+
+    return seconds
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Decides whether a failed request is sent again, and how long to wait first.
+
+    A request is retried when the response status is 5xx, 408 or 429, or when the connection fails. A 409
+    Conflict is only retried with `retry_conflicts`, since it usually reports a state that waiting won't change.
+    Failures after which the server may already have acted on the request (a 500, 502 or 504, a read
+    timeout, or a connection dropped mid-response) are only retried for idempotent methods, unless
+    `retry_non_idempotent` is set. Waits honor `Retry-After` and otherwise use exponential backoff with full
+    jitter.
+
+    Parameters
+    ----------
+    max_retries : int
+        The maximum number of retries after the first attempt.
+
+    max_retry_duration : typing.Optional[float]
+        The total time budget in seconds, measured from the first attempt. A retry is not scheduled if it
+        would start after the budget runs out.
+
+    initial_delay : float
+        The backoff ceiling, in seconds, before the first retry. It doubles on each retry.
+
+    max_delay : float
+        The largest backoff ceiling, in seconds.
+
+    max_retry_after : float
+        The longest `Retry-After` value, in seconds, that is honored. Longer values fall back to backoff.
+
+    retry_non_idempotent : bool
+        Whether to also retry POST and PATCH requests after failures the server may have acted on.
+
+    retry_conflicts : bool
+        Whether to also retry 409 Conflict responses, for callers that know the conflict is transient.
+
+    Examples
+    --------
+    from twelvelabs import TwelveLabs
+    from twelvelabs.core import RetryPolicy
+
+    client = TwelveLabs(api_key="YOUR_API_KEY", retry_policy=RetryPolicy(max_retries=5, max_retry_duration=60))
+    """
+
+    max_retries: int = 2
+    max_retry_duration: typing.Optional[float] = None
+    initial_delay: float = 0.5
+    max_delay: float = 10.0
+    max_retry_after: float = 30.0
+    retry_non_idempotent: bool = False
+    retry_conflicts: bool = False
+
+    def get_retry_delay(
+        self,
+        *,
+        method: str,
+        attempt: int,
+        elapsed: float,
+        response: typing.Optional[httpx.Response] = None,
+        error: typing.Optional[BaseException] = None,
+    ) -> typing.Optional[float]:
+        """
+        Returns the number of seconds to wait before retrying, or None if the request should not be retried.
+
+        `attempt` is the number of retries already made and `elapsed` the seconds since the first attempt.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if response is not None:
+            if not self._is_retryable_response(method, response):
+                return None
+        elif error is None or not self._is_retryable_error(method, error):
+            return None
+
+        delay = self._get_delay(attempt, response)
+        if self.max_retry_duration is not None and elapsed + delay > self.max_retry_duration:
+            return None
+        return delay
+
+    def _is_retryable_response(self, method: str, response: httpx.Response) -> bool:
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            return True
+        if response.status_code == CONFLICT_STATUS_CODE:
+            return self.retry_conflicts
+        if response.status_code >= 500:
+            return self._may_repeat(method)
+        return False
+
+    def _is_retryable_error(self, method: str, error: BaseException) -> bool:
+        if isinstance(error, RETRYABLE_CONNECT_ERRORS):
+            return True
+        if isinstance(error, RETRYABLE_TRANSPORT_ERRORS):
+            return self._may_repeat(method)
+        return False
+
+    def _may_repeat(self, method: str) -> bool:
+        return self.retry_non_idempotent or method.upper() in IDEMPOTENT_METHODS
+
+    def _get_delay(self, attempt: int, response: typing.Optional[httpx.Response]) -> float:
+        # If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers)
+            if retry_after is not None and retry_after <= self.max_retry_after:
+                return retry_after
+
+        # Full jitter spreads retries from many clients evenly instead of in synchronized waves.
+        return random.uniform(0, min(self.initial_delay * pow(2.0, attempt), self.max_delay))
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
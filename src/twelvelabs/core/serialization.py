@@ -1,6 +1,7 @@
 # This file was auto-generated by Fern from our API Definition.
 
 import collections
+import functools
 import inspect
 import typing
 
@@ -58,6 +59,10 @@ def convert_and_respect_annotation_metadata(
     if inner_type is None:
         inner_type = annotation
 
+    # Nothing to rename anywhere below this type, so don't walk the object (e.g. an embedding vector)
+    if not _has_aliases(inner_type):
+        return object_
+
     clean_type = _remove_annotations(inner_type)
     # Pydantic models
     if (
@@ -160,13 +165,7 @@ def _convert_mapping(
     direction: typing.Literal["read", "write"],
 ) -> typing.Mapping[str, object]:
     converted_object: typing.Dict[str, object] = {}
-    try:
-        annotations = typing_extensions.get_type_hints(expected_type, include_extras=True)
-    except NameError:
-        # The TypedDict contains a circular reference, so
-        # we use the __annotations__ attribute directly.
-        annotations = getattr(expected_type, "__annotations__", {})
-    aliases_to_field_names = _get_alias_to_field_name(annotations)
+    annotations, aliases_to_field_names = _get_mapping_plan(expected_type)
     for key, value in object_.items():
         if direction == "read" and key in aliases_to_field_names:
             dealiased_key = aliases_to_field_names.get(key)
@@ -191,6 +190,76 @@ def _convert_mapping(
     return converted_object
 
 
+def _get_mapping_plan(
+    expected_type: typing.Any,
+) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, str]]:
+    try:
+        return _get_cached_mapping_plan(expected_type)
+    except TypeError:
+        return _build_mapping_plan(expected_type)
+
+
+def _build_mapping_plan(
+    expected_type: typing.Any,
+) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict[str, str]]:
+    try:
+        annotations = typing_extensions.get_type_hints(expected_type, include_extras=True)
+    except NameError:
+        # The TypedDict contains a circular reference, so
+        # we use the __annotations__ attribute directly.
+        annotations = getattr(expected_type, "__annotations__", {})
+    return annotations, _get_alias_to_field_name(annotations)
+
+
+_get_cached_mapping_plan = functools.lru_cache(maxsize=1024)(_build_mapping_plan)
+
+
+def _has_aliases(type_: typing.Any) -> bool:
+    """
+    Whether any field reachable from the type is renamed by a `FieldMetadata` alias. The answer is cached per
+    type, so payloads of alias-free types (most responses) are returned as-is without being walked.
+    """
+    try:
+        return _has_aliases_cached(type_)
+    except TypeError:
+        return _type_contains_aliases(type_, set())
+
+
+@functools.lru_cache(maxsize=1024)
+def _has_aliases_cached(type_: typing.Any) -> bool:
+    return _type_contains_aliases(type_, set())
+
+
+def _type_contains_aliases(type_: typing.Any, seen: typing.Set[typing.Any]) -> bool:
+    if isinstance(type_, (str, typing.ForwardRef)):
+        # Unresolved reference, so we can't tell; assume it may be aliased
+        return True
+
+    origin = typing_extensions.get_origin(type_)
+    if origin == typing_extensions.Annotated:
+        args = typing_extensions.get_args(type_)
+        if any(isinstance(metadata, FieldMetadata) for metadata in args[1:]):
+            return True
+        return _type_contains_aliases(args[0], seen)
+    if origin == typing.ClassVar or origin == typing_extensions.Literal:
+        return False
+    if origin is not None:
+        return any(_type_contains_aliases(arg, seen) for arg in typing_extensions.get_args(type_))
+
+    if inspect.isclass(type_) and (issubclass(type_, pydantic.BaseModel) or typing_extensions.is_typeddict(type_)):
+        # Self-referencing types are fully explored by the first visit
+        if type_ in seen:
+            return False
+        seen.add(type_)
+        try:
+            annotations = typing_extensions.get_type_hints(type_, include_extras=True)
+        except NameError:
+            return True
+        return any(_type_contains_aliases(hint, seen) for hint in annotations.values())
+
+    return False
+
+
 def _get_annotation(type_: typing.Any) -> typing.Optional[typing.Any]:
     maybe_annotated_type = typing_extensions.get_origin(type_)
     if maybe_annotated_type is None:
@@ -0,0 +1,82 @@
+import asyncio
+import hashlib
+import threading
+import typing
+
+import httpx
+
+# Only requests that read can be shared, a write must reach the server once per call
+COALESCED_METHODS: typing.FrozenSet[str] = frozenset({"GET", "HEAD"})
+
+
+def get_request_key(request: httpx.Request) -> str:
+    """Identifies a request by its method, URL and headers, which include the API key."""
+    digest = hashlib.sha256()
+    for name, value in sorted(request.headers.multi_items()):
+        digest.update(f"{name}:{value}\n".encode())
+    return f"{request.method} {request.url} {digest.hexdigest()}"
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: typing.Optional[httpx.Response] = None
+        self.error: typing.Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Shares one HTTP call between the threads that send the same request at the same time. The first thread
+    sends it, and the others wait for its response, or its exception, instead of sending their own. The
+    response body is read before it is shared, so every caller can parse it.
+    """
+
+    def __init__(self) -> None:
+        self._calls: typing.Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, send: typing.Callable[[], httpx.Response]) -> httpx.Response:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return typing.cast(httpx.Response, call.response)
+        try:
+            call.response = send()
+            return call.response
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    The asyncio counterpart of `SingleFlight`. The shared call runs in its own task, so cancelling the
+    coroutine that started it doesn't cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: typing.Dict[str, "asyncio.Future[httpx.Response]"] = {}
+
+    async def do(self, key: str, send: typing.Callable[[], typing.Awaitable[httpx.Response]]) -> httpx.Response:
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = asyncio.ensure_future(send())
+
+            def forget(future: "asyncio.Future[httpx.Response]") -> None:
+                del self._calls[key]
+                # Mark the exception as retrieved, in case every caller was cancelled before it was raised
+                if not future.cancelled():
+                    future.exception()
+
+            call.add_done_callback(forget)
+        return await asyncio.shield(call)
@@ -0,0 +1,196 @@
+import asyncio
+import collections
+import dataclasses
+import typing
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from .throttle import RequestThrottle
+
+T = typing.TypeVar("T")
+
+
+@dataclasses.dataclass(frozen=True)
+class BulkItemResult(typing.Generic[T]):
+    """
+    The outcome of one input of a bulk call: the created value, or the exception raised while creating it.
+    """
+
+    index: int
+    value: typing.Optional[T] = None
+    error: typing.Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkResult(typing.List[T]):
+    """
+    The values created by a bulk call, in input order, skipping the inputs that failed.
+
+    `results` holds one `BulkItemResult` per input, in input order, so failures can be matched back to their
+    inputs.
+    """
+
+    def __init__(self, results: typing.List[BulkItemResult[T]]) -> None:
+        super().__init__(typing.cast(T, result.value) for result in results if result.ok)
+        self.results = results
+
+    @property
+    def errors(self) -> typing.List[BulkItemResult[T]]:
+        return [result for result in self.results if not result.ok]
+
+
+def _validate(max_workers: int) -> None:
+    if max_workers <= 0:
+        raise ValueError("max_workers must be greater than 0")
+
+
+def run_bulk(
+    calls: typing.Sequence[typing.Callable[[], T]],
+    *,
+    max_workers: int,
+    max_requests_per_second: typing.Optional[float],
+) -> BulkResult[T]:
+    """
+    Runs `calls` on a pool of `max_workers` threads, starting at most `max_requests_per_second` of them per
+    second. An exception only fails its own item.
+    """
+    _validate(max_workers)
+    throttle = RequestThrottle(max_requests_per_second)
+
+    def run(index: int) -> BulkItemResult[T]:
+        throttle.wait()
+        try:
+            return BulkItemResult(index=index, value=calls[index]())
+        except Exception as e:
+            return BulkItemResult(index=index, error=e)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, max(len(calls), 1))) as executor:
+        return BulkResult(list(executor.map(run, range(len(calls)))))
+
+
+async def async_run_bulk(
+    calls: typing.Sequence[typing.Callable[[], typing.Awaitable[T]]],
+    *,
+    max_workers: int,
+    max_requests_per_second: typing.Optional[float],
+) -> BulkResult[T]:
+    """
+    The async counterpart of `run_bulk`. At most `max_workers` calls are awaited at the same time.
+    """
+    _validate(max_workers)
+    throttle = RequestThrottle(max_requests_per_second)
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(index: int) -> BulkItemResult[T]:
+        async with semaphore:
+            await throttle.wait_async()
+            try:
+                return BulkItemResult(index=index, value=await calls[index]())
+            except Exception as e:
+                return BulkItemResult(index=index, error=e)
+
+    return BulkResult(list(await asyncio.gather(*(run(index) for index in range(len(calls))))))
+
+
+def iter_bulk(
+    calls: typing.Iterable[typing.Callable[[], T]],
+    *,
+    max_workers: int,
+    throttle: RequestThrottle,
+    ordered: bool = True,
+) -> typing.Iterator[BulkItemResult[T]]:
+    """
+    Like `run_bulk`, but reads `calls` lazily and yields each result as soon as it can: in input order, or in
+    completion order when `ordered` is False. At most `2 * max_workers` calls are started ahead of the results
+    read, so an input of any length runs in bounded memory. Calls not started yet are dropped when the
+    iteration stops early.
+    """
+    _validate(max_workers)
+    numbered = enumerate(calls)
+    window = 2 * max_workers
+
+    def run(index: int, call: typing.Callable[[], T]) -> BulkItemResult[T]:
+        throttle.wait()
+        try:
+            return BulkItemResult(index=index, value=call())
+        except Exception as e:
+            return BulkItemResult(index=index, error=e)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        started: "collections.deque[Future[BulkItemResult[T]]]" = collections.deque()
+
+        def start() -> None:
+            while len(started) < window:
+                item = next(numbered, None)
+                if item is None:
+                    return
+                started.append(executor.submit(run, *item))
+
+        try:
+            start()
+            while started:
+                if ordered:
+                    result = started.popleft().result()
+                else:
+                    done, _ = wait(started, return_when=FIRST_COMPLETED)
+                    future = next(future for future in started if future in done)
+                    started.remove(future)
+                    result = future.result()
+                start()
+                yield result
+        finally:
+            for future in started:
+                future.cancel()
+
+
+async def async_iter_bulk(
+    calls: typing.Iterable[typing.Callable[[], typing.Awaitable[T]]],
+    *,
+    max_workers: int,
+    throttle: RequestThrottle,
+    ordered: bool = True,
+) -> typing.AsyncIterator[BulkItemResult[T]]:
+    """
+    The async counterpart of `iter_bulk`. At most `max_workers` calls are awaited at the same time.
+    """
+    _validate(max_workers)
+    numbered = enumerate(calls)
+    window = 2 * max_workers
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(index: int, call: typing.Callable[[], typing.Awaitable[T]]) -> BulkItemResult[T]:
+        async with semaphore:
+            await throttle.wait_async()
+            try:
+                return BulkItemResult(index=index, value=await call())
+            except Exception as e:
+                return BulkItemResult(index=index, error=e)
+
+    started: "collections.deque[asyncio.Task[BulkItemResult[T]]]" = collections.deque()
+
+    def start() -> None:
+        while len(started) < window:
+            item = next(numbered, None)
+            if item is None:
+                return
+            started.append(asyncio.ensure_future(run(*item)))
+
+    try:
+        start()
+        while started:
+            if ordered:
+                result = await started.popleft()
+            else:
+                done, _ = await asyncio.wait(started, return_when=asyncio.FIRST_COMPLETED)
+                task = next(task for task in started if task in done)
+                started.remove(task)
+                result = task.result()
+            start()
+            yield result
+    finally:
+        for task in started:
+            task.cancel()
+        # Wait for the cancelled calls to unwind, so that none outlives the iterator
+        await asyncio.gather(*started, return_exceptions=True)
@@ -1,3 +1,4 @@
+import functools
 import typing
 import time
 import asyncio
@@ -9,7 +10,29 @@ from ..embed.tasks.types.tasks_status_response import TasksStatusResponse
 from ..embed.tasks.types.tasks_create_request_video_embedding_scope_item import (
     TasksCreateRequestVideoEmbeddingScopeItem,
 )
+from ..embed.v_2.client import V2Client, AsyncV2Client
+from ..embed.v_2.tasks.client import TasksClient as V2TasksClient, AsyncTasksClient as AsyncV2TasksClient
+from ..embed.v_2.types.create_embeddings_request_input_type import CreateEmbeddingsRequestInputType
+from ..embed.v_2.types.create_embeddings_request_model_name import CreateEmbeddingsRequestModelName
+from ..core.embedding_arrays import EmbeddingArrays
+from ..core.embedding_stream import EMBED_V2_PATH, async_stream_embeddings, stream_embeddings
+from ..core.jsonable_encoder import jsonable_encoder
 from ..core.request_options import RequestOptions
+from ..core.serialization import convert_and_respect_annotation_metadata
+from ..types.audio_input_request import AudioInputRequest
+from ..types.embedding_data import EmbeddingData
+from ..types.image_input_request import ImageInputRequest
+from ..types.multi_input_request import MultiInputRequest
+from ..types.text_image_input_request import TextImageInputRequest
+from ..types.text_input_request import TextInputRequest
+from ..types.video_input_request import VideoInputRequest
+from ..types.embedding_success_response import EmbeddingSuccessResponse
+from ..types.embedding_task_response import EmbeddingTaskResponse
+from .bulk import BulkItemResult, BulkResult, async_iter_bulk, async_run_bulk, iter_bulk, run_bulk
+from .embedding_cache import EmbeddingCache, get_embedding_key
+from .polling import PollingStrategy, get_polling_strategy
+from .task_waiter import DONE_STATUSES, LIST_PAGE_LIMIT, async_wait_for_many, wait_for_many
+from .throttle import RequestThrottle
 from .. import core
 
 OMIT = typing.cast(typing.Any, ...)
@@ -28,6 +51,147 @@ class CreateEmbeddingsTaskVideoParams(typing.TypedDict, total=False):
     ]
 
 
+class CreateEmbeddingsInput(typing.TypedDict, total=False):
+    """
+    One input of `embed.v_2.create_many`: the parameters of `embed.v_2.create` other than `model_name`.
+    `input_type` can be left out when exactly one of the other parameters is set.
+    """
+
+    input_type: CreateEmbeddingsRequestInputType
+    text: TextInputRequest
+    image: ImageInputRequest
+    text_image: TextImageInputRequest
+    audio: AudioInputRequest
+    video: VideoInputRequest
+    multi_input: MultiInputRequest
+
+
+# `embed.v_2.create` answers short inputs, and tasks answer long audio and video
+EmbeddingResult = typing.Union[EmbeddingSuccessResponse, EmbeddingTaskResponse]
+
+_INPUT_FIELDS = ("text", "image", "text_image", "audio", "video", "multi_input")
+
+
+def _get_input_params(embedding_input: CreateEmbeddingsInput) -> typing.Dict[str, typing.Any]:
+    """Returns the `create` parameters of an input, with its `input_type` filled in."""
+    params: typing.Dict[str, typing.Any] = {
+        field: value for field, value in embedding_input.items() if field in _INPUT_FIELDS
+    }
+    input_type = embedding_input.get("input_type")
+    if input_type is None:
+        if len(params) != 1:
+            raise ValueError(f"Cannot tell the input_type of an input with {sorted(params) or 'no media'}")
+        (input_type,) = params
+    params["input_type"] = input_type
+    return params
+
+
+def _is_long_media(params: typing.Dict[str, typing.Any], task_threshold_sec: typing.Optional[float]) -> bool:
+    """
+    Whether an input should be embedded by a task: audio or video longer than `task_threshold_sec`, or without an
+    `end_sec`, since its length is unknown.
+    """
+    if task_threshold_sec is None or params["input_type"] not in ("audio", "video"):
+        return False
+    media = params.get(params["input_type"])
+
+    def get(name: str) -> typing.Optional[float]:
+        return media.get(name) if isinstance(media, dict) else getattr(media, name, None)
+
+    end_sec = get("end_sec")
+    return end_sec is None or end_sec - (get("start_sec") or 0.0) > task_threshold_sec
+
+
+def _get_task_delay(
+    strategy: PollingStrategy,
+    attempt: int,
+    started_at: float,
+    task: typing.Optional[EmbeddingTaskResponse],
+    task_id: str,
+    max_wait_time: typing.Optional[float],
+) -> float:
+    """
+    Returns the sleep before the next status check of an embedding task, cut short so that the last check
+    happens at `max_wait_time`. Raises once the task has run for `max_wait_time` seconds.
+    """
+    elapsed = time.monotonic() - started_at
+    delay = strategy.get_delay(attempt=attempt, elapsed=elapsed, resource=task)
+    if max_wait_time is None:
+        return delay
+    if elapsed >= max_wait_time:
+        raise TimeoutError(f"Embedding task {task_id} was still running after {max_wait_time} seconds")
+    return min(delay, max_wait_time - elapsed)
+
+
+def _get_create_kwargs(
+    model_name: str,
+    video_params: CreateEmbeddingsTaskVideoParams,
+    request_options: typing.Optional[RequestOptions],
+) -> typing.Dict[str, typing.Any]:
+    # Extract parameters, handling both dict and object access
+    def get_param(key: str) -> typing.Any:
+        if hasattr(video_params, key):
+            return getattr(video_params, key)
+        return video_params.get(key) if isinstance(video_params, dict) else None
+
+    # Build kwargs, only including non-None values
+    kwargs: typing.Dict[str, typing.Any] = {"model_name": model_name}
+    for key in (
+        "video_file",
+        "video_url",
+        "video_start_offset_sec",
+        "video_end_offset_sec",
+        "video_clip_length",
+        "video_embedding_scope",
+    ):
+        value = get_param(key)
+        if value is not None:
+            kwargs[key] = value
+
+    if request_options is not None:
+        kwargs["request_options"] = request_options
+    return kwargs
+
+
+def _get_v2_create_json(
+    input_type: CreateEmbeddingsRequestInputType,
+    model_name: CreateEmbeddingsRequestModelName,
+    text: typing.Optional[TextInputRequest],
+    image: typing.Optional[ImageInputRequest],
+    text_image: typing.Optional[TextImageInputRequest],
+    audio: typing.Optional[AudioInputRequest],
+    video: typing.Optional[VideoInputRequest],
+    multi_input: typing.Optional[MultiInputRequest],
+) -> typing.Dict[str, typing.Any]:
+    # The same request body as `client.embed.v_2.create`
+    return {
+        "input_type": input_type,
+        "model_name": model_name,
+        "text": convert_and_respect_annotation_metadata(object_=text, annotation=TextInputRequest, direction="write"),
+        "image": convert_and_respect_annotation_metadata(
+            object_=image, annotation=ImageInputRequest, direction="write"
+        ),
+        "text_image": convert_and_respect_annotation_metadata(
+            object_=text_image, annotation=TextImageInputRequest, direction="write"
+        ),
+        "audio": convert_and_respect_annotation_metadata(
+            object_=audio, annotation=AudioInputRequest, direction="write"
+        ),
+        "video": convert_and_respect_annotation_metadata(
+            object_=video, annotation=VideoInputRequest, direction="write"
+        ),
+        "multi_input": convert_and_respect_annotation_metadata(
+            object_=multi_input, annotation=MultiInputRequest, direction="write"
+        ),
+    }
+
+
+def _get_cache_key(request: typing.Dict[str, typing.Any], cache: EmbeddingCache) -> str:
+    return get_embedding_key(
+        {name: value for name, value in request.items() if value is not OMIT}, normalize_text=cache.normalize_text
+    )
+
+
 class EmbedTasksClientWrapper(TasksClient):
     """Wrapper for the TasksClient that adds additional functionality."""
 
@@ -40,8 +204,10 @@ class EmbedTasksClientWrapper(TasksClient):
         *,
         model_name: typing.Literal["Marengo-retrieval-2.7"],
         videos: typing.List[CreateEmbeddingsTaskVideoParams],
+        max_workers: int = 5,
+        max_requests_per_second: typing.Optional[float] = None,
         request_options: typing.Optional[RequestOptions] = None,
-    ) -> typing.List[TasksCreateResponse]:
+    ) -> BulkResult[TasksCreateResponse]:
         """
         This method creates multiple video embedding tasks in bulk.
 
@@ -55,13 +221,20 @@ class EmbedTasksClientWrapper(TasksClient):
             - video_file or video_url: The video file or URL to embed
             - Optional parameters like start/end offsets, clip length, and embedding scopes
 
+        max_workers : int
+            The maximum number of tasks created at the same time.
+
+        max_requests_per_second : typing.Optional[float]
+            The maximum number of tasks created per second, or None for no limit.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
         Returns
         -------
-        typing.List[TasksCreateResponse]
-            A list of video embedding tasks that were successfully created.
+        BulkResult[TasksCreateResponse]
+            The video embedding tasks that were successfully created, in input order. Its `results` attribute
+            has one entry per video, holding the created task or the exception raised for it.
 
         Examples
         --------
@@ -88,57 +261,11 @@ class EmbedTasksClientWrapper(TasksClient):
             videos=videos,
         )
         """
-        tasks = []
-
-        for video_params in videos:
-            try:
-                # Extract parameters, handling both dict and object access
-                def get_param(key: str) -> typing.Any:
-                    if hasattr(video_params, key):
-                        return getattr(video_params, key)
-                    return (
-                        video_params.get(key)
-                        if isinstance(video_params, dict)
-                        else None
-                    )
-
-                # Build kwargs, only including non-None values
-                kwargs: typing.Dict[str, typing.Any] = {"model_name": model_name}
-
-                video_file = get_param("video_file")
-                if video_file is not None:
-                    kwargs["video_file"] = video_file
-
-                video_url = get_param("video_url")
-                if video_url is not None:
-                    kwargs["video_url"] = video_url
-
-                video_start_offset_sec = get_param("video_start_offset_sec")
-                if video_start_offset_sec is not None:
-                    kwargs["video_start_offset_sec"] = video_start_offset_sec
-
-                video_end_offset_sec = get_param("video_end_offset_sec")
-                if video_end_offset_sec is not None:
-                    kwargs["video_end_offset_sec"] = video_end_offset_sec
-
-                video_clip_length = get_param("video_clip_length")
-                if video_clip_length is not None:
-                    kwargs["video_clip_length"] = video_clip_length
-
-                video_embedding_scope = get_param("video_embedding_scope")
-                if video_embedding_scope is not None:
-                    kwargs["video_embedding_scope"] = video_embedding_scope
-
-                if request_options is not None:
-                    kwargs["request_options"] = request_options
-
-                task = self.create(**kwargs)
-                tasks.append(task)
-            except Exception as e:
-                print(f"Error creating embedding task: {e}")
-                continue
-
-        return tasks
+        calls: typing.List[typing.Callable[[], TasksCreateResponse]] = [
+            functools.partial(self.create, **_get_create_kwargs(model_name, video_params, request_options))
+            for video_params in videos
+        ]
+        return run_bulk(calls, max_workers=max_workers, max_requests_per_second=max_requests_per_second)
 
     def wait_for_done(
         self,
@@ -146,6 +273,7 @@ class EmbedTasksClientWrapper(TasksClient):
         *,
         sleep_interval: float = 5.0,
         callback: typing.Optional[typing.Callable[[TasksStatusResponse], None]] = None,
+        polling: typing.Optional[PollingStrategy] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> TasksStatusResponse:
         """
@@ -162,6 +290,10 @@ class EmbedTasksClientWrapper(TasksClient):
         callback : typing.Optional[typing.Callable[[TasksStatusResponse], None]], optional
             A function to call after each status check with the task response, by default None
 
+        polling : typing.Optional[PollingStrategy], optional
+            How long to sleep between status checks, for example `ExponentialBackoff()` or `DurationEstimate()`.
+            Overrides sleep_interval, by default None
+
         Returns
         -------
         TasksStatusResponse
@@ -185,8 +317,9 @@ class EmbedTasksClientWrapper(TasksClient):
             sleep_interval=10.0,
         )
         """
-        if sleep_interval <= 0:
-            raise ValueError("sleep_interval must be greater than 0")
+        strategy = get_polling_strategy(polling, sleep_interval)
+        started_at = time.monotonic()
+        attempt = 0
 
         done_statuses = ["ready", "failed"]
 
@@ -197,20 +330,107 @@ class EmbedTasksClientWrapper(TasksClient):
         if callback is not None:
             callback(task)
 
+        delay = strategy.get_delay(attempt=attempt, elapsed=time.monotonic() - started_at, resource=task)
         while task.status not in done_statuses:
-            time.sleep(sleep_interval)
+            time.sleep(delay)
+            attempt += 1
 
             try:
                 task = self.status(task_id, request_options=request_options)
             except Exception as e:
                 print(f"Retrieving task status failed: {e}. Retrying...")
+                elapsed = time.monotonic() - started_at
+                delay = strategy.get_error_delay(e, attempt=attempt, elapsed=elapsed, resource=task)
                 continue
 
             if callback is not None:
                 callback(task)
+            delay = strategy.get_delay(attempt=attempt, elapsed=time.monotonic() - started_at, resource=task)
 
         return task
 
+    def wait_for_many(
+        self,
+        task_ids: typing.Iterable[str],
+        *,
+        sleep_interval: float = 5.0,
+        max_requests_per_second: typing.Optional[float] = 5.0,
+        use_list: bool = True,
+        max_wait_time: typing.Optional[float] = None,
+        polling: typing.Optional[PollingStrategy] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[TasksStatusResponse]:
+        """
+        Wait for many tasks at once, yielding each task as soon as it is done.
+
+        A single loop polls every task. Each round lists the tasks that are still running, many per request,
+        and retrieves only the tasks that dropped off that list. Tasks are yielded in the order they finish.
+
+        Parameters
+        ----------
+        task_ids : typing.Iterable[str]
+            The unique identifiers of the tasks to wait for.
+
+        sleep_interval : float, optional
+            The time in seconds to wait between polling rounds, by default 5.0
+
+        max_requests_per_second : typing.Optional[float], optional
+            The maximum rate of status requests across all tasks, or None for no limit, by default 5.0
+
+        use_list : bool, optional
+            Whether to find running tasks through the list endpoint. If False, each task is retrieved
+            every round, by default True
+
+        max_wait_time : typing.Optional[float], optional
+            Maximum time to wait in seconds before timing out, by default None (no timeout)
+
+        polling : typing.Optional[PollingStrategy], optional
+            How long to sleep between polling rounds, for example `ExponentialBackoff()`. Overrides
+            sleep_interval, by default None
+
+        request_options : typing.Optional[RequestOptions], optional
+            Request-specific configuration, by default None
+
+        Yields
+        ------
+        TasksStatusResponse
+            Each task once its status is `ready` or `failed`
+
+        Raises
+        ------
+        ValueError
+            If sleep_interval or max_requests_per_second is less than or equal to 0
+
+        TimeoutError
+            If some tasks are still running after max_wait_time
+
+        Examples
+        --------
+        from twelvelabs import TwelveLabs
+
+        client = TwelveLabs(
+            api_key="YOUR_API_KEY",
+        )
+        tasks = client.embed.tasks.create_bulk(
+            model_name="Marengo-retrieval-2.7",
+            videos=[{"video_url": "https://example.com/video1.mp4"}, {"video_url": "https://example.com/video2.mp4"}],
+        )
+        for task in client.embed.tasks.wait_for_many([task.id for task in tasks]):
+            print(f"Task {task.id} finished with status {task.status}")
+        """
+        return wait_for_many(
+            task_ids,
+            retrieve=lambda task_id: self.status(task_id, request_options=request_options),
+            list_running=(
+                lambda: self.list(status="processing", page_limit=LIST_PAGE_LIMIT, request_options=request_options)
+            )
+            if use_list
+            else None,
+            polling=get_polling_strategy(polling, sleep_interval),
+            max_requests_per_second=max_requests_per_second,
+            max_wait_time=max_wait_time,
+        )
+
 
 class AsyncEmbedTasksClientWrapper(AsyncTasksClient):
     """Async wrapper for the TasksClient that adds additional functionality."""
@@ -224,8 +444,10 @@ class AsyncEmbedTasksClientWrapper(AsyncTasksClient):
         *,
         model_name: typing.Literal["Marengo-retrieval-2.7"],
         videos: typing.List[CreateEmbeddingsTaskVideoParams],
+        max_workers: int = 5,
+        max_requests_per_second: typing.Optional[float] = None,
         request_options: typing.Optional[RequestOptions] = None,
-    ) -> typing.List[TasksCreateResponse]:
+    ) -> BulkResult[TasksCreateResponse]:
         """
         This method creates multiple video embedding tasks in bulk.
 
@@ -239,13 +461,20 @@ class AsyncEmbedTasksClientWrapper(AsyncTasksClient):
             - video_file or video_url: The video file or URL to embed
             - Optional parameters like start/end offsets, clip length, and embedding scopes
 
+        max_workers : int
+            The maximum number of tasks created at the same time.
+
+        max_requests_per_second : typing.Optional[float]
+            The maximum number of tasks created per second, or None for no limit.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
         Returns
         -------
-        typing.List[TasksCreateResponse]
-            A list of video embedding tasks that were successfully created.
+        BulkResult[TasksCreateResponse]
+            The video embedding tasks that were successfully created, in input order. Its `results` attribute
+            has one entry per video, holding the created task or the exception raised for it.
 
         Examples
         --------
@@ -277,57 +506,11 @@ class AsyncEmbedTasksClientWrapper(AsyncTasksClient):
 
         asyncio.run(main())
         """
-        tasks = []
-
-        for video_params in videos:
-            try:
-                # Extract parameters, handling both dict and object access
-                def get_param(key: str) -> typing.Any:
-                    if hasattr(video_params, key):
-                        return getattr(video_params, key)
-                    return (
-                        video_params.get(key)
-                        if isinstance(video_params, dict)
-                        else None
-                    )
-
-                # Build kwargs, only including non-None values
-                kwargs: typing.Dict[str, typing.Any] = {"model_name": model_name}
-
-                video_file = get_param("video_file")
-                if video_file is not None:
-                    kwargs["video_file"] = video_file
-
-                video_url = get_param("video_url")
-                if video_url is not None:
-                    kwargs["video_url"] = video_url
-
-                video_start_offset_sec = get_param("video_start_offset_sec")
-                if video_start_offset_sec is not None:
-                    kwargs["video_start_offset_sec"] = video_start_offset_sec
-
-                video_end_offset_sec = get_param("video_end_offset_sec")
-                if video_end_offset_sec is not None:
-                    kwargs["video_end_offset_sec"] = video_end_offset_sec
-
-                video_clip_length = get_param("video_clip_length")
-                if video_clip_length is not None:
-                    kwargs["video_clip_length"] = video_clip_length
-
-                video_embedding_scope = get_param("video_embedding_scope")
-                if video_embedding_scope is not None:
-                    kwargs["video_embedding_scope"] = video_embedding_scope
-
-                if request_options is not None:
-                    kwargs["request_options"] = request_options
-
-                task = await self.create(**kwargs)
-                tasks.append(task)
-            except Exception as e:
-                print(f"Error creating embedding task: {e}")
-                continue
-
-        return tasks
+        calls: typing.List[typing.Callable[[], typing.Awaitable[TasksCreateResponse]]] = [
+            functools.partial(self.create, **_get_create_kwargs(model_name, video_params, request_options))
+            for video_params in videos
+        ]
+        return await async_run_bulk(calls, max_workers=max_workers, max_requests_per_second=max_requests_per_second)
 
     async def wait_for_done(
         self,
@@ -337,6 +520,7 @@ class AsyncEmbedTasksClientWrapper(AsyncTasksClient):
         callback: typing.Optional[
             typing.Callable[[TasksStatusResponse], typing.Awaitable[None]]
         ] = None,
+        polling: typing.Optional[PollingStrategy] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> TasksStatusResponse:
         """
@@ -353,6 +537,10 @@ class AsyncEmbedTasksClientWrapper(AsyncTasksClient):
         callback : typing.Optional[typing.Callable[[TasksStatusResponse], typing.Awaitable[None]]], optional
             A function to call after each status check with the task response, by default None
 
+        polling : typing.Optional[PollingStrategy], optional
+            How long to sleep between status checks, for example `ExponentialBackoff()` or `DurationEstimate()`.
+            Overrides sleep_interval, by default None
+
         Returns
         -------
         TasksStatusResponse
@@ -377,8 +565,9 @@ class AsyncEmbedTasksClientWrapper(AsyncTasksClient):
             sleep_interval=10.0,
         )
         """
-        if sleep_interval <= 0:
-            raise ValueError("sleep_interval must be greater than 0")
+        strategy = get_polling_strategy(polling, sleep_interval)
+        started_at = time.monotonic()
+        attempt = 0
 
         done_statuses = ["ready", "failed"]
 
@@ -389,36 +578,696 @@ class AsyncEmbedTasksClientWrapper(AsyncTasksClient):
         if callback is not None:
             await callback(task)
 
+        delay = strategy.get_delay(attempt=attempt, elapsed=time.monotonic() - started_at, resource=task)
         while task.status not in done_statuses:
-            await asyncio.sleep(sleep_interval)
+            await asyncio.sleep(delay)
+            attempt += 1
 
             try:
                 task = await self.status(task_id, request_options=request_options)
             except Exception as e:
                 print(f"Retrieving task status failed: {e}. Retrying...")
+                elapsed = time.monotonic() - started_at
+                delay = strategy.get_error_delay(e, attempt=attempt, elapsed=elapsed, resource=task)
                 continue
 
             if callback is not None:
                 await callback(task)
+            delay = strategy.get_delay(attempt=attempt, elapsed=time.monotonic() - started_at, resource=task)
 
         return task
 
+    def wait_for_many(
+        self,
+        task_ids: typing.Iterable[str],
+        *,
+        sleep_interval: float = 5.0,
+        max_requests_per_second: typing.Optional[float] = 5.0,
+        use_list: bool = True,
+        max_wait_time: typing.Optional[float] = None,
+        polling: typing.Optional[PollingStrategy] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[TasksStatusResponse]:
+        """
+        Wait for many tasks at once, yielding each task as soon as it is done.
+
+        A single loop polls every task. Each round lists the tasks that are still running, many per request,
+        and retrieves only the tasks that dropped off that list. Tasks are yielded in the order they finish.
+
+        Parameters
+        ----------
+        task_ids : typing.Iterable[str]
+            The unique identifiers of the tasks to wait for.
+
+        sleep_interval : float, optional
+            The time in seconds to wait between polling rounds, by default 5.0
+
+        max_requests_per_second : typing.Optional[float], optional
+            The maximum rate of status requests across all tasks, or None for no limit, by default 5.0
+
+        use_list : bool, optional
+            Whether to find running tasks through the list endpoint. If False, each task is retrieved
+            every round, by default True
+
+        max_wait_time : typing.Optional[float], optional
+            Maximum time to wait in seconds before timing out, by default None (no timeout)
+
+        polling : typing.Optional[PollingStrategy], optional
+            How long to sleep between polling rounds, for example `ExponentialBackoff()`. Overrides
+            sleep_interval, by default None
+
+        request_options : typing.Optional[RequestOptions], optional
+            Request-specific configuration, by default None
+
+        Yields
+        ------
+        TasksStatusResponse
+            Each task once its status is `ready` or `failed`
+
+        Raises
+        ------
+        ValueError
+            If sleep_interval or max_requests_per_second is less than or equal to 0
+
+        TimeoutError
+            If some tasks are still running after max_wait_time
+
+        Examples
+        --------
+        import asyncio
+
+        from twelvelabs import AsyncTwelveLabs
+
+        client = AsyncTwelveLabs(
+            api_key="YOUR_API_KEY",
+        )
+
+        async def main() -> None:
+            tasks = await client.embed.tasks.create_bulk(
+                model_name="Marengo-retrieval-2.7",
+                videos=[{"video_url": "https://example.com/video1.mp4"}, {"video_url": "https://example.com/video2.mp4"}],
+            )
+            async for task in client.embed.tasks.wait_for_many([task.id for task in tasks]):
+                print(f"Task {task.id} finished with status {task.status}")
+
+        asyncio.run(main())
+        """
+        return async_wait_for_many(
+            task_ids,
+            retrieve=lambda task_id: self.status(task_id, request_options=request_options),
+            list_running=(
+                lambda: self.list(status="processing", page_limit=LIST_PAGE_LIMIT, request_options=request_options)
+            )
+            if use_list
+            else None,
+            polling=get_polling_strategy(polling, sleep_interval),
+            max_requests_per_second=max_requests_per_second,
+            max_wait_time=max_wait_time,
+        )
+
+
+class EmbedV2TasksClientWrapper(V2TasksClient):
+    """Wrapper for the embed v2 TasksClient that adds streaming retrieval of the embeddings."""
+
+    def __init__(self, client_wrapper: SyncClientWrapper):
+        """Initialize the EmbedV2TasksClientWrapper."""
+        super().__init__(client_wrapper=client_wrapper)
+
+    def iter_embeddings(
+        self, task_id: str, *, request_options: typing.Optional[RequestOptions] = None
+    ) -> typing.Iterator[EmbeddingData]:
+        """
+        Retrieves the embeddings of a task like `retrieve`, but yields them one by one while the response
+        downloads, so memory stays bounded however long the video is. Yields nothing until the task is ready.
+
+        Parameters
+        ----------
+        task_id : str
+            The unique identifier of the embedding task.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        EmbeddingData
+            The embeddings, in response order.
+
+        Examples
+        --------
+        from twelvelabs import TwelveLabs
+
+        client = TwelveLabs(
+            api_key="YOUR_API_KEY",
+        )
+        for embedding in client.embed.v_2.tasks.iter_embeddings("64f8d2c7e4a1b37f8a9c5d12"):
+            print(embedding.start_sec, embedding.embedding[:3])
+        """
+        yield from stream_embeddings(
+            self._raw_client._client_wrapper,
+            f"embed-v2/tasks/{jsonable_encoder(task_id)}",
+            method="GET",
+            path=EMBED_V2_PATH,
+            type_=EmbeddingData,
+            request_options=request_options,
+        )
+
+    def iter_embedding_batches(
+        self,
+        task_id: str,
+        *,
+        batch_size: int = 256,
+        use_numpy: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[EmbeddingArrays]:
+        """
+        Like `iter_embeddings`, but packs the embeddings into `EmbeddingArrays` of `batch_size` segments, without
+        building a model per segment.
+
+        Parameters
+        ----------
+        task_id : str
+            The unique identifier of the embedding task.
+
+        batch_size : int
+            The number of segments in each batch. The last batch may be smaller.
+
+        use_numpy : typing.Optional[bool]
+            Whether to return NumPy arrays. By default, they are returned when NumPy is installed.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        EmbeddingArrays
+            The embeddings, in response order.
+        """
+        yield from stream_embeddings(
+            self._raw_client._client_wrapper,
+            f"embed-v2/tasks/{jsonable_encoder(task_id)}",
+            method="GET",
+            path=EMBED_V2_PATH,
+            type_=EmbeddingData,
+            batch_size=batch_size,
+            use_numpy=use_numpy,
+            request_options=request_options,
+        )
+
+
+class AsyncEmbedV2TasksClientWrapper(AsyncV2TasksClient):
+    """Async wrapper for the embed v2 TasksClient that adds streaming retrieval of the embeddings."""
+
+    def __init__(self, client_wrapper: AsyncClientWrapper):
+        """Initialize the AsyncEmbedV2TasksClientWrapper."""
+        super().__init__(client_wrapper=client_wrapper)
+
+    async def iter_embeddings(
+        self, task_id: str, *, request_options: typing.Optional[RequestOptions] = None
+    ) -> typing.AsyncIterator[EmbeddingData]:
+        """
+        The async counterpart of `EmbedV2TasksClientWrapper.iter_embeddings`.
+
+        Examples
+        --------
+        async for embedding in client.embed.v_2.tasks.iter_embeddings("64f8d2c7e4a1b37f8a9c5d12"):
+            print(embedding.start_sec, embedding.embedding[:3])
+        """
+        async for embedding in async_stream_embeddings(
+            self._raw_client._client_wrapper,
+            f"embed-v2/tasks/{jsonable_encoder(task_id)}",
+            method="GET",
+            path=EMBED_V2_PATH,
+            type_=EmbeddingData,
+            request_options=request_options,
+        ):
+            yield embedding
+
+    async def iter_embedding_batches(
+        self,
+        task_id: str,
+        *,
+        batch_size: int = 256,
+        use_numpy: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[EmbeddingArrays]:
+        """The async counterpart of `EmbedV2TasksClientWrapper.iter_embedding_batches`."""
+        async for batch in async_stream_embeddings(
+            self._raw_client._client_wrapper,
+            f"embed-v2/tasks/{jsonable_encoder(task_id)}",
+            method="GET",
+            path=EMBED_V2_PATH,
+            type_=EmbeddingData,
+            batch_size=batch_size,
+            use_numpy=use_numpy,
+            request_options=request_options,
+        ):
+            yield batch
+
+
+class EmbedV2ClientWrapper(V2Client):
+    """Wrapper for the embed v2 client that adds cached, bulk and streaming creation of embeddings."""
+
+    tasks: EmbedV2TasksClientWrapper
+
+    def __init__(self, client_wrapper: SyncClientWrapper):
+        """Initialize the EmbedV2ClientWrapper."""
+        super().__init__(client_wrapper=client_wrapper)
+        # Replace the tasks property with our custom implementation
+        self.tasks = EmbedV2TasksClientWrapper(client_wrapper=client_wrapper)
+        # Set to an EmbeddingCache to answer repeated `create` requests without calling the API
+        self.cache: typing.Optional[EmbeddingCache] = None
+
+    def create(
+        self,
+        *,
+        input_type: CreateEmbeddingsRequestInputType,
+        model_name: CreateEmbeddingsRequestModelName,
+        text: typing.Optional[TextInputRequest] = OMIT,
+        image: typing.Optional[ImageInputRequest] = OMIT,
+        text_image: typing.Optional[TextImageInputRequest] = OMIT,
+        audio: typing.Optional[AudioInputRequest] = OMIT,
+        video: typing.Optional[VideoInputRequest] = OMIT,
+        multi_input: typing.Optional[MultiInputRequest] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> EmbeddingSuccessResponse:
+        """
+        Creates embeddings, as `V2Client.create` does. When `cache` is set, a request that was already made is
+        answered from the cache instead of the API.
+        """
+        cache = self.cache
+        key = None
+        if cache is not None:
+            key = _get_cache_key(
+                _get_v2_create_json(input_type, model_name, text, image, text_image, audio, video, multi_input), cache
+            )
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        response = super().create(
+            input_type=input_type,
+            model_name=model_name,
+            text=text,
+            image=image,
+            text_image=text_image,
+            audio=audio,
+            video=video,
+            multi_input=multi_input,
+            request_options=request_options,
+        )
+        if cache is not None and key is not None:
+            cache.set(key, response)
+        return response
+
+    def create_many(
+        self,
+        inputs: typing.Iterable[CreateEmbeddingsInput],
+        *,
+        model_name: CreateEmbeddingsRequestModelName,
+        concurrency: int = 5,
+        max_requests_per_second: typing.Optional[float] = None,
+        ordered: bool = True,
+        task_threshold_sec: typing.Optional[float] = 600.0,
+        sleep_interval: float = 5.0,
+        polling: typing.Optional[PollingStrategy] = None,
+        max_wait_time: typing.Optional[float] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[BulkItemResult[EmbeddingResult]]:
+        """
+        Creates embeddings for many inputs of any type, `concurrency` requests at a time, and yields each result
+        as soon as it can. `inputs` is read lazily, so it can be a generator over a large catalogue.
+
+        Audio and video longer than `task_threshold_sec`, or without an `end_sec`, are embedded by
+        `tasks.create` instead, and their tasks are polled until they are done. Such an input holds one of the
+        `concurrency` slots while it waits. Other inputs go through `create`, and so through `cache` when it is set.
+
+        Parameters
+        ----------
+        inputs : typing.Iterable[CreateEmbeddingsInput]
+            The inputs to embed, as the parameters of `create` other than `model_name`.
+
+        model_name : CreateEmbeddingsRequestModelName
+            The model to use for every input.
+
+        concurrency : int
+            The maximum number of inputs embedded at the same time.
+
+        max_requests_per_second : typing.Optional[float]
+            The maximum number of requests per second, including task status checks, or None for no limit.
+
+        ordered : bool
+            Whether to yield the results in input order. When False, they are yielded as they complete, so a long
+            task doesn't hold back the inputs after it.
+
+        task_threshold_sec : typing.Optional[float]
+            The length in seconds above which audio and video are embedded by a task, or None to send every input
+            to `create`.
+
+        sleep_interval : float
+            The time in seconds to wait between task status checks.
+
+        polling : typing.Optional[PollingStrategy]
+            How long to sleep between task status checks. Overrides sleep_interval.
+
+        max_wait_time : typing.Optional[float]
+            The maximum time in seconds to wait for each task, or None for no limit. An input whose task is still
+            running after that fails with a `TimeoutError`.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        BulkItemResult[EmbeddingResult]
+            One result per input, with its input index. Its value is an `EmbeddingSuccessResponse`, or the
+            `EmbeddingTaskResponse` of a task once its status is `ready` or `failed`. A failed request only fails
+            its own item.
+
+        Examples
+        --------
+        from twelvelabs import ImageInputRequest, MediaSource, TwelveLabs
+
+        client = TwelveLabs(
+            api_key="YOUR_API_KEY",
+        )
+        inputs = (
+            {"image": ImageInputRequest(media_source=MediaSource(url=url))} for url in image_urls
+        )
+        for result in client.embed.v_2.create_many(inputs, model_name="marengo3.0", concurrency=16):
+            if result.ok:
+                print(result.index, result.value.data[0].embedding[:3])
+        """
+        throttle = RequestThrottle(max_requests_per_second)
+        strategy = get_polling_strategy(polling, sleep_interval)
+
+        def embed(embedding_input: CreateEmbeddingsInput) -> EmbeddingResult:
+            params = _get_input_params(embedding_input)
+            if not _is_long_media(params, task_threshold_sec):
+                return self.create(model_name=model_name, **params, request_options=request_options)
+            task = self.tasks.create(model_name=model_name, **params, request_options=request_options)
+            started_at = time.monotonic()
+            attempt = 0
+            result: typing.Optional[EmbeddingTaskResponse] = None
+            while result is None or result.status not in DONE_STATUSES:
+                time.sleep(_get_task_delay(strategy, attempt, started_at, result, task.id, max_wait_time))
+                throttle.wait()
+                result = self.tasks.retrieve(task.id, request_options=request_options)
+                attempt += 1
+            return result
+
+        return iter_bulk(
+            (functools.partial(embed, embedding_input) for embedding_input in inputs),
+            max_workers=concurrency,
+            throttle=throttle,
+            ordered=ordered,
+        )
+
+    def iter_embeddings(
+        self,
+        *,
+        input_type: CreateEmbeddingsRequestInputType,
+        model_name: CreateEmbeddingsRequestModelName,
+        text: typing.Optional[TextInputRequest] = OMIT,
+        image: typing.Optional[ImageInputRequest] = OMIT,
+        text_image: typing.Optional[TextImageInputRequest] = OMIT,
+        audio: typing.Optional[AudioInputRequest] = OMIT,
+        video: typing.Optional[VideoInputRequest] = OMIT,
+        multi_input: typing.Optional[MultiInputRequest] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[EmbeddingData]:
+        """
+        Creates embeddings like `create`, but yields them one by one while the response downloads, so memory
+        stays bounded however long the audio or video is. The request is sent when iteration starts.
+
+        Parameters
+        ----------
+        input_type, model_name, text, image, text_image, audio, video, multi_input
+            The same parameters as `create`.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        EmbeddingData
+            The embeddings, in response order.
+
+        Examples
+        --------
+        from twelvelabs import MediaSource, TwelveLabs, VideoInputRequest
+
+        client = TwelveLabs(
+            api_key="YOUR_API_KEY",
+        )
+        for embedding in client.embed.v_2.iter_embeddings(
+            input_type="video",
+            model_name="marengo3.0",
+            video=VideoInputRequest(media_source=MediaSource(url="https://example.com/video.mp4")),
+        ):
+            print(embedding.start_sec, embedding.embedding[:3])
+        """
+        yield from stream_embeddings(
+            self._raw_client._client_wrapper,
+            "embed-v2",
+            method="POST",
+            path=EMBED_V2_PATH,
+            type_=EmbeddingData,
+            json=_get_v2_create_json(input_type, model_name, text, image, text_image, audio, video, multi_input),
+            request_options=request_options,
+            omit=OMIT,
+        )
+
+    def iter_embedding_batches(
+        self,
+        *,
+        input_type: CreateEmbeddingsRequestInputType,
+        model_name: CreateEmbeddingsRequestModelName,
+        text: typing.Optional[TextInputRequest] = OMIT,
+        image: typing.Optional[ImageInputRequest] = OMIT,
+        text_image: typing.Optional[TextImageInputRequest] = OMIT,
+        audio: typing.Optional[AudioInputRequest] = OMIT,
+        video: typing.Optional[VideoInputRequest] = OMIT,
+        multi_input: typing.Optional[MultiInputRequest] = OMIT,
+        batch_size: int = 256,
+        use_numpy: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[EmbeddingArrays]:
+        """
+        Like `iter_embeddings`, but packs the embeddings into `EmbeddingArrays` of `batch_size` segments, without
+        building a model per segment.
+
+        Parameters
+        ----------
+        input_type, model_name, text, image, text_image, audio, video, multi_input
+            The same parameters as `create`.
+
+        batch_size : int
+            The number of segments in each batch. The last batch may be smaller.
+
+        use_numpy : typing.Optional[bool]
+            Whether to return NumPy arrays. By default, they are returned when NumPy is installed.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        EmbeddingArrays
+            The embeddings, in response order.
+        """
+        yield from stream_embeddings(
+            self._raw_client._client_wrapper,
+            "embed-v2",
+            method="POST",
+            path=EMBED_V2_PATH,
+            type_=EmbeddingData,
+            batch_size=batch_size,
+            use_numpy=use_numpy,
+            json=_get_v2_create_json(input_type, model_name, text, image, text_image, audio, video, multi_input),
+            request_options=request_options,
+            omit=OMIT,
+        )
+
+
+class AsyncEmbedV2ClientWrapper(AsyncV2Client):
+    """Async wrapper for the embed v2 client that adds cached, bulk and streaming creation of embeddings."""
+
+    tasks: AsyncEmbedV2TasksClientWrapper
+
+    def __init__(self, client_wrapper: AsyncClientWrapper):
+        """Initialize the AsyncEmbedV2ClientWrapper."""
+        super().__init__(client_wrapper=client_wrapper)
+        # Replace the tasks property with our custom implementation
+        self.tasks = AsyncEmbedV2TasksClientWrapper(client_wrapper=client_wrapper)
+        # Set to an EmbeddingCache to answer repeated `create` requests without calling the API
+        self.cache: typing.Optional[EmbeddingCache] = None
+
+    async def create(
+        self,
+        *,
+        input_type: CreateEmbeddingsRequestInputType,
+        model_name: CreateEmbeddingsRequestModelName,
+        text: typing.Optional[TextInputRequest] = OMIT,
+        image: typing.Optional[ImageInputRequest] = OMIT,
+        text_image: typing.Optional[TextImageInputRequest] = OMIT,
+        audio: typing.Optional[AudioInputRequest] = OMIT,
+        video: typing.Optional[VideoInputRequest] = OMIT,
+        multi_input: typing.Optional[MultiInputRequest] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> EmbeddingSuccessResponse:
+        """The async counterpart of `EmbedV2ClientWrapper.create`."""
+        cache = self.cache
+        key = None
+        if cache is not None:
+            key = _get_cache_key(
+                _get_v2_create_json(input_type, model_name, text, image, text_image, audio, video, multi_input), cache
+            )
+            cached = await cache.async_get(key)
+            if cached is not None:
+                return cached
+        response = await super().create(
+            input_type=input_type,
+            model_name=model_name,
+            text=text,
+            image=image,
+            text_image=text_image,
+            audio=audio,
+            video=video,
+            multi_input=multi_input,
+            request_options=request_options,
+        )
+        if cache is not None and key is not None:
+            await cache.async_set(key, response)
+        return response
+
+    def create_many(
+        self,
+        inputs: typing.Iterable[CreateEmbeddingsInput],
+        *,
+        model_name: CreateEmbeddingsRequestModelName,
+        concurrency: int = 5,
+        max_requests_per_second: typing.Optional[float] = None,
+        ordered: bool = True,
+        task_threshold_sec: typing.Optional[float] = 600.0,
+        sleep_interval: float = 5.0,
+        polling: typing.Optional[PollingStrategy] = None,
+        max_wait_time: typing.Optional[float] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[BulkItemResult[EmbeddingResult]]:
+        """
+        The async counterpart of `EmbedV2ClientWrapper.create_many`.
+
+        Examples
+        --------
+        async for result in client.embed.v_2.create_many(inputs, model_name="marengo3.0", concurrency=16):
+            if result.ok:
+                print(result.index, result.value.data[0].embedding[:3])
+        """
+        throttle = RequestThrottle(max_requests_per_second)
+        strategy = get_polling_strategy(polling, sleep_interval)
+
+        async def embed(embedding_input: CreateEmbeddingsInput) -> EmbeddingResult:
+            params = _get_input_params(embedding_input)
+            if not _is_long_media(params, task_threshold_sec):
+                return await self.create(model_name=model_name, **params, request_options=request_options)
+            task = await self.tasks.create(model_name=model_name, **params, request_options=request_options)
+            started_at = time.monotonic()
+            attempt = 0
+            result: typing.Optional[EmbeddingTaskResponse] = None
+            while result is None or result.status not in DONE_STATUSES:
+                await asyncio.sleep(_get_task_delay(strategy, attempt, started_at, result, task.id, max_wait_time))
+                await throttle.wait_async()
+                result = await self.tasks.retrieve(task.id, request_options=request_options)
+                attempt += 1
+            return result
+
+        return async_iter_bulk(
+            (functools.partial(embed, embedding_input) for embedding_input in inputs),
+            max_workers=concurrency,
+            throttle=throttle,
+            ordered=ordered,
+        )
+
+    async def iter_embeddings(
+        self,
+        *,
+        input_type: CreateEmbeddingsRequestInputType,
+        model_name: CreateEmbeddingsRequestModelName,
+        text: typing.Optional[TextInputRequest] = OMIT,
+        image: typing.Optional[ImageInputRequest] = OMIT,
+        text_image: typing.Optional[TextImageInputRequest] = OMIT,
+        audio: typing.Optional[AudioInputRequest] = OMIT,
+        video: typing.Optional[VideoInputRequest] = OMIT,
+        multi_input: typing.Optional[MultiInputRequest] = OMIT,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[EmbeddingData]:
+        """The async counterpart of `EmbedV2ClientWrapper.iter_embeddings`."""
+        async for embedding in async_stream_embeddings(
+            self._raw_client._client_wrapper,
+            "embed-v2",
+            method="POST",
+            path=EMBED_V2_PATH,
+            type_=EmbeddingData,
+            json=_get_v2_create_json(input_type, model_name, text, image, text_image, audio, video, multi_input),
+            request_options=request_options,
+            omit=OMIT,
+        ):
+            yield embedding
+
+    async def iter_embedding_batches(
+        self,
+        *,
+        input_type: CreateEmbeddingsRequestInputType,
+        model_name: CreateEmbeddingsRequestModelName,
+        text: typing.Optional[TextInputRequest] = OMIT,
+        image: typing.Optional[ImageInputRequest] = OMIT,
+        text_image: typing.Optional[TextImageInputRequest] = OMIT,
+        audio: typing.Optional[AudioInputRequest] = OMIT,
+        video: typing.Optional[VideoInputRequest] = OMIT,
+        multi_input: typing.Optional[MultiInputRequest] = OMIT,
+        batch_size: int = 256,
+        use_numpy: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[EmbeddingArrays]:
+        """The async counterpart of `EmbedV2ClientWrapper.iter_embedding_batches`."""
+        async for batch in async_stream_embeddings(
+            self._raw_client._client_wrapper,
+            "embed-v2",
+            method="POST",
+            path=EMBED_V2_PATH,
+            type_=EmbeddingData,
+            batch_size=batch_size,
+            use_numpy=use_numpy,
+            json=_get_v2_create_json(input_type, model_name, text, image, text_image, audio, video, multi_input),
+            request_options=request_options,
+            omit=OMIT,
+        ):
+            yield batch
+
 
 class EmbedClientWrapper(EmbedClient):
     """Wrapper for the EmbedClient that adds custom functionality."""
 
+    tasks: EmbedTasksClientWrapper
+    v_2: EmbedV2ClientWrapper
+
     def __init__(self, client_wrapper: SyncClientWrapper):
         """Initialize the EmbedClientWrapper."""
         super().__init__(client_wrapper=client_wrapper)
         # Replace the tasks property with our custom implementation
         self.tasks = EmbedTasksClientWrapper(client_wrapper=client_wrapper)
+        self.v_2 = EmbedV2ClientWrapper(client_wrapper=client_wrapper)
 
 
 class AsyncEmbedClientWrapper(AsyncEmbedClient):
     """Async wrapper for the EmbedClient that adds custom functionality."""
 
+    tasks: AsyncEmbedTasksClientWrapper
+    v_2: AsyncEmbedV2ClientWrapper
+
     def __init__(self, client_wrapper: AsyncClientWrapper):
         """Initialize the AsyncEmbedClientWrapper."""
         super().__init__(client_wrapper=client_wrapper)
         # Replace the tasks property with our custom implementation
         self.tasks = AsyncEmbedTasksClientWrapper(client_wrapper=client_wrapper)
+        self.v_2 = AsyncEmbedV2ClientWrapper(client_wrapper=client_wrapper)
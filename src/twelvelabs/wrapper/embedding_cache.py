@@ -0,0 +1,200 @@
+import array
+import asyncio
+import collections
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import typing
+
+from ..core.jsonable_encoder import jsonable_encoder
+from ..core.pydantic_utilities import parse_obj_as
+from ..types.embedding_success_response import EmbeddingSuccessResponse
+
+
+@dataclasses.dataclass
+class EmbeddingCacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Hits served by the persistent tier, which are also counted in `hits`
+    persistent_hits: int = 0
+    evictions: int = 0
+    persistent_evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+# The inputs of embed v2 requests that hold text
+_TEXT_INPUTS = ("text", "text_image", "multi_input")
+
+
+def _normalize_text(body: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+    for name in _TEXT_INPUTS:
+        value = body.get(name)
+        if isinstance(value, dict) and isinstance(value.get("input_text"), str):
+            body[name] = {**value, "input_text": " ".join(value["input_text"].split())}
+    return body
+
+
+def get_embedding_key(request: typing.Dict[str, typing.Any], *, normalize_text: bool = False) -> str:
+    """
+    Identifies an embedding request by a hash of its body, without the parameters that were not set. Media
+    sent as base64 strings is hashed with the rest of the body. With `normalize_text`, runs of whitespace in
+    the input text are collapsed to one space and leading and trailing whitespace is ignored.
+    """
+    body = jsonable_encoder({name: value for name, value in request.items() if value is not None})
+    if normalize_text:
+        body = _normalize_text(body)
+    return hashlib.sha256(json.dumps(body, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+def encode_response(response: EmbeddingSuccessResponse) -> typing.Tuple[str, bytes]:
+    """Splits a response into JSON without the vectors, and the vectors as one float32 buffer."""
+    document = jsonable_encoder(response)
+    vectors: "array.array[float]" = array.array("f")
+    for item in document.get("data") or []:
+        embedding = item.pop("embedding", None) or []
+        vectors.extend(embedding)
+        item["dim"] = len(embedding)
+    return json.dumps(document), vectors.tobytes()
+
+
+def decode_response(metadata: str, vectors: bytes) -> EmbeddingSuccessResponse:
+    document = json.loads(metadata)
+    buffer: "array.array[float]" = array.array("f")
+    buffer.frombytes(vectors)
+    offset = 0
+    for item in document.get("data") or []:
+        dim = item.pop("dim")
+        item["embedding"] = buffer[offset : offset + dim].tolist()
+        offset += dim
+    return typing.cast(EmbeddingSuccessResponse, parse_obj_as(EmbeddingSuccessResponse, document))
+
+
+class EmbeddingCache:
+    """
+    Caches the responses of `embed.v_2.create` by request, so that embedding the same text, image or media
+    again doesn't send a request. Media given by URL is cached by URL, so a file that changes behind its URL
+    keeps its old embeddings.
+
+    The most recently used `max_entries` responses are kept in memory. With `path`, responses are also kept in
+    a SQLite database file, with their vectors stored as float32, so that they survive restarts and can be
+    shared between processes. The least recently used rows are evicted once the vectors take more than
+    `max_bytes`. Vectors read back from the database have float32 precision.
+
+    Texts that differ only in whitespace share an entry, unless `normalize_text` is False. With the async
+    client, the database is read and written in the event loop's default executor.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        path: typing.Optional[str] = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        normalize_text: bool = True,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.normalize_text = normalize_text
+        self.stats = EmbeddingCacheStats()
+        self._entries: "collections.OrderedDict[str, EmbeddingSuccessResponse]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, metadata TEXT, vectors BLOB, size INTEGER, accessed_at REAL)"
+            )
+
+    def get(self, key: str) -> typing.Optional[EmbeddingSuccessResponse]:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return response
+            row = None
+            if self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT metadata, vectors FROM embeddings WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self._connection.execute(  # type: ignore[union-attr]
+                "UPDATE embeddings SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self.stats.hits += 1
+            self.stats.persistent_hits += 1
+        response = decode_response(row[0], bytes(row[1]))
+        self._set_in_memory(key, response)
+        return response
+
+    def _set_in_memory(self, key: str, response: EmbeddingSuccessResponse) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def set(self, key: str, response: EmbeddingSuccessResponse) -> None:
+        self._set_in_memory(key, response)
+        if self._connection is None:
+            return
+        metadata, vectors = encode_response(response)
+        size = len(metadata) + len(vectors)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?, ?)", (key, metadata, vectors, size, time.time())
+            )
+            (total,) = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()
+            if total <= self.max_bytes:
+                return
+            evicted = []
+            rows = self._connection.execute("SELECT key, size FROM embeddings ORDER BY accessed_at").fetchall()
+            for evicted_key, evicted_size in rows:
+                if total <= self.max_bytes:
+                    break
+                evicted.append((evicted_key,))
+                total -= evicted_size
+            self._connection.executemany("DELETE FROM embeddings WHERE key = ?", evicted)
+            self.stats.persistent_evictions += len(evicted)
+
+    async def async_get(self, key: str) -> typing.Optional[EmbeddingSuccessResponse]:
+        """The async counterpart of `get`, which doesn't block the event loop on the database."""
+        if self._connection is None:
+            return self.get(key)
+        with self._lock:
+            in_memory = key in self._entries
+        if in_memory:
+            return self.get(key)
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key)
+
+    async def async_set(self, key: str, response: EmbeddingSuccessResponse) -> None:
+        """The async counterpart of `set`, which doesn't block the event loop on the database."""
+        if self._connection is None:
+            self.set(key, response)
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.set, key, response)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM embeddings")
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
@@ -5,6 +5,7 @@ from ..core.client_wrapper import SyncClientWrapper, AsyncClientWrapper
 from ..core.http_response import BaseHttpResponse
 from ..core.jsonable_encoder import jsonable_encoder
 from ..core.pagination import SyncPager, AsyncPager
+from ..core.json_backend import parse_json_as
 from ..core.pydantic_utilities import parse_obj_as
 from ..core.request_options import RequestOptions
 from ..types.video_vector import VideoVector
@@ -19,6 +20,12 @@ from ..types.videos_list_request_width import VideosListRequestWidth
 from ..types.videos_list_request_height import VideosListRequestHeight
 from ..types.videos_list_request_size import VideosListRequestSize
 from ..indexes.videos.types.videos_list_response import VideosListResponse
+from ..indexes.videos.types.videos_retrieve_request_embedding_option_item import (
+    VideosRetrieveRequestEmbeddingOptionItem,
+)
+from ..core.embedding_arrays import EmbeddingArrays
+from ..core.embedding_stream import VIDEO_EMBEDDING_PATH, async_stream_embeddings, stream_embeddings
+from ..types.video_segment import VideoSegment
 from ..errors.bad_request_error import BadRequestError
 
 OMIT = typing.cast(typing.Any, ...)
@@ -202,9 +209,10 @@ class VideosClientWrapper(VideosClient):
             if 200 <= _response.status_code < 300:
                 _parsed_response = typing.cast(
                     VideosListResponse,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=VideosListResponse,  # type: ignore
-                        object_=_response.json(),
+                        json_=_response.content,
+                        json_backend=self._raw_client._client_wrapper.json_backend,
                     ),
                 )
                 _items = _parsed_response.data
@@ -226,11 +234,32 @@ class VideosClientWrapper(VideosClient):
                     user_metadata=user_metadata,
                     request_options=request_options,
                 )
+                _get_page = lambda _page: self.list(
+                    index_id,
+                    page=_page,
+                    page_limit=page_limit,
+                    sort_by=sort_by,
+                    sort_option=sort_option,
+                    filename=filename,
+                    duration=duration,
+                    fps=fps,
+                    width=width,
+                    height=height,
+                    size=size,
+                    created_at=created_at,
+                    updated_at=updated_at,
+                    user_metadata=user_metadata,
+                    request_options=request_options,
+                )
+                _total_pages = _parsed_response.page_info.total_page if _parsed_response.page_info is not None else None
                 return SyncPager(
                     has_next=_has_next,
                     items=_items,
                     get_next=_get_next,
                     response=BaseHttpResponse(response=_response),
+                    get_page=_get_page,
+                    page_number=page,
+                    total_pages=_total_pages,
                 )
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -256,6 +285,116 @@ class VideosClientWrapper(VideosClient):
             body=_response_json,
         )
 
+    def iter_embeddings(
+        self,
+        index_id: str,
+        video_id: str,
+        *,
+        embedding_option: typing.Union[
+            VideosRetrieveRequestEmbeddingOptionItem, typing.Sequence[VideosRetrieveRequestEmbeddingOptionItem]
+        ],
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[VideoSegment]:
+        """
+        Retrieves the embeddings of a video like `retrieve(embedding_option=...)`, but yields its segments one by
+        one while the response downloads, so memory stays bounded however long the video is.
+
+        Parameters
+        ----------
+        index_id : str
+            The unique identifier of the index to which the video has been uploaded.
+
+        video_id : str
+            The unique identifier of the video to retrieve.
+
+        embedding_option : typing.Union[VideosRetrieveRequestEmbeddingOptionItem, typing.Sequence[VideosRetrieveRequestEmbeddingOptionItem]]
+            The types of embeddings to retrieve: `visual`, `audio` or `transcription`.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        VideoSegment
+            The segments, in response order.
+
+        Examples
+        --------
+        from twelvelabs import TwelveLabs
+
+        client = TwelveLabs(
+            api_key="YOUR_API_KEY",
+        )
+        for segment in client.indexes.videos.iter_embeddings(
+            index_id="6298d673f1090f1100476d4c",
+            video_id="6298d673f1090f1100476d4c",
+            embedding_option=["visual"],
+        ):
+            print(segment.start_offset_sec, segment.float_[:3])
+        """
+        yield from stream_embeddings(
+            self._raw_client._client_wrapper,
+            f"indexes/{jsonable_encoder(index_id)}/videos/{jsonable_encoder(video_id)}",
+            method="GET",
+            path=VIDEO_EMBEDDING_PATH,
+            type_=VideoSegment,
+            params={"embedding_option": embedding_option},
+            request_options=request_options,
+        )
+
+    def iter_embedding_batches(
+        self,
+        index_id: str,
+        video_id: str,
+        *,
+        embedding_option: typing.Union[
+            VideosRetrieveRequestEmbeddingOptionItem, typing.Sequence[VideosRetrieveRequestEmbeddingOptionItem]
+        ],
+        batch_size: int = 256,
+        use_numpy: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[EmbeddingArrays]:
+        """
+        Like `iter_embeddings`, but packs the segments into `EmbeddingArrays` of `batch_size` segments, without
+        building a model per segment.
+
+        Parameters
+        ----------
+        index_id : str
+            The unique identifier of the index to which the video has been uploaded.
+
+        video_id : str
+            The unique identifier of the video to retrieve.
+
+        embedding_option : typing.Union[VideosRetrieveRequestEmbeddingOptionItem, typing.Sequence[VideosRetrieveRequestEmbeddingOptionItem]]
+            The types of embeddings to retrieve: `visual`, `audio` or `transcription`.
+
+        batch_size : int
+            The number of segments in each batch. The last batch may be smaller.
+
+        use_numpy : typing.Optional[bool]
+            Whether to return NumPy arrays. By default, they are returned when NumPy is installed.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        Yields
+        ------
+        EmbeddingArrays
+            The segments, in response order.
+        """
+        yield from stream_embeddings(
+            self._raw_client._client_wrapper,
+            f"indexes/{jsonable_encoder(index_id)}/videos/{jsonable_encoder(video_id)}",
+            method="GET",
+            path=VIDEO_EMBEDDING_PATH,
+            type_=VideoSegment,
+            batch_size=batch_size,
+            use_numpy=use_numpy,
+            params={"embedding_option": embedding_option},
+            request_options=request_options,
+        )
+
 
 class AsyncVideosClientWrapper(AsyncVideosClient):
     """Async wrapper for the VideosClient that adds additional functionality."""
@@ -416,9 +555,10 @@ class AsyncVideosClientWrapper(AsyncVideosClient):
             if 200 <= _response.status_code < 300:
                 _parsed_response = typing.cast(
                     VideosListResponse,
-                    parse_obj_as(
+                    parse_json_as(
                         type_=VideosListResponse,  # type: ignore
-                        object_=_response.json(),
+                        json_=_response.content,
+                        json_backend=self._raw_client._client_wrapper.json_backend,
                     ),
                 )
                 _items = _parsed_response.data
@@ -443,11 +583,34 @@ class AsyncVideosClientWrapper(AsyncVideosClient):
                         request_options=request_options,
                     )
 
+                async def _get_page(_page: int):
+                    return await self.list(
+                        index_id,
+                        page=_page,
+                        page_limit=page_limit,
+                        sort_by=sort_by,
+                        sort_option=sort_option,
+                        filename=filename,
+                        duration=duration,
+                        fps=fps,
+                        width=width,
+                        height=height,
+                        size=size,
+                        created_at=created_at,
+                        updated_at=updated_at,
+                        user_metadata=user_metadata,
+                        request_options=request_options,
+                    )
+
+                _total_pages = _parsed_response.page_info.total_page if _parsed_response.page_info is not None else None
                 return AsyncPager(
                     has_next=_has_next,
                     items=_items,
                     get_next=_get_next,
                     response=BaseHttpResponse(response=_response),
+                    get_page=_get_page,
+                    page_number=page,
+                    total_pages=_total_pages,
                 )
             if _response.status_code == 400:
                 raise BadRequestError(
@@ -473,10 +636,60 @@ class AsyncVideosClientWrapper(AsyncVideosClient):
             body=_response_json,
         )
 
+    async def iter_embeddings(
+        self,
+        index_id: str,
+        video_id: str,
+        *,
+        embedding_option: typing.Union[
+            VideosRetrieveRequestEmbeddingOptionItem, typing.Sequence[VideosRetrieveRequestEmbeddingOptionItem]
+        ],
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[VideoSegment]:
+        """The async counterpart of `VideosClientWrapper.iter_embeddings`."""
+        async for segment in async_stream_embeddings(
+            self._raw_client._client_wrapper,
+            f"indexes/{jsonable_encoder(index_id)}/videos/{jsonable_encoder(video_id)}",
+            method="GET",
+            path=VIDEO_EMBEDDING_PATH,
+            type_=VideoSegment,
+            params={"embedding_option": embedding_option},
+            request_options=request_options,
+        ):
+            yield segment
+
+    async def iter_embedding_batches(
+        self,
+        index_id: str,
+        video_id: str,
+        *,
+        embedding_option: typing.Union[
+            VideosRetrieveRequestEmbeddingOptionItem, typing.Sequence[VideosRetrieveRequestEmbeddingOptionItem]
+        ],
+        batch_size: int = 256,
+        use_numpy: typing.Optional[bool] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[EmbeddingArrays]:
+        """The async counterpart of `VideosClientWrapper.iter_embedding_batches`."""
+        async for batch in async_stream_embeddings(
+            self._raw_client._client_wrapper,
+            f"indexes/{jsonable_encoder(index_id)}/videos/{jsonable_encoder(video_id)}",
+            method="GET",
+            path=VIDEO_EMBEDDING_PATH,
+            type_=VideoSegment,
+            batch_size=batch_size,
+            use_numpy=use_numpy,
+            params={"embedding_option": embedding_option},
+            request_options=request_options,
+        ):
+            yield batch
+
 
 class IndexesClientWrapper(IndexesClient):
     """Wrapper for the IndexesClient that adds custom functionality."""
 
+    videos: VideosClientWrapper
+
     def __init__(self, client_wrapper: SyncClientWrapper):
         """Initialize the IndexesClientWrapper."""
         super().__init__(client_wrapper=client_wrapper)
@@ -487,6 +700,8 @@ class IndexesClientWrapper(IndexesClient):
 class AsyncIndexesClientWrapper(AsyncIndexesClient):
     """Async wrapper for the IndexesClient that adds custom functionality."""
 
+    videos: AsyncVideosClientWrapper
+
     def __init__(self, client_wrapper: AsyncClientWrapper):
         """Initialize the AsyncIndexesClientWrapper."""
         super().__init__(client_wrapper=client_wrapper)
@@ -0,0 +1,197 @@
+import asyncio
+import hashlib
+import inspect
+import os
+import sqlite3
+import threading
+import time
+import typing
+
+from .. import core
+from ..core.file import FileContent
+
+# Puts media bytes somewhere the platform can download them from, and returns their URL. It receives the
+# bytes, the filename and the content type, when known. With the async client, it may be a coroutine function.
+MediaUploader = typing.Callable[
+    [bytes, typing.Optional[str], typing.Optional[str]], typing.Union[str, typing.Awaitable[str]]
+]
+
+
+def read_file(file: core.File) -> typing.Tuple[typing.Optional[str], bytes, typing.Optional[str]]:
+    """Reads a file parameter into its filename, its bytes and its content type."""
+    filename: typing.Optional[str] = None
+    content_type: typing.Optional[str] = None
+    content: FileContent
+    if isinstance(file, tuple):
+        filename, content = file[0], file[1]
+        if len(file) > 2:
+            content_type = typing.cast(typing.Optional[str], file[2])
+    else:
+        content = file
+    if isinstance(content, str):
+        return filename, content.encode("utf-8"), content_type
+    if isinstance(content, bytes):
+        return filename, content, content_type
+    name = getattr(content, "name", None)
+    if filename is None and isinstance(name, str):
+        filename = os.path.basename(name)
+    return filename, content.read(), content_type
+
+
+def get_content_key(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+class MediaUrlCache:
+    """
+    Maps the SHA-256 hash of media files to URLs the platform can download them from, so that a search with a
+    media file already seen sends its URL instead of uploading the bytes again.
+
+    A file seen for the first time is uploaded once with `upload`, when set, and its URL is kept. Without
+    `upload`, only the files registered with `register` are replaced, and the others are sent as before. With
+    `path`, the URLs are kept in a SQLite database file, so that they survive restarts.
+
+    Uploaded media often lives behind signed or temporary URLs. With `ttl`, a URL is dropped that many seconds
+    after it was stored, and the file is uploaded again the next time it is seen. A URL is also dropped when a
+    search that sent it fails.
+    """
+
+    def __init__(
+        self,
+        *,
+        upload: typing.Optional[MediaUploader] = None,
+        path: typing.Optional[str] = None,
+        ttl: typing.Optional[float] = None,
+    ) -> None:
+        self.upload = upload
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # The URL of each content hash, and the time.time() at which it expires, or None
+        self._urls: typing.Dict[str, typing.Tuple[str, typing.Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self._connection: typing.Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS media_urls (key TEXT PRIMARY KEY, url TEXT, expires_at REAL)"
+            )
+
+    def get(self, key: str) -> typing.Optional[str]:
+        with self._lock:
+            entry = self._urls.get(key)
+            if entry is None and self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT url, expires_at FROM media_urls WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    entry = self._urls[key] = (row[0], row[1])
+            if entry is not None and entry[1] is not None and entry[1] <= time.time():
+                self._delete(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, url: str) -> None:
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._urls[key] = (url, expires_at)
+            if self._connection is not None:
+                self._connection.execute("INSERT OR REPLACE INTO media_urls VALUES (?, ?, ?)", (key, url, expires_at))
+
+    def discard(self, urls: typing.Iterable[str]) -> None:
+        """Drops the entries that point to `urls`, so that their files are uploaded again."""
+        urls = set(urls)
+        with self._lock:
+            for key in [key for key, (url, _) in self._urls.items() if url in urls]:
+                self._delete(key)
+            if self._connection is not None:
+                self._connection.executemany("DELETE FROM media_urls WHERE url = ?", [(url,) for url in urls])
+
+    async def async_get(self, key: str) -> typing.Optional[str]:
+        """The async counterpart of `get`, which doesn't block the event loop on the database."""
+        if self._connection is None:
+            return self.get(key)
+        with self._lock:
+            entry = self._urls.get(key)
+        if entry is not None and (entry[1] is None or entry[1] > time.time()):
+            return self.get(key)
+        return await asyncio.get_running_loop().run_in_executor(None, self.get, key)
+
+    async def async_set(self, key: str, url: str) -> None:
+        """The async counterpart of `set`, which doesn't block the event loop on the database."""
+        if self._connection is None:
+            self.set(key, url)
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.set, key, url)
+
+    async def async_discard(self, urls: typing.Iterable[str]) -> None:
+        """The async counterpart of `discard`, which doesn't block the event loop on the database."""
+        if self._connection is None:
+            self.discard(urls)
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self.discard, list(urls))
+
+    def _delete(self, key: str) -> None:
+        self._urls.pop(key, None)
+        if self._connection is not None:
+            self._connection.execute("DELETE FROM media_urls WHERE key = ?", (key,))
+
+    def register(self, file: core.File, url: str) -> str:
+        """Records that `url` serves the content of `file`, and returns the content hash."""
+        key = get_content_key(read_file(file)[1])
+        self.set(key, url)
+        return key
+
+    def resolve(
+        self, files: typing.Sequence[core.File]
+    ) -> typing.Tuple[typing.Optional[typing.List[str]], typing.List[core.File]]:
+        """
+        Returns the URLs of `files`, or None when one of them has no URL, along with the files as bytes, since
+        reading them consumes file objects.
+        """
+        urls: typing.List[typing.Optional[str]] = []
+        read: typing.List[core.File] = []
+        for file in files:
+            filename, content, content_type = read_file(file)
+            key = get_content_key(content)
+            url = self.get(key)
+            if url is None and self.upload is not None:
+                if inspect.iscoroutinefunction(self.upload):
+                    raise TypeError("upload is a coroutine function. Use it with the async client")
+                uploaded = self.upload(content, filename, content_type)
+                if inspect.isawaitable(uploaded):
+                    # A callable that returns an awaitable without being a coroutine function
+                    if inspect.iscoroutine(uploaded):
+                        uploaded.close()
+                    raise TypeError("upload returned an awaitable. Use it with the async client")
+                url = uploaded
+                self.set(key, url)
+            urls.append(url)
+            read.append((filename, content, content_type))
+        if any(url is None for url in urls):
+            return None, read
+        return typing.cast(typing.List[str], urls), read
+
+    async def async_resolve(
+        self, files: typing.Sequence[core.File]
+    ) -> typing.Tuple[typing.Optional[typing.List[str]], typing.List[core.File]]:
+        """The async counterpart of `resolve`. `upload` may be a coroutine function."""
+        urls: typing.List[typing.Optional[str]] = []
+        read: typing.List[core.File] = []
+        for file in files:
+            filename, content, content_type = read_file(file)
+            key = get_content_key(content)
+            url = await self.async_get(key)
+            if url is None and self.upload is not None:
+                uploaded = self.upload(content, filename, content_type)
+                url = await uploaded if inspect.isawaitable(uploaded) else typing.cast(str, uploaded)
+                await self.async_set(key, url)
+            urls.append(url)
+            read.append((filename, content, content_type))
+        if any(url is None for url in urls):
+            return None, read
+        return typing.cast(typing.List[str], urls), read
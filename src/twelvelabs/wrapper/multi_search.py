@@ -0,0 +1,150 @@
+import dataclasses
+import heapq
+import math
+import typing
+
+from ..core.pagination import AsyncPager, SyncPager
+from ..types.search_item import SearchItem
+from .bulk import BulkResult
+
+
+@dataclasses.dataclass(frozen=True)
+class SearchSource:
+    """One search of a fan-out: an index, and the position of the query variant in `queries`."""
+
+    index_id: str
+    query: int
+
+
+@dataclasses.dataclass(frozen=True)
+class SearchHit:
+    """A search result, with the search that found it."""
+
+    source: SearchSource
+    item: SearchItem
+
+    @property
+    def index_id(self) -> str:
+        return self.source.index_id
+
+
+@dataclasses.dataclass(frozen=True)
+class SearchFailure:
+    """The exception raised by one search of a fan-out, while sending it or while reading a further page."""
+
+    source: SearchSource
+    error: Exception
+
+    @property
+    def index_id(self) -> str:
+        return self.source.index_id
+
+
+def get_sources(index_ids: typing.Sequence[str], queries: typing.Sequence[typing.Any]) -> typing.List[SearchSource]:
+    """Returns one search per index and query variant, grouped by index."""
+    return [SearchSource(index_id=index_id, query=query) for index_id in index_ids for query in range(len(queries))]
+
+
+def _get_rank(hit: SearchHit) -> float:
+    # Results without a rank go last
+    return hit.item.rank if hit.item.rank is not None else math.inf
+
+
+class MultiSearchResult:
+    """
+    The results of a search fan-out, merged into one stream by `rank`. Results of the same rank keep the order of
+    their searches, so the first index and query variant come first.
+
+    The results are read lazily. With `all_pages`, the next page of a search is only requested once the merged
+    stream reaches the end of its current page. A search that fails is reported in `failures`, and the others
+    carry on. Failures of further pages are added to `failures` as the stream reaches them.
+    """
+
+    def __init__(self, sources: typing.List[SearchSource], pagers: BulkResult[SyncPager[SearchItem]], all_pages: bool):
+        self.sources = sources
+        self.failures = [
+            SearchFailure(source=sources[result.index], error=typing.cast(Exception, result.error))
+            for result in pagers.errors
+        ]
+        self._pagers = [
+            (sources[result.index], typing.cast(SyncPager[SearchItem], result.value))
+            for result in pagers.results
+            if result.ok
+        ]
+        self._all_pages = all_pages
+
+    def _iter_source(self, source: SearchSource, pager: SyncPager[SearchItem]) -> typing.Iterator[SearchHit]:
+        if not self._all_pages:
+            for item in pager.items or []:
+                yield SearchHit(source=source, item=item)
+            return
+        try:
+            for page in pager.iter_pages():
+                for item in page.items or []:
+                    yield SearchHit(source=source, item=item)
+        except Exception as e:
+            self.failures.append(SearchFailure(source=source, error=e))
+
+    def __iter__(self) -> typing.Iterator[SearchHit]:
+        return iter(heapq.merge(*(self._iter_source(source, pager) for source, pager in self._pagers), key=_get_rank))
+
+    @property
+    def failed_index_ids(self) -> typing.List[str]:
+        return list(dict.fromkeys(failure.index_id for failure in self.failures))
+
+
+class AsyncMultiSearchResult:
+    """The async counterpart of `MultiSearchResult`, read with `async for`."""
+
+    def __init__(self, sources: typing.List[SearchSource], pagers: BulkResult[AsyncPager[SearchItem]], all_pages: bool):
+        self.sources = sources
+        self.failures = [
+            SearchFailure(source=sources[result.index], error=typing.cast(Exception, result.error))
+            for result in pagers.errors
+        ]
+        self._pagers = [
+            (sources[result.index], typing.cast(AsyncPager[SearchItem], result.value))
+            for result in pagers.results
+            if result.ok
+        ]
+        self._all_pages = all_pages
+
+    async def _iter_source(
+        self, source: SearchSource, pager: AsyncPager[SearchItem]
+    ) -> typing.AsyncIterator[SearchHit]:
+        if not self._all_pages:
+            for item in pager.items or []:
+                yield SearchHit(source=source, item=item)
+            return
+        try:
+            async for page in pager.iter_pages():
+                for item in page.items or []:
+                    yield SearchHit(source=source, item=item)
+        except Exception as e:
+            self.failures.append(SearchFailure(source=source, error=e))
+
+    async def __aiter__(self) -> typing.AsyncIterator[SearchHit]:
+        # The same merge as heapq.merge: the heap holds the next hit of each search, ordered by rank and then by
+        # search, and the search whose hit is taken is advanced.
+        iterators = [self._iter_source(source, pager) for source, pager in self._pagers]
+        heap: typing.List[typing.Tuple[float, int, SearchHit]] = []
+        for order, iterator in enumerate(iterators):
+            try:
+                hit = await iterator.__anext__()
+            except StopAsyncIteration:
+                continue
+            heap.append((_get_rank(hit), order, hit))
+        heapq.heapify(heap)
+        while heap:
+            _, order, hit = heap[0]
+            yield hit
+            try:
+                hit = await iterators[order].__anext__()
+            except StopAsyncIteration:
+                heapq.heappop(heap)
+                continue
+            heapq.heapreplace(heap, (_get_rank(hit), order, hit))
+
+    @property
+    def failed_index_ids(self) -> typing.List[str]:
+        return list(dict.fromkeys(failure.index_id for failure in self.failures))
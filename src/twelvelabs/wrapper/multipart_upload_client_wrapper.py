@@ -1,20 +1,35 @@
 import typing
 import time
 import asyncio
+import json
 import logging
+import os
+import threading
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import httpx
 from ..multipart_upload.types.create_asset_upload_request_type import CreateAssetUploadRequestType
+from ..core.api_error import ApiError
 from ..core.client_wrapper import SyncClientWrapper, AsyncClientWrapper
 from ..multipart_upload.client import MultipartUploadClient, AsyncMultipartUploadClient
 from ..types.completed_chunk import CompletedChunk
+from ..types.report_chunk_batch_response import ReportChunkBatchResponse
 from ..core.request_options import RequestOptions
 from ..core.pydantic_utilities import UniversalBaseModel
+from .polling import PollingStrategy, get_polling_strategy
 import pydantic
 
 OMIT = typing.cast(typing.Any, ...)
 
+# The platform hands out at most this many presigned URLs per request
+MAX_PRESIGNED_URLS_PER_REQUEST = 50
+
+# Timeout for a single presigned chunk PUT; large chunks can take a while
+CHUNK_UPLOAD_TIMEOUT_SECONDS = 300.0
+
+# Idle connections kept open to the storage backend, unless an upload uses more workers
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -53,12 +68,155 @@ class UploadError(Exception):
         super().__init__(message)
 
 
+class _ChunkSpan(typing.NamedTuple):
+    """A byte range of the source file that is uploaded as a single chunk."""
+
+    chunk_index: int  # 1-based, matches the presigned URL chunk_index
+    offset: int
+    length: int
+
+
+def _plan_chunks(total_size: int, chunk_size: int) -> typing.List[_ChunkSpan]:
+    """Compute the byte range of every chunk without touching the file."""
+    return [
+        _ChunkSpan(chunk_index=i + 1, offset=offset, length=min(chunk_size, total_size - offset))
+        for i, offset in enumerate(range(0, total_size, chunk_size))
+    ]
+
+
+def _read_chunk(file_path: Path, chunk: _ChunkSpan) -> bytes:
+    """Read a single chunk straight from the source file at its offset."""
+    try:
+        with open(file_path, 'rb') as f:
+            f.seek(chunk.offset)
+            data = f.read(chunk.length)
+    except OSError as e:
+        raise UploadError(f"Failed to read chunk {chunk.chunk_index}: {e}", chunk_index=chunk.chunk_index, original_error=e)
+
+    if len(data) != chunk.length:
+        raise UploadError(
+            f"Failed to read chunk {chunk.chunk_index}: expected {chunk.length} bytes at offset {chunk.offset}, "
+            f"got {len(data)} (was the file modified during upload?)",
+            chunk_index=chunk.chunk_index,
+        )
+    return data
+
+
+class _UploadJournal:
+    """
+    Local checkpoint of a multipart upload, used to resume it after the process dies.
+
+    The journal records the upload session and the ETag of every chunk uploaded so far, together with
+    the size and modification time of the source file so that a journal is never applied to a file
+    that has changed since. It is a JSON lines file: a header line for the session, then one line
+    appended per uploaded chunk, so recording a chunk costs the same however large the upload is.
+    """
+
+    def __init__(self, path: Path, source: Path):
+        self.path = path
+        stat = source.stat()
+        self._fingerprint = {"source": str(source.resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        self.upload_id = ""
+        self.asset_id: typing.Optional[str] = None
+        self.chunk_size = 0
+        self.uploaded: typing.Dict[int, CompletedChunk] = {}
+
+    @staticmethod
+    def default_path(source: Path) -> Path:
+        return source.with_name(f"{source.name}.upload.jsonl")
+
+    def load(self) -> bool:
+        """Load a previous checkpoint. Returns False if there is none for this exact source file."""
+        try:
+            lines = self.path.read_text().splitlines()
+            header = json.loads(lines[0])
+        except (OSError, ValueError, IndexError):
+            return False
+        if header.get("fingerprint") != self._fingerprint:
+            logger.info(f"Ignoring upload journal {self.path}: source file has changed")
+            return False
+
+        self.upload_id = header["upload_id"]
+        self.asset_id = header.get("asset_id")
+        self.chunk_size = header["chunk_size"]
+        self.uploaded = {}
+        for line in lines[1:]:
+            try:
+                chunk = json.loads(line)
+            except ValueError:
+                # The last line may have been cut short by a crash; the chunk is just uploaded again
+                continue
+            self.uploaded[chunk["index"]] = CompletedChunk(
+                chunk_index=chunk["index"], proof=chunk["etag"], proof_type="etag", chunk_size=chunk["size"]
+            )
+        return True
+
+    def start(self, upload_id: str, asset_id: typing.Optional[str], chunk_size: int) -> None:
+        self.upload_id = upload_id
+        self.asset_id = asset_id
+        self.chunk_size = chunk_size
+        self.uploaded = {}
+        header = {
+            "fingerprint": self._fingerprint,
+            "upload_id": upload_id,
+            "asset_id": asset_id,
+            "chunk_size": chunk_size,
+        }
+        # Write to a temporary file first so a crash never leaves a journal without its header behind
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(header) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def record_uploaded(self, chunk: CompletedChunk) -> None:
+        self.uploaded[chunk.chunk_index] = chunk
+        with self.path.open("a") as journal_file:
+            journal_file.write(
+                json.dumps({"index": chunk.chunk_index, "etag": chunk.proof, "size": chunk.chunk_size}) + "\n"
+            )
+
+    def remove(self) -> None:
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
 class MultipartUploadClientWrapper(MultipartUploadClient):
     """Wrapper for the MultipartUploadClient that adds high-level upload functionality."""
 
-    def __init__(self, client_wrapper: SyncClientWrapper):
-        """Initialize the MultipartUploadClientWrapper."""
+    def __init__(self, client_wrapper: SyncClientWrapper, *, upload_httpx_client: typing.Optional[httpx.Client] = None):
+        """
+        Initialize the MultipartUploadClientWrapper.
+
+        Chunks are PUT to their presigned URLs with ``upload_httpx_client``. By default a pooled client
+        is created on first use and reused for every chunk of every upload, so connections to the
+        storage backend stay alive between chunks; it is closed by ``close()``. Pass your own client to
+        customize pooling, proxies or HTTP/2 (``httpx.Client(http2=True)``, requires ``httpx[http2]``).
+        """
         super().__init__(client_wrapper=client_wrapper)
+        self._upload_httpx_client = upload_httpx_client
+        self._owns_upload_httpx_client = upload_httpx_client is None
+        self._upload_httpx_client_lock = threading.Lock()
+
+    def _get_upload_httpx_client(self, max_workers: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS) -> httpx.Client:
+        """Return the shared client used for chunk PUTs, creating it on first use."""
+        with self._upload_httpx_client_lock:
+            if self._upload_httpx_client is None:
+                self._upload_httpx_client = httpx.Client(
+                    timeout=CHUNK_UPLOAD_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(
+                        max_connections=None,
+                        max_keepalive_connections=max(max_workers, DEFAULT_MAX_KEEPALIVE_CONNECTIONS),
+                    ),
+                )
+            return self._upload_httpx_client
+
+    def close(self) -> None:
+        """Close the pooled HTTP client used for chunk uploads, if this wrapper created it."""
+        with self._upload_httpx_client_lock:
+            if self._owns_upload_httpx_client and self._upload_httpx_client is not None:
+                self._upload_httpx_client.close()
+                self._upload_httpx_client = None
 
     def upload_file(
         self,
@@ -71,6 +229,8 @@ class MultipartUploadClientWrapper(MultipartUploadClient):
         progress_callback: typing.Optional[typing.Callable[[UploadProgress], None]] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        resume: bool = False,
+        journal_path: typing.Optional[typing.Union[str, Path]] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> UploadResult:
         """
@@ -102,6 +262,15 @@ class MultipartUploadClientWrapper(MultipartUploadClient):
         retry_delay : float
             Delay in seconds between retry attempts (default: 1.0).
 
+        resume : bool
+            Keep a local journal of the upload so that, if it is interrupted, calling `upload_file` again
+            with `resume=True` continues the same upload session and only uploads the missing chunks
+            (default: False). The journal is removed once the upload completes. Upload sessions expire
+            24 hours after they are created; after that a new upload is started.
+
+        journal_path : typing.Optional[typing.Union[str, Path]]
+            Where to store the resume journal (default: `<file_path>.upload.jsonl` next to the file).
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -136,6 +305,9 @@ class MultipartUploadClientWrapper(MultipartUploadClient):
             batch_size=5
         )
         print(f"Upload completed! Asset ID: {result.asset_id}")
+
+        # Resumable upload: re-running after a crash only uploads the missing chunks
+        result = client.multipart_upload.upload_file("large_video.mp4", resume=True)
         """
         file_path = Path(file_path)
         if not file_path.exists():
@@ -145,159 +317,118 @@ class MultipartUploadClientWrapper(MultipartUploadClient):
             filename = file_path.name
 
         total_size = file_path.stat().st_size
-        chunk_files = []
+        journal = (
+            _UploadJournal(Path(journal_path) if journal_path is not None else _UploadJournal.default_path(file_path), file_path)
+            if resume
+            else None
+        )
 
         try:
-            logger.info(f"Creating upload session for {filename} ({total_size:,} bytes)")
-            # Step 1: Create upload session
-            upload_session = self.create(
-                filename=filename,
-                type=file_type,
-                total_size=total_size,
-                request_options=request_options
-            )
-            
-            if not upload_session.upload_id or not upload_session.chunk_size:
-                raise UploadError("Invalid upload session response: missing upload_id or chunk_size")
-                
-            upload_id = upload_session.upload_id
-            chunk_size = upload_session.chunk_size
-            logger.info(f"Upload session created: {upload_id} (chunk size: {chunk_size:,} bytes)")
-
-            # Step 2: Split file into chunks
-            chunk_files = self._split_file(file_path, chunk_size)
-            total_chunks = len(chunk_files)
-            logger.info(f"File split into {total_chunks} chunks")
-            
-            if total_chunks == 0:
-                raise UploadError("No chunks created from file")
-
-            # Step 3: Upload chunks in batches
             current_urls: typing.Dict[int, str] = {}
-            if upload_session.upload_urls:
-                for url in upload_session.upload_urls:
-                    if url.chunk_index is not None and url.url is not None:
-                        current_urls[url.chunk_index] = url.url
-            completed_chunks_count = 0
-
-            for batch_start in range(0, total_chunks, batch_size):
-                batch_end = min(batch_start + batch_size, total_chunks)
-                batch_chunk_files = chunk_files[batch_start:batch_end]
-                batch_indices = list(range(batch_start + 1, batch_end + 1))  # 1-based indexing
-
-                # Ensure we have URLs for all chunks in this batch
-                missing_urls = [idx for idx in batch_indices if idx not in current_urls]
-                if missing_urls:
-                    min_chunk = min(missing_urls)
-                    max_chunk = max(missing_urls)
-                    
-                    logger.debug(f"Fetching URLs for chunks {min_chunk}-{max_chunk} ({len(missing_urls)} missing)")
-                    start = min_chunk
-                    count = max_chunk - min_chunk + 1
-                    
-                    additional_urls = self.get_additional_presigned_urls(
-                        upload_id, start=start, count=count, request_options=request_options
-                    )
-                    
-                    if additional_urls.upload_urls:
-                        for url_info in additional_urls.upload_urls:
-                            if url_info.chunk_index is not None and url_info.url is not None and url_info.chunk_index in missing_urls:
-                                current_urls[url_info.chunk_index] = url_info.url
-
-                # Upload batch chunks in parallel with retry logic
-                batch_completed_chunks = self._upload_chunk_batch_with_retry(
-                    batch_chunk_files,
-                    batch_indices,
-                    current_urls,
-                    max_workers,
-                    max_retries,
-                    retry_delay
-                )
-
-                # Report completed batch
-                result = self.report_chunk_batch(
-                    upload_id,
-                    completed_chunks=batch_completed_chunks,
+            completed_indices = self._resume_upload(journal, request_options) if journal is not None else None
+            if journal is not None and completed_indices is not None:
+                upload_id = journal.upload_id
+                asset_id = journal.asset_id
+                chunk_size = journal.chunk_size
+                logger.info(f"Resuming upload session {upload_id} ({len(completed_indices)} chunks already completed)")
+            else:
+                completed_indices = set()
+                logger.info(f"Creating upload session for {filename} ({total_size:,} bytes)")
+                # Step 1: Create upload session
+                upload_session = self.create(
+                    filename=filename,
+                    type=file_type,
+                    total_size=total_size,
                     request_options=request_options
                 )
 
-                completed_chunks_count += len(batch_completed_chunks)
+                if not upload_session.upload_id or not upload_session.chunk_size:
+                    raise UploadError("Invalid upload session response: missing upload_id or chunk_size")
+
+                upload_id = upload_session.upload_id
+                asset_id = upload_session.asset_id
+                chunk_size = upload_session.chunk_size
+                logger.info(f"Upload session created: {upload_id} (chunk size: {chunk_size:,} bytes)")
+
+                if upload_session.upload_urls:
+                    for url in upload_session.upload_urls:
+                        if url.chunk_index is not None and url.url is not None:
+                            current_urls[url.chunk_index] = url.url
+                if journal is not None:
+                    journal.start(upload_id, asset_id, chunk_size)
+
+            # Step 2: Plan chunk byte ranges; chunks are read from the source file on demand
+            chunks = _plan_chunks(total_size, chunk_size)
+            total_chunks = len(chunks)
+            logger.info(f"File will be uploaded in {total_chunks} chunks")
+            
+            if total_chunks == 0:
+                raise UploadError("No chunks created from file")
 
-                # Update progress
-                if progress_callback:
-                    progress = UploadProgress(
-                        total_chunks=total_chunks,
-                        completed_chunks=completed_chunks_count,
-                        percentage=(completed_chunks_count / total_chunks) * 100,
-                        status="uploading"
-                    )
-                    progress_callback(progress)
-
-                # Check if upload is complete
-                if result.url:
-                    logger.info(f"Upload completed successfully! Asset ID: {upload_session.asset_id}")
-                    return UploadResult(
-                        asset_id=upload_session.asset_id,
-                        asset_url=result.url,
-                    )
+            # Chunks uploaded before an interruption but never reported are reported without re-uploading
+            unreported = (
+                [chunk for index, chunk in journal.uploaded.items() if index not in completed_indices]
+                if journal is not None
+                else []
+            )
+            skipped = completed_indices | {chunk.chunk_index for chunk in unreported}
+            pending_chunks = [chunk for chunk in chunks if chunk.chunk_index not in skipped]
+
+            # Step 3: Upload chunks through a sliding window of in-flight PUTs
+            asset_url = self._upload_chunks_pipelined(
+                upload_id,
+                file_path,
+                pending_chunks,
+                current_urls,
+                total_chunks=total_chunks,
+                reported_count=len(completed_indices),
+                unreported=unreported,
+                journal=journal,
+                batch_size=batch_size,
+                max_workers=max_workers,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                progress_callback=progress_callback,
+                request_options=request_options,
+            )
 
-            # All chunks have been uploaded and reported
-            logger.info(f"Upload completed successfully! Asset ID: {upload_session.asset_id}")
+            if journal is not None:
+                journal.remove()
+            logger.info(f"Upload completed successfully! Asset ID: {asset_id}")
             return UploadResult(
-                asset_id=upload_session.asset_id,
-                asset_url="",  # URL will be available after processing
+                asset_id=asset_id,
+                asset_url=asset_url or "",  # URL will be available after processing
             )
             
         except UploadError:
             raise
         except Exception as e:
             raise UploadError(f"Upload failed: {str(e)}", original_error=e)
-        finally:
-            # Cleanup temporary files
-            if chunk_files:
-                try:
-                    self._cleanup_chunks(chunk_files)
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup chunk files: {e}")
-
-    def _split_file(self, file_path: Path, chunk_size: int) -> typing.List[Path]:
-        """Split file into chunks and return list of chunk file paths."""
-        chunk_files = []
-        chunk_dir = file_path.parent / f"{file_path.stem}_chunks"
-        
-        try:
-            chunk_dir.mkdir(exist_ok=True)
-
-            with open(file_path, 'rb') as f:
-                chunk_num = 1
-                while True:
-                    chunk_data = f.read(chunk_size)
-                    if not chunk_data:
-                        break
 
-                    chunk_file = chunk_dir / f"chunk_{chunk_num:04d}"
-                    with open(chunk_file, 'wb') as chunk_f:
-                        chunk_f.write(chunk_data)
-
-                    chunk_files.append(chunk_file)
-                    chunk_num += 1
-        except Exception as e:
-            # Clean up any partial chunks on error
-            self._cleanup_chunks(chunk_files)
-            raise UploadError(f"Failed to split file into chunks: {e}", original_error=e)
-
-        return chunk_files
-
-    def _upload_chunk_to_s3(self, chunk_file: Path, presigned_url: str) -> str:
+    def _resume_upload(
+        self, journal: _UploadJournal, request_options: typing.Optional[RequestOptions]
+    ) -> typing.Optional[typing.Set[int]]:
+        """Return the chunks the platform already has for a journaled upload, or None if it can't be resumed."""
+        if not journal.load():
+            return None
+        try:
+            return {
+                chunk.index
+                for chunk in self.get_status(journal.upload_id, page_limit=50, request_options=request_options)
+                if chunk.index is not None and chunk.status == "completed"
+            }
+        except ApiError as e:
+            logger.warning(f"Cannot resume upload session {journal.upload_id}, starting a new one: {e}")
+            return None
+
+    def _upload_chunk_to_s3(self, chunk_data: bytes, presigned_url: str) -> str:
         """Upload a single chunk to S3 and return ETag."""
         try:
-            with open(chunk_file, 'rb') as f:
-                response = httpx.put(
-                    presigned_url,
-                    content=f,
-                    headers={'Content-Type': 'application/octet-stream'},
-                    timeout=300.0  # 5 minute timeout for large chunks
-                )
+            response = self._get_upload_httpx_client().put(
+                presigned_url,
+                content=chunk_data,
+                headers={'Content-Type': 'application/octet-stream'},
+            )
 
             response.raise_for_status()
             etag = response.headers.get('ETag', '').strip('"')
@@ -309,84 +440,175 @@ class MultipartUploadClientWrapper(MultipartUploadClient):
         except Exception as e:
             raise UploadError(f"Failed to upload chunk: {e}", original_error=e)
 
-    def _upload_chunk_batch_with_retry(
+    def _prefetch_presigned_urls(
         self,
-        chunk_files: typing.List[Path],
-        chunk_indices: typing.List[int],
+        upload_id: str,
         presigned_urls: typing.Dict[int, str],
-        max_workers: int,
-        max_retries: int,
-        retry_delay: float
-    ) -> typing.List[CompletedChunk]:
-        """Upload a batch of chunks in parallel with retry logic."""
-        completed_chunks = []
-        max_workers = min(len(chunk_files), max_workers)
-
-        def upload_chunk_with_retry(chunk_file: Path, chunk_index: int) -> CompletedChunk:
-            presigned_url = presigned_urls[chunk_index]
-            last_error = None
-            
-            for attempt in range(max_retries + 1):
-                try:
-                    etag = self._upload_chunk_to_s3(chunk_file, presigned_url)
-                    chunk_size_bytes = chunk_file.stat().st_size
-                    return CompletedChunk(
-                        chunk_index=chunk_index,
-                        proof=etag,
-                        proof_type="etag",
-                        chunk_size=chunk_size_bytes
-                    )
-                except Exception as e:
-                    last_error = e
-                    if attempt < max_retries:
-                        logger.warning(f"Chunk {chunk_index} upload failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                        time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
-                    else:
-                        logger.error(f"Chunk {chunk_index} upload failed after {max_retries + 1} attempts")
-            
-            raise UploadError(f"Chunk {chunk_index} upload failed after {max_retries + 1} attempts", 
-                            chunk_index=chunk_index, original_error=last_error)
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_chunk = {}
-            for i, chunk_file in enumerate(chunk_files):
-                chunk_index = chunk_indices[i]
-                future = executor.submit(upload_chunk_with_retry, chunk_file, chunk_index)
-                future_to_chunk[future] = (chunk_index, chunk_file)
-
-            for future in as_completed(future_to_chunk):
-                chunk_index, chunk_file = future_to_chunk[future]
-                try:
-                    completed_chunk = future.result()
-                    completed_chunks.append(completed_chunk)
-                except Exception as e:
-                    raise UploadError(f"Chunk {chunk_index} upload failed: {e}", 
-                                    chunk_index=chunk_index, original_error=e)
-
-        return completed_chunks
-
-    def _cleanup_chunks(self, chunk_files: typing.List[Path]):
-        """Clean up temporary chunk files."""
-        if not chunk_files:
+        chunk_index: int,
+        total_chunks: int,
+        lookahead: int,
+        request_options: typing.Optional[RequestOptions],
+    ) -> None:
+        """Make sure presigned URLs are known for the ``lookahead`` chunks starting at ``chunk_index``."""
+        end = min(chunk_index + lookahead, total_chunks + 1)
+        start = next((idx for idx in range(chunk_index, end) if idx not in presigned_urls), None)
+        if start is None:
             return
-            
-        chunk_dir = None
-        for chunk_file in chunk_files:
+
+        count = min(MAX_PRESIGNED_URLS_PER_REQUEST, total_chunks - start + 1)
+        logger.debug(f"Fetching URLs for chunks {start}-{start + count - 1}")
+        additional_urls = self.get_additional_presigned_urls(
+            upload_id, start=start, count=count, request_options=request_options
+        )
+        if additional_urls.upload_urls:
+            for url_info in additional_urls.upload_urls:
+                if url_info.chunk_index is not None and url_info.url is not None:
+                    presigned_urls[url_info.chunk_index] = url_info.url
+
+        if chunk_index not in presigned_urls:
+            raise UploadError(f"No presigned URL returned for chunk {chunk_index}", chunk_index=chunk_index)
+
+    def _upload_chunk_with_retry(
+        self,
+        file_path: Path,
+        chunk: _ChunkSpan,
+        presigned_url: str,
+        max_retries: int,
+        retry_delay: float,
+    ) -> CompletedChunk:
+        """Read a chunk from the source file and upload it with retry logic."""
+        chunk_index = chunk.chunk_index
+        chunk_data = _read_chunk(file_path, chunk)
+        last_error = None
+
+        for attempt in range(max_retries + 1):
             try:
-                if chunk_file.exists():
-                    chunk_file.unlink()
-                if chunk_dir is None:
-                    chunk_dir = chunk_file.parent
-            except OSError as e:
-                logger.warning(f"Failed to delete chunk file {chunk_file}: {e}")
-
-        # Remove chunk directory if empty
-        if chunk_dir and chunk_dir.exists():
+                etag = self._upload_chunk_to_s3(chunk_data, presigned_url)
+                return CompletedChunk(
+                    chunk_index=chunk_index,
+                    proof=etag,
+                    proof_type="etag",
+                    chunk_size=chunk.length
+                )
+            except Exception as e:
+                last_error = e
+                if attempt < max_retries:
+                    logger.warning(f"Chunk {chunk_index} upload failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
+                    time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
+                else:
+                    logger.error(f"Chunk {chunk_index} upload failed after {max_retries + 1} attempts")
+
+        raise UploadError(f"Chunk {chunk_index} upload failed after {max_retries + 1} attempts",
+                        chunk_index=chunk_index, original_error=last_error)
+
+    def _upload_chunks_pipelined(
+        self,
+        upload_id: str,
+        file_path: Path,
+        chunks: typing.List[_ChunkSpan],
+        presigned_urls: typing.Dict[int, str],
+        *,
+        total_chunks: int,
+        reported_count: int,
+        unreported: typing.List[CompletedChunk],
+        journal: typing.Optional[_UploadJournal],
+        batch_size: int,
+        max_workers: int,
+        max_retries: int,
+        retry_delay: float,
+        progress_callback: typing.Optional[typing.Callable[[UploadProgress], None]],
+        request_options: typing.Optional[RequestOptions],
+    ) -> typing.Optional[str]:
+        """
+        Upload chunks keeping ``max_workers`` PUTs in flight at all times.
+
+        A new chunk starts as soon as any upload finishes, presigned URLs are fetched ahead of need,
+        and completed chunks are reported in groups of ``batch_size`` on a background thread, so a
+        slow chunk or report call never stalls the other workers. Each worker reads its chunk only
+        when it starts, so at most ``max_workers`` chunk buffers are held in memory.
+
+        ``chunks`` are the chunks still to upload; ``unreported`` holds chunks already uploaded (by a
+        previous, interrupted run) that still have to be reported. Every uploaded chunk is recorded in
+        ``journal``, if given. Returns the asset URL once the platform reports the upload as complete.
+        """
+        lookahead = 2 * max_workers
+        asset_url: typing.Optional[str] = None
+        next_chunk = 0
+        unreported = list(unreported)
+        # Size the shared connection pool for this upload before the workers start using it
+        self._get_upload_httpx_client(max_workers)
+        uploads: typing.Dict[Future, int] = {}
+        reports: typing.Dict[Future, int] = {}
+
+        # Reports run on a single thread so they reach the platform one at a time
+        with ThreadPoolExecutor(max_workers=max_workers) as upload_executor, ThreadPoolExecutor(
+            max_workers=1
+        ) as report_executor:
             try:
-                chunk_dir.rmdir()
-            except OSError:
-                # Directory not empty or other error, ignore
-                pass
+                while next_chunk < len(chunks) or uploads or reports or unreported:
+                    # Keep the upload window full
+                    while next_chunk < len(chunks) and len(uploads) < max_workers:
+                        chunk = chunks[next_chunk]
+                        self._prefetch_presigned_urls(
+                            upload_id, presigned_urls, chunk.chunk_index, total_chunks, lookahead, request_options
+                        )
+                        future = upload_executor.submit(
+                            self._upload_chunk_with_retry,
+                            file_path,
+                            chunk,
+                            presigned_urls[chunk.chunk_index],
+                            max_retries,
+                            retry_delay,
+                        )
+                        uploads[future] = chunk.chunk_index
+                        next_chunk += 1
+
+                    # Report a full batch, or whatever is left once every upload has finished
+                    all_uploaded = next_chunk == len(chunks) and not uploads
+                    if len(unreported) >= batch_size or (unreported and all_uploaded):
+                        batch, unreported = unreported[:batch_size], unreported[batch_size:]
+                        report = report_executor.submit(
+                            self.report_chunk_batch, upload_id, completed_chunks=batch, request_options=request_options
+                        )
+                        reports[report] = len(batch)
+                        continue
+
+                    pending: typing.List[Future] = [*uploads, *reports]
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for finished in done:
+                        if finished in uploads:
+                            chunk_index = uploads.pop(finished)
+                            try:
+                                completed_chunk = finished.result()
+                            except Exception as e:
+                                raise UploadError(f"Chunk {chunk_index} upload failed: {e}",
+                                                chunk_index=chunk_index, original_error=e)
+                            unreported.append(completed_chunk)
+                            if journal is not None:
+                                journal.record_uploaded(completed_chunk)
+                            continue
+
+                        reported_count += reports.pop(finished)
+                        result: ReportChunkBatchResponse = finished.result()
+                        if result.url:
+                            asset_url = result.url
+
+                        # Update progress
+                        if progress_callback:
+                            progress = UploadProgress(
+                                total_chunks=total_chunks,
+                                completed_chunks=reported_count,
+                                percentage=(reported_count / total_chunks) * 100,
+                                status="uploading"
+                            )
+                            progress_callback(progress)
+            except BaseException:
+                # Don't start queued work; in-flight PUTs finish before the executors shut down
+                for future in list(uploads) + list(reports):
+                    future.cancel()
+                raise
+
+        return asset_url
 
     def wait_for_upload_completion(
         self,
@@ -395,6 +617,7 @@ class MultipartUploadClientWrapper(MultipartUploadClient):
         sleep_interval: float = 5.0,
         max_wait_time: typing.Optional[float] = None,
         callback: typing.Optional[typing.Callable[[UploadStatus], None]] = None,
+        polling: typing.Optional[PollingStrategy] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> UploadStatus:
         """
@@ -414,6 +637,10 @@ class MultipartUploadClientWrapper(MultipartUploadClient):
         callback : typing.Optional[typing.Callable[[UploadStatus], None]], optional
             A function to call after each status check with the upload status, by default None
 
+        polling : typing.Optional[PollingStrategy], optional
+            How long to sleep between status checks, for example `ExponentialBackoff()`. Overrides
+            sleep_interval, by default None
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -445,11 +672,11 @@ class MultipartUploadClientWrapper(MultipartUploadClient):
             max_wait_time=3600.0,  # 1 hour timeout
         )
         """
-        if sleep_interval <= 0:
-            raise ValueError("sleep_interval must be greater than 0")
-
+        strategy = get_polling_strategy(polling, sleep_interval)
         start_time = time.time()
-        
+        attempt = 0
+        status: typing.Optional[UploadStatus] = None
+
         while True:
             try:
                 # Get chunk status
@@ -489,21 +716,55 @@ class MultipartUploadClientWrapper(MultipartUploadClient):
                 if max_wait_time and (time.time() - start_time) > max_wait_time:
                     raise UploadError(f"Upload timed out after {max_wait_time} seconds")
 
-                time.sleep(sleep_interval)
+                delay = strategy.get_delay(attempt=attempt, elapsed=time.time() - start_time, resource=status)
+                time.sleep(delay)
+                attempt += 1
 
             except UploadError:
                 raise
             except Exception as e:
                 logger.warning(f"Error checking upload status: {e}")
-                time.sleep(sleep_interval)
+                delay = strategy.get_error_delay(e, attempt=attempt, elapsed=time.time() - start_time, resource=status)
+                time.sleep(delay)
+                attempt += 1
 
 
 class AsyncMultipartUploadClientWrapper(AsyncMultipartUploadClient):
     """Async wrapper for the MultipartUploadClient that adds high-level upload functionality."""
 
-    def __init__(self, client_wrapper: AsyncClientWrapper):
-        """Initialize the AsyncMultipartUploadClientWrapper."""
+    def __init__(
+        self, client_wrapper: AsyncClientWrapper, *, upload_httpx_client: typing.Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Initialize the AsyncMultipartUploadClientWrapper.
+
+        Chunks are PUT to their presigned URLs with ``upload_httpx_client``. By default a pooled client
+        is created on first use and reused for every chunk of every upload, so connections to the
+        storage backend stay alive between chunks; it is closed by ``aclose()``. Pass your own client
+        to customize pooling, proxies or HTTP/2 (``httpx.AsyncClient(http2=True)``, requires
+        ``httpx[http2]``).
+        """
         super().__init__(client_wrapper=client_wrapper)
+        self._upload_httpx_client = upload_httpx_client
+        self._owns_upload_httpx_client = upload_httpx_client is None
+
+    def _get_upload_httpx_client(self, max_workers: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS) -> httpx.AsyncClient:
+        """Return the shared client used for chunk PUTs, creating it on first use."""
+        if self._upload_httpx_client is None:
+            self._upload_httpx_client = httpx.AsyncClient(
+                timeout=CHUNK_UPLOAD_TIMEOUT_SECONDS,
+                limits=httpx.Limits(
+                    max_connections=None,
+                    max_keepalive_connections=max(max_workers, DEFAULT_MAX_KEEPALIVE_CONNECTIONS),
+                ),
+            )
+        return self._upload_httpx_client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client used for chunk uploads, if this wrapper created it."""
+        if self._owns_upload_httpx_client and self._upload_httpx_client is not None:
+            await self._upload_httpx_client.aclose()
+            self._upload_httpx_client = None
 
     async def upload_file(
         self,
@@ -518,6 +779,8 @@ class AsyncMultipartUploadClientWrapper(AsyncMultipartUploadClient):
         ] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        resume: bool = False,
+        journal_path: typing.Optional[typing.Union[str, Path]] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> UploadResult:
         """
@@ -549,6 +812,15 @@ class AsyncMultipartUploadClientWrapper(AsyncMultipartUploadClient):
         retry_delay : float
             Delay in seconds between retry attempts (default: 1.0).
 
+        resume : bool
+            Keep a local journal of the upload so that, if it is interrupted, calling `upload_file` again
+            with `resume=True` continues the same upload session and only uploads the missing chunks
+            (default: False). The journal is removed once the upload completes. Upload sessions expire
+            24 hours after they are created; after that a new upload is started.
+
+        journal_path : typing.Optional[typing.Union[str, Path]]
+            Where to store the resume journal (default: `<file_path>.upload.jsonl` next to the file).
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -586,6 +858,9 @@ class AsyncMultipartUploadClientWrapper(AsyncMultipartUploadClient):
             )
             print(f"Upload completed! Asset ID: {result.asset_id}")
 
+            # Resumable upload: re-running after a crash only uploads the missing chunks
+            result = await client.multipart_upload.upload_file("large_video.mp4", resume=True)
+
         asyncio.run(main())
         """
         file_path = Path(file_path)
@@ -596,162 +871,119 @@ class AsyncMultipartUploadClientWrapper(AsyncMultipartUploadClient):
             filename = file_path.name
 
         total_size = file_path.stat().st_size
-        chunk_files = []
+        journal = (
+            _UploadJournal(Path(journal_path) if journal_path is not None else _UploadJournal.default_path(file_path), file_path)
+            if resume
+            else None
+        )
 
         try:
-            logger.info(f"Creating upload session for {filename} ({total_size:,} bytes)")
-            # Step 1: Create upload session
-            upload_session = await self.create(
-                filename=filename,
-                type=file_type,
-                total_size=total_size,
-                request_options=request_options
-            )
-            
-            if not upload_session.upload_id or not upload_session.chunk_size:
-                raise UploadError("Invalid upload session response: missing upload_id or chunk_size")
-                
-            upload_id = upload_session.upload_id
-            chunk_size = upload_session.chunk_size
-            logger.info(f"Upload session created: {upload_id} (chunk size: {chunk_size:,} bytes)")
-
-            # Step 2: Split file into chunks
-            chunk_files = await self._split_file_async(file_path, chunk_size)
-            total_chunks = len(chunk_files)
-            logger.info(f"File split into {total_chunks} chunks")
-            
-            if total_chunks == 0:
-                raise UploadError("No chunks created from file")
-
-            # Step 3: Upload chunks in batches
             current_urls: typing.Dict[int, str] = {}
-            if upload_session.upload_urls:
-                for url in upload_session.upload_urls:
-                    if url.chunk_index is not None and url.url is not None:
-                        current_urls[url.chunk_index] = url.url
-            completed_chunks_count = 0
-
-            for batch_start in range(0, total_chunks, batch_size):
-                batch_end = min(batch_start + batch_size, total_chunks)
-                batch_chunk_files = chunk_files[batch_start:batch_end]
-                batch_indices = list(range(batch_start + 1, batch_end + 1))  # 1-based indexing
-
-                # Ensure we have URLs for all chunks in this batch
-                missing_urls = [idx for idx in batch_indices if idx not in current_urls]
-                if missing_urls:
-                    min_chunk = min(missing_urls)
-                    max_chunk = max(missing_urls)
-                    
-                    logger.debug(f"Fetching URLs for chunks {min_chunk}-{max_chunk} ({len(missing_urls)} missing)")
-                    start = min_chunk
-                    count = max_chunk - min_chunk + 1
-                    
-                    additional_urls = await self.get_additional_presigned_urls(
-                        upload_id, start=start, count=count, request_options=request_options
-                    )
-                    
-                    if additional_urls.upload_urls:
-                        for url_info in additional_urls.upload_urls:
-                            if url_info.chunk_index is not None and url_info.url is not None and url_info.chunk_index in missing_urls:
-                                current_urls[url_info.chunk_index] = url_info.url
-
-                # Upload batch chunks in parallel with retry logic
-                batch_completed_chunks = await self._upload_chunk_batch_async_with_retry(
-                    batch_chunk_files,
-                    batch_indices,
-                    current_urls,
-                    max_workers,
-                    max_retries,
-                    retry_delay
-                )
-
-                # Report completed batch
-                result = await self.report_chunk_batch(
-                    upload_id,
-                    completed_chunks=batch_completed_chunks,
+            completed_indices = await self._resume_upload(journal, request_options) if journal is not None else None
+            if journal is not None and completed_indices is not None:
+                upload_id = journal.upload_id
+                asset_id = journal.asset_id
+                chunk_size = journal.chunk_size
+                logger.info(f"Resuming upload session {upload_id} ({len(completed_indices)} chunks already completed)")
+            else:
+                completed_indices = set()
+                logger.info(f"Creating upload session for {filename} ({total_size:,} bytes)")
+                # Step 1: Create upload session
+                upload_session = await self.create(
+                    filename=filename,
+                    type=file_type,
+                    total_size=total_size,
                     request_options=request_options
                 )
 
-                completed_chunks_count += len(batch_completed_chunks)
+                if not upload_session.upload_id or not upload_session.chunk_size:
+                    raise UploadError("Invalid upload session response: missing upload_id or chunk_size")
+
+                upload_id = upload_session.upload_id
+                asset_id = upload_session.asset_id
+                chunk_size = upload_session.chunk_size
+                logger.info(f"Upload session created: {upload_id} (chunk size: {chunk_size:,} bytes)")
+
+                if upload_session.upload_urls:
+                    for url in upload_session.upload_urls:
+                        if url.chunk_index is not None and url.url is not None:
+                            current_urls[url.chunk_index] = url.url
+                if journal is not None:
+                    journal.start(upload_id, asset_id, chunk_size)
+
+            # Step 2: Plan chunk byte ranges; chunks are read from the source file on demand
+            chunks = _plan_chunks(total_size, chunk_size)
+            total_chunks = len(chunks)
+            logger.info(f"File will be uploaded in {total_chunks} chunks")
+            
+            if total_chunks == 0:
+                raise UploadError("No chunks created from file")
 
-                # Update progress
-                if progress_callback:
-                    progress = UploadProgress(
-                        total_chunks=total_chunks,
-                        completed_chunks=completed_chunks_count,
-                        percentage=(completed_chunks_count / total_chunks) * 100,
-                        status="uploading"
-                    )
-                    await progress_callback(progress)
-
-                # Check if upload is complete
-                if result.url:
-                    logger.info(f"Upload completed successfully! Asset ID: {upload_session.asset_id}")
-                    return UploadResult(
-                        asset_id=upload_session.asset_id,
-                        asset_url=result.url,
-                    )
+            # Chunks uploaded before an interruption but never reported are reported without re-uploading
+            unreported = (
+                [chunk for index, chunk in journal.uploaded.items() if index not in completed_indices]
+                if journal is not None
+                else []
+            )
+            skipped = completed_indices | {chunk.chunk_index for chunk in unreported}
+            pending_chunks = [chunk for chunk in chunks if chunk.chunk_index not in skipped]
+
+            # Step 3: Upload chunks through a sliding window of in-flight PUTs
+            asset_url = await self._upload_chunks_pipelined(
+                upload_id,
+                file_path,
+                pending_chunks,
+                current_urls,
+                total_chunks=total_chunks,
+                reported_count=len(completed_indices),
+                unreported=unreported,
+                journal=journal,
+                batch_size=batch_size,
+                max_workers=max_workers,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                progress_callback=progress_callback,
+                request_options=request_options,
+            )
 
-            # All chunks have been uploaded and reported
-            logger.info(f"Upload completed successfully! Asset ID: {upload_session.asset_id}")
+            if journal is not None:
+                journal.remove()
+            logger.info(f"Upload completed successfully! Asset ID: {asset_id}")
             return UploadResult(
-                asset_id=upload_session.asset_id,
-                asset_url="",  # URL will be available after processing
+                asset_id=asset_id,
+                asset_url=asset_url or "",  # URL will be available after processing
             )
             
         except UploadError:
             raise
         except Exception as e:
             raise UploadError(f"Upload failed: {str(e)}", original_error=e)
-        finally:
-            # Cleanup temporary files
-            if chunk_files:
-                try:
-                    await self._cleanup_chunks_async(chunk_files)
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup chunk files: {e}")
-
-    async def _split_file_async(self, file_path: Path, chunk_size: int) -> typing.List[Path]:
-        """Split file into chunks asynchronously and return list of chunk file paths."""
-        chunk_files = []
-        chunk_dir = file_path.parent / f"{file_path.stem}_chunks"
-        
-        try:
-            chunk_dir.mkdir(exist_ok=True)
-
-            with open(file_path, 'rb') as f:
-                chunk_num = 1
-                while True:
-                    chunk_data = f.read(chunk_size)
-                    if not chunk_data:
-                        break
 
-                    chunk_file = chunk_dir / f"chunk_{chunk_num:04d}"
-                    with open(chunk_file, 'wb') as chunk_f:
-                        chunk_f.write(chunk_data)
-
-                    chunk_files.append(chunk_file)
-                    chunk_num += 1
-        except Exception as e:
-            # Clean up any partial chunks on error
-            await self._cleanup_chunks_async(chunk_files)
-            raise UploadError(f"Failed to split file into chunks: {e}", original_error=e)
-
-        return chunk_files
-
-    async def _upload_chunk_to_s3_async(self, chunk_file: Path, presigned_url: str) -> str:
+    async def _resume_upload(
+        self, journal: _UploadJournal, request_options: typing.Optional[RequestOptions]
+    ) -> typing.Optional[typing.Set[int]]:
+        """Return the chunks the platform already has for a journaled upload, or None if it can't be resumed."""
+        if not journal.load():
+            return None
+        try:
+            chunk_status = await self.get_status(journal.upload_id, page_limit=50, request_options=request_options)
+            return {
+                chunk.index
+                async for chunk in chunk_status
+                if chunk.index is not None and chunk.status == "completed"
+            }
+        except ApiError as e:
+            logger.warning(f"Cannot resume upload session {journal.upload_id}, starting a new one: {e}")
+            return None
+
+    async def _upload_chunk_to_s3_async(self, chunk_data: bytes, presigned_url: str) -> str:
         """Upload a single chunk to S3 asynchronously and return ETag."""
         try:
-            # Read file content first, then upload asynchronously
-            with open(chunk_file, 'rb') as f:
-                file_content = f.read()
-            
-            async with httpx.AsyncClient(timeout=300.0) as client:  # 5 minute timeout
-                response = await client.put(
-                    presigned_url,
-                    content=file_content,
-                    headers={'Content-Type': 'application/octet-stream'}
-                )
+            response = await self._get_upload_httpx_client().put(
+                presigned_url,
+                content=chunk_data,
+                headers={'Content-Type': 'application/octet-stream'}
+            )
 
             response.raise_for_status()
             etag = response.headers.get('ETag', '').strip('"')
@@ -763,84 +995,172 @@ class AsyncMultipartUploadClientWrapper(AsyncMultipartUploadClient):
         except Exception as e:
             raise UploadError(f"Failed to upload chunk: {e}", original_error=e)
 
-    async def _upload_chunk_batch_async_with_retry(
+    async def _prefetch_presigned_urls(
+        self,
+        upload_id: str,
+        presigned_urls: typing.Dict[int, str],
+        chunk_index: int,
+        total_chunks: int,
+        lookahead: int,
+        request_options: typing.Optional[RequestOptions],
+    ) -> None:
+        """Make sure presigned URLs are known for the ``lookahead`` chunks starting at ``chunk_index``."""
+        end = min(chunk_index + lookahead, total_chunks + 1)
+        start = next((idx for idx in range(chunk_index, end) if idx not in presigned_urls), None)
+        if start is None:
+            return
+
+        count = min(MAX_PRESIGNED_URLS_PER_REQUEST, total_chunks - start + 1)
+        logger.debug(f"Fetching URLs for chunks {start}-{start + count - 1}")
+        additional_urls = await self.get_additional_presigned_urls(
+            upload_id, start=start, count=count, request_options=request_options
+        )
+        if additional_urls.upload_urls:
+            for url_info in additional_urls.upload_urls:
+                if url_info.chunk_index is not None and url_info.url is not None:
+                    presigned_urls[url_info.chunk_index] = url_info.url
+
+        if chunk_index not in presigned_urls:
+            raise UploadError(f"No presigned URL returned for chunk {chunk_index}", chunk_index=chunk_index)
+
+    async def _upload_chunk_with_retry_async(
+        self,
+        file_path: Path,
+        chunk: _ChunkSpan,
+        presigned_url: str,
+        max_retries: int,
+        retry_delay: float,
+    ) -> CompletedChunk:
+        """Read a chunk from the source file and upload it asynchronously with retry logic."""
+        chunk_index = chunk.chunk_index
+        # Read off the event loop so large chunks don't block other uploads
+        chunk_data = await asyncio.get_running_loop().run_in_executor(None, _read_chunk, file_path, chunk)
+        last_error = None
+
+        for attempt in range(max_retries + 1):
+            try:
+                etag = await self._upload_chunk_to_s3_async(chunk_data, presigned_url)
+                return CompletedChunk(
+                    chunk_index=chunk_index,
+                    proof=etag,
+                    proof_type="etag",
+                    chunk_size=chunk.length
+                )
+            except Exception as e:
+                last_error = e
+                if attempt < max_retries:
+                    logger.warning(f"Chunk {chunk_index} upload failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
+                    await asyncio.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
+                else:
+                    logger.error(f"Chunk {chunk_index} upload failed after {max_retries + 1} attempts")
+
+        raise UploadError(f"Chunk {chunk_index} upload failed after {max_retries + 1} attempts",
+                        chunk_index=chunk_index, original_error=last_error)
+
+    async def _upload_chunks_pipelined(
         self,
-        chunk_files: typing.List[Path],
-        chunk_indices: typing.List[int],
+        upload_id: str,
+        file_path: Path,
+        chunks: typing.List[_ChunkSpan],
         presigned_urls: typing.Dict[int, str],
+        *,
+        total_chunks: int,
+        reported_count: int,
+        unreported: typing.List[CompletedChunk],
+        journal: typing.Optional[_UploadJournal],
+        batch_size: int,
         max_workers: int,
         max_retries: int,
-        retry_delay: float
-    ) -> typing.List[CompletedChunk]:
-        """Upload a batch of chunks in parallel asynchronously with retry logic."""
-        completed_chunks = []
-        max_workers = min(len(chunk_files), max_workers)
-
-        # Create semaphore to limit concurrent uploads
-        semaphore = asyncio.Semaphore(max_workers)
-
-        async def upload_single_chunk_with_retry(chunk_file: Path, chunk_index: int) -> CompletedChunk:
-            async with semaphore:
-                presigned_url = presigned_urls[chunk_index]
-                last_error = None
-                
-                for attempt in range(max_retries + 1):
-                    try:
-                        etag = await self._upload_chunk_to_s3_async(chunk_file, presigned_url)
-                        chunk_size_bytes = chunk_file.stat().st_size
-                        return CompletedChunk(
-                            chunk_index=chunk_index,
-                            proof=etag,
-                            proof_type="etag",
-                            chunk_size=chunk_size_bytes
-                        )
-                    except Exception as e:
-                        last_error = e
-                        if attempt < max_retries:
-                            logger.warning(f"Chunk {chunk_index} upload failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                            await asyncio.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
-                        else:
-                            logger.error(f"Chunk {chunk_index} upload failed after {max_retries + 1} attempts")
-                
-                raise UploadError(f"Chunk {chunk_index} upload failed after {max_retries + 1} attempts", 
-                                chunk_index=chunk_index, original_error=last_error)
-
-        # Create tasks for all chunks
-        tasks = [
-            upload_single_chunk_with_retry(chunk_file, chunk_indices[i])
-            for i, chunk_file in enumerate(chunk_files)
-        ]
-
-        # Wait for all uploads to complete
-        try:
-            completed_chunks = await asyncio.gather(*tasks)
-        except Exception as e:
-            raise UploadError(f"Batch upload failed: {e}", original_error=e)
+        retry_delay: float,
+        progress_callback: typing.Optional[typing.Callable[[UploadProgress], typing.Awaitable[None]]],
+        request_options: typing.Optional[RequestOptions],
+    ) -> typing.Optional[str]:
+        """
+        Upload chunks keeping ``max_workers`` PUTs in flight at all times.
 
-        return completed_chunks
+        A new chunk starts as soon as any upload finishes, presigned URLs are fetched ahead of need,
+        and completed chunks are reported in groups of ``batch_size`` by background tasks, so a slow
+        chunk or report call never stalls the other uploads. Each upload reads its chunk only when it
+        starts, so at most ``max_workers`` chunk buffers are held in memory.
 
-    async def _cleanup_chunks_async(self, chunk_files: typing.List[Path]):
-        """Clean up temporary chunk files asynchronously."""
-        if not chunk_files:
-            return
-            
-        chunk_dir = None
-        for chunk_file in chunk_files:
-            try:
-                if chunk_file.exists():
-                    chunk_file.unlink()
-                if chunk_dir is None:
-                    chunk_dir = chunk_file.parent
-            except OSError as e:
-                logger.warning(f"Failed to delete chunk file {chunk_file}: {e}")
-
-        # Remove chunk directory if empty
-        if chunk_dir and chunk_dir.exists():
-            try:
-                chunk_dir.rmdir()
-            except OSError:
-                # Directory not empty or other error, ignore
-                pass
+        ``chunks`` are the chunks still to upload; ``unreported`` holds chunks already uploaded (by a
+        previous, interrupted run) that still have to be reported. Every uploaded chunk is recorded in
+        ``journal``, if given. Returns the asset URL once the platform reports the upload as complete.
+        """
+        lookahead = 2 * max_workers
+        asset_url: typing.Optional[str] = None
+        next_chunk = 0
+        unreported = list(unreported)
+        uploads: typing.Dict[asyncio.Future, int] = {}
+        reports: typing.Dict[asyncio.Future, int] = {}
+        # Size the shared connection pool for this upload before the workers start using it
+        self._get_upload_httpx_client(max_workers)
+        # Reports reach the platform one at a time
+        report_lock = asyncio.Lock()
+
+        async def report(batch: typing.List[CompletedChunk]) -> ReportChunkBatchResponse:
+            async with report_lock:
+                return await self.report_chunk_batch(upload_id, completed_chunks=batch, request_options=request_options)
+
+        try:
+            while next_chunk < len(chunks) or uploads or reports or unreported:
+                # Keep the upload window full
+                while next_chunk < len(chunks) and len(uploads) < max_workers:
+                    chunk = chunks[next_chunk]
+                    await self._prefetch_presigned_urls(
+                        upload_id, presigned_urls, chunk.chunk_index, total_chunks, lookahead, request_options
+                    )
+                    task = asyncio.ensure_future(
+                        self._upload_chunk_with_retry_async(
+                            file_path, chunk, presigned_urls[chunk.chunk_index], max_retries, retry_delay
+                        )
+                    )
+                    uploads[task] = chunk.chunk_index
+                    next_chunk += 1
+
+                # Report a full batch, or whatever is left once every upload has finished
+                all_uploaded = next_chunk == len(chunks) and not uploads
+                if len(unreported) >= batch_size or (unreported and all_uploaded):
+                    batch, unreported = unreported[:batch_size], unreported[batch_size:]
+                    reports[asyncio.ensure_future(report(batch))] = len(batch)
+                    continue
+
+                done, _ = await asyncio.wait([*uploads, *reports], return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    if finished in uploads:
+                        chunk_index = uploads.pop(finished)
+                        try:
+                            completed_chunk = finished.result()
+                        except Exception as e:
+                            raise UploadError(f"Chunk {chunk_index} upload failed: {e}",
+                                            chunk_index=chunk_index, original_error=e)
+                        unreported.append(completed_chunk)
+                        if journal is not None:
+                            journal.record_uploaded(completed_chunk)
+                        continue
+
+                    reported_count += reports.pop(finished)
+                    result: ReportChunkBatchResponse = finished.result()
+                    if result.url:
+                        asset_url = result.url
+
+                    # Update progress
+                    if progress_callback:
+                        progress = UploadProgress(
+                            total_chunks=total_chunks,
+                            completed_chunks=reported_count,
+                            percentage=(reported_count / total_chunks) * 100,
+                            status="uploading"
+                        )
+                        await progress_callback(progress)
+        except BaseException:
+            outstanding = [*uploads, *reports]
+            for pending_task in outstanding:
+                pending_task.cancel()
+            await asyncio.gather(*outstanding, return_exceptions=True)
+            raise
+
+        return asset_url
 
     async def wait_for_upload_completion(
         self,
@@ -851,6 +1171,7 @@ class AsyncMultipartUploadClientWrapper(AsyncMultipartUploadClient):
         callback: typing.Optional[
             typing.Callable[[UploadStatus], typing.Awaitable[None]]
         ] = None,
+        polling: typing.Optional[PollingStrategy] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> UploadStatus:
         """
@@ -870,6 +1191,10 @@ class AsyncMultipartUploadClientWrapper(AsyncMultipartUploadClient):
         callback : typing.Optional[typing.Callable[[UploadStatus], typing.Awaitable[None]]], optional
             An async function to call after each status check with the upload status, by default None
 
+        polling : typing.Optional[PollingStrategy], optional
+            How long to sleep between status checks, for example `ExponentialBackoff()`. Overrides
+            sleep_interval, by default None
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
@@ -905,11 +1230,11 @@ class AsyncMultipartUploadClientWrapper(AsyncMultipartUploadClient):
 
         asyncio.run(main())
         """
-        if sleep_interval <= 0:
-            raise ValueError("sleep_interval must be greater than 0")
-
+        strategy = get_polling_strategy(polling, sleep_interval)
         start_time = time.time()
-        
+        attempt = 0
+        status: typing.Optional[UploadStatus] = None
+
         while True:
             try:
                 # Get chunk status
@@ -949,10 +1274,14 @@ class AsyncMultipartUploadClientWrapper(AsyncMultipartUploadClient):
                 if max_wait_time and (time.time() - start_time) > max_wait_time:
                     raise UploadError(f"Upload timed out after {max_wait_time} seconds")
 
-                await asyncio.sleep(sleep_interval)
+                delay = strategy.get_delay(attempt=attempt, elapsed=time.time() - start_time, resource=status)
+                await asyncio.sleep(delay)
+                attempt += 1
 
             except UploadError:
                 raise
             except Exception as e:
                 logger.warning(f"Error checking upload status: {e}")
-                await asyncio.sleep(sleep_interval)
\ No newline at end of file
+                delay = strategy.get_error_delay(e, attempt=attempt, elapsed=time.time() - start_time, resource=status)
+                await asyncio.sleep(delay)
+                attempt += 1
\ No newline at end of file
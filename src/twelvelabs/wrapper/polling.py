@@ -0,0 +1,129 @@
+import abc
+import dataclasses
+import random
+import typing
+
+import httpx
+from ..core.api_error import ApiError
+from ..core.retry_policy import _parse_retry_after
+
+
+class PollingStrategy(abc.ABC):
+    """
+    Decides how long a waiter sleeps before its next status check.
+
+    Subclasses override `get_delay`. `attempt` is the number of times the waiter has slept so far, `elapsed` the
+    seconds since the wait started, and `resource` the latest status response, or None if there is none.
+
+    Examples
+    --------
+    from twelvelabs import TwelveLabs
+    from twelvelabs.wrapper.polling import DurationEstimate
+
+    client = TwelveLabs(api_key="YOUR_API_KEY")
+    task = client.tasks.wait_for_done(task_id="task_id", polling=DurationEstimate())
+    """
+
+    @abc.abstractmethod
+    def get_delay(self, *, attempt: int, elapsed: float, resource: typing.Optional[typing.Any] = None) -> float: ...
+
+    def get_error_delay(
+        self, error: BaseException, *, attempt: int, elapsed: float, resource: typing.Optional[typing.Any] = None
+    ) -> float:
+        """
+        Returns the sleep after a failed status check. A rate-limited check waits at least as long as the
+        `Retry-After` header asks.
+        """
+        delay = self.get_delay(attempt=attempt, elapsed=elapsed, resource=resource)
+        retry_after = _get_retry_after(error)
+        return delay if retry_after is None else max(delay, retry_after)
+
+
+@dataclasses.dataclass(frozen=True)
+class FixedInterval(PollingStrategy):
+    """
+    Sleeps the same interval, in seconds, between every status check.
+    """
+
+    interval: float = 5.0
+
+    def __post_init__(self) -> None:
+        if self.interval <= 0:
+            raise ValueError("interval must be greater than 0")
+
+    def get_delay(self, *, attempt: int, elapsed: float, resource: typing.Optional[typing.Any] = None) -> float:
+        return self.interval
+
+
+@dataclasses.dataclass(frozen=True)
+class ExponentialBackoff(PollingStrategy):
+    """
+    Starts with short sleeps so that quick tasks return early, and multiplies the sleep after every check up
+    to `max_interval` so that long tasks send few requests. `jitter` spreads the sleeps of many waiters by up to
+    that fraction of the interval.
+    """
+
+    initial_interval: float = 1.0
+    multiplier: float = 1.5
+    max_interval: float = 30.0
+    jitter: float = 0.1
+
+    def __post_init__(self) -> None:
+        if self.initial_interval <= 0 or self.max_interval < self.initial_interval:
+            raise ValueError("initial_interval must be greater than 0 and no greater than max_interval")
+        if self.multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+
+    def get_delay(self, *, attempt: int, elapsed: float, resource: typing.Optional[typing.Any] = None) -> float:
+        # Cap the exponent so that long waits don't overflow
+        interval = min(self.initial_interval * pow(self.multiplier, min(attempt, 64)), self.max_interval)
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+@dataclasses.dataclass(frozen=True)
+class DurationEstimate(PollingStrategy):
+    """
+    Estimates when a task finishes from the duration of its media, and sleeps until then.
+
+    The estimate is `overhead + seconds_per_media_second * duration`, using the duration in the task's system
+    metadata or embedding metadata. Past the estimate, the sleep grows with the overrun, starting from
+    `min_interval`. Sleeps never exceed `max_interval`. When the status response has no duration, the
+    `fallback` strategy decides.
+    """
+
+    seconds_per_media_second: float = 0.5
+    overhead: float = 10.0
+    min_interval: float = 2.0
+    max_interval: float = 60.0
+    fallback: PollingStrategy = ExponentialBackoff()
+
+    def get_delay(self, *, attempt: int, elapsed: float, resource: typing.Optional[typing.Any] = None) -> float:
+        duration = _get_media_duration(resource)
+        if duration is None:
+            return self.fallback.get_delay(attempt=attempt, elapsed=elapsed, resource=resource)
+        remaining = self.overhead + self.seconds_per_media_second * duration - elapsed
+        delay = remaining if remaining > 0 else -remaining / 2
+        return min(max(delay, self.min_interval), self.max_interval)
+
+
+def get_polling_strategy(polling: typing.Optional[PollingStrategy], sleep_interval: float) -> PollingStrategy:
+    if sleep_interval <= 0:
+        raise ValueError("sleep_interval must be greater than 0")
+    return polling if polling is not None else FixedInterval(sleep_interval)
+
+
+def _get_media_duration(resource: typing.Optional[typing.Any]) -> typing.Optional[float]:
+    # Video indexing tasks report the duration in their system metadata, embedding tasks in their embedding metadata
+    for path in (("system_metadata", "duration"), ("video_embedding", "metadata", "duration")):
+        value = resource
+        for name in path:
+            value = getattr(value, name, None)
+        if isinstance(value, (int, float)) and value > 0:
+            return float(value)
+    return None
+
+
+def _get_retry_after(error: BaseException) -> typing.Optional[float]:
+    if isinstance(error, ApiError) and error.status_code == 429 and error.headers:
+        return _parse_retry_after(httpx.Headers(error.headers))
+    return None
@@ -0,0 +1,134 @@
+import dataclasses
+import typing
+
+from ..core.pagination import AsyncPager, SyncPager
+from .throttle import RequestThrottle
+
+T = typing.TypeVar("T")
+
+# The largest `page_limit` the page-number paginated list endpoints accept
+MAX_PAGE_LIMIT = 50
+
+
+def _validate(concurrency: int) -> None:
+    if concurrency <= 0:
+        raise ValueError("concurrency must be greater than 0")
+
+
+def _get_total_pages(first: typing.Union[SyncPager[T], AsyncPager[T]]) -> typing.Optional[int]:
+    # Generated pagers don't carry the page count, so it is read from `page_info` in the first response
+    if first.total_pages is not None:
+        return first.total_pages
+    if first.response is None:
+        return None
+    try:
+        page_info = first.response._response.json().get("page_info") or {}
+    except ValueError:
+        return None
+    total_page = page_info.get("total_page")
+    return total_page if isinstance(total_page, int) else None
+
+
+def scan_all(
+    list_fn: typing.Callable[..., SyncPager[T]],
+    *,
+    concurrency: int = 5,
+    max_requests_per_second: typing.Optional[float] = None,
+    page_limit: int = MAX_PAGE_LIMIT,
+    **kwargs: typing.Any,
+) -> typing.Iterator[T]:
+    """
+    Yields every item of a page-number paginated list endpoint, in page order.
+
+    The first page gives the number of pages from `page_info.total_page`, and the remaining pages are then
+    fetched `concurrency` at a time, starting at most `max_requests_per_second` requests per second. At most
+    `concurrency` pages are held in memory ahead of the caller. Items added while the scan runs may be missed,
+    and the scan stops early at the first empty page. Endpoints that don't report a page count are walked
+    sequentially. The remaining keyword arguments are passed to `list_fn`.
+
+    Examples
+    --------
+    from twelvelabs import TwelveLabs
+    from twelvelabs.wrapper.scan import scan_all
+
+    client = TwelveLabs(api_key="YOUR_API_KEY")
+    for asset in scan_all(client.indexes.indexed_assets.list, index_id="index_id", concurrency=8):
+        print(asset.id)
+    """
+    _validate(concurrency)
+    return _scan_all(list_fn, RequestThrottle(max_requests_per_second), concurrency, page_limit, kwargs)
+
+
+def _scan_all(
+    list_fn: typing.Callable[..., SyncPager[T]],
+    throttle: RequestThrottle,
+    concurrency: int,
+    page_limit: int,
+    kwargs: typing.Dict[str, typing.Any],
+) -> typing.Iterator[T]:
+    throttle.wait()
+    first = list_fn(page=1, page_limit=page_limit, **kwargs)
+    total_pages = _get_total_pages(first)
+    if total_pages is None:
+        page: typing.Optional[SyncPager[T]] = first
+        while page is not None:
+            yield from page.items or []
+            if not page.has_next or not page.items:
+                return
+            throttle.wait()
+            page = page.next_page()
+        return
+
+    def get_page(number: int) -> typing.Optional[SyncPager[T]]:
+        throttle.wait()
+        return list_fn(page=number, page_limit=page_limit, **kwargs)
+
+    throttled = dataclasses.replace(first, get_page=get_page, page_number=1, total_pages=total_pages)
+    for page in throttled.iter_pages(prefetch=concurrency):
+        yield from page.items or []
+
+
+def async_scan_all(
+    list_fn: typing.Callable[..., typing.Awaitable[AsyncPager[T]]],
+    *,
+    concurrency: int = 5,
+    max_requests_per_second: typing.Optional[float] = None,
+    page_limit: int = MAX_PAGE_LIMIT,
+    **kwargs: typing.Any,
+) -> typing.AsyncIterator[T]:
+    """
+    The async counterpart of `scan_all`. At most `concurrency` pages are requested at the same time.
+    """
+    _validate(concurrency)
+    return _async_scan_all(list_fn, RequestThrottle(max_requests_per_second), concurrency, page_limit, kwargs)
+
+
+async def _async_scan_all(
+    list_fn: typing.Callable[..., typing.Awaitable[AsyncPager[T]]],
+    throttle: RequestThrottle,
+    concurrency: int,
+    page_limit: int,
+    kwargs: typing.Dict[str, typing.Any],
+) -> typing.AsyncIterator[T]:
+    await throttle.wait_async()
+    first = await list_fn(page=1, page_limit=page_limit, **kwargs)
+    total_pages = _get_total_pages(first)
+    if total_pages is None:
+        page: typing.Optional[AsyncPager[T]] = first
+        while page is not None:
+            for item in page.items or []:
+                yield item
+            if not page.has_next or not page.items:
+                return
+            await throttle.wait_async()
+            page = await page.next_page()
+        return
+
+    async def get_page(number: int) -> typing.Optional[AsyncPager[T]]:
+        await throttle.wait_async()
+        return await list_fn(page=number, page_limit=page_limit, **kwargs)
+
+    throttled = dataclasses.replace(first, get_page=get_page, page_number=1, total_pages=total_pages)
+    async for page in throttled.iter_pages(prefetch=concurrency):
+        for item in page.items or []:
+            yield item
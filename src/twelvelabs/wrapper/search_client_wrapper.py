@@ -1,10 +1,14 @@
+import asyncio
+import functools
+import threading
 import typing
+from concurrent.futures import Future
 from ..core.client_wrapper import SyncClientWrapper
 from ..search.client import SearchClient
 from ..types.search_item import SearchItem
 from ..core.pagination import SyncPager, AsyncPager
 from ..core.client_wrapper import AsyncClientWrapper
-from ..core.pydantic_utilities import parse_obj_as
+from ..core.json_backend import parse_json_as
 from ..search.client import AsyncSearchClient
 from ..search.types.search_create_request_search_options_item import (
     SearchCreateRequestSearchOptionsItem,
@@ -15,36 +19,176 @@ from ..types.search_results import SearchResults
 from ..core.request_options import RequestOptions
 from .. import core
 from ..search.types.search_create_request_transcription_options_item import SearchCreateRequestTranscriptionOptionsItem
+from .bulk import async_run_bulk, run_bulk
+from .multi_search import AsyncMultiSearchResult, MultiSearchResult, get_sources
+from .media_cache import MediaUrlCache
+from .search_page_cache import SearchPageCache, get_page_key
+from ..core.api_error import ApiError
 
 OMIT = typing.cast(typing.Any, ...)
 
 
+def _get_media_files(
+    query_media_url: typing.Optional[str],
+    query_media_file: typing.Optional[core.File],
+    query_media_urls: typing.Optional[typing.List[str]],
+    query_media_files: typing.Optional[typing.List[core.File]],
+) -> typing.Optional[typing.List[core.File]]:
+    # The media files of a search that can be replaced by URLs: not when the caller already gave URLs
+    if query_media_files is not None:
+        return query_media_files if query_media_urls is None else None
+    if query_media_file is not OMIT and query_media_file is not None and query_media_url in (OMIT, None):
+        return [query_media_file]
+    return None
+
+
 class SearchClientWrapper(SearchClient):
     def __init__(self, client_wrapper: SyncClientWrapper):
         super().__init__(client_wrapper=client_wrapper)
-
-    def _get_next_page(self, page_token: str) -> SyncPager[SearchItem]:
+        # The pages read by token, shared by every search of this client
+        self.page_cache = SearchPageCache()
+        # Set to a MediaUrlCache to send the URLs of media files already seen instead of their bytes
+        self.media_cache: typing.Optional[MediaUrlCache] = None
+        self._prefetches: typing.Dict[str, "Future[SearchResults]"] = {}
+        self._prefetch_lock = threading.Lock()
+
+    def _request_page(
+        self,
+        page_token: str,
+        include_user_metadata: typing.Optional[bool],
+        request_options: typing.Optional[RequestOptions],
+    ) -> SearchResults:
         _response = self._raw_client._client_wrapper.httpx_client.request(
             f"search/{page_token}",
             method="GET",
+            params={"include_user_metadata": include_user_metadata},
+            request_options=request_options,
         )
-        _parsed_response = typing.cast(
+        if not 200 <= _response.status_code < 300:
+            raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
+        results = typing.cast(
             SearchResults,
-            parse_obj_as(
+            parse_json_as(
                 type_=SearchResults,
-                object_=_response.json(),
+                json_=_response.content,
+                json_backend=self._raw_client._client_wrapper.json_backend,
             ),
         )
-        _has_next = (
-            _parsed_response.page_info is not None
-            and _parsed_response.page_info.next_page_token is not None
-        )
+        self.page_cache.set(get_page_key(page_token, include_user_metadata), results)
+        return results
+
+    def _get_page(
+        self,
+        page_token: str,
+        include_user_metadata: typing.Optional[bool],
+        request_options: typing.Optional[RequestOptions],
+    ) -> SearchResults:
+        key = get_page_key(page_token, include_user_metadata)
+        # A finished prefetch caches its page before it leaves `_prefetches`, so checking in this order
+        # doesn't miss it
+        with self._prefetch_lock:
+            prefetch = self._prefetches.get(key)
+        if prefetch is not None:
+            try:
+                return prefetch.result()
+            except Exception:
+                # Send the request again, so that its error reaches the caller
+                pass
+        else:
+            results = self.page_cache.get(key)
+            if results is not None:
+                return results
+        return self._request_page(page_token, include_user_metadata, request_options)
+
+    def _prefetch_page(
+        self,
+        page_token: str,
+        include_user_metadata: typing.Optional[bool],
+        request_options: typing.Optional[RequestOptions],
+    ) -> None:
+        key = get_page_key(page_token, include_user_metadata)
+        with self._prefetch_lock:
+            if key in self._prefetches or key in self.page_cache:
+                return
+            future: "Future[SearchResults]" = Future()
+            self._prefetches[key] = future
+
+        def fetch() -> None:
+            try:
+                future.set_result(self._request_page(page_token, include_user_metadata, request_options))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._prefetch_lock:
+                    del self._prefetches[key]
+
+        threading.Thread(target=fetch, name="twelvelabs-search-prefetch", daemon=True).start()
+
+    def _to_pager(
+        self,
+        results: SearchResults,
+        include_user_metadata: typing.Optional[bool],
+        prefetch_next_page: bool,
+        request_options: typing.Optional[RequestOptions],
+    ) -> SyncPager[SearchItem]:
+        next_page_token = results.page_info.next_page_token if results.page_info is not None else None
+        if next_page_token is not None and prefetch_next_page:
+            self._prefetch_page(next_page_token, include_user_metadata, request_options)
         _get_next = lambda: self._get_next_page(
-            _parsed_response.page_info.next_page_token  # type: ignore
+            next_page_token,  # type: ignore
+            include_user_metadata=include_user_metadata,
+            prefetch_next_page=prefetch_next_page,
+            request_options=request_options,
         )
-        _items = _parsed_response.data
-        return SyncPager(
-            has_next=_has_next, items=_items, get_next=_get_next, response=None
+        return SyncPager(has_next=next_page_token is not None, items=results.data, get_next=_get_next, response=None)
+
+    def _get_next_page(
+        self,
+        page_token: str,
+        *,
+        include_user_metadata: typing.Optional[bool] = None,
+        prefetch_next_page: bool = False,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> SyncPager[SearchItem]:
+        results = self._get_page(page_token, include_user_metadata, request_options)
+        return self._to_pager(results, include_user_metadata, prefetch_next_page, request_options)
+
+    def get_page(
+        self,
+        page_token: str,
+        *,
+        include_user_metadata: typing.Optional[bool] = None,
+        prefetch_next_page: bool = False,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> SyncPager[SearchItem]:
+        """
+        Returns the page of search results that a page token identifies. Pages that were already read, or
+        prefetched, come from `page_cache` without a request until their token expires.
+
+        Parameters
+        ----------
+        page_token : str
+            A token that identifies the page to retrieve, from the `page_info.next_page_token` of a page.
+
+        include_user_metadata : typing.Optional[bool]
+            Specifies whether to include user-defined metadata in the search results.
+
+        prefetch_next_page : bool
+            Whether to fetch the next page in the background as soon as this one is returned.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration, also used for the pages after this one.
+
+        Returns
+        -------
+        SyncPager[SearchItem]
+            The page of search results.
+        """
+        return self._get_next_page(
+            page_token,
+            include_user_metadata=include_user_metadata,
+            prefetch_next_page=prefetch_next_page,
+            request_options=request_options,
         )
 
     def query(
@@ -67,6 +211,7 @@ class SearchClientWrapper(SearchClient):
         filter: typing.Optional[str] = OMIT,
         include_user_metadata: typing.Optional[bool] = OMIT,
         transcription_options: typing.Optional[typing.List[SearchCreateRequestTranscriptionOptionsItem]] = OMIT,
+        prefetch_next_page: bool = False,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> SyncPager[SearchItem]:
         """
@@ -130,6 +275,9 @@ class SearchClientWrapper(SearchClient):
         query_media_file : typing.Optional[core.File]
             See core.File for more documentation
 
+            When `media_cache` is set to a `MediaUrlCache`, a file whose content already has a URL there is sent
+            as `query_media_url` instead, and so are the files of `query_media_files`.
+
         query_text : typing.Optional[str]
             The text query to search for. This parameter is required for text queries. Note that the platform supports full natural language-based search. You can use this parameter together with `query_media_type` and `query_media_url` or `query_media_file` to perform a composed image+text search.
 
@@ -219,8 +367,12 @@ class SearchClientWrapper(SearchClient):
         include_user_metadata : typing.Optional[bool]
             Specifies whether to include user-defined metadata in the search results.
         
+        prefetch_next_page : bool
+            Whether to fetch each next page in the background as soon as the page before it is returned, so
+            that it is ready when the pager reaches it. Pages are kept in `page_cache` until their token expires.
+        
         request_options : typing.Optional[RequestOptions]
-            Request-specific configuration.
+            Request-specific configuration, also used for the next pages.
         
         Returns
         -------
@@ -240,67 +392,187 @@ class SearchClientWrapper(SearchClient):
         )
         """
 
-        _has_plural = query_media_urls is not None or query_media_files is not None
-        if _has_plural:
-            # Note: adjust_confidence_level, threshold, sort_option are deprecated and not sent to the API.
-            _data: typing.Dict[str, typing.Any] = {
-                "index_id": index_id,
-                "search_options": search_options,
-                "query_media_type": query_media_type,
-                "query_media_url": query_media_urls if query_media_urls is not None else query_media_url,
-                "query_text": query_text,
-                "group_by": group_by,
-                "operator": operator,
-                "page_limit": page_limit,
-                "filter": filter,
-                "include_user_metadata": include_user_metadata,
-                "transcription_options": transcription_options,
-            }
-            _files: typing.Dict[str, typing.Any] = {}
-            if query_media_files is not None:
-                _files["query_media_file"] = query_media_files
-            elif query_media_file is not OMIT:
-                _files["query_media_file"] = query_media_file
-            _http_response = self._raw_client._client_wrapper.httpx_client.request(
-                "search",
-                method="POST",
-                data=_data,
-                files=_files,
-                request_options=request_options,
-                omit=OMIT,
-                force_multipart=True,
-            )
-            _response = typing.cast(
-                SearchResults,
-                parse_obj_as(type_=SearchResults, object_=_http_response.json()),
-            )
-        else:
-            # Note: adjust_confidence_level, threshold, sort_option are deprecated and not sent to the API.
-            _response = self.create(
-                index_id=index_id,
-                search_options=search_options,
-                query_media_type=query_media_type,
-                query_media_url=query_media_url,
-                query_media_file=query_media_file,
-                query_text=query_text,
-                group_by=group_by,
-                operator=operator,
-                page_limit=page_limit,
-                filter=filter,
-                include_user_metadata=include_user_metadata,
-                transcription_options=transcription_options,
-                request_options=request_options,
-            )
+        _media_files = (
+            _get_media_files(query_media_url, query_media_file, query_media_urls, query_media_files)
+            if self.media_cache is not None
+            else None
+        )
+        _urls: typing.Optional[typing.List[str]] = None
+        if _media_files is not None:
+            _urls, _media_files = self.media_cache.resolve(_media_files)  # type: ignore
+            if _urls is None:
+                # Send the bytes already read, since reading consumes file objects
+                if query_media_files is not None:
+                    query_media_files = _media_files
+                else:
+                    query_media_file = _media_files[0]
+            elif query_media_files is not None:
+                query_media_urls, query_media_files = _urls, None
+            else:
+                query_media_url, query_media_file = _urls[0], OMIT
+
+        try:
+            _has_plural = query_media_urls is not None or query_media_files is not None
+            if _has_plural:
+                # Note: adjust_confidence_level, threshold, sort_option are deprecated and not sent to the API.
+                _data: typing.Dict[str, typing.Any] = {
+                    "index_id": index_id,
+                    "search_options": search_options,
+                    "query_media_type": query_media_type,
+                    "query_media_url": query_media_urls if query_media_urls is not None else query_media_url,
+                    "query_text": query_text,
+                    "group_by": group_by,
+                    "operator": operator,
+                    "page_limit": page_limit,
+                    "filter": filter,
+                    "include_user_metadata": include_user_metadata,
+                    "transcription_options": transcription_options,
+                }
+                _files: typing.Dict[str, typing.Any] = {}
+                if query_media_files is not None:
+                    _files["query_media_file"] = query_media_files
+                elif query_media_file is not OMIT:
+                    _files["query_media_file"] = query_media_file
+                _http_response = self._raw_client._client_wrapper.httpx_client.request(
+                    "search",
+                    method="POST",
+                    data=_data,
+                    files=_files,
+                    request_options=request_options,
+                    omit=OMIT,
+                    force_multipart=True,
+                )
+                if not 200 <= _http_response.status_code < 300:
+                    raise ApiError(
+                        status_code=_http_response.status_code,
+                        headers=dict(_http_response.headers),
+                        body=_http_response.text,
+                    )
+                _response = typing.cast(
+                    SearchResults,
+                    parse_json_as(
+                        type_=SearchResults,
+                        json_=_http_response.content,
+                        json_backend=self._raw_client._client_wrapper.json_backend,
+                    ),
+                )
+            else:
+                # Note: adjust_confidence_level, threshold, sort_option are deprecated and not sent to the API.
+                _response = self.create(
+                    index_id=index_id,
+                    search_options=search_options,
+                    query_media_type=query_media_type,
+                    query_media_url=query_media_url,
+                    query_media_file=query_media_file,
+                    query_text=query_text,
+                    group_by=group_by,
+                    operator=operator,
+                    page_limit=page_limit,
+                    filter=filter,
+                    include_user_metadata=include_user_metadata,
+                    transcription_options=transcription_options,
+                    request_options=request_options,
+                )
+        except Exception:
+            if _urls is not None:
+                # The URLs may have expired, so the files are uploaded again by the next search
+                self.media_cache.discard(_urls)  # type: ignore
+            raise
+
+        return self._to_pager(
+            _response,
+            None if include_user_metadata is OMIT else include_user_metadata,
+            prefetch_next_page,
+            request_options,
+        )
+
+    def query_many(
+        self,
+        *,
+        index_ids: typing.Sequence[str],
+        search_options: typing.List[SearchCreateRequestSearchOptionsItem],
+        queries: typing.Optional[typing.Sequence[typing.Dict[str, typing.Any]]] = None,
+        all_pages: bool = False,
+        max_workers: int = 5,
+        max_requests_per_second: typing.Optional[float] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        **kwargs: typing.Any,
+    ) -> MultiSearchResult:
+        """
+        Searches several indexes, with one or more query variants, and merges the results by `rank`.
+
+        One `query` call is made per index and query variant, `max_workers` at a time, starting at most
+        `max_requests_per_second` of them per second. A search that fails doesn't fail the others: it is
+        reported in the `failures` attribute of the result.
+
+        Parameters
+        ----------
+        index_ids : typing.Sequence[str]
+            The unique identifiers of the indexes to search.
+
+        search_options : typing.List[SearchCreateRequestSearchOptionsItem]
+            The modalities to search, as for `query`.
+
+        queries : typing.Optional[typing.Sequence[typing.Dict[str, typing.Any]]]
+            The query variants, as `query` keyword arguments, for example `[{"query_text": "red car"},
+            {"query_text": "crimson car"}]`. They take precedence over the remaining keyword arguments. By
+            default, each index is searched once, with the remaining keyword arguments.
 
-        _has_next = (
-            _response.page_info is not None
-            and _response.page_info.next_page_token is not None
+        all_pages : bool
+            Whether to read the further pages of each search. They are requested as the merged results reach
+            them. By default, only the first page of each search is merged.
+
+        max_workers : int
+            The maximum number of searches sent at the same time.
+
+        max_requests_per_second : typing.Optional[float]
+            The maximum number of searches started per second, or None for no limit.
+
+        request_options : typing.Optional[RequestOptions]
+            Request-specific configuration.
+
+        **kwargs
+            The other `query` parameters, shared by every search. Pass media files as bytes, since they are
+            read once per search.
+
+        Returns
+        -------
+        MultiSearchResult
+            An iterable of `SearchHit`, each holding a `SearchItem` and the index and query variant that
+            found it.
+
+        Examples
+        --------
+        from twelvelabs import TwelveLabs
+
+        client = TwelveLabs(
+            api_key="YOUR_API_KEY",
         )
-        _get_next = lambda: self._get_next_page(_response.page_info.next_page_token)  # type: ignore
-        _items = _response.data
-        return SyncPager(
-            has_next=_has_next, items=_items, get_next=_get_next, response=None
+        results = client.search.query_many(
+            index_ids=["index_1", "index_2"],
+            search_options=["visual"],
+            query_text="a red car",
+            max_workers=8,
         )
+        for hit in results:
+            print(hit.index_id, hit.item.video_id, hit.item.rank)
+        for failure in results.failures:
+            print(failure.index_id, failure.error)
+        """
+        variants = queries if queries is not None else [{}]
+        sources = get_sources(index_ids, variants)
+        calls = [
+            functools.partial(
+                self.query,
+                index_id=source.index_id,
+                search_options=search_options,
+                request_options=request_options,
+                **{**kwargs, **variants[source.query]},
+            )
+            for source in sources
+        ]
+        pagers = run_bulk(calls, max_workers=max_workers, max_requests_per_second=max_requests_per_second)
+        return MultiSearchResult(sources, pagers, all_pages)
 
     def __getattr__(self, item):
         return getattr(self.client_wrapper, item)
@@ -309,29 +581,125 @@ class SearchClientWrapper(SearchClient):
 class AsyncSearchClientWrapper(AsyncSearchClient):
     def __init__(self, client_wrapper: AsyncClientWrapper):
         super().__init__(client_wrapper=client_wrapper)
+        # The pages read by token, shared by every search of this client
+        self.page_cache = SearchPageCache()
+        # Set to a MediaUrlCache to send the URLs of media files already seen instead of their bytes
+        self.media_cache: typing.Optional[MediaUrlCache] = None
+        self._prefetches: typing.Dict[str, "asyncio.Future[SearchResults]"] = {}
 
-    async def _get_next_page(self, page_token: str) -> AsyncPager[SearchItem]:
+    async def _request_page(
+        self,
+        page_token: str,
+        include_user_metadata: typing.Optional[bool],
+        request_options: typing.Optional[RequestOptions],
+    ) -> SearchResults:
         _response = await self._raw_client._client_wrapper.httpx_client.request(
             f"search/{page_token}",
             method="GET",
+            params={"include_user_metadata": include_user_metadata},
+            request_options=request_options,
         )
-        _parsed_response = typing.cast(
+        if not 200 <= _response.status_code < 300:
+            raise ApiError(status_code=_response.status_code, headers=dict(_response.headers), body=_response.text)
+        results = typing.cast(
             SearchResults,
-            parse_obj_as(
+            parse_json_as(
                 type_=SearchResults,
-                object_=_response.json(),
+                json_=_response.content,
+                json_backend=self._raw_client._client_wrapper.json_backend,
             ),
         )
-        _has_next = (
-            _parsed_response.page_info is not None
-            and _parsed_response.page_info.next_page_token is not None
+        self.page_cache.set(get_page_key(page_token, include_user_metadata), results)
+        return results
+
+    async def _get_page(
+        self,
+        page_token: str,
+        include_user_metadata: typing.Optional[bool],
+        request_options: typing.Optional[RequestOptions],
+    ) -> SearchResults:
+        key = get_page_key(page_token, include_user_metadata)
+        prefetch = self._prefetches.get(key)
+        if prefetch is not None:
+            try:
+                # Cancelling this call doesn't cancel the prefetch
+                return await asyncio.shield(prefetch)
+            except Exception:
+                # Send the request again, so that its error reaches the caller
+                pass
+        else:
+            results = self.page_cache.get(key)
+            if results is not None:
+                return results
+        return await self._request_page(page_token, include_user_metadata, request_options)
+
+    def _prefetch_page(
+        self,
+        page_token: str,
+        include_user_metadata: typing.Optional[bool],
+        request_options: typing.Optional[RequestOptions],
+    ) -> None:
+        key = get_page_key(page_token, include_user_metadata)
+        if key in self._prefetches or key in self.page_cache:
+            return
+        prefetch = self._prefetches[key] = asyncio.ensure_future(
+            self._request_page(page_token, include_user_metadata, request_options)
         )
+
+        def forget(future: "asyncio.Future[SearchResults]") -> None:
+            del self._prefetches[key]
+            # Mark the exception as retrieved, in case the page is never read
+            if not future.cancelled():
+                future.exception()
+
+        prefetch.add_done_callback(forget)
+
+    def _to_pager(
+        self,
+        results: SearchResults,
+        include_user_metadata: typing.Optional[bool],
+        prefetch_next_page: bool,
+        request_options: typing.Optional[RequestOptions],
+    ) -> AsyncPager[SearchItem]:
+        next_page_token = results.page_info.next_page_token if results.page_info is not None else None
+        if next_page_token is not None and prefetch_next_page:
+            self._prefetch_page(next_page_token, include_user_metadata, request_options)
         _get_next = lambda: self._get_next_page(
-            _parsed_response.page_info.next_page_token  # type: ignore
+            next_page_token,  # type: ignore
+            include_user_metadata=include_user_metadata,
+            prefetch_next_page=prefetch_next_page,
+            request_options=request_options,
         )
-        _items = _parsed_response.data
-        return AsyncPager(
-            has_next=_has_next, items=_items, get_next=_get_next, response=None
+        return AsyncPager(has_next=next_page_token is not None, items=results.data, get_next=_get_next, response=None)
+
+    async def _get_next_page(
+        self,
+        page_token: str,
+        *,
+        include_user_metadata: typing.Optional[bool] = None,
+        prefetch_next_page: bool = False,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AsyncPager[SearchItem]:
+        results = await self._get_page(page_token, include_user_metadata, request_options)
+        return self._to_pager(results, include_user_metadata, prefetch_next_page, request_options)
+
+    async def get_page(
+        self,
+        page_token: str,
+        *,
+        include_user_metadata: typing.Optional[bool] = None,
+        prefetch_next_page: bool = False,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> AsyncPager[SearchItem]:
+        """
+        The async counterpart of `SearchClientWrapper.get_page`. A prefetched page is fetched in a background
+        task.
+        """
+        return await self._get_next_page(
+            page_token,
+            include_user_metadata=include_user_metadata,
+            prefetch_next_page=prefetch_next_page,
+            request_options=request_options,
         )
 
     async def query(
@@ -354,6 +722,7 @@ class AsyncSearchClientWrapper(AsyncSearchClient):
         filter: typing.Optional[str] = OMIT,
         include_user_metadata: typing.Optional[bool] = OMIT,
         transcription_options: typing.Optional[typing.List[SearchCreateRequestTranscriptionOptionsItem]] = OMIT,
+        prefetch_next_page: bool = False,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> AsyncPager[SearchItem]:
         """
@@ -417,6 +786,9 @@ class AsyncSearchClientWrapper(AsyncSearchClient):
         query_media_file : typing.Optional[core.File]
             See core.File for more documentation
 
+            When `media_cache` is set to a `MediaUrlCache`, a file whose content already has a URL there is sent
+            as `query_media_url` instead, and so are the files of `query_media_files`.
+
         query_text : typing.Optional[str]
             The text query to search for. This parameter is required for text queries. Note that the platform supports full natural language-based search. You can use this parameter together with `query_media_type` and `query_media_url` or `query_media_file` to perform a composed image+text search.
 
@@ -506,8 +878,12 @@ class AsyncSearchClientWrapper(AsyncSearchClient):
         include_user_metadata : typing.Optional[bool]
             Specifies whether to include user-defined metadata in the search results.
 
+        prefetch_next_page : bool
+            Whether to fetch each next page in the background as soon as the page before it is returned, so
+            that it is ready when the pager reaches it. Pages are kept in `page_cache` until their token expires.
+
         request_options : typing.Optional[RequestOptions]
-            Request-specific configuration.
+            Request-specific configuration, also used for the next pages.
 
         Returns
         -------
@@ -535,67 +911,140 @@ class AsyncSearchClientWrapper(AsyncSearchClient):
         asyncio.run(main())
         """
 
-        _has_plural = query_media_urls is not None or query_media_files is not None
-        if _has_plural:
-            # Note: adjust_confidence_level, threshold, sort_option are deprecated and not sent to the API.
-            _data: typing.Dict[str, typing.Any] = {
-                "index_id": index_id,
-                "search_options": search_options,
-                "query_media_type": query_media_type,
-                "query_media_url": query_media_urls if query_media_urls is not None else query_media_url,
-                "query_text": query_text,
-                "group_by": group_by,
-                "operator": operator,
-                "page_limit": page_limit,
-                "filter": filter,
-                "include_user_metadata": include_user_metadata,
-                "transcription_options": transcription_options,
-            }
-            _files: typing.Dict[str, typing.Any] = {}
-            if query_media_files is not None:
-                _files["query_media_file"] = query_media_files
-            elif query_media_file is not OMIT:
-                _files["query_media_file"] = query_media_file
-            _http_response = await self._raw_client._client_wrapper.httpx_client.request(
-                "search",
-                method="POST",
-                data=_data,
-                files=_files,
-                request_options=request_options,
-                omit=OMIT,
-                force_multipart=True,
-            )
-            _response = typing.cast(
-                SearchResults,
-                parse_obj_as(type_=SearchResults, object_=_http_response.json()),
-            )
-        else:
-            # Note: adjust_confidence_level, threshold, sort_option are deprecated and not sent to the API.
-            _response = await self.create(
-                index_id=index_id,
+        _media_files = (
+            _get_media_files(query_media_url, query_media_file, query_media_urls, query_media_files)
+            if self.media_cache is not None
+            else None
+        )
+        _urls: typing.Optional[typing.List[str]] = None
+        if _media_files is not None:
+            _urls, _media_files = await self.media_cache.async_resolve(_media_files)  # type: ignore
+            if _urls is None:
+                # Send the bytes already read, since reading consumes file objects
+                if query_media_files is not None:
+                    query_media_files = _media_files
+                else:
+                    query_media_file = _media_files[0]
+            elif query_media_files is not None:
+                query_media_urls, query_media_files = _urls, None
+            else:
+                query_media_url, query_media_file = _urls[0], OMIT
+
+        try:
+            _has_plural = query_media_urls is not None or query_media_files is not None
+            if _has_plural:
+                # Note: adjust_confidence_level, threshold, sort_option are deprecated and not sent to the API.
+                _data: typing.Dict[str, typing.Any] = {
+                    "index_id": index_id,
+                    "search_options": search_options,
+                    "query_media_type": query_media_type,
+                    "query_media_url": query_media_urls if query_media_urls is not None else query_media_url,
+                    "query_text": query_text,
+                    "group_by": group_by,
+                    "operator": operator,
+                    "page_limit": page_limit,
+                    "filter": filter,
+                    "include_user_metadata": include_user_metadata,
+                    "transcription_options": transcription_options,
+                }
+                _files: typing.Dict[str, typing.Any] = {}
+                if query_media_files is not None:
+                    _files["query_media_file"] = query_media_files
+                elif query_media_file is not OMIT:
+                    _files["query_media_file"] = query_media_file
+                _http_response = await self._raw_client._client_wrapper.httpx_client.request(
+                    "search",
+                    method="POST",
+                    data=_data,
+                    files=_files,
+                    request_options=request_options,
+                    omit=OMIT,
+                    force_multipart=True,
+                )
+                if not 200 <= _http_response.status_code < 300:
+                    raise ApiError(
+                        status_code=_http_response.status_code,
+                        headers=dict(_http_response.headers),
+                        body=_http_response.text,
+                    )
+                _response = typing.cast(
+                    SearchResults,
+                    parse_json_as(
+                        type_=SearchResults,
+                        json_=_http_response.content,
+                        json_backend=self._raw_client._client_wrapper.json_backend,
+                    ),
+                )
+            else:
+                # Note: adjust_confidence_level, threshold, sort_option are deprecated and not sent to the API.
+                _response = await self.create(
+                    index_id=index_id,
+                    search_options=search_options,
+                    query_media_type=query_media_type,
+                    query_media_url=query_media_url,
+                    query_media_file=query_media_file,
+                    query_text=query_text,
+                    group_by=group_by,
+                    operator=operator,
+                    page_limit=page_limit,
+                    filter=filter,
+                    include_user_metadata=include_user_metadata,
+                    transcription_options=transcription_options,
+                    request_options=request_options,
+                )
+        except Exception:
+            if _urls is not None:
+                # The URLs may have expired, so the files are uploaded again by the next search
+                await self.media_cache.async_discard(_urls)  # type: ignore
+            raise
+
+        return self._to_pager(
+            _response,
+            None if include_user_metadata is OMIT else include_user_metadata,
+            prefetch_next_page,
+            request_options,
+        )
+
+    async def query_many(
+        self,
+        *,
+        index_ids: typing.Sequence[str],
+        search_options: typing.List[SearchCreateRequestSearchOptionsItem],
+        queries: typing.Optional[typing.Sequence[typing.Dict[str, typing.Any]]] = None,
+        all_pages: bool = False,
+        max_workers: int = 5,
+        max_requests_per_second: typing.Optional[float] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+        **kwargs: typing.Any,
+    ) -> AsyncMultiSearchResult:
+        """
+        The async counterpart of `SearchClientWrapper.query_many`. At most `max_workers` searches are awaited
+        at the same time, and the merged results are read with `async for`.
+
+        Examples
+        --------
+        results = await client.search.query_many(
+            index_ids=["index_1", "index_2"],
+            search_options=["visual"],
+            query_text="a red car",
+        )
+        async for hit in results:
+            print(hit.index_id, hit.item.video_id, hit.item.rank)
+        """
+        variants = queries if queries is not None else [{}]
+        sources = get_sources(index_ids, variants)
+        calls = [
+            functools.partial(
+                self.query,
+                index_id=source.index_id,
                 search_options=search_options,
-                query_media_type=query_media_type,
-                query_media_url=query_media_url,
-                query_media_file=query_media_file,
-                query_text=query_text,
-                group_by=group_by,
-                operator=operator,
-                page_limit=page_limit,
-                filter=filter,
-                include_user_metadata=include_user_metadata,
-                transcription_options=transcription_options,
                 request_options=request_options,
+                **{**kwargs, **variants[source.query]},
             )
-
-        _has_next = (
-            _response.page_info is not None
-            and _response.page_info.next_page_token is not None
-        )
-        _get_next = lambda: self._get_next_page(_response.page_info.next_page_token)  # type: ignore
-        _items = _response.data
-        return AsyncPager(
-            has_next=_has_next, items=_items, get_next=_get_next, response=None
-        )
+            for source in sources
+        ]
+        pagers = await async_run_bulk(calls, max_workers=max_workers, max_requests_per_second=max_requests_per_second)
+        return AsyncMultiSearchResult(sources, pagers, all_pages)
 
     def __getattr__(self, item):
         return getattr(self.client_wrapper, item)
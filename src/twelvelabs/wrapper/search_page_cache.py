@@ -0,0 +1,81 @@
+import collections
+import datetime
+import threading
+import time
+import typing
+
+from ..types.search_results import SearchResults
+
+
+def get_page_key(page_token: str, include_user_metadata: typing.Optional[bool]) -> str:
+    """Identifies a page by its token and the parameters that change its content."""
+    return f"{page_token}?include_user_metadata={include_user_metadata}"
+
+
+def get_expires_at(results: SearchResults, ttl: float) -> float:
+    """
+    Returns when a page should leave the cache, as a `time.monotonic()` value: after `ttl` seconds, or when
+    its `page_expires_at` says its token expires, whichever comes first.
+    """
+    expires_at = time.monotonic() + ttl
+    page_expires_at = results.page_info.page_expires_at if results.page_info is not None else None
+    if page_expires_at:
+        try:
+            expires = datetime.datetime.fromisoformat(page_expires_at.replace("Z", "+00:00"))
+        except ValueError:
+            return expires_at
+        if expires.tzinfo is None:
+            expires = expires.replace(tzinfo=datetime.timezone.utc)
+        remaining = expires.timestamp() - time.time()
+        expires_at = min(expires_at, time.monotonic() + remaining)
+    return expires_at
+
+
+class SearchPageCache:
+    """
+    A bounded LRU cache of search result pages, keyed by page token. A page is kept until `ttl` seconds
+    have passed or its token expires, whichever comes first, so going back to a page that was already read
+    doesn't send a request. Set `max_pages` to 0 to disable it.
+    """
+
+    def __init__(self, *, max_pages: int = 64, ttl: float = 300.0) -> None:
+        if max_pages < 0:
+            raise ValueError("max_pages must not be negative")
+        self.max_pages = max_pages
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._pages: "collections.OrderedDict[str, typing.Tuple[SearchResults, float]]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> typing.Optional[SearchResults]:
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._pages[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: str, results: SearchResults) -> None:
+        if self.max_pages == 0:
+            return
+        expires_at = get_expires_at(results, self.ttl)
+        with self._lock:
+            self._pages[key] = (results, expires_at)
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._pages.get(typing.cast(str, key))
+            return entry is not None and entry[1] > time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
@@ -1,15 +1,23 @@
+import functools
 import typing
 import time
 import asyncio
 from ..core.client_wrapper import SyncClientWrapper, AsyncClientWrapper
 from ..tasks.client import TasksClient, AsyncTasksClient
 from ..tasks.types.tasks_create_response import TasksCreateResponse
+from ..tasks.types.tasks_list_request_status_item import TasksListRequestStatusItem
 from ..tasks.types.tasks_retrieve_response import TasksRetrieveResponse
 from ..core.request_options import RequestOptions
+from .bulk import BulkResult, async_run_bulk, run_bulk
+from .polling import PollingStrategy, get_polling_strategy
+from .task_waiter import LIST_PAGE_LIMIT, async_wait_for_many, wait_for_many
 from .. import core
 
 OMIT = typing.cast(typing.Any, ...)
 
+# Statuses of video indexing tasks the platform is still working on
+RUNNING_STATUSES: typing.List[TasksListRequestStatusItem] = ["uploading", "validating", "pending", "queued", "indexing"]
+
 
 class TaskClientWrapper(TasksClient):
     """Wrapper for the TasksClient that adds additional functionality."""
@@ -25,8 +33,10 @@ class TaskClientWrapper(TasksClient):
         video_files: typing.Optional[typing.List[core.File]] = None,
         video_urls: typing.Optional[typing.List[str]] = None,
         enable_video_stream: typing.Optional[bool] = OMIT,
+        max_workers: int = 5,
+        max_requests_per_second: typing.Optional[float] = None,
         request_options: typing.Optional[RequestOptions] = None,
-    ) -> typing.List[TasksCreateResponse]:
+    ) -> BulkResult[TasksCreateResponse]:
         """
         This method creates multiple video indexing tasks that upload and index videos in bulk.
         Ensure your videos meet the requirements in the Prerequisites section of the Upload single videos page.
@@ -49,13 +59,21 @@ class TaskClientWrapper(TasksClient):
         enable_video_stream : typing.Optional[bool]
             This parameter indicates if the platform stores the videos for streaming.
 
+        max_workers : int
+            The maximum number of tasks created at the same time.
+
+        max_requests_per_second : typing.Optional[float]
+            The maximum number of tasks created per second, or None for no limit.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
         Returns
         -------
-        typing.List[TasksCreateResponse]
-            A list of video indexing tasks that were successfully created.
+        BulkResult[TasksCreateResponse]
+            The video indexing tasks that were successfully created, in input order. Its `results` attribute has
+            one entry per input, holding the created task or the exception raised for it. Inputs are numbered
+            with the files first, followed by the URLs.
 
         Examples
         --------
@@ -72,37 +90,27 @@ class TaskClientWrapper(TasksClient):
         if not video_files and not video_urls:
             raise ValueError("Either video_files or video_urls must be provided")
 
-        tasks = []
-
-        if video_files:
-            for video_file in video_files:
-                try:
-                    task = self.create(
-                        index_id=index_id,
-                        video_file=video_file,
-                        enable_video_stream=enable_video_stream,
-                        request_options=request_options,
-                    )
-                    tasks.append(task)
-                except Exception as e:
-                    print(f"Error processing file: {e}")
-                    continue
-
-        if video_urls:
-            for video_url in video_urls:
-                try:
-                    task = self.create(
-                        index_id=index_id,
-                        video_url=video_url,
-                        enable_video_stream=enable_video_stream,
-                        request_options=request_options,
-                    )
-                    tasks.append(task)
-                except Exception as e:
-                    print(f"Error processing url {video_url}: {e}")
-                    continue
-
-        return tasks
+        calls: typing.List[typing.Callable[[], TasksCreateResponse]] = [
+            functools.partial(
+                self.create,
+                index_id=index_id,
+                video_file=video_file,
+                enable_video_stream=enable_video_stream,
+                request_options=request_options,
+            )
+            for video_file in video_files or []
+        ]
+        calls.extend(
+            functools.partial(
+                self.create,
+                index_id=index_id,
+                video_url=video_url,
+                enable_video_stream=enable_video_stream,
+                request_options=request_options,
+            )
+            for video_url in video_urls or []
+        )
+        return run_bulk(calls, max_workers=max_workers, max_requests_per_second=max_requests_per_second)
 
     def wait_for_done(
         self,
@@ -112,6 +120,7 @@ class TaskClientWrapper(TasksClient):
         callback: typing.Optional[
             typing.Callable[[TasksRetrieveResponse], None]
         ] = None,
+        polling: typing.Optional[PollingStrategy] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> TasksRetrieveResponse:
         """
@@ -128,6 +137,10 @@ class TaskClientWrapper(TasksClient):
         callback : typing.Optional[typing.Callable[[TasksRetrieveResponse], None]], optional
             A function to call after each status check with the task response, by default None
 
+        polling : typing.Optional[PollingStrategy], optional
+            How long to sleep between status checks, for example `ExponentialBackoff()` or `DurationEstimate()`.
+            Overrides sleep_interval, by default None
+
         request_options : typing.Optional[RequestOptions], optional
             Request-specific configuration, by default None
 
@@ -155,8 +168,9 @@ class TaskClientWrapper(TasksClient):
             callback=lambda task: print(f"Current status: {task.status}")
         )
         """
-        if sleep_interval <= 0:
-            raise ValueError("sleep_interval must be greater than 0")
+        strategy = get_polling_strategy(polling, sleep_interval)
+        started_at = time.monotonic()
+        attempt = 0
 
         done_statuses = ["ready", "failed"]
 
@@ -167,21 +181,117 @@ class TaskClientWrapper(TasksClient):
         if callback is not None:
             callback(task)
 
+        delay = strategy.get_delay(attempt=attempt, elapsed=time.monotonic() - started_at, resource=task)
         # Continue checking until it's done
         while task.status not in done_statuses:
-            time.sleep(sleep_interval)
+            time.sleep(delay)
+            attempt += 1
 
             try:
                 task = self.retrieve(task_id, request_options=request_options)
             except Exception as e:
                 print(f"Retrieving task failed: {e}. Retrying...")
+                elapsed = time.monotonic() - started_at
+                delay = strategy.get_error_delay(e, attempt=attempt, elapsed=elapsed, resource=task)
                 continue
 
             if callback is not None:
                 callback(task)
+            delay = strategy.get_delay(attempt=attempt, elapsed=time.monotonic() - started_at, resource=task)
 
         return task
 
+    def wait_for_many(
+        self,
+        task_ids: typing.Iterable[str],
+        *,
+        index_id: typing.Optional[str] = None,
+        sleep_interval: float = 5.0,
+        max_requests_per_second: typing.Optional[float] = 5.0,
+        use_list: bool = True,
+        max_wait_time: typing.Optional[float] = None,
+        polling: typing.Optional[PollingStrategy] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.Iterator[TasksRetrieveResponse]:
+        """
+        Wait for many tasks at once, yielding each task as soon as it is done.
+
+        A single loop polls every task. Each round lists the tasks that are still running, many per request,
+        and retrieves only the tasks that dropped off that list. Tasks are yielded in the order they finish.
+
+        Parameters
+        ----------
+        task_ids : typing.Iterable[str]
+            The unique identifiers of the tasks to wait for.
+
+        index_id : typing.Optional[str], optional
+            The index the tasks belong to. Narrows the list of running tasks, by default None
+
+        sleep_interval : float, optional
+            The time in seconds to wait between polling rounds, by default 5.0
+
+        max_requests_per_second : typing.Optional[float], optional
+            The maximum rate of status requests across all tasks, or None for no limit, by default 5.0
+
+        use_list : bool, optional
+            Whether to find running tasks through the list endpoint. If False, each task is retrieved
+            every round, by default True
+
+        max_wait_time : typing.Optional[float], optional
+            Maximum time to wait in seconds before timing out, by default None (no timeout)
+
+        polling : typing.Optional[PollingStrategy], optional
+            How long to sleep between polling rounds, for example `ExponentialBackoff()`. Overrides
+            sleep_interval, by default None
+
+        request_options : typing.Optional[RequestOptions], optional
+            Request-specific configuration, by default None
+
+        Yields
+        ------
+        TasksRetrieveResponse
+            Each task once its status is `ready` or `failed`
+
+        Raises
+        ------
+        ValueError
+            If sleep_interval or max_requests_per_second is less than or equal to 0
+
+        TimeoutError
+            If some tasks are still running after max_wait_time
+
+        Examples
+        --------
+        from twelvelabs import TwelveLabs
+
+        client = TwelveLabs(
+            api_key="YOUR_API_KEY",
+        )
+        tasks = client.tasks.create_bulk(
+            index_id="index_id",
+            video_urls=["https://example.com/video1.mp4", "https://example.com/video2.mp4"],
+        )
+        for task in client.tasks.wait_for_many([task.id for task in tasks]):
+            print(f"Task {task.id} finished with status {task.status}")
+        """
+        return wait_for_many(
+            task_ids,
+            retrieve=lambda task_id: self.retrieve(task_id, request_options=request_options),
+            list_running=(
+                lambda: self.list(
+                    index_id=index_id,
+                    status=RUNNING_STATUSES,
+                    page_limit=LIST_PAGE_LIMIT,
+                    request_options=request_options,
+                )
+            )
+            if use_list
+            else None,
+            polling=get_polling_strategy(polling, sleep_interval),
+            max_requests_per_second=max_requests_per_second,
+            max_wait_time=max_wait_time,
+        )
+
 
 class AsyncTaskClientWrapper(AsyncTasksClient):
     """Async wrapper for the TasksClient that adds additional functionality."""
@@ -197,8 +307,10 @@ class AsyncTaskClientWrapper(AsyncTasksClient):
         video_files: typing.Optional[typing.List[core.File]] = None,
         video_urls: typing.Optional[typing.List[str]] = None,
         enable_video_stream: typing.Optional[bool] = OMIT,
+        max_workers: int = 5,
+        max_requests_per_second: typing.Optional[float] = None,
         request_options: typing.Optional[RequestOptions] = None,
-    ) -> typing.List[TasksCreateResponse]:
+    ) -> BulkResult[TasksCreateResponse]:
         """
         This method creates multiple video indexing tasks that upload and index videos in bulk.
         Ensure your videos meet the requirements in the Prerequisites section of the Upload single videos page.
@@ -221,13 +333,21 @@ class AsyncTaskClientWrapper(AsyncTasksClient):
         enable_video_stream : typing.Optional[bool]
             This parameter indicates if the platform stores the videos for streaming.
 
+        max_workers : int
+            The maximum number of tasks created at the same time.
+
+        max_requests_per_second : typing.Optional[float]
+            The maximum number of tasks created per second, or None for no limit.
+
         request_options : typing.Optional[RequestOptions]
             Request-specific configuration.
 
         Returns
         -------
-        typing.List[TasksCreateResponse]
-            A list of video indexing tasks that were successfully created.
+        BulkResult[TasksCreateResponse]
+            The video indexing tasks that were successfully created, in input order. Its `results` attribute has
+            one entry per input, holding the created task or the exception raised for it. Inputs are numbered
+            with the files first, followed by the URLs.
 
         Examples
         --------
@@ -251,37 +371,27 @@ class AsyncTaskClientWrapper(AsyncTasksClient):
         if not video_files and not video_urls:
             raise ValueError("Either video_files or video_urls must be provided")
 
-        tasks = []
-
-        if video_files:
-            for video_file in video_files:
-                try:
-                    task = await self.create(
-                        index_id=index_id,
-                        video_file=video_file,
-                        enable_video_stream=enable_video_stream,
-                        request_options=request_options,
-                    )
-                    tasks.append(task)
-                except Exception as e:
-                    print(f"Error processing file: {e}")
-                    continue
-
-        if video_urls:
-            for video_url in video_urls:
-                try:
-                    task = await self.create(
-                        index_id=index_id,
-                        video_url=video_url,
-                        enable_video_stream=enable_video_stream,
-                        request_options=request_options,
-                    )
-                    tasks.append(task)
-                except Exception as e:
-                    print(f"Error processing url {video_url}: {e}")
-                    continue
-
-        return tasks
+        calls: typing.List[typing.Callable[[], typing.Awaitable[TasksCreateResponse]]] = [
+            functools.partial(
+                self.create,
+                index_id=index_id,
+                video_file=video_file,
+                enable_video_stream=enable_video_stream,
+                request_options=request_options,
+            )
+            for video_file in video_files or []
+        ]
+        calls.extend(
+            functools.partial(
+                self.create,
+                index_id=index_id,
+                video_url=video_url,
+                enable_video_stream=enable_video_stream,
+                request_options=request_options,
+            )
+            for video_url in video_urls or []
+        )
+        return await async_run_bulk(calls, max_workers=max_workers, max_requests_per_second=max_requests_per_second)
 
     async def wait_for_done(
         self,
@@ -291,6 +401,7 @@ class AsyncTaskClientWrapper(AsyncTasksClient):
         callback: typing.Optional[
             typing.Callable[[TasksRetrieveResponse], typing.Awaitable[None]]
         ] = None,
+        polling: typing.Optional[PollingStrategy] = None,
         request_options: typing.Optional[RequestOptions] = None,
     ) -> TasksRetrieveResponse:
         """
@@ -307,6 +418,10 @@ class AsyncTaskClientWrapper(AsyncTasksClient):
         callback : typing.Optional[typing.Callable[[TasksRetrieveResponse], typing.Awaitable[None]]], optional
             An async function to call after each status check with the task response, by default None
 
+        polling : typing.Optional[PollingStrategy], optional
+            How long to sleep between status checks, for example `ExponentialBackoff()` or `DurationEstimate()`.
+            Overrides sleep_interval, by default None
+
         request_options : typing.Optional[RequestOptions], optional
             Request-specific configuration, by default None
 
@@ -343,8 +458,9 @@ class AsyncTaskClientWrapper(AsyncTasksClient):
 
         asyncio.run(main())
         """
-        if sleep_interval <= 0:
-            raise ValueError("sleep_interval must be greater than 0")
+        strategy = get_polling_strategy(polling, sleep_interval)
+        started_at = time.monotonic()
+        attempt = 0
 
         done_statuses = ["ready", "failed"]
 
@@ -355,17 +471,119 @@ class AsyncTaskClientWrapper(AsyncTasksClient):
         if callback is not None:
             await callback(task)
 
+        delay = strategy.get_delay(attempt=attempt, elapsed=time.monotonic() - started_at, resource=task)
         # Continue checking until it's done
         while task.status not in done_statuses:
-            await asyncio.sleep(sleep_interval)
+            await asyncio.sleep(delay)
+            attempt += 1
 
             try:
                 task = await self.retrieve(task_id, request_options=request_options)
             except Exception as e:
                 print(f"Retrieving task failed: {e}. Retrying...")
+                elapsed = time.monotonic() - started_at
+                delay = strategy.get_error_delay(e, attempt=attempt, elapsed=elapsed, resource=task)
                 continue
 
             if callback is not None:
                 await callback(task)
+            delay = strategy.get_delay(attempt=attempt, elapsed=time.monotonic() - started_at, resource=task)
 
         return task
+
+    def wait_for_many(
+        self,
+        task_ids: typing.Iterable[str],
+        *,
+        index_id: typing.Optional[str] = None,
+        sleep_interval: float = 5.0,
+        max_requests_per_second: typing.Optional[float] = 5.0,
+        use_list: bool = True,
+        max_wait_time: typing.Optional[float] = None,
+        polling: typing.Optional[PollingStrategy] = None,
+        request_options: typing.Optional[RequestOptions] = None,
+    ) -> typing.AsyncIterator[TasksRetrieveResponse]:
+        """
+        Wait for many tasks at once, yielding each task as soon as it is done.
+
+        A single loop polls every task. Each round lists the tasks that are still running, many per request,
+        and retrieves only the tasks that dropped off that list. Tasks are yielded in the order they finish.
+
+        Parameters
+        ----------
+        task_ids : typing.Iterable[str]
+            The unique identifiers of the tasks to wait for.
+
+        index_id : typing.Optional[str], optional
+            The index the tasks belong to. Narrows the list of running tasks, by default None
+
+        sleep_interval : float, optional
+            The time in seconds to wait between polling rounds, by default 5.0
+
+        max_requests_per_second : typing.Optional[float], optional
+            The maximum rate of status requests across all tasks, or None for no limit, by default 5.0
+
+        use_list : bool, optional
+            Whether to find running tasks through the list endpoint. If False, each task is retrieved
+            every round, by default True
+
+        max_wait_time : typing.Optional[float], optional
+            Maximum time to wait in seconds before timing out, by default None (no timeout)
+
+        polling : typing.Optional[PollingStrategy], optional
+            How long to sleep between polling rounds, for example `ExponentialBackoff()`. Overrides
+            sleep_interval, by default None
+
+        request_options : typing.Optional[RequestOptions], optional
+            Request-specific configuration, by default None
+
+        Yields
+        ------
+        TasksRetrieveResponse
+            Each task once its status is `ready` or `failed`
+
+        Raises
+        ------
+        ValueError
+            If sleep_interval or max_requests_per_second is less than or equal to 0
+
+        TimeoutError
+            If some tasks are still running after max_wait_time
+
+        Examples
+        --------
+        import asyncio
+
+        from twelvelabs import AsyncTwelveLabs
+
+        client = AsyncTwelveLabs(
+            api_key="YOUR_API_KEY",
+        )
+
+        async def main() -> None:
+            tasks = await client.tasks.create_bulk(
+                index_id="index_id",
+                video_urls=["https://example.com/video1.mp4", "https://example.com/video2.mp4"],
+            )
+            async for task in client.tasks.wait_for_many([task.id for task in tasks]):
+                print(f"Task {task.id} finished with status {task.status}")
+
+        asyncio.run(main())
+        """
+        return async_wait_for_many(
+            task_ids,
+            retrieve=lambda task_id: self.retrieve(task_id, request_options=request_options),
+            list_running=(
+                lambda: self.list(
+                    index_id=index_id,
+                    status=RUNNING_STATUSES,
+                    page_limit=LIST_PAGE_LIMIT,
+                    request_options=request_options,
+                )
+            )
+            if use_list
+            else None,
+            polling=get_polling_strategy(polling, sleep_interval),
+            max_requests_per_second=max_requests_per_second,
+            max_wait_time=max_wait_time,
+        )
@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import time
+import typing
+
+from ..core.pagination import AsyncPager, SyncPager
+from .polling import PollingStrategy, _get_retry_after
+from .throttle import RequestThrottle
+
+logger = logging.getLogger(__name__)
+
+# The platform no longer updates a task once it reaches one of these statuses
+DONE_STATUSES = frozenset({"ready", "failed"})
+
+# The largest page the task list endpoints return
+LIST_PAGE_LIMIT = 50
+
+
+class _Task(typing.Protocol):
+    @property
+    def status(self) -> typing.Optional[str]: ...
+
+
+TaskT = typing.TypeVar("TaskT", bound=_Task)
+
+
+def _check_deadline(deadline: typing.Optional[float], pending: typing.Dict[str, None]) -> typing.Optional[float]:
+    """Raises if the deadline has passed, otherwise returns the seconds left."""
+    if deadline is None:
+        return None
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError(f"{len(pending)} tasks were still running when the wait timed out")
+    return remaining
+
+
+def _get_round_delay(
+    polling: PollingStrategy, attempt: int, elapsed: float, latest: typing.Dict[str, typing.Any]
+) -> float:
+    """
+    Returns the sleep before the next round: the shortest one `polling` gives for any pending task, so that the
+    task expected to finish first is checked on time.
+    """
+    if not latest:
+        return polling.get_delay(attempt=attempt, elapsed=elapsed)
+    return min(polling.get_delay(attempt=attempt, elapsed=elapsed, resource=task) for task in latest.values())
+
+
+def wait_for_many(
+    task_ids: typing.Iterable[str],
+    *,
+    retrieve: typing.Callable[[str], TaskT],
+    list_running: typing.Optional[typing.Callable[[], SyncPager[typing.Any]]],
+    polling: PollingStrategy,
+    max_requests_per_second: typing.Optional[float],
+    max_wait_time: typing.Optional[float],
+) -> typing.Iterator[TaskT]:
+    """
+    Polls many tasks from one loop and yields each task once it reaches a done status, in completion order.
+
+    Each round first pages through the tasks that are still running, `LIST_PAGE_LIMIT` at a time, and then
+    retrieves only the pending tasks missing from that list. A task is only reported as done once `retrieve`
+    confirms it, so tasks the list misses are just retrieved early. Without `list_running`, every pending task
+    is retrieved each round. All requests share one `RequestThrottle`, and `polling` decides the sleep
+    between rounds from the latest status of each pending task, waking for the one due first. A rate-limited
+    request ends the round early and waits at least its `Retry-After`.
+    """
+    throttle = RequestThrottle(max_requests_per_second)
+    return _wait_for_many(task_ids, retrieve, list_running, throttle, polling, max_wait_time)
+
+
+def _wait_for_many(
+    task_ids: typing.Iterable[str],
+    retrieve: typing.Callable[[str], TaskT],
+    list_running: typing.Optional[typing.Callable[[], SyncPager[typing.Any]]],
+    throttle: RequestThrottle,
+    polling: PollingStrategy,
+    max_wait_time: typing.Optional[float],
+) -> typing.Iterator[TaskT]:
+    pending = dict.fromkeys(task_ids)
+    # The latest status seen for each pending task, from the list or from retrieving it
+    latest: typing.Dict[str, typing.Any] = {}
+    started_at = time.monotonic()
+    deadline = None if max_wait_time is None else started_at + max_wait_time
+    attempt = 0
+    while pending:
+        retry_after: typing.Optional[float] = None
+        running: typing.Set[str] = set()
+        if list_running is not None:
+            try:
+                throttle.wait()
+                page: typing.Optional[SyncPager[typing.Any]] = list_running()
+                pages = 1
+                while page is not None:
+                    for item in page.items or []:
+                        if item.id is not None:
+                            running.add(item.id)
+                            if item.id in pending:
+                                latest[item.id] = item
+                    # A short page is the last one. Past len(pending) // LIST_PAGE_LIMIT pages, listing costs about as
+                    # many requests as retrieving every pending task
+                    if (
+                        not page.has_next
+                        or len(page.items or []) < LIST_PAGE_LIMIT
+                        or running.issuperset(pending)
+                        or pages > len(pending) // LIST_PAGE_LIMIT
+                    ):
+                        break
+                    throttle.wait()
+                    page = page.next_page()
+                    pages += 1
+            except Exception as e:
+                logger.warning(f"Listing running tasks failed: {e}. Retrieving each task instead")
+                running = set()
+                retry_after = _get_retry_after(e)
+
+        candidates = [] if retry_after is not None else [task_id for task_id in pending if task_id not in running]
+        for task_id in candidates:
+            throttle.wait()
+            try:
+                task = retrieve(task_id)
+            except Exception as e:
+                logger.warning(f"Retrieving task {task_id} failed: {e}. Retrying...")
+                # Back off for the rest of the round once the API starts rate limiting
+                retry_after = _get_retry_after(e)
+                if retry_after is not None:
+                    break
+                continue
+            if task.status in DONE_STATUSES:
+                del pending[task_id]
+                latest.pop(task_id, None)
+                yield task
+            else:
+                latest[task_id] = task
+
+        if not pending:
+            return
+        delay = _get_round_delay(polling, attempt, time.monotonic() - started_at, latest)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        remaining = _check_deadline(deadline, pending)
+        time.sleep(delay if remaining is None else min(delay, remaining))
+        attempt += 1
+
+
+def async_wait_for_many(
+    task_ids: typing.Iterable[str],
+    *,
+    retrieve: typing.Callable[[str], typing.Awaitable[TaskT]],
+    list_running: typing.Optional[typing.Callable[[], typing.Awaitable[AsyncPager[typing.Any]]]],
+    polling: PollingStrategy,
+    max_requests_per_second: typing.Optional[float],
+    max_wait_time: typing.Optional[float],
+) -> typing.AsyncIterator[TaskT]:
+    """
+    The async counterpart of `wait_for_many`.
+    """
+    throttle = RequestThrottle(max_requests_per_second)
+    return _async_wait_for_many(task_ids, retrieve, list_running, throttle, polling, max_wait_time)
+
+
+async def _async_wait_for_many(
+    task_ids: typing.Iterable[str],
+    retrieve: typing.Callable[[str], typing.Awaitable[TaskT]],
+    list_running: typing.Optional[typing.Callable[[], typing.Awaitable[AsyncPager[typing.Any]]]],
+    throttle: RequestThrottle,
+    polling: PollingStrategy,
+    max_wait_time: typing.Optional[float],
+) -> typing.AsyncIterator[TaskT]:
+    pending = dict.fromkeys(task_ids)
+    # The latest status seen for each pending task, from the list or from retrieving it
+    latest: typing.Dict[str, typing.Any] = {}
+    started_at = time.monotonic()
+    deadline = None if max_wait_time is None else started_at + max_wait_time
+    attempt = 0
+    while pending:
+        retry_after: typing.Optional[float] = None
+        running: typing.Set[str] = set()
+        if list_running is not None:
+            try:
+                await throttle.wait_async()
+                page: typing.Optional[AsyncPager[typing.Any]] = await list_running()
+                pages = 1
+                while page is not None:
+                    for item in page.items or []:
+                        if item.id is not None:
+                            running.add(item.id)
+                            if item.id in pending:
+                                latest[item.id] = item
+                    # A short page is the last one. Past len(pending) // LIST_PAGE_LIMIT pages, listing costs about as
+                    # many requests as retrieving every pending task
+                    if (
+                        not page.has_next
+                        or len(page.items or []) < LIST_PAGE_LIMIT
+                        or running.issuperset(pending)
+                        or pages > len(pending) // LIST_PAGE_LIMIT
+                    ):
+                        break
+                    await throttle.wait_async()
+                    page = await page.next_page()
+                    pages += 1
+            except Exception as e:
+                logger.warning(f"Listing running tasks failed: {e}. Retrieving each task instead")
+                running = set()
+                retry_after = _get_retry_after(e)
+
+        candidates = [] if retry_after is not None else [task_id for task_id in pending if task_id not in running]
+        for task_id in candidates:
+            await throttle.wait_async()
+            try:
+                task = await retrieve(task_id)
+            except Exception as e:
+                logger.warning(f"Retrieving task {task_id} failed: {e}. Retrying...")
+                # Back off for the rest of the round once the API starts rate limiting
+                retry_after = _get_retry_after(e)
+                if retry_after is not None:
+                    break
+                continue
+            if task.status in DONE_STATUSES:
+                del pending[task_id]
+                latest.pop(task_id, None)
+                yield task
+            else:
+                latest[task_id] = task
+
+        if not pending:
+            return
+        delay = _get_round_delay(polling, attempt, time.monotonic() - started_at, latest)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        remaining = _check_deadline(deadline, pending)
+        await asyncio.sleep(delay if remaining is None else min(delay, remaining))
+        attempt += 1
@@ -0,0 +1,36 @@
+import asyncio
+import time
+import typing
+
+from ..core.rate_limiter import RateLimit, _TokenBucket
+
+
+class RequestThrottle:
+    """
+    Spaces out requests so that they stay under a requests-per-second cap. It can be shared between threads,
+    or between the tasks of one event loop.
+
+    It is a token bucket of the same kind as a `RateLimiter` group, without a burst: the requests it lets
+    through are still subject to the client's `rate_limiter`.
+    """
+
+    def __init__(self, max_requests_per_second: typing.Optional[float]) -> None:
+        if max_requests_per_second is not None and max_requests_per_second <= 0:
+            raise ValueError("max_requests_per_second must be greater than 0")
+        self._bucket = _TokenBucket(
+            RateLimit(max_requests_per_second, burst=1) if max_requests_per_second is not None else None
+        )
+
+    def reserve(self) -> float:
+        """Claims the next request slot and returns the number of seconds to wait for it."""
+        return self._bucket.reserve()
+
+    def wait(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
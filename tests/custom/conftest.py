@@ -0,0 +1,43 @@
+import typing
+
+import httpx
+import pytest
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+
+BASE_URL = "https://api.example.com"
+
+# Answers the requests of a test client. For async clients, it may be a coroutine function
+Handler = typing.Union[
+    typing.Callable[[httpx.Request], httpx.Response],
+    typing.Callable[[httpx.Request], typing.Coroutine[None, None, httpx.Response]],
+]
+
+
+@pytest.fixture
+def make_client() -> typing.Callable[..., TwelveLabs]:
+    """
+    Returns a function that builds a `TwelveLabs` client whose requests are answered by a handler instead of
+    the network. Its keyword arguments are passed on to the client.
+    """
+
+    def make(handler: Handler, **kwargs: typing.Any) -> TwelveLabs:
+        kwargs.setdefault("api_key", "test")
+        return TwelveLabs(
+            base_url=BASE_URL, httpx_client=httpx.Client(transport=httpx.MockTransport(handler)), **kwargs
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_async_client() -> typing.Callable[..., AsyncTwelveLabs]:
+    """The async counterpart of `make_client`. The handler may be a function or a coroutine function."""
+
+    def make(handler: Handler, **kwargs: typing.Any) -> AsyncTwelveLabs:
+        kwargs.setdefault("api_key", "test")
+        return AsyncTwelveLabs(
+            base_url=BASE_URL, httpx_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)), **kwargs
+        )
+
+    return make
@@ -0,0 +1,121 @@
+import asyncio
+import threading
+import time
+import typing
+
+import httpx
+import pytest
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+from twelvelabs.core.api_error import ApiError
+from twelvelabs.wrapper.bulk import BulkItemResult, BulkResult, async_iter_bulk, run_bulk
+from twelvelabs.wrapper.throttle import RequestThrottle
+
+
+class _FakeCreateApi:
+    """Serves `POST /tasks`, failing for URLs that contain "broken", and tracks how many requests overlap."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        body = request.read().decode()
+        url = next(part for part in body.split("\r\n") if part.startswith("https://"))
+        if "broken" in url:
+            return httpx.Response(400, json={"code": "parameter_invalid", "message": url})
+        return httpx.Response(200, json={"_id": url.rsplit("/", 1)[-1]})
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return self._respond(request)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        return self._respond(request)
+
+
+URLS = [f"https://example.com/{'broken' if i % 5 == 3 else 'video'}-{i}" for i in range(20)]
+
+
+def test_create_bulk_runs_concurrently_and_reports_each_input(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeCreateApi()
+    client = make_client(api.handler)
+
+    tasks = client.tasks.create_bulk(index_id="index", video_urls=URLS, max_workers=4)
+
+    assert 1 < api.max_in_flight <= 4
+    # The return value is still the list of created tasks, in input order
+    assert [task.id for task in tasks] == [f"video-{i}" for i in range(20) if i % 5 != 3]
+    assert [result.index for result in tasks.results] == list(range(20))
+    assert [result.index for result in tasks.errors] == [3, 8, 13, 18]
+    assert all(isinstance(result.error, ApiError) and result.error.status_code == 400 for result in tasks.errors)
+
+
+def test_async_create_bulk_bounds_concurrency(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    api = _FakeCreateApi()
+    client = make_async_client(api.async_handler)
+
+    tasks = asyncio.run(client.tasks.create_bulk(index_id="index", video_urls=URLS, max_workers=3))
+
+    assert api.max_in_flight == 3
+    assert [result.ok for result in tasks.results] == [i % 5 != 3 for i in range(20)]
+
+
+def test_run_bulk_rate_limits_calls() -> None:
+    started: typing.List[float] = []
+
+    def call() -> int:
+        started.append(time.monotonic())
+        return len(started)
+
+    result = run_bulk([call] * 5, max_workers=5, max_requests_per_second=50)
+
+    assert sorted(result) == [1, 2, 3, 4, 5]
+    assert max(started) - min(started) >= 0.07
+    with pytest.raises(ValueError):
+        run_bulk([call], max_workers=0, max_requests_per_second=None)
+
+
+def test_bulk_result_is_a_list_of_successes() -> None:
+    error = ValueError("boom")
+    result = BulkResult([BulkItemResult(index=0, value="a"), BulkItemResult(index=1, error=error)])
+
+    assert result == ["a"]
+    assert result.errors == [BulkItemResult(index=1, error=error)]
+
+
+def test_closing_async_iter_bulk_waits_for_the_cancelled_calls() -> None:
+    started: typing.List[int] = []
+    unwound: typing.List[int] = []
+
+    def make_call(index: int) -> typing.Callable[[], typing.Awaitable[int]]:
+        async def call() -> int:
+            started.append(index)
+            try:
+                await asyncio.sleep(0 if index == 0 else 10)
+                return index
+            finally:
+                unwound.append(index)
+
+        return call
+
+    async def first() -> typing.Optional[int]:
+        results = async_iter_bulk([make_call(i) for i in range(10)], max_workers=3, throttle=RequestThrottle(None))
+        async for result in results:
+            await results.aclose()  # type: ignore[attr-defined]
+            # Every call has unwound by the time the iterator is closed, not only when the loop shuts down
+            assert sorted(unwound) == sorted(started) and len(started) > 1
+            return result.value
+        return None
+
+    assert asyncio.run(first()) == 0
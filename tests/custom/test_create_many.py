@@ -0,0 +1,153 @@
+import asyncio
+import json
+import threading
+import time
+import typing
+
+import httpx
+
+from twelvelabs import (
+    AsyncTwelveLabs,
+    ImageInputRequest,
+    MediaSource,
+    TextInputRequest,
+    TwelveLabs,
+    VideoInputRequest,
+)
+from twelvelabs.wrapper.embed_client_wrapper import CreateEmbeddingsInput
+from twelvelabs.wrapper.polling import FixedInterval
+
+
+class _FakeEmbedApi:
+    """
+    Serves `POST /embed-v2`, slower for the text "slow" and failing for the text "broken", and video tasks that
+    are ready on their second status check.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.paths: typing.List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.checks: typing.Dict[str, int] = {}
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.paths.append(path)
+        if path == "/embed-v2/tasks":
+            return httpx.Response(200, json={"_id": "task-1", "status": "processing"})
+        if path.startswith("/embed-v2/tasks/"):
+            task_id = path.rsplit("/", 1)[-1]
+            self.checks[task_id] = self.checks.get(task_id, 0) + 1
+            if self.checks[task_id] < 2:
+                return httpx.Response(200, json={"_id": task_id, "status": "processing"})
+            return httpx.Response(200, json={"_id": task_id, "status": "ready", "data": [{"embedding": [1.0]}]})
+        body = json.loads(request.read())
+        if body.get("text", {}).get("input_text") == "broken":
+            return httpx.Response(400, json={"code": "parameter_invalid", "message": "broken"})
+        return httpx.Response(200, json={"data": [{"embedding": [0.5]}]})
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.1 if b'"slow"' in request.read() else 0.01)
+        with self.lock:
+            self.in_flight -= 1
+            return self._respond(request)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.1 if b'"slow"' in request.read() else 0.01)
+        self.in_flight -= 1
+        return self._respond(request)
+
+
+def _inputs() -> typing.List[CreateEmbeddingsInput]:
+    return [
+        {"text": TextInputRequest(input_text="slow")},
+        {"input_type": "image", "image": ImageInputRequest(media_source=MediaSource(url="https://example.com/a.png"))},
+        {"text": TextInputRequest(input_text="broken")},
+        {"video": VideoInputRequest(media_source=MediaSource(url="https://example.com/short.mp4"), end_sec=30)},
+        {"video": VideoInputRequest(media_source=MediaSource(url="https://example.com/long.mp4"))},
+    ]
+
+
+def test_results_stream_in_input_order_and_long_videos_become_tasks(
+    make_client: typing.Callable[..., TwelveLabs],
+) -> None:
+    api = _FakeEmbedApi()
+
+    results = list(
+        make_client(api.handler).embed.v_2.create_many(
+            iter(_inputs()), model_name="marengo3.0", concurrency=3, polling=FixedInterval(interval=0.01)
+        )
+    )
+
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [result.ok for result in results] == [True, True, False, True, True]
+    task = results[4].value
+    assert task is not None and task.data is not None and task.data[0].embedding == [1.0]
+    # Only the video without an end_sec went through a task, polled until it was ready
+    assert api.paths.count("/embed-v2") == 4
+    assert api.paths.count("/embed-v2/tasks/task-1") == 2
+    assert 1 < api.max_in_flight <= 3
+
+
+def test_unordered_results_come_as_they_complete(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeEmbedApi()
+
+    results = list(
+        make_client(api.handler).embed.v_2.create_many(
+            _inputs()[:3], model_name="marengo3.0", concurrency=3, ordered=False
+        )
+    )
+
+    assert results[-1].index == 0
+    assert sorted(result.index for result in results) == [0, 1, 2]
+
+
+def test_input_without_a_type_fails_its_own_item(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeEmbedApi()
+
+    results = list(
+        make_client(api.handler).embed.v_2.create_many(
+            [{}, {"text": TextInputRequest(input_text="goal")}], model_name="marengo3.0"
+        )
+    )
+
+    assert isinstance(results[0].error, ValueError)
+    assert results[1].ok
+
+
+def test_async_create_many(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    api = _FakeEmbedApi()
+    client = make_async_client(api.async_handler)
+
+    async def collect() -> typing.List[int]:
+        return [
+            result.index
+            async for result in client.embed.v_2.create_many(
+                _inputs(), model_name="marengo3.0", concurrency=2, polling=FixedInterval(interval=0.01)
+            )
+            if result.ok
+        ]
+
+    assert asyncio.run(collect()) == [0, 1, 3, 4]
+    assert api.max_in_flight == 2
+
+
+def test_task_still_running_after_max_wait_time_fails_its_item(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeEmbedApi()
+
+    results = list(
+        make_client(api.handler).embed.v_2.create_many(
+            _inputs()[3:], model_name="marengo3.0", polling=FixedInterval(interval=60), max_wait_time=0.05
+        )
+    )
+
+    assert results[0].ok
+    assert isinstance(results[1].error, TimeoutError)
+    # The wait was cut short to check the task once, at the deadline
+    assert api.paths.count("/embed-v2/tasks/task-1") == 1
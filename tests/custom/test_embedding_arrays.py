@@ -0,0 +1,93 @@
+import array
+import json
+import math
+
+import pytest
+
+from twelvelabs.core.embedding_arrays import Float32Matrix, parse_embedding_arrays, to_embedding_arrays
+from twelvelabs.core.pydantic_utilities import parse_obj_as
+from twelvelabs.types.embedding_success_response import EmbeddingSuccessResponse
+from twelvelabs.types.indexed_asset_detailed_embedding_video_embedding import (
+    IndexedAssetDetailedEmbeddingVideoEmbedding,
+)
+
+BODY = {
+    "data": [
+        {
+            "embedding": [0.5, -1.25, 2.0],
+            "embedding_option": "visual",
+            "embedding_scope": "clip",
+            "start_sec": 0.0,
+            "end_sec": 6.0,
+        },
+        {
+            "embedding": [1.0, 0.0, -0.5],
+            "embedding_option": "audio",
+            "embedding_scope": "clip",
+            "start_sec": 6.0,
+            "end_sec": 12.0,
+        },
+        {"embedding": [0.25, 0.75, 1.5], "embedding_option": None, "embedding_scope": None},
+    ]
+}
+
+
+def test_to_arrays_packs_embeddings_into_float32_buffers() -> None:
+    response = parse_obj_as(EmbeddingSuccessResponse, BODY)
+
+    arrays = to_embedding_arrays(response, use_numpy=False)
+
+    assert isinstance(arrays.vectors, Float32Matrix)
+    assert arrays.vectors.shape == (3, 3)
+    assert arrays.vectors.buffer.itemsize == 4
+    assert arrays.vectors[1].tolist() == [1.0, 0.0, -0.5]
+    assert arrays.vectors.tolist()[0] == [0.5, -1.25, 2.0]
+    assert list(arrays.start_sec[:2]) == [0.0, 6.0] and math.isnan(arrays.start_sec[2])
+    assert arrays.embedding_option == ["visual", "audio", None]
+    assert len(arrays) == 3 and arrays.dim == 3
+
+
+def test_parse_embedding_arrays_skips_the_models() -> None:
+    arrays = parse_embedding_arrays(json.dumps(BODY).encode(), use_numpy=False)
+
+    assert arrays.vectors.buffer == array.array("f", [0.5, -1.25, 2.0, 1.0, 0.0, -0.5, 0.25, 0.75, 1.5])
+    assert list(arrays.end_sec[:2]) == [6.0, 12.0]
+
+
+def test_parse_embedding_arrays_scans_bodies_larger_than_a_chunk() -> None:
+    vector = [float(i) for i in range(1024)]
+    body = {"id": "task", "segments": [{"float": vector, "start_offset_sec": i} for i in range(40)]}
+
+    arrays = parse_embedding_arrays(json.dumps(body), path=("segments",), use_numpy=False)
+
+    assert arrays.vectors.shape == (40, 1024)
+    assert arrays.vectors[39].tolist() == vector
+    assert arrays.start_sec[39] == 39.0
+
+
+def test_segments_use_their_offsets() -> None:
+    embedding = parse_obj_as(
+        IndexedAssetDetailedEmbeddingVideoEmbedding,
+        {"segments": [{"float": [1.0, 2.0], "start_offset_sec": 0, "end_offset_sec": 6, "embedding_scope": "clip"}]},
+    )
+
+    arrays = to_embedding_arrays(embedding, use_numpy=False)
+
+    assert arrays.vectors.tolist() == [[1.0, 2.0]]
+    assert (arrays.start_sec[0], arrays.end_sec[0]) == (0.0, 6.0)
+
+
+def test_mismatched_dimensions_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        parse_embedding_arrays(json.dumps({"data": [{"embedding": [1.0]}, {"embedding": [1.0, 2.0]}]}))
+
+
+def test_to_numpy_returns_a_matrix_and_offsets() -> None:
+    numpy = pytest.importorskip("numpy")
+    response = parse_obj_as(EmbeddingSuccessResponse, BODY)
+
+    vectors, start_sec, end_sec = to_embedding_arrays(response).to_numpy()
+
+    assert vectors.dtype == numpy.float32 and vectors.shape == (3, 3)
+    assert vectors[1].tolist() == [1.0, 0.0, -0.5]
+    assert start_sec[1] == 6.0 and numpy.isnan(end_sec[2])
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import threading
+import typing
+from pathlib import Path
+
+import httpx
+import pytest
+
+from twelvelabs import AsyncTwelveLabs, TextInputRequest, TwelveLabs
+from twelvelabs.wrapper import embedding_cache
+from twelvelabs.wrapper.embedding_cache import EmbeddingCache
+
+
+class _FakeEmbedApi:
+    def __init__(self) -> None:
+        self.bodies: typing.List[typing.Dict[str, typing.Any]] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.read())
+        self.bodies.append(body)
+        embedding = [0.1 * len(body["text"]["input_text"]), 0.5, -1.0 / 3]
+        return httpx.Response(200, json={"data": [{"embedding": embedding, "embedding_option": "visual"}]})
+
+
+def _with_cache(client: TwelveLabs, cache: EmbeddingCache) -> TwelveLabs:
+    client.embed.v_2.cache = cache
+    return client
+
+
+def test_repeated_requests_are_answered_from_memory(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeEmbedApi()
+    cache = EmbeddingCache(max_entries=1)
+    client = _with_cache(make_client(api.handler), cache)
+
+    for text in ("goal", "goal", "red card", "goal"):
+        client.embed.v_2.create(input_type="text", model_name="marengo3.0", text=TextInputRequest(input_text=text))
+
+    # "goal" was evicted by "red card"
+    assert [body["text"]["input_text"] for body in api.bodies] == ["goal", "red card", "goal"]
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.evictions) == (1, 3, 2)
+    assert cache.stats.hit_ratio == 0.25
+
+
+def test_responses_persist_with_float32_vectors(tmp_path: Path, make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeEmbedApi()
+    path = str(tmp_path / "embeddings.db")
+    first = _with_cache(make_client(api.handler), EmbeddingCache(path=path)).embed.v_2.create(
+        input_type="text", model_name="marengo3.0", text=TextInputRequest(input_text="goal")
+    )
+
+    cache = EmbeddingCache(path=path)
+    again = _with_cache(make_client(api.handler), cache).embed.v_2.create(
+        input_type="text", model_name="marengo3.0", text=TextInputRequest(input_text="goal")
+    )
+
+    assert len(api.bodies) == 1
+    assert cache.stats.persistent_hits == 1
+    assert again.data[0].embedding_option == "visual"
+    assert again.data[0].embedding is not None and first.data[0].embedding is not None
+    assert [round(value, 6) for value in again.data[0].embedding] == [
+        round(value, 6) for value in first.data[0].embedding
+    ]
+
+
+def test_persistent_tier_is_bounded(tmp_path: Path, make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeEmbedApi()
+    cache = EmbeddingCache(max_entries=0, path=str(tmp_path / "embeddings.db"), max_bytes=100)
+    client = _with_cache(make_client(api.handler), cache)
+
+    for text in ("goal", "red card", "goal"):
+        client.embed.v_2.create(input_type="text", model_name="marengo3.0", text=TextInputRequest(input_text=text))
+
+    assert len(api.bodies) == 3
+    assert cache.stats.persistent_evictions == 2
+
+
+def test_async_create_uses_the_cache(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    api = _FakeEmbedApi()
+    client = make_async_client(api.handler)
+    client.embed.v_2.cache = EmbeddingCache()
+
+    async def create() -> None:
+        for _ in range(2):
+            await client.embed.v_2.create(
+                input_type="text", model_name="marengo3.0", text=TextInputRequest(input_text="goal")
+            )
+
+    asyncio.run(create())
+
+    assert len(api.bodies) == 1
+
+
+def test_texts_differing_in_whitespace_share_an_entry(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeEmbedApi()
+    client = _with_cache(make_client(api.handler), EmbeddingCache())
+    strict = _with_cache(make_client(api.handler), EmbeddingCache(normalize_text=False))
+
+    for input_text in ["red car", "  red   car\n", "red car"]:
+        client.embed.v_2.create(
+            input_type="text", model_name="marengo3.0", text=TextInputRequest(input_text=input_text)
+        )
+        strict.embed.v_2.create(
+            input_type="text", model_name="marengo3.0", text=TextInputRequest(input_text=input_text)
+        )
+
+    assert [body["text"]["input_text"] for body in api.bodies] == ["red car", "red car", "  red   car\n"]
+
+
+def test_async_create_reads_the_database_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    make_client: typing.Callable[..., TwelveLabs],
+    make_async_client: typing.Callable[..., AsyncTwelveLabs],
+) -> None:
+    api = _FakeEmbedApi()
+    path = str(tmp_path / "embeddings.db")
+    _with_cache(make_client(api.handler), EmbeddingCache(path=path)).embed.v_2.create(
+        input_type="text", model_name="marengo3.0", text=TextInputRequest(input_text="goal")
+    )
+    threads: typing.List[int] = []
+    decode_response = embedding_cache.decode_response
+
+    def record_thread(metadata: str, vectors: bytes) -> typing.Any:
+        threads.append(threading.get_ident())
+        return decode_response(metadata, vectors)
+
+    monkeypatch.setattr(embedding_cache, "decode_response", record_thread)
+    client = make_async_client(api.handler)
+    client.embed.v_2.cache = EmbeddingCache(path=path)
+
+    async def create() -> int:
+        for input_text in ["goal", "save"]:
+            await client.embed.v_2.create(
+                input_type="text", model_name="marengo3.0", text=TextInputRequest(input_text=input_text)
+            )
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(create())
+
+    assert len(api.bodies) == 2
+    assert len(threads) == 1 and threads[0] != loop_thread
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import typing
+
+import httpx
+import pytest
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+from twelvelabs.core.api_error import ApiError
+from twelvelabs.core.embedding_stream import JsonArrayScanner
+
+SEGMENTS = [
+    {
+        "float": [i / 10, -1.5, 2.0],
+        "start_offset_sec": 6.0 * i,
+        "end_offset_sec": 6.0 * (i + 1),
+        "embedding_option": "visual",
+        "embedding_scope": "clip",
+    }
+    for i in range(25)
+]
+VIDEO = {
+    "_id": "video",
+    "embedding": {"model_name": "marengo3.0", "video_embedding": {"segments": SEGMENTS}},
+    "transcription": [{"start": 0, "end": 1, "value": 'a "quoted" [text] {with} brackets\\'}],
+}
+TASK = {
+    "_id": "task",
+    "status": "ready",
+    "data": [{"embedding": [1.0, 2.0], "embedding_option": "visual", "start_sec": 0.0, "end_sec": 6.0}] * 5,
+}
+
+
+def _chunks(body: typing.Any, size: int) -> typing.Iterator[bytes]:
+    content = json.dumps(body).encode()
+    for start in range(0, len(content), size):
+        yield content[start : start + size]
+
+
+class _ChunkedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, body: typing.Any, size: int = 7) -> None:
+        self.body = body
+        self.size = size
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        return _chunks(self.body, self.size)
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        for chunk in _chunks(self.body, self.size):
+            yield chunk
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/videos/missing"):
+        return httpx.Response(404, json={"code": "video_not_found"})
+    if request.url.path.startswith("/indexes"):
+        assert request.url.params["embedding_option"] == "visual"
+        return httpx.Response(200, stream=_ChunkedStream(VIDEO))
+    return httpx.Response(200, stream=_ChunkedStream(TASK))
+
+
+def test_scanner_returns_each_segment_as_it_completes() -> None:
+    scanner = JsonArrayScanner(("embedding", "video_embedding", "segments"))
+    items: typing.List[bytes] = []
+    for chunk in _chunks(VIDEO, 3):
+        items.extend(scanner.feed(chunk))
+        # Only the unfinished segment is kept
+        assert len(scanner._buffer) < 200
+
+    assert [json.loads(item) for item in items] == SEGMENTS
+    assert scanner.done
+
+
+def test_video_segments_are_streamed(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    segments = list(make_client(_handler).indexes.videos.iter_embeddings("index", "video", embedding_option=["visual"]))
+
+    assert len(segments) == 25
+    assert segments[3].float_ == [0.3, -1.5, 2.0]
+    assert segments[3].start_offset_sec == 18.0
+
+
+def test_batches_are_packed_into_arrays(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    batches = list(
+        make_client(_handler).indexes.videos.iter_embedding_batches(
+            "index", "video", embedding_option="visual", batch_size=10, use_numpy=False
+        )
+    )
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    assert batches[2].vectors.shape == (5, 3)
+    assert batches[1].start_sec[0] == 60.0
+
+
+def test_embed_v2_results_are_streamed(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    client = make_client(_handler)
+
+    embeddings = list(client.embed.v_2.tasks.iter_embeddings("task"))
+    created = list(client.embed.v_2.iter_embedding_batches(input_type="text", model_name="marengo3.0", batch_size=2))
+
+    assert [embedding.embedding for embedding in embeddings] == [[1.0, 2.0]] * 5
+    assert [len(batch) for batch in created] == [2, 2, 1]
+
+
+def test_errors_are_raised(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    with pytest.raises(ApiError) as error:
+        list(make_client(_handler).indexes.videos.iter_embeddings("index", "missing", embedding_option="visual"))
+
+    assert error.value.status_code == 404
+    assert error.value.body == {"code": "video_not_found"}
+
+
+def test_async_segments_are_streamed(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    client = make_async_client(_handler)
+
+    async def collect() -> typing.List[float]:
+        return [
+            segment.start_offset_sec or 0.0
+            async for segment in client.indexes.videos.iter_embeddings("index", "video", embedding_option="visual")
+        ]
+
+    assert asyncio.run(collect()) == [6.0 * i for i in range(25)]
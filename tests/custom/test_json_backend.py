@@ -0,0 +1,86 @@
+import json
+import typing
+
+import httpx
+import pytest
+
+from twelvelabs import TwelveLabs
+from twelvelabs.core.api_error import ApiError
+from twelvelabs.core.json_backend import JsonBackend, get_json_backend, parse_json_as
+from twelvelabs.core.pydantic_utilities import IS_PYDANTIC_V2
+from twelvelabs.types.embedding_success_response import EmbeddingSuccessResponse
+from twelvelabs.types.video_vector import VideoVector
+
+
+def _available_backends() -> typing.List[JsonBackend]:
+    backends = [get_json_backend("stdlib")]
+    for name in ("orjson", "pydantic_core"):
+        try:
+            backends.append(get_json_backend(name))  # type: ignore[arg-type]
+        except ImportError:
+            pass
+    return backends
+
+
+@pytest.mark.parametrize("backend", _available_backends(), ids=lambda backend: backend.name)
+def test_backends_parse_identically(backend: JsonBackend) -> None:
+    body = b'{"data": [{"embedding": [0.5, -0.25], "start_sec": 0.0, "end_sec": 6.0}]}'
+    assert parse_json_as(EmbeddingSuccessResponse, body, backend) == parse_json_as(EmbeddingSuccessResponse, body)
+
+    # Aliased types still have their fields renamed
+    vector = parse_json_as(VideoVector, '{"_id": "video"}', backend)
+    assert vector.id == "video"
+
+    with pytest.raises(json.JSONDecodeError):
+        parse_json_as(EmbeddingSuccessResponse, b'{"data": [', backend)
+
+
+@pytest.mark.skipif(not IS_PYDANTIC_V2, reason="pydantic_core backend requires pydantic v2")
+def test_client_uses_configured_backend() -> None:
+    bodies = [b'{"_id": "task", "status": "ready"}', b"<html>Bad gateway</html>"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=bodies.pop(0))
+
+    client = TwelveLabs(
+        api_key="test",
+        json_backend="pydantic_core",
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    assert client._client_wrapper.json_backend.name == "pydantic_core"
+    assert client.tasks.retrieve("task").id == "task"
+    # Malformed bodies are still reported as an ApiError carrying the raw text
+    with pytest.raises(ApiError) as exc_info:
+        client.tasks.retrieve("task")
+    assert exc_info.value.body == "<html>Bad gateway</html>"
+
+
+class _CountingBackend(JsonBackend):
+    name = "counting"
+
+    def __init__(self) -> None:
+        self.bodies: typing.List[typing.Union[str, bytes]] = []
+
+    def loads(self, json_: typing.Union[str, bytes]) -> typing.Any:
+        self.bodies.append(json_)
+        return super().loads(json_)
+
+
+def test_generated_endpoints_decode_with_the_backend() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("missing"):
+            return httpx.Response(404, json={"code": "index_not_found"})
+        return httpx.Response(200, json={"_id": "index"})
+
+    backend = _CountingBackend()
+    client = TwelveLabs(
+        api_key="test",
+        json_backend=backend,
+        httpx_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    assert client.indexes.retrieve("index").id == "index"
+    with pytest.raises(ApiError):
+        client.indexes.retrieve("missing")
+    assert backend.bodies == [b'{"_id":"index"}', b'{"code":"index_not_found"}']
@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+import twelvelabs
+
+
+def _loaded_wrapper_modules(statement: str) -> str:
+    statement += "; import sys; print(sorted(m for m in sys.modules if m.startswith('twelvelabs.wrapper')))"
+    return subprocess.check_output([sys.executable, "-c", statement], universal_newlines=True).strip()
+
+
+def test_import_does_not_load_wrappers() -> None:
+    assert _loaded_wrapper_modules("from twelvelabs import TwelveLabs; TwelveLabs(api_key='test')") == "[]"
+
+
+def test_client_loads_only_the_wrappers_it_uses() -> None:
+    output = _loaded_wrapper_modules("from twelvelabs import TwelveLabs; TwelveLabs(api_key='test').search")
+
+    assert "twelvelabs.wrapper.search_client_wrapper" in output
+    assert "twelvelabs.wrapper.embed_client_wrapper" not in output
+
+
+def test_resource_clients_can_be_replaced() -> None:
+    client = twelvelabs.TwelveLabs(api_key="test")
+    search = client.search
+    assets = client.assets
+
+    client.search = search
+    client.assets = assets
+
+    assert client.search is search and client.assets is assets
@@ -0,0 +1,172 @@
+import asyncio
+import io
+import threading
+import types
+import typing
+import warnings
+from pathlib import Path
+
+import httpx
+import pytest
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+from twelvelabs.core.api_error import ApiError
+from twelvelabs.wrapper import media_cache
+from twelvelabs.wrapper.media_cache import MediaUrlCache
+
+LOGO = b"\x89PNG logo bytes"
+
+
+class _FakeSearchApi:
+    def __init__(self) -> None:
+        self.bodies: typing.List[bytes] = []
+        self.status_code = 200
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.bodies.append(request.read())
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={"message": "media_url could not be downloaded"})
+        return httpx.Response(200, json={"data": [], "page_info": {}})
+
+
+def _with_cache(client: TwelveLabs, cache: MediaUrlCache) -> TwelveLabs:
+    client.search.media_cache = cache
+    return client
+
+
+def test_media_is_uploaded_once_and_then_sent_by_url(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeSearchApi()
+    uploads: typing.List[typing.Optional[str]] = []
+
+    def upload(content: bytes, filename: typing.Optional[str], content_type: typing.Optional[str]) -> str:
+        uploads.append(filename)
+        return f"https://cdn.example.com/{len(uploads)}.png"
+
+    cache = MediaUrlCache(upload=upload)
+    client = _with_cache(make_client(api.handler), cache)
+
+    for _ in range(3):
+        client.search.query(
+            index_id="index", search_options=["visual"], query_media_type="image", query_media_file=("logo.png", LOGO)
+        )
+
+    assert uploads == ["logo.png"]
+    assert all(LOGO not in body and b"https://cdn.example.com/1.png" in body for body in api.bodies)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_unknown_media_is_sent_as_bytes_without_an_uploader(
+    tmp_path: Path, make_client: typing.Callable[..., TwelveLabs]
+) -> None:
+    api = _FakeSearchApi()
+    path = str(tmp_path / "media.db")
+    MediaUrlCache(path=path).register(LOGO, "https://cdn.example.com/logo.png")
+    client = _with_cache(make_client(api.handler), MediaUrlCache(path=path))
+
+    client.search.query(
+        index_id="index",
+        search_options=["visual"],
+        query_media_type="image",
+        query_media_files=[io.BytesIO(LOGO), io.BytesIO(b"other image")],
+    )
+    client.search.query(
+        index_id="index", search_options=["visual"], query_media_type="image", query_media_files=[io.BytesIO(LOGO)]
+    )
+
+    # One file has no URL, so both are sent as bytes. The registered URL outlives the cache that stored it
+    assert LOGO in api.bodies[0] and b"other image" in api.bodies[0]
+    assert LOGO not in api.bodies[1] and b"https://cdn.example.com/logo.png" in api.bodies[1]
+
+
+def test_async_uploader(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    api = _FakeSearchApi()
+
+    async def upload(content: bytes, filename: typing.Optional[str], content_type: typing.Optional[str]) -> str:
+        return "https://cdn.example.com/logo.png"
+
+    client = make_async_client(api.handler)
+    client.search.media_cache = MediaUrlCache(upload=upload)
+
+    asyncio.run(
+        client.search.query(
+            index_id="index", search_options=["visual"], query_media_type="image", query_media_file=LOGO
+        )
+    )
+
+    assert LOGO not in api.bodies[0] and b"https://cdn.example.com/logo.png" in api.bodies[0]
+
+
+def _counting_uploader(uploads: typing.List[typing.Optional[str]]) -> media_cache.MediaUploader:
+    def upload(content: bytes, filename: typing.Optional[str], content_type: typing.Optional[str]) -> str:
+        uploads.append(filename)
+        return f"https://cdn.example.com/{len(uploads)}.png"
+
+    return upload
+
+
+def test_urls_expire_after_the_ttl(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    now = [1000.0]
+    monkeypatch.setattr(media_cache, "time", types.SimpleNamespace(time=lambda: now[0]))
+    uploads: typing.List[typing.Optional[str]] = []
+    cache = MediaUrlCache(upload=_counting_uploader(uploads), path=str(tmp_path / "media.db"), ttl=60.0)
+
+    assert cache.resolve([LOGO])[0] == ["https://cdn.example.com/1.png"]
+    now[0] += 59.0
+    assert cache.resolve([LOGO])[0] == ["https://cdn.example.com/1.png"]
+    now[0] += 2.0
+    assert cache.resolve([LOGO])[0] == ["https://cdn.example.com/2.png"]
+    assert MediaUrlCache(path=str(tmp_path / "media.db")).get(media_cache.get_content_key(LOGO)) is not None
+
+
+def test_async_resolve_keeps_the_database_off_the_event_loop(tmp_path: Path) -> None:
+    threads: typing.List[int] = []
+    uploads: typing.List[typing.Optional[str]] = []
+    cache = MediaUrlCache(upload=_counting_uploader(uploads), path=str(tmp_path / "media.db"))
+    connection = cache._connection
+
+    class RecordingConnection:
+        def execute(self, *args: typing.Any) -> typing.Any:
+            threads.append(threading.get_ident())
+            return typing.cast(typing.Any, connection).execute(*args)
+
+    cache._connection = typing.cast(typing.Any, RecordingConnection())
+
+    async def resolve_twice() -> int:
+        await cache.async_resolve([LOGO])
+        # A URL already in memory is served without a database read
+        queries = len(threads)
+        assert (await cache.async_resolve([LOGO]))[0] == ["https://cdn.example.com/1.png"]
+        assert len(threads) == queries
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(resolve_twice())
+
+    assert len(uploads) == 1
+    assert threads and loop_thread not in threads
+
+
+def test_a_failed_search_drops_the_urls_it_sent(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeSearchApi()
+    uploads: typing.List[typing.Optional[str]] = []
+    client = _with_cache(make_client(api.handler), MediaUrlCache(upload=_counting_uploader(uploads)))
+
+    api.status_code = 400
+    with pytest.raises(ApiError):
+        client.search.query(
+            index_id="index", search_options=["visual"], query_media_type="image", query_media_files=[LOGO]
+        )
+    api.status_code = 200
+    client.search.query(index_id="index", search_options=["visual"], query_media_type="image", query_media_files=[LOGO])
+
+    assert len(uploads) == 2
+    assert b"https://cdn.example.com/2.png" in api.bodies[1]
+
+
+def test_sync_resolve_rejects_a_coroutine_uploader_without_calling_it() -> None:
+    async def upload(content: bytes, filename: typing.Optional[str], content_type: typing.Optional[str]) -> str:
+        return "https://cdn.example.com/logo.png"
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(TypeError):
+            MediaUrlCache(upload=upload).resolve([LOGO])
@@ -0,0 +1,108 @@
+import asyncio
+import re
+import threading
+import time
+import typing
+
+import httpx
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+
+
+class _FakeSearchApi:
+    """Serves two pages of two results per index, taking 50ms per search. The `broken` index fails."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def _response(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            index_id = request.url.path.split("/")[-1].split("-")[0]
+            data = [{"video_id": f"{index_id}-{rank}", "rank": rank} for rank in (3, 4)]
+            return httpx.Response(200, json={"data": data, "page_info": {}})
+        match = re.search(rb'name="index_id"\r\n\r\n(\w+)', request.read())
+        index_id = match.group(1).decode() if match else ""
+        if index_id == "broken":
+            return httpx.Response(400, json={"code": "index_not_found"})
+        query = re.search(rb'name="query_text"\r\n\r\n(\w+)', request.read())
+        suffix = f"-{query.group(1).decode()}" if query else ""
+        data = [{"video_id": f"{index_id}{suffix}-{rank}", "rank": rank} for rank in (1, 2)]
+        return httpx.Response(200, json={"data": data, "page_info": {"next_page_token": f"{index_id}-2"}})
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return self._response(request)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return self._response(request)
+
+
+def test_results_are_merged_by_rank_across_indexes(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeSearchApi()
+
+    results = make_client(api.handler).search.query_many(
+        index_ids=["a", "b", "c", "d"], search_options=["visual"], query_text="car", max_workers=2
+    )
+
+    assert [hit.item.video_id for hit in results] == [
+        "a-car-1",
+        "b-car-1",
+        "c-car-1",
+        "d-car-1",
+        "a-car-2",
+        "b-car-2",
+        "c-car-2",
+        "d-car-2",
+    ]
+    assert api.max_active == 2
+
+
+def test_failures_are_reported_per_index(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    results = make_client(_FakeSearchApi().handler).search.query_many(
+        index_ids=["a", "broken", "b"], search_options=["visual"], query_text="car"
+    )
+
+    assert [hit.index_id for hit in results] == ["a", "b", "a", "b"]
+    assert results.failed_index_ids == ["broken"]
+    assert getattr(results.failures[0].error, "status_code") == 400
+
+
+def test_query_variants_and_further_pages(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    results = make_client(_FakeSearchApi().handler).search.query_many(
+        index_ids=["a"],
+        search_options=["visual"],
+        queries=[{"query_text": "car"}, {"query_text": "truck"}],
+        all_pages=True,
+    )
+
+    hits = list(results)
+
+    assert [hit.item.video_id for hit in hits[:4]] == ["a-car-1", "a-truck-1", "a-car-2", "a-truck-2"]
+    assert [hit.item.rank for hit in hits[4:]] == [3, 3, 4, 4]
+    assert [hit.source.query for hit in hits[4:6]] == [0, 1]
+
+
+def test_async_fan_out(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    api = _FakeSearchApi()
+    client = make_async_client(api.async_handler)
+
+    async def search() -> typing.List[typing.Optional[str]]:
+        results = await client.search.query_many(
+            index_ids=["a", "broken", "b"], search_options=["visual"], query_text="car", all_pages=True
+        )
+        assert results.failed_index_ids == ["broken"]
+        return [hit.item.video_id async for hit in results]
+
+    started_at = time.monotonic()
+    video_ids = asyncio.run(search())
+
+    assert video_ids == ["a-car-1", "b-car-1", "a-car-2", "b-car-2", "a-3", "b-3", "a-4", "b-4"]
+    assert time.monotonic() - started_at < 0.5
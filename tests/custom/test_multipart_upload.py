@@ -0,0 +1,346 @@
+import asyncio
+import json
+import threading
+import time
+import typing
+from pathlib import Path
+
+import httpx
+import pytest
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+from twelvelabs.core.client_wrapper import AsyncClientWrapper, SyncClientWrapper
+from twelvelabs.core.pagination import AsyncPager, SyncPager
+from twelvelabs.multipart_upload.client import MultipartUploadClient
+from twelvelabs.types.chunk_info import ChunkInfo
+from twelvelabs.types.completed_chunk import CompletedChunk
+from twelvelabs.types.create_asset_upload_response import CreateAssetUploadResponse
+from twelvelabs.types.presigned_url_chunk import PresignedUrlChunk
+from twelvelabs.types.report_chunk_batch_response import ReportChunkBatchResponse
+from twelvelabs.types.request_additional_presigned_ur_ls_response import RequestAdditionalPresignedUrLsResponse
+from twelvelabs.wrapper.multipart_upload_client_wrapper import (
+    AsyncMultipartUploadClientWrapper,
+    MultipartUploadClientWrapper,
+    UploadError,
+    _plan_chunks,
+    _read_chunk,
+)
+
+
+def test_plan_chunks_covers_file_without_gaps() -> None:
+    chunks = _plan_chunks(total_size=25, chunk_size=10)
+
+    assert [chunk.chunk_index for chunk in chunks] == [1, 2, 3]
+    assert [(chunk.offset, chunk.length) for chunk in chunks] == [(0, 10), (10, 10), (20, 5)]
+
+
+def test_plan_chunks_empty_file() -> None:
+    assert _plan_chunks(total_size=0, chunk_size=10) == []
+
+
+def test_read_chunk_reads_window_from_source(tmp_path: Path) -> None:
+    source = tmp_path / "video.mp4"
+    source.write_bytes(bytes(range(25)))
+
+    chunks = _plan_chunks(total_size=25, chunk_size=10)
+
+    assert b"".join(_read_chunk(source, chunk) for chunk in chunks) == bytes(range(25))
+    assert _read_chunk(source, chunks[2]) == bytes(range(20, 25))
+    assert not (tmp_path / "video_chunks").exists()
+
+
+def test_read_chunk_detects_truncated_source(tmp_path: Path) -> None:
+    source = tmp_path / "video.mp4"
+    source.write_bytes(b"x" * 25)
+    chunks = _plan_chunks(total_size=25, chunk_size=10)
+    source.write_bytes(b"x" * 15)
+
+    with pytest.raises(UploadError) as exc_info:
+        _read_chunk(source, chunks[2])
+    assert exc_info.value.chunk_index == 3
+
+
+class _FakeUploader(MultipartUploadClientWrapper):
+    """Uploader whose API calls and S3 PUTs are served in memory."""
+
+    def __init__(self, chunk_size: int, slow_chunks: typing.Sequence[int] = ()) -> None:
+        super().__init__(
+            client_wrapper=SyncClientWrapper(api_key="test", base_url="http://localhost", httpx_client=httpx.Client())
+        )
+        self.chunk_size = chunk_size
+        self.slow_chunks = set(slow_chunks)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.put_order: typing.List[int] = []
+        self.url_requests: typing.List[typing.Tuple[int, int]] = []
+        self.reports: typing.List[typing.List[int]] = []
+        self.total_chunks = 0
+        self.sessions_created = 0
+        self.failing_chunks: typing.Set[int] = set()
+
+    def create(
+        self, filename: str, type: typing.Any, total_size: int, **kwargs: typing.Any
+    ) -> CreateAssetUploadResponse:  # type: ignore[override]
+        self.total_chunks = -(-total_size // self.chunk_size)
+        self.sessions_created += 1
+        return CreateAssetUploadResponse(
+            upload_id="upload",
+            asset_id="asset",
+            chunk_size=self.chunk_size,
+            upload_urls=[PresignedUrlChunk(chunk_index=1, url="s3://1")],
+        )
+
+    def get_additional_presigned_urls(
+        self, upload_id: str, *, start: int, count: int, **kwargs: typing.Any
+    ) -> RequestAdditionalPresignedUrLsResponse:  # type: ignore[override]
+        self.url_requests.append((start, count))
+        return RequestAdditionalPresignedUrLsResponse(
+            upload_urls=[PresignedUrlChunk(chunk_index=i, url=f"s3://{i}") for i in range(start, start + count)]
+        )
+
+    def report_chunk_batch(
+        self, upload_id: str, completed_chunks: typing.Sequence[CompletedChunk], **kwargs: typing.Any
+    ) -> ReportChunkBatchResponse:  # type: ignore[override]
+        with self.lock:
+            self.reports.append([chunk.chunk_index for chunk in completed_chunks])
+            total_completed = sum(len(report) for report in self.reports)
+        url = "https://assets/asset" if total_completed == self.total_chunks else None
+        return ReportChunkBatchResponse(url=url, total_completed=total_completed)
+
+    def get_status(self, upload_id: str, *args: typing.Any, **kwargs: typing.Any) -> SyncPager[ChunkInfo]:  # type: ignore[override]
+        items = [ChunkInfo(index=index, status="completed") for report in self.reports for index in report]
+        return SyncPager(has_next=False, items=items, get_next=None, response=None)
+
+    def _upload_chunk_to_s3(self, chunk_data: bytes, presigned_url: str) -> str:
+        chunk_index = int(presigned_url[len("s3://") :])
+        if chunk_index in self.failing_chunks:
+            raise UploadError("connection reset")
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.3 if chunk_index in self.slow_chunks else 0.01)
+        with self.lock:
+            self.in_flight -= 1
+            self.put_order.append(chunk_index)
+        return f"etag-{chunk_index}"
+
+
+def test_upload_file_keeps_window_full_past_slow_chunk(tmp_path: Path) -> None:
+    source = tmp_path / "video.mp4"
+    source.write_bytes(b"x" * 1005)
+    uploader = _FakeUploader(chunk_size=10, slow_chunks=[1])
+
+    result = uploader.upload_file(source, batch_size=7, max_workers=4)
+
+    assert result.asset_url == "https://assets/asset"
+    reported = sorted(index for report in uploader.reports for index in report)
+    assert reported == list(range(1, 102))
+    assert all(len(report) <= 7 for report in uploader.reports)
+    assert uploader.max_in_flight == 4
+    # Chunk 1 is slow, but the other workers keep going instead of waiting for it
+    assert uploader.put_order.index(1) > 20
+    # URLs are requested in large batches rather than per chunk
+    assert len(uploader.url_requests) <= 3
+
+
+def test_upload_file_resumes_from_journal(tmp_path: Path) -> None:
+    source = tmp_path / "video.mp4"
+    source.write_bytes(b"x" * 1005)
+    journal_path = tmp_path / "video.mp4.upload.jsonl"
+    uploader = _FakeUploader(chunk_size=10)
+    uploader.failing_chunks = {60}
+
+    with pytest.raises(UploadError):
+        uploader.upload_file(source, batch_size=5, max_workers=2, max_retries=0, retry_delay=0, resume=True)
+    journaled = {json.loads(line)["index"] for line in journal_path.read_text().splitlines()[1:]}
+    assert journaled
+
+    uploader.failing_chunks = set()
+    uploader.put_order = []
+    result = uploader.upload_file(source, batch_size=5, max_workers=2, resume=True)
+
+    assert result.asset_url == "https://assets/asset"
+    assert uploader.sessions_created == 1
+    assert set(uploader.put_order).isdisjoint(journaled)
+    assert sorted(journaled | set(uploader.put_order)) == list(range(1, 102))
+    assert sorted(index for report in uploader.reports for index in set(report)) == list(range(1, 102))
+    assert not journal_path.exists()
+
+
+def test_upload_file_ignores_journal_for_modified_source(tmp_path: Path) -> None:
+    source = tmp_path / "video.mp4"
+    source.write_bytes(b"x" * 1005)
+    uploader = _FakeUploader(chunk_size=10)
+    uploader.failing_chunks = {60}
+    with pytest.raises(UploadError):
+        uploader.upload_file(source, max_workers=2, max_retries=0, retry_delay=0, resume=True)
+
+    source.write_bytes(b"y" * 1005)
+    uploader.failing_chunks = set()
+    uploader.reports = []
+    uploader.upload_file(source, max_workers=2, resume=True)
+
+    assert uploader.sessions_created == 2
+
+
+def test_chunk_uploads_share_the_upload_client() -> None:
+    requests: typing.List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, headers={"ETag": f'"etag-{len(requests)}"'})
+
+    upload_client = httpx.Client(transport=httpx.MockTransport(handler))
+    uploader = MultipartUploadClientWrapper(
+        client_wrapper=SyncClientWrapper(api_key="test", base_url="http://localhost", httpx_client=httpx.Client()),
+        upload_httpx_client=upload_client,
+    )
+
+    assert uploader._upload_chunk_to_s3(b"abc", "https://s3.example.com/1") == "etag-1"
+    assert uploader._upload_chunk_to_s3(b"def", "https://s3.example.com/2") == "etag-2"
+    assert [request.content for request in requests] == [b"abc", b"def"]
+
+    # A client passed in by the caller is left open for the caller to close
+    uploader.close()
+    assert not upload_client.is_closed
+
+
+def test_client_closes_only_the_http_clients_it_created() -> None:
+    client = TwelveLabs(api_key="test")
+    # A replaced upload client has no pool of its own to close
+    client.multipart_upload = MultipartUploadClient(client_wrapper=client._client_wrapper)  # type: ignore[assignment]
+    with client:
+        pass
+    assert client._client_wrapper.httpx_client.httpx_client.is_closed
+
+    httpx_client = httpx.Client()
+    with TwelveLabs(api_key="test", httpx_client=httpx_client) as client:
+        upload_client = client.multipart_upload._get_upload_httpx_client()
+    assert upload_client.is_closed
+    assert not httpx_client.is_closed
+
+    async def main() -> None:
+        async with AsyncTwelveLabs(api_key="test") as async_client:
+            pass
+        assert async_client._client_wrapper.httpx_client.httpx_client.is_closed
+
+    asyncio.run(main())
+
+
+class _AsyncFakeUploader(AsyncMultipartUploadClientWrapper):
+    """Async uploader whose API calls and S3 PUTs are served in memory, with slow report calls."""
+
+    def __init__(self, chunk_size: int) -> None:
+        super().__init__(
+            client_wrapper=AsyncClientWrapper(
+                api_key="test", base_url="http://localhost", httpx_client=httpx.AsyncClient()
+            )
+        )
+        self.chunk_size = chunk_size
+        self.total_chunks = 0
+        self.sessions_created = 0
+        self.put_order: typing.List[int] = []
+        self.reports: typing.List[typing.List[int]] = []
+        self.reports_in_flight = 0
+        self.max_reports_in_flight = 0
+        self.failing_chunks: typing.Set[int] = set()
+
+    async def create(
+        self, filename: str, type: typing.Any, total_size: int, **kwargs: typing.Any
+    ) -> CreateAssetUploadResponse:  # type: ignore[override]
+        self.total_chunks = -(-total_size // self.chunk_size)
+        self.sessions_created += 1
+        return CreateAssetUploadResponse(upload_id="upload", asset_id="asset", chunk_size=self.chunk_size)
+
+    async def get_additional_presigned_urls(
+        self, upload_id: str, *, start: int, count: int, **kwargs: typing.Any
+    ) -> RequestAdditionalPresignedUrLsResponse:  # type: ignore[override]
+        return RequestAdditionalPresignedUrLsResponse(
+            upload_urls=[PresignedUrlChunk(chunk_index=i, url=f"s3://{i}") for i in range(start, start + count)]
+        )
+
+    async def report_chunk_batch(
+        self, upload_id: str, completed_chunks: typing.Sequence[CompletedChunk], **kwargs: typing.Any
+    ) -> ReportChunkBatchResponse:  # type: ignore[override]
+        self.reports_in_flight += 1
+        self.max_reports_in_flight = max(self.max_reports_in_flight, self.reports_in_flight)
+        await asyncio.sleep(0.02)
+        self.reports_in_flight -= 1
+        self.reports.append([chunk.chunk_index for chunk in completed_chunks])
+        total_completed = sum(len(report) for report in self.reports)
+        url = "https://assets/asset" if total_completed == self.total_chunks else None
+        return ReportChunkBatchResponse(url=url, total_completed=total_completed)
+
+    async def get_status(self, upload_id: str, *args: typing.Any, **kwargs: typing.Any) -> AsyncPager[ChunkInfo]:  # type: ignore[override]
+        items = [ChunkInfo(index=index, status="completed") for report in self.reports for index in report]
+        return AsyncPager(has_next=False, items=items, get_next=None, response=None)
+
+    async def _upload_chunk_to_s3_async(self, chunk_data: bytes, presigned_url: str) -> str:
+        chunk_index = int(presigned_url[len("s3://") :])
+        if chunk_index in self.failing_chunks:
+            raise UploadError("connection reset")
+        await asyncio.sleep(0.001)
+        self.put_order.append(chunk_index)
+        return f"etag-{chunk_index}"
+
+
+def test_async_upload_file_reports_batches_one_at_a_time(tmp_path: Path) -> None:
+    source = tmp_path / "video.mp4"
+    source.write_bytes(b"x" * 205)
+    uploader = _AsyncFakeUploader(chunk_size=10)
+    progress: typing.List[int] = []
+
+    async def on_progress(update: typing.Any) -> None:
+        progress.append(update.completed_chunks)
+
+    result = asyncio.run(uploader.upload_file(source, batch_size=3, max_workers=4, progress_callback=on_progress))
+
+    assert result.asset_url == "https://assets/asset"
+    assert uploader.max_reports_in_flight == 1
+    assert sorted(index for report in uploader.reports for index in report) == list(range(1, 22))
+    assert all(len(report) <= 3 for report in uploader.reports)
+    assert progress == sorted(progress) and progress[-1] == 21
+
+
+def test_async_upload_file_fails_on_chunk_error(tmp_path: Path) -> None:
+    source = tmp_path / "video.mp4"
+    source.write_bytes(b"x" * 205)
+    uploader = _AsyncFakeUploader(chunk_size=10)
+    uploader.failing_chunks = {5}
+
+    with pytest.raises(UploadError) as exc_info:
+        asyncio.run(uploader.upload_file(source, max_workers=4, max_retries=0, retry_delay=0))
+
+    assert exc_info.value.chunk_index == 5
+    # The failed chunk is never reported, and no report is left running
+    assert all(5 not in report for report in uploader.reports)
+    assert uploader.reports_in_flight == 0
+
+
+def test_async_upload_file_resumes_from_journal(tmp_path: Path) -> None:
+    source = tmp_path / "video.mp4"
+    source.write_bytes(b"x" * 205)
+    journal_path = tmp_path / "video.mp4.upload.jsonl"
+    uploader = _AsyncFakeUploader(chunk_size=10)
+    uploader.failing_chunks = {15}
+
+    with pytest.raises(UploadError):
+        asyncio.run(
+            uploader.upload_file(source, batch_size=3, max_workers=2, max_retries=0, retry_delay=0, resume=True)
+        )
+    # A crash while appending leaves a partial last line, which is ignored
+    with journal_path.open("a") as journal_file:
+        journal_file.write('{"index": 1')
+    journaled = {json.loads(line)["index"] for line in journal_path.read_text().splitlines()[1:-1]}
+    assert journaled
+
+    uploader.failing_chunks = set()
+    uploader.put_order = []
+    result = asyncio.run(uploader.upload_file(source, batch_size=3, max_workers=2, resume=True))
+
+    assert result.asset_url == "https://assets/asset"
+    assert uploader.sessions_created == 1
+    assert set(uploader.put_order).isdisjoint(journaled)
+    assert sorted(journaled | set(uploader.put_order)) == list(range(1, 22))
+    assert not journal_path.exists()
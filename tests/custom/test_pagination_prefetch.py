@@ -0,0 +1,180 @@
+import asyncio
+import dataclasses
+import threading
+import time
+import typing
+
+import httpx
+
+from twelvelabs import AsyncTwelveLabs, IndexSchema, TwelveLabs
+from twelvelabs.core.pagination import AsyncPager, SyncPager
+
+
+class _FakeIndexesApi:
+    """Serves `GET /indexes` with `page_count` pages of `page_size` indexes, each page taking `delay` seconds."""
+
+    def __init__(self, page_count: int, page_size: int = 10, delay: float = 0.05) -> None:
+        self.page_count = page_count
+        self.page_size = page_size
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.requested: typing.List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _page(self, page: int) -> httpx.Response:
+        start = (page - 1) * self.page_size
+        data = [] if page > self.page_count else [{"_id": f"index-{i}"} for i in range(start, start + self.page_size)]
+        return httpx.Response(
+            200,
+            json={
+                "data": data,
+                "page_info": {"page": page, "limit_per_page": self.page_size, "total_page": self.page_count},
+            },
+        )
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        with self.lock:
+            self.requested.append(page)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return self._page(page)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", "1"))
+        self.requested.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return self._page(page)
+
+
+def test_prefetch_fetches_pages_in_parallel_and_in_order(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeIndexesApi(page_count=12)
+
+    client = make_client(api.handler)
+    first = dataclasses.replace(
+        client.indexes.list(page_limit=10),
+        get_page=lambda number: client.indexes.list(page=number, page_limit=10),
+        page_number=1,
+        total_pages=12,
+    )
+
+    started_at = time.monotonic()
+    ids = [index.id for page in first.iter_pages(prefetch=4) for index in page.items or []]
+    elapsed = time.monotonic() - started_at
+
+    assert ids == [f"index-{i}" for i in range(120)]
+    assert sorted(api.requested) == list(range(1, 13))
+    assert api.max_in_flight == 4
+    # Sequentially the 12 pages take 0.6s
+    assert elapsed < 0.45
+
+
+def test_prefetch_stops_fetching_when_the_caller_stops(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeIndexesApi(page_count=50, delay=0.01)
+
+    pages = make_client(api.handler).indexes.list(page_limit=10).iter_pages(prefetch=3)
+    for page_number, _ in enumerate(pages, start=1):
+        if page_number == 2:
+            break
+    typing.cast(typing.Generator[typing.Any, None, None], pages).close()
+
+    # The first two pages, plus at most the prefetch window
+    assert len(api.requested) <= 2 + 3
+
+
+def test_prefetch_reads_ahead_without_page_count() -> None:
+    fetched: typing.List[int] = []
+
+    def get_pager(number: int) -> SyncPager[int]:
+        fetched.append(number)
+        time.sleep(0.02)
+        return SyncPager(
+            has_next=number < 5,
+            items=[number],
+            get_next=lambda: get_pager(number + 1),
+            response=None,
+        )
+
+    pages = get_pager(1).iter_pages(prefetch=2)
+    assert next(pages).items == [1]
+    deadline = time.monotonic() + 5
+    while len(fetched) < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # The background thread stops once it is `prefetch` pages ahead
+    assert fetched == [1, 2, 3, 4]
+    assert [page.items for page in pages] == [[2], [3], [4], [5]]
+
+
+def test_async_prefetch_fetches_pages_concurrently(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    api = _FakeIndexesApi(page_count=12)
+    client = make_async_client(api.async_handler)
+
+    async def get_page(number: int) -> AsyncPager[IndexSchema]:
+        return await client.indexes.list(page=number, page_limit=10)
+
+    async def list_ids() -> typing.List[typing.Optional[str]]:
+        pager = dataclasses.replace(await get_page(1), get_page=get_page, page_number=1, total_pages=12)
+        return [index.id async for page in pager.iter_pages(prefetch=4) for index in page.items or []]
+
+    assert asyncio.run(list_ids()) == [f"index-{i}" for i in range(120)]
+    assert api.max_in_flight == 4
+
+
+def test_async_prefetch_reads_ahead_without_page_count() -> None:
+    async def get_pager(number: int) -> AsyncPager[int]:
+        await asyncio.sleep(0.01)
+        return AsyncPager(
+            has_next=number < 5,
+            items=[number],
+            get_next=lambda: get_pager(number + 1),
+            response=None,
+        )
+
+    async def collect() -> typing.List[typing.Optional[typing.List[int]]]:
+        first = await get_pager(1)
+        return [page.items async for page in first.iter_pages(prefetch=2)]
+
+    assert asyncio.run(collect()) == [[1], [2], [3], [4], [5]]
+
+
+def test_async_prefetch_unwinds_its_fetches_when_closed() -> None:
+    unwound: typing.List[int] = []
+
+    async def get_pager(number: int) -> AsyncPager[int]:
+        try:
+            # Every page after the second one is still in flight when the caller stops
+            await asyncio.sleep(0 if number <= 2 else 60)
+        except asyncio.CancelledError:
+            unwound.append(number)
+            raise
+        return AsyncPager(
+            has_next=True,
+            items=[number],
+            get_next=lambda: get_pager(number + 1),
+            response=None,
+            get_page=get_pager,
+            page_number=number,
+            total_pages=5,
+        )
+
+    async def stop_after_two_pages(first: AsyncPager[int]) -> None:
+        pages = first.iter_pages(prefetch=2)
+        assert [(await pages.__anext__()).items for _ in range(2)] == [[1], [2]]
+        await pages.aclose()  # type: ignore[attr-defined]
+        # The fetch still in flight has unwound by the time the iterator is closed
+        assert unwound == [3]
+        unwound.clear()
+
+    async def main() -> None:
+        first = await get_pager(1)
+        await stop_after_two_pages(first)
+        await stop_after_two_pages(dataclasses.replace(first, get_page=None))
+
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+import typing
+
+import httpx
+import pytest
+
+from twelvelabs import TwelveLabs
+from twelvelabs.errors.too_many_requests_error import TooManyRequestsError
+from twelvelabs.tasks.types.tasks_retrieve_response import TasksRetrieveResponse
+from twelvelabs.types.video_indexing_task_system_metadata import VideoIndexingTaskSystemMetadata
+from twelvelabs.wrapper.polling import DurationEstimate, ExponentialBackoff, FixedInterval
+
+
+def test_exponential_backoff_grows_to_the_cap() -> None:
+    polling = ExponentialBackoff(initial_interval=1, multiplier=2, max_interval=10, jitter=0)
+
+    assert [polling.get_delay(attempt=attempt, elapsed=0) for attempt in range(6)] == [1, 2, 4, 8, 10, 10]
+    assert polling.get_delay(attempt=10_000, elapsed=0) == 10
+    with pytest.raises(ValueError):
+        ExponentialBackoff(initial_interval=0)
+
+
+def test_duration_estimate_sleeps_until_the_expected_finish() -> None:
+    polling = DurationEstimate(seconds_per_media_second=0.5, overhead=10, min_interval=2, max_interval=60)
+    task = TasksRetrieveResponse(status="indexing", system_metadata=VideoIndexingTaskSystemMetadata(duration=60))
+
+    # Expected to finish 40 seconds in
+    assert polling.get_delay(attempt=0, elapsed=0, resource=task) == 40
+    assert polling.get_delay(attempt=1, elapsed=38, resource=task) == 2
+    # Past the estimate, sleeps grow with the overrun
+    assert polling.get_delay(attempt=2, elapsed=60, resource=task) == 10
+    assert polling.get_delay(attempt=3, elapsed=1000, resource=task) == 60
+    # Without a duration the fallback decides
+    fallback = DurationEstimate(fallback=FixedInterval(3))
+    assert fallback.get_delay(attempt=0, elapsed=0, resource=TasksRetrieveResponse(status="pending")) == 3
+
+
+def test_rate_limited_checks_honor_retry_after() -> None:
+    polling = FixedInterval(1)
+    error = TooManyRequestsError(body=None, headers={"retry-after": "7"})
+
+    assert polling.get_error_delay(error, attempt=0, elapsed=0) == 7
+    assert polling.get_error_delay(ValueError("boom"), attempt=0, elapsed=0) == 1
+
+
+def test_wait_for_done_uses_the_polling_strategy(
+    monkeypatch: pytest.MonkeyPatch, make_client: typing.Callable[..., TwelveLabs]
+) -> None:
+    statuses = ["pending", "indexing", 429, "indexing", "ready"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        if isinstance(status, int):
+            return httpx.Response(status, headers={"Retry-After": "20"}, json={"message": "slow down"})
+        return httpx.Response(200, json={"_id": "task", "status": status})
+
+    sleeps: typing.List[float] = []
+    monkeypatch.setattr("twelvelabs.wrapper.task_client_wrapper.time.sleep", sleeps.append)
+    client = make_client(handler)
+
+    task = client.tasks.wait_for_done(
+        "task",
+        polling=ExponentialBackoff(initial_interval=1, multiplier=2, jitter=0),
+        request_options={"max_retries": 0},
+    )
+
+    assert task.status == "ready"
+    # The rate-limited check waits for Retry-After instead of the 4 second backoff
+    assert sleeps == [1, 2, 20, 8]
@@ -0,0 +1,27 @@
+import typing
+
+import pytest
+import typing_extensions
+
+from twelvelabs.core.pydantic_utilities import IS_PYDANTIC_V2, _get_type_adapter, parse_obj_as
+from twelvelabs.types.batch_result_item import BatchResultItem
+
+pytestmark = pytest.mark.skipif(not IS_PYDANTIC_V2, reason="TypeAdapter is pydantic v2 only")
+
+
+def test_type_adapter_is_reused_for_the_same_type() -> None:
+    type_ = typing.Optional[typing.List[BatchResultItem]]
+
+    assert _get_type_adapter(type_) is _get_type_adapter(type_)
+    parsed: typing.Optional[typing.List[BatchResultItem]] = parse_obj_as(
+        type_,  # type: ignore[arg-type]
+        [{"task_id": "task", "status": "queued"}],
+    )
+    assert parsed is not None and parsed[0].task_id == "task"
+
+
+def test_unhashable_type_is_parsed_without_caching() -> None:
+    type_ = typing_extensions.Annotated[int, {"unhashable": "metadata"}]
+
+    assert parse_obj_as(type_, "3") == 3
+    assert _get_type_adapter(type_) is not _get_type_adapter(type_)
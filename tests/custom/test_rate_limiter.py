@@ -0,0 +1,111 @@
+import asyncio
+import threading
+import types
+import typing
+
+import httpx
+import pytest
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+from twelvelabs.core import rate_limiter
+from twelvelabs.core.rate_limiter import RateLimit, RateLimiter, get_endpoint_group
+
+
+class _RecordingRateLimiter(RateLimiter):
+    """Records how long each request was told to wait."""
+
+    def __init__(self, limits: typing.Mapping[str, RateLimit]) -> None:
+        super().__init__(limits)
+        self.delays: typing.List[float] = []
+        self._delays_lock = threading.Lock()
+
+    def acquire(self, *, method: str, path: typing.Optional[str]) -> float:
+        delay = super().acquire(method=method, path=path)
+        with self._delays_lock:
+            self.delays.append(delay)
+        return delay
+
+
+@pytest.fixture(autouse=True)
+def frozen_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The buckets see no time pass between requests, so the delays they hand out don't depend on scheduling
+    monkeypatch.setattr(rate_limiter, "time", types.SimpleNamespace(monotonic=lambda: 1000.0, time=lambda: 0.0))
+
+
+@pytest.mark.parametrize(
+    "method, path, group",
+    [
+        ("POST", "search", "search"),
+        ("GET", "search/page-token", "search"),
+        ("POST", "knowledge-stores/store-id/search", "search"),
+        ("POST", "embed-v2/tasks", "embed"),
+        ("POST", "analyze", "analyze"),
+        ("POST", "assets/multipart-uploads", "uploads"),
+        ("POST", "tasks", "uploads"),
+        ("GET", "tasks/task-id", "default"),
+        ("GET", "indexes", "default"),
+    ],
+)
+def test_requests_are_grouped_by_endpoint(method: str, path: str, group: str) -> None:
+    assert get_endpoint_group(method, path) == group
+
+
+def test_unknown_groups_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        RateLimiter({"searches": RateLimit(1)})
+
+
+def test_bursts_are_spread_out_across_threads(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"_id": "index"})
+
+    limiter = _RecordingRateLimiter({"default": RateLimit(requests_per_second=50, burst=2)})
+    client = make_client(handler, rate_limiter=limiter)
+    threads = [threading.Thread(target=client.indexes.retrieve, args=("index",)) for _ in range(12)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Two requests go out at once, and the other ten follow 20ms apart
+    assert sorted(limiter.delays) == pytest.approx([0, 0] + [0.02 * i for i in range(1, 11)])
+
+
+def test_groups_have_separate_buckets(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"_id": "index"})
+
+    limiter = _RecordingRateLimiter({"search": RateLimit(requests_per_second=1, burst=1)})
+    client = make_client(handler, rate_limiter=limiter)
+    for _ in range(20):
+        client.indexes.retrieve("index")
+
+    assert limiter.delays == [0] * 20
+
+
+def test_exhausted_rate_limit_headers_pause_the_group(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": "0.2"} if not limiter.delays[1:] else {}
+        return httpx.Response(200, json={"_id": "index"}, headers=headers)
+
+    limiter = _RecordingRateLimiter({})
+    client = make_client(handler, rate_limiter=limiter)
+    client.indexes.retrieve("index")
+    client.indexes.retrieve("index")
+
+    assert limiter.delays == pytest.approx([0, 0.2])
+
+
+def test_async_requests_share_the_bucket(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"_id": "index"})
+
+    limiter = _RecordingRateLimiter({"default": RateLimit(requests_per_second=50, burst=1)})
+    client = make_async_client(handler, rate_limiter=limiter)
+
+    async def retrieve_all() -> None:
+        await asyncio.gather(*(client.indexes.retrieve("index") for _ in range(6)))
+
+    asyncio.run(retrieve_all())
+
+    assert sorted(limiter.delays) == pytest.approx([0.02 * i for i in range(6)])
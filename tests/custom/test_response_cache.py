@@ -0,0 +1,136 @@
+import asyncio
+import time
+import typing
+from pathlib import Path
+
+import httpx
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+from twelvelabs.core.response_cache import CacheEntry, MemoryCacheBackend, ResponseCache, SqliteCacheBackend
+
+
+class _FakeIndexesApi:
+    """Serves one index, with an ETag that changes whenever it is renamed."""
+
+    def __init__(self) -> None:
+        self.name = "first"
+        self.version = 1
+        self.requests: typing.List[httpx.Request] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = f'"v{self.version}"'
+        if request.method == "PUT":
+            self.name = "renamed"
+            self.version += 1
+            return httpx.Response(204)
+        if request.url.path.endswith("/indexes"):
+            data = [{"_id": "index", "index_name": self.name}] if request.url.params.get("page", "1") == "1" else []
+            return httpx.Response(200, json={"data": data})
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json={"_id": "index", "index_name": self.name}, headers={"ETag": etag})
+
+
+def test_repeated_reads_are_served_from_the_cache(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeIndexesApi()
+    cache = ResponseCache(ttl=60)
+    client = make_client(api.handler, response_cache=cache)
+
+    names = [client.indexes.retrieve("index").index_name for _ in range(5)]
+
+    assert names == ["first"] * 5
+    assert len(api.requests) == 1
+    assert (cache.stats.hits, cache.stats.misses) == (4, 1)
+
+
+def test_stale_entries_are_revalidated_with_their_etag(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeIndexesApi()
+    cache = ResponseCache(ttl=0.05)
+    client = make_client(api.handler, response_cache=cache)
+
+    client.indexes.retrieve("index")
+    time.sleep(0.06)
+    index = client.indexes.retrieve("index")
+
+    assert index.index_name == "first"
+    assert api.requests[1].headers["if-none-match"] == '"v1"'
+    assert cache.stats.revalidations == 1
+    # The 304 makes the entry fresh again
+    client.indexes.retrieve("index")
+    assert len(api.requests) == 2
+
+
+def test_mutations_invalidate_the_resource_and_its_collection(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeIndexesApi()
+    cache = ResponseCache(ttl=60)
+    client = make_client(api.handler, response_cache=cache)
+    client.indexes.retrieve("index")
+    client.indexes.list()
+
+    client.indexes.update("index", index_name="renamed")
+
+    assert cache.stats.invalidations == 2
+    assert client.indexes.retrieve("index").index_name == "renamed"
+    assert [index.index_name for index in client.indexes.list().items or []] == ["renamed"]
+
+
+def test_route_ttls_and_api_keys(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeIndexesApi()
+    cache = ResponseCache(ttl=60, route_ttls={"indexes": 0})
+
+    make_client(api.handler, response_cache=cache).indexes.list()
+    make_client(api.handler, response_cache=cache).indexes.list()
+    make_client(api.handler, response_cache=cache).indexes.retrieve("index")
+    make_client(api.handler, response_cache=cache, api_key="other").indexes.retrieve("index")
+
+    # Lists are never cached, and each API key gets its own entries
+    assert len(api.requests) == 4
+
+
+def test_memory_backend_evicts_least_recently_used_entries() -> None:
+    backend = MemoryCacheBackend(max_bytes=250)
+
+    def entry(path: str) -> CacheEntry:
+        return CacheEntry(path=path, headers=[], content=b"x" * 100, etag=None, expires_at=time.time() + 60)
+
+    backend.set("a", entry("/a"))
+    backend.set("b", entry("/b"))
+    assert backend.get("a") is not None
+    backend.set("c", entry("/c"))
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None and backend.get("c") is not None
+
+
+def test_sqlite_backend_outlives_the_client(tmp_path: Path, make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeIndexesApi()
+    path = str(tmp_path / "cache.db")
+
+    make_client(
+        api.handler, response_cache=ResponseCache(backends=[MemoryCacheBackend(), SqliteCacheBackend(path)])
+    ).indexes.retrieve("index")
+    cache = ResponseCache(backends=[MemoryCacheBackend(), SqliteCacheBackend(path)])
+    index = make_client(api.handler, response_cache=cache).indexes.retrieve("index")
+
+    assert index.index_name == "first"
+    assert len(api.requests) == 1
+    assert cache.stats.hits == 1
+    assert cache.backends[0].get(cache.get_key(api.requests[0])) is not None
+
+
+def test_async_client_uses_the_cache(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    api = _FakeIndexesApi()
+    cache = ResponseCache(ttl=60)
+    client = make_async_client(
+        api.handler,
+        response_cache=cache,
+    )
+
+    async def retrieve_twice() -> None:
+        await client.indexes.retrieve("index")
+        await client.indexes.retrieve("index")
+
+    asyncio.run(retrieve_twice())
+
+    assert len(api.requests) == 1
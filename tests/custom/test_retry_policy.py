@@ -0,0 +1,138 @@
+import asyncio
+import io
+import typing
+
+import httpx
+import pytest
+
+from twelvelabs.core.http_client import AsyncHttpClient, HttpClient
+from twelvelabs.core.retry_policy import RetryPolicy
+
+NO_WAIT = RetryPolicy(max_retries=3, initial_delay=0)
+
+
+def _response(status_code: int, headers: typing.Optional[typing.Dict[str, str]] = None) -> httpx.Response:
+    return httpx.Response(status_code, headers=headers, request=httpx.Request("GET", "https://api.example.com"))
+
+
+@pytest.mark.parametrize(
+    "method, error, retried",
+    [
+        ("POST", httpx.ConnectError("refused"), True),
+        ("GET", httpx.ReadTimeout("timed out"), True),
+        ("POST", httpx.ReadTimeout("timed out"), False),
+        ("DELETE", httpx.RemoteProtocolError("reset"), True),
+        ("PATCH", httpx.RemoteProtocolError("reset"), False),
+        ("GET", ValueError("not a transport error"), False),
+    ],
+)
+def test_transport_errors_are_retried_by_idempotency(method: str, error: Exception, retried: bool) -> None:
+    delay = NO_WAIT.get_retry_delay(method=method, attempt=0, elapsed=0, error=error)
+    assert (delay is not None) == retried
+
+
+@pytest.mark.parametrize(
+    "method, status_code, retried",
+    [("POST", 429, True), ("POST", 503, True), ("POST", 500, False), ("GET", 500, True), ("GET", 404, False)],
+)
+def test_status_codes_are_retried_by_idempotency(method: str, status_code: int, retried: bool) -> None:
+    delay = NO_WAIT.get_retry_delay(method=method, attempt=0, elapsed=0, response=_response(status_code))
+    assert (delay is not None) == retried
+
+
+def test_conflicts_are_only_retried_when_enabled() -> None:
+    assert NO_WAIT.get_retry_delay(method="DELETE", attempt=0, elapsed=0, response=_response(409)) is None
+    policy = RetryPolicy(initial_delay=0, retry_conflicts=True)
+    assert policy.get_retry_delay(method="DELETE", attempt=0, elapsed=0, response=_response(409)) is not None
+
+
+def test_retry_limits() -> None:
+    policy = RetryPolicy(max_retries=2, max_retry_duration=5, initial_delay=1, max_delay=4)
+    response = _response(503)
+
+    assert policy.get_retry_delay(method="GET", attempt=2, elapsed=0, response=response) is None
+    # Full jitter never waits longer than the backoff ceiling
+    delays = [policy.get_retry_delay(method="GET", attempt=1, elapsed=0, response=response) for _ in range(100)]
+    assert all(delay is not None and 0 <= delay <= 2 for delay in delays)
+    # Retry-After is honored, but not past the total budget
+    assert (
+        policy.get_retry_delay(method="GET", attempt=0, elapsed=0, response=_response(429, {"Retry-After": "3"})) == 3
+    )
+    assert (
+        policy.get_retry_delay(method="GET", attempt=0, elapsed=3, response=_response(429, {"Retry-After": "3"}))
+        is None
+    )
+
+
+def _flaky_transport(
+    failures: typing.List[typing.Union[Exception, int]], bodies: typing.List[bytes]
+) -> typing.Callable[[httpx.Request], httpx.Response]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.read())
+        if failures:
+            failure = failures.pop(0)
+            if isinstance(failure, Exception):
+                raise failure
+            return httpx.Response(failure)
+        return httpx.Response(200, json={"ok": True})
+
+    return handler
+
+
+def test_http_client_retries_transport_errors_iteratively() -> None:
+    bodies: typing.List[bytes] = []
+    failures: typing.List[typing.Union[Exception, int]] = [
+        httpx.ConnectError("refused"),
+        503,
+        httpx.ConnectError("refused"),
+    ]
+    client = HttpClient(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_flaky_transport(failures, bodies))),
+        base_timeout=lambda: None,
+        base_headers=lambda: {},
+        base_url=lambda: "https://api.example.com",
+        base_retry_policy=lambda: NO_WAIT,
+    )
+
+    response = client.request("search", method="POST", files={"query_media_file": io.BytesIO(b"image-bytes")})
+
+    assert response.status_code == 200
+    assert len(bodies) == 4
+    # The file is rewound before every retry
+    assert all(b"image-bytes" in body for body in bodies)
+
+
+def test_request_options_override_the_client_policy() -> None:
+    bodies: typing.List[bytes] = []
+    client = HttpClient(
+        httpx_client=httpx.Client(transport=httpx.MockTransport(_flaky_transport([503, 503], bodies))),
+        base_timeout=lambda: None,
+        base_headers=lambda: {},
+        base_url=lambda: "https://api.example.com",
+        base_retry_policy=lambda: NO_WAIT,
+    )
+
+    response = client.request("tasks", method="GET", request_options={"max_retries": 1})
+
+    assert response.status_code == 503
+    assert len(bodies) == 2
+
+
+def test_async_http_client_gives_up_on_non_idempotent_read_timeout() -> None:
+    bodies: typing.List[bytes] = []
+    client = AsyncHttpClient(
+        httpx_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(_flaky_transport([httpx.ReadTimeout("timed out")], bodies))
+        ),
+        base_timeout=lambda: None,
+        base_headers=lambda: {},
+        base_url=lambda: "https://api.example.com",
+        base_retry_policy=lambda: NO_WAIT,
+    )
+
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(client.request("tasks", method="POST", json={"index_id": "index"}))
+    assert len(bodies) == 1
+
+    response = asyncio.run(client.request("tasks", method="GET"))
+    assert response.status_code == 200
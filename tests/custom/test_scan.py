@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+import typing
+
+import httpx
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+from twelvelabs.core.pagination import SyncPager
+from twelvelabs.wrapper.scan import async_scan_all, scan_all
+
+
+class _FakeAssetsApi:
+    """Serves `GET /assets` with `count` assets, each page taking 20ms."""
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.lock = threading.Lock()
+        self.requests: typing.List[httpx.Request] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _page(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        limit = int(request.url.params["page_limit"])
+        ids = range((page - 1) * limit, min(page * limit, self.count))
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"_id": f"asset-{i}"} for i in ids],
+                "page_info": {"page": page, "limit_per_page": limit, "total_page": -(-self.count // limit)},
+            },
+        )
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return self._page(request)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        return self._page(request)
+
+
+def test_scan_all_streams_every_item_in_page_order(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeAssetsApi(count=1234)
+    client = make_client(api.handler)
+
+    ids = [asset.id for asset in scan_all(client.assets.list, concurrency=8, asset_types="video")]
+
+    assert ids == [f"asset-{i}" for i in range(1234)]
+    assert len(api.requests) == 25
+    assert api.max_in_flight == 8
+    assert all(request.url.params["page_limit"] == "50" for request in api.requests)
+    assert all(request.url.params["asset_types"] == "video" for request in api.requests)
+
+
+def test_scan_all_respects_the_rate_limit(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeAssetsApi(count=500)
+    client = make_client(api.handler)
+
+    started_at = time.monotonic()
+    assert len(list(scan_all(client.assets.list, concurrency=8, max_requests_per_second=50))) == 500
+
+    # 10 requests spaced 20ms apart
+    assert time.monotonic() - started_at >= 0.18
+
+
+def test_scan_all_walks_pagers_without_page_count() -> None:
+    def list_fn(*, page: int, page_limit: int) -> SyncPager[int]:
+        return SyncPager(
+            has_next=page < 3,
+            items=list(range((page - 1) * page_limit, page * page_limit)),
+            get_next=lambda: list_fn(page=page + 1, page_limit=page_limit),
+            response=None,
+        )
+
+    assert list(scan_all(list_fn, page_limit=2)) == [0, 1, 2, 3, 4, 5]
+
+
+def test_async_scan_all_streams_every_item_in_page_order(
+    make_async_client: typing.Callable[..., AsyncTwelveLabs],
+) -> None:
+    api = _FakeAssetsApi(count=1234)
+    client = make_async_client(api.async_handler)
+
+    async def collect() -> typing.List[typing.Optional[str]]:
+        return [asset.id async for asset in async_scan_all(client.assets.list, concurrency=8)]
+
+    assert asyncio.run(collect()) == [f"asset-{i}" for i in range(1234)]
+    assert api.max_in_flight == 8
@@ -0,0 +1,117 @@
+import asyncio
+import datetime
+import threading
+import time
+import typing
+
+import httpx
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+from twelvelabs.types.search_results import SearchResults
+from twelvelabs.wrapper.search_page_cache import SearchPageCache
+
+
+class _FakeSearchApi:
+    """Serves three pages of one result, linked by `page-2` and `page-3` tokens, taking 50ms per page."""
+
+    def __init__(self, page_expires_at: typing.Optional[str] = None) -> None:
+        self.page_expires_at = page_expires_at or "2999-01-01T00:00:00Z"
+        self.requests: typing.List[httpx.Request] = []
+        self.lock = threading.Lock()
+
+    def _response(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append(request)
+        page = int(request.url.path.split("-")[-1]) if request.method == "GET" else 1
+        page_info: typing.Dict[str, typing.Any] = {"page_expires_at": self.page_expires_at}
+        if page < 3:
+            page_info["next_page_token"] = f"page-{page + 1}"
+        return httpx.Response(200, json={"data": [{"video_id": f"video-{page}", "rank": page}], "page_info": page_info})
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(0.05)
+        return self._response(request)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return self._response(request)
+
+    @property
+    def pages(self) -> typing.List[str]:
+        return [request.url.path for request in self.requests if request.method == "GET"]
+
+
+def test_next_page_is_prefetched_with_the_request_options(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeSearchApi()
+    client = make_client(api.handler)
+
+    first = client.search.query(
+        index_id="index",
+        search_options=["visual"],
+        query_text="car",
+        prefetch_next_page=True,
+        request_options={"additional_headers": {"x-trace": "abc"}},
+    )
+    second = first.next_page()
+
+    assert second is not None and second.items is not None and second.items[0].video_id == "video-2"
+    # The next page waited for the prefetch instead of sending its own request, and the third page is
+    # prefetched in turn
+    for prefetch in list(client.search._prefetches.values()):
+        prefetch.result(timeout=5)
+    assert api.pages == ["/search/page-2", "/search/page-3"]
+    assert all(request.headers["x-trace"] == "abc" for request in api.requests)
+
+
+def test_pages_read_again_come_from_the_cache(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeSearchApi()
+    client = make_client(api.handler)
+
+    pages = [
+        page.items[0].video_id
+        for page in client.search.query(index_id="index", search_options=["visual"]).iter_pages()
+        if page.items
+    ]
+    again = client.search.get_page("page-2")
+
+    assert pages == ["video-1", "video-2", "video-3"]
+    assert again.items is not None and again.items[0].video_id == "video-2"
+    assert api.pages == ["/search/page-2", "/search/page-3"]
+    assert client.search.page_cache.hits == 1
+
+
+def test_expired_pages_are_not_cached(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeSearchApi(page_expires_at="2000-01-01T00:00:00Z")
+    client = make_client(api.handler)
+
+    client.search.get_page("page-2")
+    client.search.get_page("page-2")
+
+    assert len(api.pages) == 2
+
+
+def test_cache_is_bounded() -> None:
+    cache = SearchPageCache(max_pages=2)
+    expires_at = (datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)).isoformat()
+    results = SearchResults(data=[], page_info={"page_expires_at": expires_at})
+
+    for token in ("a", "b", "c"):
+        cache.set(token, results)
+
+    assert "a" not in cache and "b" in cache and "c" in cache
+
+
+def test_async_next_page_is_prefetched(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    api = _FakeSearchApi()
+    client = make_async_client(api.async_handler)
+
+    async def read() -> typing.List[typing.Optional[str]]:
+        first = await client.search.query(index_id="index", search_options=["visual"], prefetch_next_page=True)
+        await asyncio.wait_for(asyncio.gather(*client.search._prefetches.values()), timeout=5)
+        second = await first.next_page()
+        assert second is not None
+        again = await client.search.get_page("page-2")
+        return [page.items[0].video_id for page in (first, second, again) if page.items]
+
+    assert asyncio.run(read()) == ["video-1", "video-2", "video-2"]
+    assert api.pages[0] == "/search/page-2" and api.pages.count("/search/page-2") == 1
@@ -0,0 +1,25 @@
+import typing
+
+from twelvelabs.core.pydantic_utilities import parse_obj_as
+from twelvelabs.core.serialization import _has_aliases, convert_and_respect_annotation_metadata
+from twelvelabs.types.embedding_success_response import EmbeddingSuccessResponse
+from twelvelabs.types.video_vector import VideoVector
+
+
+def test_alias_free_payload_is_not_copied() -> None:
+    body = {"data": [{"embedding": [0.1, 0.2, 0.3], "start_sec": 0.0, "end_sec": 6.0}]}
+
+    assert not _has_aliases(EmbeddingSuccessResponse)
+    converted = convert_and_respect_annotation_metadata(
+        object_=body, annotation=EmbeddingSuccessResponse, direction="read"
+    )
+    assert converted is body
+    assert parse_obj_as(EmbeddingSuccessResponse, body).data[0].embedding == [0.1, 0.2, 0.3]
+
+
+def test_aliased_paths_are_still_converted() -> None:
+    assert _has_aliases(typing.Optional[typing.List[VideoVector]])
+
+    vectors = parse_obj_as(typing.List[VideoVector], [{"_id": "video", "asset_id": "asset"}])  # type: ignore[arg-type]
+    assert vectors[0].id == "video"
+    assert vectors[0].asset_id == "asset"
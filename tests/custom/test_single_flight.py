@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import time
+import typing
+
+import httpx
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+from twelvelabs.core.rate_limiter import RateLimiter
+
+
+class _FakeVideosApi:
+    """Serves `GET /indexes/{index_id}/videos/{video_id}`, taking 100ms per response."""
+
+    def __init__(self) -> None:
+        self.requests: typing.List[httpx.Request] = []
+        self.lock = threading.Lock()
+
+    def _response(self, request: httpx.Request) -> httpx.Response:
+        video_id = request.url.path.split("/")[-1]
+        return httpx.Response(200, json={"_id": video_id, "embedding": {"model_name": "marengo3.0"}})
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append(request)
+        time.sleep(0.1)
+        return self._response(request)
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await asyncio.sleep(0.1)
+        return self._response(request)
+
+
+def test_concurrent_identical_requests_share_one_call(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeVideosApi()
+    client = make_client(
+        api.handler,
+        coalesce_requests=True,
+    )
+    results: typing.List[str] = []
+
+    def retrieve(video_id: str) -> None:
+        video = client.indexes.videos.retrieve("index", video_id, embedding_option=["visual"])
+        results.append(video.id or "")
+
+    threads = [threading.Thread(target=retrieve, args=("video" if i < 8 else "other",)) for i in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == ["other"] * 2 + ["video"] * 8
+    assert sorted(request.url.path.split("/")[-1] for request in api.requests) == ["other", "video"]
+
+    # Once the call finishes, the next request is sent again
+    client.indexes.videos.retrieve("index", "video", embedding_option=["visual"])
+    assert len(api.requests) == 3
+
+
+def test_async_requests_share_one_call(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    api = _FakeVideosApi()
+    client = make_async_client(api.async_handler, coalesce_requests=True)
+
+    async def retrieve_all() -> typing.List[typing.Optional[str]]:
+        videos = await asyncio.gather(*(client.indexes.videos.retrieve("index", "video") for _ in range(20)))
+        return [video.id for video in videos]
+
+    assert asyncio.run(retrieve_all()) == ["video"] * 20
+    assert len(api.requests) == 1
+
+
+class _CountingRateLimiter(RateLimiter):
+    def __init__(self) -> None:
+        super().__init__({})
+        self.updates = 0
+
+    def update(self, *, method: str, path: typing.Optional[str], response: httpx.Response) -> None:
+        self.updates += 1
+        super().update(method=method, path=path, response=response)
+
+
+def test_shared_response_updates_the_rate_limiter_once(
+    make_async_client: typing.Callable[..., AsyncTwelveLabs],
+) -> None:
+    api = _FakeVideosApi()
+    rate_limiter = _CountingRateLimiter()
+    client = make_async_client(
+        api.async_handler,
+        rate_limiter=rate_limiter,
+        coalesce_requests=True,
+    )
+
+    async def retrieve_all() -> None:
+        await asyncio.gather(*(client.indexes.videos.retrieve("index", "video") for _ in range(5)))
+
+    asyncio.run(retrieve_all())
+
+    assert len(api.requests) == 1
+    assert rate_limiter.updates == 1
+
+
+def test_cancelling_the_first_caller_does_not_cancel_the_others(
+    make_async_client: typing.Callable[..., AsyncTwelveLabs],
+) -> None:
+    api = _FakeVideosApi()
+    client = make_async_client(api.async_handler, coalesce_requests=True)
+
+    async def retrieve_after_cancel() -> typing.Optional[str]:
+        first = asyncio.ensure_future(client.indexes.videos.retrieve("index", "video"))
+        await asyncio.sleep(0.01)
+        second = asyncio.ensure_future(client.indexes.videos.retrieve("index", "video"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return (await second).id
+
+    assert asyncio.run(retrieve_after_cancel()) == "video"
+    assert len(api.requests) == 1
+
+
+def test_requests_are_not_shared_by_default(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    api = _FakeVideosApi()
+    client = make_async_client(api.async_handler, coalesce_requests=False)
+
+    async def retrieve_all() -> None:
+        await asyncio.gather(*(client.indexes.videos.retrieve("index", "video") for _ in range(3)))
+
+    asyncio.run(retrieve_all())
+
+    assert len(api.requests) == 3
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import typing
+
+import httpx
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+from twelvelabs.core.retry_policy import RetryPolicy
+
+NO_WAIT = RetryPolicy(max_retries=2, initial_delay=0)
+
+LINES = [json.dumps({"task_id": f"task-{i}", "status": "ready"}).encode() + b"\n" for i in range(5)]
+
+
+class _DroppedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Sends the first `cut` lines of the body, then drops the connection."""
+
+    def __init__(self, cut: typing.Optional[int]) -> None:
+        self.cut = cut
+
+    def _chunks(self) -> typing.Iterator[bytes]:
+        for index, line in enumerate(LINES):
+            if index == self.cut:
+                raise httpx.RemoteProtocolError("peer closed connection without sending complete message body")
+            yield line
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        return self._chunks()
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        for chunk in self._chunks():
+            yield chunk
+
+
+def _transport(steps: typing.List[typing.Union[int, _DroppedStream]], calls: typing.List[str]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        step = steps.pop(0) if steps else _DroppedStream(cut=None)
+        if isinstance(step, int):
+            return httpx.Response(step, headers={"Retry-After": "0"}, json={"message": "slow down"})
+        return httpx.Response(200, stream=step)
+
+    return httpx.MockTransport(handler)
+
+
+def test_stream_retries_rate_limit_before_first_byte() -> None:
+    calls: typing.List[str] = []
+    client = TwelveLabs(
+        api_key="test",
+        base_url="https://api.example.com",
+        httpx_client=httpx.Client(transport=_transport([429, 503], calls)),
+        retry_policy=NO_WAIT,
+    )
+
+    items = list(client.analyze_async.batches.results("batch"))
+
+    assert [item.task_id for item in items] == [f"task-{i}" for i in range(5)]
+    assert len(calls) == 3
+
+
+def test_results_resume_skips_delivered_lines() -> None:
+    calls: typing.List[str] = []
+    client = TwelveLabs(
+        api_key="test",
+        base_url="https://api.example.com",
+        httpx_client=httpx.Client(transport=_transport([_DroppedStream(cut=2), _DroppedStream(cut=4)], calls)),
+        retry_policy=NO_WAIT,
+    )
+
+    items = list(client.analyze_async.batches.results("batch", resume=True))
+
+    assert [item.task_id for item in items] == [f"task-{i}" for i in range(5)]
+    assert len(calls) == 3
+
+
+def test_results_without_resume_surfaces_the_disconnect() -> None:
+    calls: typing.List[str] = []
+    client = TwelveLabs(
+        api_key="test",
+        base_url="https://api.example.com",
+        httpx_client=httpx.Client(transport=_transport([_DroppedStream(cut=2)], calls)),
+        retry_policy=NO_WAIT,
+    )
+
+    delivered: typing.List[str] = []
+    try:
+        for item in client.analyze_async.batches.results("batch"):
+            delivered.append(item.task_id)
+    except httpx.RemoteProtocolError:
+        pass
+    else:
+        raise AssertionError("the disconnect was not surfaced")
+    assert delivered == ["task-0", "task-1"]
+    assert len(calls) == 1
+
+
+def test_async_results_resume_skips_delivered_lines() -> None:
+    calls: typing.List[str] = []
+    client = AsyncTwelveLabs(
+        api_key="test",
+        base_url="https://api.example.com",
+        httpx_client=httpx.AsyncClient(transport=_transport([503, _DroppedStream(cut=3)], calls)),
+        retry_policy=NO_WAIT,
+    )
+
+    async def collect() -> typing.List[str]:
+        return [item.task_id async for item in client.analyze_async.batches.results("batch", resume=True)]
+
+    assert asyncio.run(collect()) == [f"task-{i}" for i in range(5)]
+    assert len(calls) == 3
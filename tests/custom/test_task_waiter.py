@@ -0,0 +1,96 @@
+import asyncio
+import types
+import typing
+
+import httpx
+import pytest
+
+from twelvelabs import AsyncTwelveLabs, TwelveLabs
+from twelvelabs.wrapper.polling import DurationEstimate, FixedInterval
+from twelvelabs.wrapper.task_waiter import LIST_PAGE_LIMIT, _get_round_delay
+
+
+class _FakeTasksApi:
+    """Serves `GET /tasks` and `GET /tasks/{id}`. Task `task-i` finishes after `i` polling rounds."""
+
+    def __init__(self, count: int) -> None:
+        self.remaining_rounds = {f"task-{i}": i for i in range(count)}
+        self.list_calls = 0
+        self.retrieve_calls = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.strip("/")
+        if path == "tasks":
+            self.list_calls += 1
+            page = int(request.url.params.get("page", "1"))
+            if page == 1:
+                # Each listing of the first page starts a new polling round
+                self.remaining_rounds = {task_id: rounds - 1 for task_id, rounds in self.remaining_rounds.items()}
+            running = [task_id for task_id, rounds in self.remaining_rounds.items() if rounds > 0]
+            data = running[(page - 1) * LIST_PAGE_LIMIT : page * LIST_PAGE_LIMIT]
+            return httpx.Response(200, json={"data": [{"_id": task_id, "status": "indexing"} for task_id in data]})
+        self.retrieve_calls += 1
+        task_id = path.split("/")[-1]
+        status = "ready" if self.remaining_rounds[task_id] <= 0 else "indexing"
+        return httpx.Response(200, json={"_id": task_id, "status": status})
+
+
+def test_wait_for_many_yields_tasks_as_they_finish(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeTasksApi(count=120)
+    client = make_client(api.handler)
+
+    finished = [
+        task.id
+        for task in client.tasks.wait_for_many(
+            [f"task-{i}" for i in range(120)], sleep_interval=0.001, max_requests_per_second=None
+        )
+    ]
+
+    assert set(finished) == {f"task-{i}" for i in range(120)}
+    assert len(finished) == 120
+    assert finished[:2] == ["task-0", "task-1"]
+    # Every task is retrieved once, when it drops off the running list. Polling each task every round would
+    # take over 7,000 requests.
+    assert api.retrieve_calls == 120
+    assert api.list_calls + api.retrieve_calls < 400
+
+
+def test_wait_for_many_without_list_retrieves_every_round(make_client: typing.Callable[..., TwelveLabs]) -> None:
+    api = _FakeTasksApi(count=3)
+    api.remaining_rounds = {"task-0": 0, "task-1": 0, "task-2": 0}
+    client = make_client(api.handler)
+
+    finished = list(client.tasks.wait_for_many(["task-0", "task-2"], use_list=False, sleep_interval=0.001))
+
+    assert [task.id for task in finished] == ["task-0", "task-2"]
+    assert api.list_calls == 0
+
+
+def test_wait_for_many_times_out(make_async_client: typing.Callable[..., AsyncTwelveLabs]) -> None:
+    api = _FakeTasksApi(count=3)
+    api.remaining_rounds["task-2"] = 10**6
+    client = make_async_client(api.handler)
+
+    finished: typing.List[typing.Optional[str]] = []
+
+    async def collect() -> None:
+        async for task in client.tasks.wait_for_many(
+            ["task-0", "task-1", "task-2"], sleep_interval=0.01, max_wait_time=0.2
+        ):
+            finished.append(task.id)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(collect())
+    assert finished == ["task-0", "task-1"]
+
+
+def test_round_delay_follows_the_task_expected_to_finish_first() -> None:
+    polling = DurationEstimate(fallback=FixedInterval(3.0))
+    latest = {
+        task_id: types.SimpleNamespace(system_metadata=types.SimpleNamespace(duration=duration))
+        for task_id, duration in (("long", 600.0), ("short", 20.0))
+    }
+
+    # The short task is estimated to finish 10 + 0.5 * 20 seconds after the wait started
+    assert _get_round_delay(polling, 0, 0.0, latest) == 20.0
+    assert _get_round_delay(polling, 0, 0.0, {}) == 3.0
@@ -0,0 +1,14 @@
+import pytest
+
+from twelvelabs.wrapper.throttle import RequestThrottle
+
+
+def test_request_throttle_spaces_out_requests() -> None:
+    throttle = RequestThrottle(max_requests_per_second=10)
+
+    delays = [throttle.reserve() for _ in range(5)]
+
+    assert delays[0] == 0
+    assert delays[-1] == pytest.approx(0.4, abs=0.05)
+    with pytest.raises(ValueError):
+        RequestThrottle(max_requests_per_second=0)